@@ -40,6 +40,8 @@ import org.apache.flink.table.types.logical.VarCharType;
 import org.apache.flink.shaded.jackson2.com.fasterxml.jackson.core.JsonProcessingException;
 import org.apache.flink.shaded.jackson2.com.fasterxml.jackson.databind.ObjectMapper;
 
+import java.nio.ByteBuffer;
+import java.nio.ByteOrder;
 import java.util.ArrayList;
 import java.util.HashMap;
 import java.util.List;
@@ -255,4 +257,298 @@ public class ConversionUtils {
         }
         return new GenericMapData(newMap);
     }
+
+    /**
+     * Converts the field of a row to bytes in the binary value encoding. The encoding is
+     * little-endian and consists of the following formats.
+     *
+     * <ul>
+     *   <li>BOOLEAN: 1 byte. INT and FLOAT: 4 bytes. BIGINT and DOUBLE: 8 bytes. TIMESTAMP: the
+     *       milliseconds since epoch in 8 bytes.
+     *   <li>STRING: the UTF-8 bytes of the string. BYTES: the bytes as-is.
+     *   <li>ARRAY of fixed-width elements: the number of elements in 4 bytes, a byte that is 1 if
+     *       there is any null element, a bitmap of null elements if there is any null element,
+     *       and the packed elements.
+     *   <li>ARRAY of other elements: the number of elements in 4 bytes, followed by the
+     *       length-prefixed elements.
+     *   <li>MAP: the number of entries in 4 bytes, followed by the length-prefixed key and value
+     *       of each entry.
+     * </ul>
+     *
+     * <p>A length-prefixed value is the length of its bytes in 4 bytes followed by the bytes. The
+     * length is -1 if the value is null.
+     */
+    public static byte[] toBytes(RowData data, int index, DataType dataType) {
+        if (data.isNullAt(index)) {
+            return null;
+        }
+
+        return toBytes(
+                RowData.createFieldGetter(dataType.getLogicalType(), index).getFieldOrNull(data),
+                dataType);
+    }
+
+    /** Converts the bytes in the binary value encoding to Flink internal data structure. */
+    public static Object fromBytes(byte[] bytes, DataType dataType) {
+        if (bytes == null) {
+            return null;
+        }
+
+        return fromBytes(ByteBuffer.wrap(bytes).order(ByteOrder.LITTLE_ENDIAN), dataType);
+    }
+
+    private static byte[] toBytes(Object object, DataType dataType) {
+        if (object == null) {
+            return null;
+        }
+
+        if (dataType instanceof AtomicDataType) {
+            LogicalType logicalType = dataType.getLogicalType();
+            if (logicalType instanceof VarCharType) {
+                return ((StringData) object).toBytes();
+            } else if (logicalType instanceof VarBinaryType) {
+                return (byte[]) object;
+            }
+
+            int width = getFixedWidth(logicalType);
+            if (width > 0) {
+                ByteBuffer buffer = ByteBuffer.allocate(width).order(ByteOrder.LITTLE_ENDIAN);
+                putFixedWidthValue(buffer, object, logicalType);
+                return buffer.array();
+            }
+
+            throw new UnsupportedOperationException(
+                    String.format(
+                            "Cannot write data with type %s to Redis.",
+                            logicalType.getClass().getName()));
+
+        } else if (dataType instanceof KeyValueDataType) {
+            return mapToBytes((MapData) object, (KeyValueDataType) dataType);
+        } else if (dataType instanceof CollectionDataType) {
+            return arrayToBytes((ArrayData) object, (CollectionDataType) dataType);
+        }
+
+        throw new UnsupportedOperationException(
+                String.format(
+                        "Cannot write data with type %s to Redis.", dataType.getClass().getName()));
+    }
+
+    private static byte[] arrayToBytes(ArrayData arrayData, CollectionDataType dataType) {
+        DataType elementDataType = dataType.getElementDataType();
+        LogicalType elementType = elementDataType.getLogicalType();
+        int size = arrayData.size();
+        int width = getFixedWidth(elementType);
+
+        if (width > 0) {
+            boolean hasNull = false;
+            for (int i = 0; i < size; i++) {
+                if (arrayData.isNullAt(i)) {
+                    hasNull = true;
+                    break;
+                }
+            }
+
+            int bitmapSize = hasNull ? (size + 7) / 8 : 0;
+            ByteBuffer buffer =
+                    ByteBuffer.allocate(5 + bitmapSize + size * width)
+                            .order(ByteOrder.LITTLE_ENDIAN);
+            buffer.putInt(size);
+            buffer.put((byte) (hasNull ? 1 : 0));
+            if (hasNull) {
+                byte[] bitmap = new byte[bitmapSize];
+                for (int i = 0; i < size; i++) {
+                    if (arrayData.isNullAt(i)) {
+                        bitmap[i / 8] |= (byte) (1 << (i % 8));
+                    }
+                }
+                buffer.put(bitmap);
+            }
+
+            ArrayData.ElementGetter getter = ArrayData.createElementGetter(elementType);
+            for (int i = 0; i < size; i++) {
+                Object element = getter.getElementOrNull(arrayData, i);
+                if (element == null) {
+                    buffer.position(buffer.position() + width);
+                } else {
+                    putFixedWidthValue(buffer, element, elementType);
+                }
+            }
+            return buffer.array();
+        }
+
+        ArrayData.ElementGetter getter = ArrayData.createElementGetter(elementType);
+        List<byte[]> elements = new ArrayList<>(size);
+        for (int i = 0; i < size; i++) {
+            elements.add(toBytes(getter.getElementOrNull(arrayData, i), elementDataType));
+        }
+        return toLengthPrefixedBytes(size, elements);
+    }
+
+    private static byte[] mapToBytes(MapData mapData, KeyValueDataType dataType) {
+        DataType keyDataType = dataType.getKeyDataType();
+        DataType valueDataType = dataType.getValueDataType();
+        ArrayData.ElementGetter keyGetter =
+                ArrayData.createElementGetter(keyDataType.getLogicalType());
+        ArrayData.ElementGetter valueGetter =
+                ArrayData.createElementGetter(valueDataType.getLogicalType());
+        ArrayData keyArrayData = mapData.keyArray();
+        ArrayData valueArrayData = mapData.valueArray();
+        int size = mapData.size();
+
+        List<byte[]> elements = new ArrayList<>(size * 2);
+        for (int i = 0; i < size; i++) {
+            elements.add(toBytes(keyGetter.getElementOrNull(keyArrayData, i), keyDataType));
+            elements.add(
+                    toBytes(valueGetter.getElementOrNull(valueArrayData, i), valueDataType));
+        }
+        return toLengthPrefixedBytes(size, elements);
+    }
+
+    private static byte[] toLengthPrefixedBytes(int size, List<byte[]> elements) {
+        int totalLength = 4;
+        for (byte[] element : elements) {
+            totalLength += 4 + (element == null ? 0 : element.length);
+        }
+
+        ByteBuffer buffer = ByteBuffer.allocate(totalLength).order(ByteOrder.LITTLE_ENDIAN);
+        buffer.putInt(size);
+        for (byte[] element : elements) {
+            if (element == null) {
+                buffer.putInt(-1);
+            } else {
+                buffer.putInt(element.length);
+                buffer.put(element);
+            }
+        }
+        return buffer.array();
+    }
+
+    private static Object fromBytes(ByteBuffer buffer, DataType dataType) {
+        if (dataType instanceof AtomicDataType) {
+            LogicalType logicalType = dataType.getLogicalType();
+            if (logicalType instanceof VarCharType) {
+                byte[] bytes = new byte[buffer.remaining()];
+                buffer.get(bytes);
+                return StringData.fromBytes(bytes);
+            } else if (logicalType instanceof VarBinaryType) {
+                byte[] bytes = new byte[buffer.remaining()];
+                buffer.get(bytes);
+                return bytes;
+            } else if (getFixedWidth(logicalType) > 0) {
+                return getFixedWidthValue(buffer, logicalType);
+            }
+
+            throw new UnsupportedOperationException(
+                    String.format(
+                            "Cannot read data with type %s from Redis.",
+                            logicalType.getClass().getName()));
+
+        } else if (dataType instanceof KeyValueDataType) {
+            DataType keyDataType = ((KeyValueDataType) dataType).getKeyDataType();
+            DataType valueDataType = ((KeyValueDataType) dataType).getValueDataType();
+            int size = buffer.getInt();
+            Map<Object, Object> map = new HashMap<>();
+            for (int i = 0; i < size; i++) {
+                Object key = readLengthPrefixed(buffer, keyDataType);
+                map.put(key, readLengthPrefixed(buffer, valueDataType));
+            }
+            return new GenericMapData(map);
+        } else if (dataType instanceof CollectionDataType) {
+            DataType elementDataType = ((CollectionDataType) dataType).getElementDataType();
+            LogicalType elementType = elementDataType.getLogicalType();
+            int size = buffer.getInt();
+            Object[] objects = new Object[size];
+            int width = getFixedWidth(elementType);
+            if (width > 0) {
+                boolean hasNull = buffer.get() != 0;
+                byte[] bitmap = new byte[hasNull ? (size + 7) / 8 : 0];
+                buffer.get(bitmap);
+                for (int i = 0; i < size; i++) {
+                    if (hasNull && (bitmap[i / 8] & (1 << (i % 8))) != 0) {
+                        buffer.position(buffer.position() + width);
+                    } else {
+                        objects[i] = getFixedWidthValue(buffer, elementType);
+                    }
+                }
+            } else {
+                for (int i = 0; i < size; i++) {
+                    objects[i] = readLengthPrefixed(buffer, elementDataType);
+                }
+            }
+            return new GenericArrayData(objects);
+        }
+
+        throw new UnsupportedOperationException(
+                String.format(
+                        "Cannot read data with type %s from Redis.",
+                        dataType.getClass().getName()));
+    }
+
+    private static Object readLengthPrefixed(ByteBuffer buffer, DataType dataType) {
+        int length = buffer.getInt();
+        if (length < 0) {
+            return null;
+        }
+
+        ByteBuffer slice = buffer.slice().order(ByteOrder.LITTLE_ENDIAN);
+        slice.limit(length);
+        buffer.position(buffer.position() + length);
+        return fromBytes(slice, dataType);
+    }
+
+    /** Returns the width of the type in the binary value encoding, or 0 if it is not fixed. */
+    private static int getFixedWidth(LogicalType logicalType) {
+        if (logicalType instanceof BooleanType) {
+            return 1;
+        } else if (logicalType instanceof IntType || logicalType instanceof FloatType) {
+            return 4;
+        } else if (logicalType instanceof BigIntType
+                || logicalType instanceof DoubleType
+                || logicalType instanceof TimestampType) {
+            return 8;
+        }
+        return 0;
+    }
+
+    private static void putFixedWidthValue(
+            ByteBuffer buffer, Object object, LogicalType logicalType) {
+        if (logicalType instanceof BooleanType) {
+            buffer.put((byte) ((Boolean) object ? 1 : 0));
+        } else if (logicalType instanceof IntType) {
+            buffer.putInt((Integer) object);
+        } else if (logicalType instanceof FloatType) {
+            buffer.putFloat((Float) object);
+        } else if (logicalType instanceof BigIntType) {
+            buffer.putLong((Long) object);
+        } else if (logicalType instanceof DoubleType) {
+            buffer.putDouble((Double) object);
+        } else if (logicalType instanceof TimestampType) {
+            buffer.putLong(((TimestampData) object).getMillisecond());
+        } else {
+            throw new UnsupportedOperationException(
+                    String.format(
+                            "Cannot write data with type %s to Redis.",
+                            logicalType.getClass().getName()));
+        }
+    }
+
+    private static Object getFixedWidthValue(ByteBuffer buffer, LogicalType logicalType) {
+        if (logicalType instanceof BooleanType) {
+            return buffer.get() != 0;
+        } else if (logicalType instanceof IntType) {
+            return buffer.getInt();
+        } else if (logicalType instanceof FloatType) {
+            return buffer.getFloat();
+        } else if (logicalType instanceof BigIntType) {
+            return buffer.getLong();
+        } else if (logicalType instanceof DoubleType) {
+            return buffer.getDouble();
+        } else if (logicalType instanceof TimestampType) {
+            return TimestampData.fromEpochMillis(buffer.getLong());
+        }
+        throw new UnsupportedOperationException(
+                String.format(
+                        "Cannot read data with type %s from Redis.",
+                        logicalType.getClass().getName()));
+    }
 }
@@ -40,12 +40,22 @@ public interface JedisClient {
 
     List<String> hmget(String key, String... fields);
 
+    void hset(byte[] key, Map<byte[], byte[]> hash);
+
+    List<byte[]> hmget(byte[] key, byte[]... fields);
+
+    void hdel(byte[] key, byte[]... fields);
+
     void rpush(String key, String... string);
 
     String get(String key);
 
     void set(String key, String value);
 
+    byte[] get(byte[] key);
+
+    void set(byte[] key, byte[] value);
+
     void lpush(String key, String... string);
 
     void lpop(String key, int count);
@@ -69,6 +69,21 @@ public class JedisClusterClient implements JedisClient {
         return jedis.hmget(key, fields);
     }
 
+    @Override
+    public void hset(byte[] key, Map<byte[], byte[]> hash) {
+        pipeline.hset(key, hash);
+    }
+
+    @Override
+    public List<byte[]> hmget(byte[] key, byte[]... fields) {
+        return jedis.hmget(key, fields);
+    }
+
+    @Override
+    public void hdel(byte[] key, byte[]... fields) {
+        pipeline.hdel(key, fields);
+    }
+
     @Override
     public void rpush(String key, String... string) {
         pipeline.rpush(key, string);
@@ -84,6 +99,16 @@ public class JedisClusterClient implements JedisClient {
         pipeline.set(key, value);
     }
 
+    @Override
+    public byte[] get(byte[] key) {
+        return jedis.get(key);
+    }
+
+    @Override
+    public void set(byte[] key, byte[] value) {
+        pipeline.set(key, value);
+    }
+
     @Override
     public void lpush(String key, String... string) {
         pipeline.lpush(key, string);
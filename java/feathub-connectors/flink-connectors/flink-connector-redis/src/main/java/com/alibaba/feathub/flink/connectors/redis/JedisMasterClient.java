@@ -71,6 +71,21 @@ public class JedisMasterClient implements JedisClient {
         return jedis.hmget(key, fields);
     }
 
+    @Override
+    public void hset(byte[] key, Map<byte[], byte[]> hash) {
+        commands.add(commandObjects.hset(key, hash));
+    }
+
+    @Override
+    public List<byte[]> hmget(byte[] key, byte[]... fields) {
+        return jedis.hmget(key, fields);
+    }
+
+    @Override
+    public void hdel(byte[] key, byte[]... fields) {
+        commands.add(commandObjects.hdel(key, fields));
+    }
+
     @Override
     public void rpush(String key, String... string) {
         commands.add(commandObjects.rpush(key, string));
@@ -86,6 +101,16 @@ public class JedisMasterClient implements JedisClient {
         commands.add(commandObjects.set(key, value));
     }
 
+    @Override
+    public byte[] get(byte[] key) {
+        return jedis.get(key);
+    }
+
+    @Override
+    public void set(byte[] key, byte[] value) {
+        commands.add(commandObjects.set(key, value));
+    }
+
     @Override
     public void lpush(String key, String... string) {
         commands.add(commandObjects.lpush(key, string));
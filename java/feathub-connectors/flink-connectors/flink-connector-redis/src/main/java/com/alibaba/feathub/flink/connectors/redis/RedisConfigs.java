@@ -85,10 +85,40 @@ public class RedisConfigs {
                                     + "containing the hashes needs to be acquired. If a map-typed column does not "
                                     + "appear in the map, all hashes corresponding to the map would be acquired.");
 
+    public static final ConfigOption<ValueEncoding> VALUE_ENCODING =
+            ConfigOptions.key("valueEncoding")
+                    .enumType(ValueEncoding.class)
+                    .defaultValue(ValueEncoding.TEXT)
+                    .withDescription(
+                            "The encoding of feature values in Redis. TEXT saves values as UTF-8 "
+                                    + "strings, lists and hashes. BINARY saves each value as one "
+                                    + "compact little-endian binary string.");
+
+    public static final ConfigOption<StorageLayout> STORAGE_LAYOUT =
+            ConfigOptions.key("storageLayout")
+                    .enumType(StorageLayout.class)
+                    .defaultValue(StorageLayout.KEY_PER_FEATURE)
+                    .withDescription(
+                            "The layout of feature values in Redis. KEY_PER_FEATURE saves each "
+                                    + "feature of a row under its own key. HASH_PER_ROW saves "
+                                    + "all features of a row as the fields of one hash.");
+
     /** Supported Redis deployment modes. */
     public enum RedisMode {
         STANDALONE,
         MASTER_SLAVE,
         CLUSTER,
     }
+
+    /** Supported encodings of feature values in Redis. */
+    public enum ValueEncoding {
+        TEXT,
+        BINARY,
+    }
+
+    /** Supported layouts of feature values in Redis. */
+    public enum StorageLayout {
+        KEY_PER_FEATURE,
+        HASH_PER_ROW,
+    }
 }
@@ -37,7 +37,9 @@ import static com.alibaba.feathub.flink.connectors.redis.RedisConfigs.KEY_FIELDS
 import static com.alibaba.feathub.flink.connectors.redis.RedisConfigs.PASSWORD;
 import static com.alibaba.feathub.flink.connectors.redis.RedisConfigs.PORT;
 import static com.alibaba.feathub.flink.connectors.redis.RedisConfigs.REDIS_MODE;
+import static com.alibaba.feathub.flink.connectors.redis.RedisConfigs.STORAGE_LAYOUT;
 import static com.alibaba.feathub.flink.connectors.redis.RedisConfigs.USERNAME;
+import static com.alibaba.feathub.flink.connectors.redis.RedisConfigs.VALUE_ENCODING;
 
 /** The table factory for {@link RedisLookupTableSource} and {@link RedisDynamicTableSink}. */
 public class RedisDynamicTableFactory
@@ -83,6 +85,8 @@ public class RedisDynamicTableFactory
         options.add(KEY_FIELDS);
         options.add(ENABLE_HASH_PARTIAL_UPDATE);
         options.add(HASH_FIELDS);
+        options.add(VALUE_ENCODING);
+        options.add(STORAGE_LAYOUT);
         return options;
     }
 }
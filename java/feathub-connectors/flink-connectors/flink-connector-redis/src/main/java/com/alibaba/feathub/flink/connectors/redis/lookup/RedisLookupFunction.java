@@ -33,19 +33,25 @@ import org.apache.flink.shaded.jackson2.com.fasterxml.jackson.core.type.TypeRefe
 
 import com.alibaba.feathub.flink.connectors.redis.ConversionUtils;
 import com.alibaba.feathub.flink.connectors.redis.JedisClient;
+import com.alibaba.feathub.flink.connectors.redis.RedisConfigs.StorageLayout;
+import com.alibaba.feathub.flink.connectors.redis.RedisConfigs.ValueEncoding;
 
 import java.io.IOException;
+import java.nio.charset.StandardCharsets;
 import java.util.ArrayList;
 import java.util.Arrays;
 import java.util.Collection;
 import java.util.Collections;
 import java.util.HashMap;
+import java.util.LinkedHashMap;
 import java.util.List;
 import java.util.Map;
 
 import static com.alibaba.feathub.flink.connectors.redis.ConversionUtils.OBJECT_MAPPER;
 import static com.alibaba.feathub.flink.connectors.redis.RedisConfigs.HASH_FIELDS;
 import static com.alibaba.feathub.flink.connectors.redis.RedisConfigs.KEY_FIELDS;
+import static com.alibaba.feathub.flink.connectors.redis.RedisConfigs.STORAGE_LAYOUT;
+import static com.alibaba.feathub.flink.connectors.redis.RedisConfigs.VALUE_ENCODING;
 
 /**
  * A {@link org.apache.flink.streaming.api.functions.source.SourceFunction} used to query a Redis
@@ -69,6 +75,10 @@ import static com.alibaba.feathub.flink.connectors.redis.RedisConfigs.KEY_FIELDS
  * by directly passing the values from input row. The feature fields would be fulfilled by querying
  * against the Redis database, where the keys in the queries comes from the corresponding physical
  * key fields.
+ *
+ * <p>With the HASH_PER_ROW storage layout, the feature fields sharing the same physical key are
+ * read from the fields of one Redis hash with one query, whose field names are the names of the
+ * feature fields.
  */
 public class RedisLookupFunction extends LookupFunction {
 
@@ -82,6 +92,12 @@ public class RedisLookupFunction extends LookupFunction {
 
     private final String[][] hashFields;
 
+    private final ValueEncoding valueEncoding;
+
+    private final StorageLayout storageLayout;
+
+    private final byte[][] featureFieldNames;
+
     private transient JedisClient client;
 
     private transient RowData.FieldGetter[] logicalKeyGetters;
@@ -94,6 +110,15 @@ public class RedisLookupFunction extends LookupFunction {
         this.featureFieldIndices = getFeatureFieldIndices(schema, config);
         this.physicalKeyFieldIndices = getPhysicalKeyFieldIndices(schema, featureFieldIndices);
         this.fieldDataTypes = schema.getColumnDataTypes().toArray(new DataType[0]);
+        this.valueEncoding = config.get(VALUE_ENCODING);
+        this.storageLayout = config.get(STORAGE_LAYOUT);
+        this.featureFieldNames = new byte[featureFieldIndices.length][];
+        for (int i = 0; i < featureFieldIndices.length; i++) {
+            featureFieldNames[i] =
+                    schema.getColumnNames()
+                            .get(featureFieldIndices[i])
+                            .getBytes(StandardCharsets.UTF_8);
+        }
         if (config.get(HASH_FIELDS) == null) {
             this.hashFields = null;
         } else {
@@ -142,6 +167,11 @@ public class RedisLookupFunction extends LookupFunction {
                     logicalKeyFieldIndices[i], logicalKeyGetters[i].getFieldOrNull(rowData));
         }
 
+        if (storageLayout == StorageLayout.HASH_PER_ROW) {
+            lookupHashPerRow(rowData, result);
+            return Collections.singletonList(result);
+        }
+
         for (int i = 0; i < featureFieldIndices.length; i++) {
             result.setField(
                     physicalKeyFieldIndices[i], physicalKeyGetters[i].getFieldOrNull(rowData));
@@ -153,7 +183,13 @@ public class RedisLookupFunction extends LookupFunction {
                             fieldDataTypes[physicalKeyFieldIndices[i]]);
             int valueFieldIndex = featureFieldIndices[i];
             DataType valueType = fieldDataTypes[valueFieldIndex];
-            if (valueType instanceof CollectionDataType) {
+            if (valueEncoding == ValueEncoding.BINARY) {
+                byte[] redisData = client.get(key.getBytes(StandardCharsets.UTF_8));
+                if (redisData == null) {
+                    continue;
+                }
+                result.setField(valueFieldIndex, ConversionUtils.fromBytes(redisData, valueType));
+            } else if (valueType instanceof CollectionDataType) {
                 List<String> redisData = client.lrange(key, 0, -1);
                 if (redisData.isEmpty()) {
                     continue;
@@ -191,6 +227,53 @@ public class RedisLookupFunction extends LookupFunction {
         return Collections.singletonList(result);
     }
 
+    /**
+     * Fills the feature fields of the result with the fields of the Redis hashes under their
+     * physical keys. Feature fields sharing the same physical key are read with one query.
+     */
+    private void lookupHashPerRow(RowData rowData, GenericRowData result) throws IOException {
+        Map<String, List<Integer>> featuresByKey = new LinkedHashMap<>();
+        for (int i = 0; i < featureFieldIndices.length; i++) {
+            result.setField(
+                    physicalKeyFieldIndices[i], physicalKeyGetters[i].getFieldOrNull(rowData));
+
+            String key =
+                    ConversionUtils.toString(
+                            rowData,
+                            i + logicalKeyFieldIndices.length,
+                            fieldDataTypes[physicalKeyFieldIndices[i]]);
+            featuresByKey.computeIfAbsent(key, k -> new ArrayList<>()).add(i);
+        }
+
+        for (Map.Entry<String, List<Integer>> entry : featuresByKey.entrySet()) {
+            List<Integer> indices = entry.getValue();
+            byte[][] fields = new byte[indices.size()][];
+            for (int j = 0; j < indices.size(); j++) {
+                fields[j] = featureFieldNames[indices.get(j)];
+            }
+
+            List<byte[]> values =
+                    client.hmget(entry.getKey().getBytes(StandardCharsets.UTF_8), fields);
+            for (int j = 0; j < indices.size(); j++) {
+                int valueFieldIndex = featureFieldIndices[indices.get(j)];
+                result.setField(
+                        valueFieldIndex,
+                        fromHashFieldValue(values.get(j), fieldDataTypes[valueFieldIndex]));
+            }
+        }
+    }
+
+    private Object fromHashFieldValue(byte[] value, DataType dataType) throws IOException {
+        if (value == null) {
+            return null;
+        }
+
+        if (valueEncoding == ValueEncoding.BINARY) {
+            return ConversionUtils.fromBytes(value, dataType);
+        }
+        return ConversionUtils.fromString(new String(value, StandardCharsets.UTF_8), dataType);
+    }
+
     @Override
     public void close() throws Exception {
         super.close();
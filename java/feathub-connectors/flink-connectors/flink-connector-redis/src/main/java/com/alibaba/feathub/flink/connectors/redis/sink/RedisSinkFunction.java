@@ -30,15 +30,22 @@ import org.apache.flink.shaded.jackson2.com.fasterxml.jackson.core.JsonProcessin
 
 import com.alibaba.feathub.flink.connectors.redis.ConversionUtils;
 import com.alibaba.feathub.flink.connectors.redis.JedisClient;
+import com.alibaba.feathub.flink.connectors.redis.RedisConfigs.StorageLayout;
+import com.alibaba.feathub.flink.connectors.redis.RedisConfigs.ValueEncoding;
 
+import java.nio.charset.StandardCharsets;
 import java.util.ArrayList;
+import java.util.HashMap;
 import java.util.HashSet;
+import java.util.LinkedHashMap;
 import java.util.List;
 import java.util.Map;
 import java.util.Objects;
 import java.util.Set;
 
 import static com.alibaba.feathub.flink.connectors.redis.RedisConfigs.ENABLE_HASH_PARTIAL_UPDATE;
+import static com.alibaba.feathub.flink.connectors.redis.RedisConfigs.STORAGE_LAYOUT;
+import static com.alibaba.feathub.flink.connectors.redis.RedisConfigs.VALUE_ENCODING;
 
 /**
  * A {@link org.apache.flink.streaming.api.functions.sink.SinkFunction} that writes to a Redis
@@ -50,6 +57,9 @@ import static com.alibaba.feathub.flink.connectors.redis.RedisConfigs.ENABLE_HAS
  * in the input row would be saved as an individual entry into Redis. The value of the entry is the
  * value of this field, and the key of the entry is the value of the corresponding field starting
  * with "__KEY__".
+ *
+ * <p>With the HASH_PER_ROW storage layout, the fields sharing the same key are saved as the fields
+ * of one Redis hash instead, whose field names are the names of the input fields.
  */
 public class RedisSinkFunction extends RichSinkFunction<RowData> {
 
@@ -61,6 +71,12 @@ public class RedisSinkFunction extends RichSinkFunction<RowData> {
 
     private final boolean enableHashPartialUpdate;
 
+    private final ValueEncoding valueEncoding;
+
+    private final StorageLayout storageLayout;
+
+    private final byte[][] valueFieldNames;
+
     private transient JedisClient client;
 
     public RedisSinkFunction(ReadableConfig config, ResolvedSchema schema) {
@@ -70,6 +86,19 @@ public class RedisSinkFunction extends RichSinkFunction<RowData> {
         this.valueFieldIndices = getValueFieldIndices(schema);
         this.keyFieldIndices = getKeyFieldIndices(schema, valueFieldIndices);
         this.enableHashPartialUpdate = config.get(ENABLE_HASH_PARTIAL_UPDATE);
+        this.valueEncoding = config.get(VALUE_ENCODING);
+        this.storageLayout = config.get(STORAGE_LAYOUT);
+        this.valueFieldNames = new byte[valueFieldIndices.length][];
+        for (int i = 0; i < valueFieldIndices.length; i++) {
+            valueFieldNames[i] =
+                    schema.getColumnNames()
+                            .get(valueFieldIndices[i])
+                            .getBytes(StandardCharsets.UTF_8);
+        }
+
+        Preconditions.checkArgument(
+                !(enableHashPartialUpdate && storageLayout == StorageLayout.HASH_PER_ROW),
+                "Hash partial update is not supported with the HASH_PER_ROW storage layout.");
 
         Preconditions.checkArgument(
                 schema.getColumnCount() % 2 == 0,
@@ -89,6 +118,16 @@ public class RedisSinkFunction extends RichSinkFunction<RowData> {
 
     @Override
     public void invoke(RowData data, Context context) throws JsonProcessingException {
+        if (storageLayout == StorageLayout.HASH_PER_ROW) {
+            invokeWithHashPerRow(data);
+            return;
+        }
+
+        if (valueEncoding == ValueEncoding.BINARY) {
+            invokeWithBinaryEncoding(data);
+            return;
+        }
+
         for (int i = 0; i < valueFieldIndices.length; i++) {
             String key = data.getString(keyFieldIndices[i]).toString();
             int valueFieldIndex = valueFieldIndices[i];
@@ -170,6 +209,66 @@ public class RedisSinkFunction extends RichSinkFunction<RowData> {
         client.flush();
     }
 
+    /** Saves each feature value as one Redis string in the binary value encoding. */
+    private void invokeWithBinaryEncoding(RowData data) {
+        for (int i = 0; i < valueFieldIndices.length; i++) {
+            String key = data.getString(keyFieldIndices[i]).toString();
+            int valueFieldIndex = valueFieldIndices[i];
+            byte[] value =
+                    ConversionUtils.toBytes(data, valueFieldIndex, fieldTypes[valueFieldIndex]);
+            if (value == null) {
+                client.del(key);
+            } else {
+                client.set(key.getBytes(StandardCharsets.UTF_8), value);
+            }
+        }
+
+        client.flush();
+    }
+
+    /**
+     * Saves the feature values of a row as the fields of the Redis hashes under their keys. Values
+     * sharing the same key are written with one command.
+     */
+    private void invokeWithHashPerRow(RowData data) throws JsonProcessingException {
+        Map<String, Map<byte[], byte[]>> fieldsToSet = new LinkedHashMap<>();
+        Map<String, List<byte[]>> fieldsToDelete = new LinkedHashMap<>();
+        for (int i = 0; i < valueFieldIndices.length; i++) {
+            String key = data.getString(keyFieldIndices[i]).toString();
+            byte[] value = toHashFieldValue(data, valueFieldIndices[i]);
+            if (value == null) {
+                fieldsToDelete
+                        .computeIfAbsent(key, k -> new ArrayList<>())
+                        .add(valueFieldNames[i]);
+            } else {
+                fieldsToSet
+                        .computeIfAbsent(key, k -> new HashMap<>())
+                        .put(valueFieldNames[i], value);
+            }
+        }
+
+        for (Map.Entry<String, List<byte[]>> entry : fieldsToDelete.entrySet()) {
+            client.hdel(
+                    entry.getKey().getBytes(StandardCharsets.UTF_8),
+                    entry.getValue().toArray(new byte[0][]));
+        }
+
+        for (Map.Entry<String, Map<byte[], byte[]>> entry : fieldsToSet.entrySet()) {
+            client.hset(entry.getKey().getBytes(StandardCharsets.UTF_8), entry.getValue());
+        }
+
+        client.flush();
+    }
+
+    private byte[] toHashFieldValue(RowData data, int index) throws JsonProcessingException {
+        if (valueEncoding == ValueEncoding.BINARY) {
+            return ConversionUtils.toBytes(data, index, fieldTypes[index]);
+        }
+
+        String value = ConversionUtils.toString(data, index, fieldTypes[index]);
+        return value == null ? null : value.getBytes(StandardCharsets.UTF_8);
+    }
+
     @Override
     public void close() {
         // TODO: Remove the registered script from Redis when Redis supports removing a certain
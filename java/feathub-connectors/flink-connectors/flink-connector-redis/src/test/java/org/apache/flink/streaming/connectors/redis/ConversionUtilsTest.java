@@ -16,6 +16,7 @@
 
 package org.apache.flink.streaming.connectors.redis;
 
+import org.apache.flink.api.java.tuple.Tuple2;
 import org.apache.flink.api.java.tuple.Tuple3;
 import org.apache.flink.table.api.DataTypes;
 import org.apache.flink.table.data.ArrayData;
@@ -24,6 +25,7 @@ import org.apache.flink.table.data.GenericMapData;
 import org.apache.flink.table.data.GenericRowData;
 import org.apache.flink.table.data.MapData;
 import org.apache.flink.table.data.StringData;
+import org.apache.flink.table.data.TimestampData;
 import org.apache.flink.table.types.CollectionDataType;
 import org.apache.flink.table.types.DataType;
 import org.apache.flink.table.types.KeyValueDataType;
@@ -188,4 +190,48 @@ public class ConversionUtilsTest {
             assertThat(ConversionUtils.fromString(null, dataType)).isNull();
         }
     }
+
+    @Test
+    public void testBinaryEncoding() {
+        List<Tuple2<DataType, Object>> testData =
+                Arrays.asList(
+                        Tuple2.of(DataTypes.STRING(), StringData.fromString("foobar")),
+                        Tuple2.of(DataTypes.BYTES(), "foobar".getBytes()),
+                        Tuple2.of(DataTypes.BOOLEAN(), true),
+                        Tuple2.of(DataTypes.INT(), 1),
+                        Tuple2.of(DataTypes.BIGINT(), 1L),
+                        Tuple2.of(DataTypes.DOUBLE(), 1.0),
+                        Tuple2.of(DataTypes.FLOAT(), 1.0f),
+                        Tuple2.of(DataTypes.TIMESTAMP(3), TimestampData.fromEpochMillis(1000L)),
+                        Tuple2.of(
+                                DataTypes.ARRAY(DataTypes.DOUBLE()),
+                                new GenericArrayData(new Object[] {1.0, null, 3.0})),
+                        Tuple2.of(
+                                DataTypes.ARRAY(DataTypes.STRING()),
+                                new GenericArrayData(
+                                        new Object[] {StringData.fromString("a"), null})),
+                        Tuple2.of(
+                                DataTypes.MAP(
+                                        DataTypes.STRING(), DataTypes.ARRAY(DataTypes.BIGINT())),
+                                new GenericMapData(
+                                        new HashMap<Object, Object>() {
+                                            {
+                                                put(
+                                                        StringData.fromString("a"),
+                                                        new GenericArrayData(
+                                                                new Object[] {1L, 2L}));
+                                                put(StringData.fromString("b"), null);
+                                            }
+                                        })));
+
+        for (Tuple2<DataType, Object> tuple2 : testData) {
+            GenericRowData rowData = new GenericRowData(1);
+            rowData.setField(0, tuple2.f1);
+            byte[] bytes = ConversionUtils.toBytes(rowData, 0, tuple2.f0);
+            assertThat(ConversionUtils.fromBytes(bytes, tuple2.f0)).isEqualTo(tuple2.f1);
+
+            assertThat(ConversionUtils.toBytes(new GenericRowData(1), 0, tuple2.f0)).isNull();
+            assertThat(ConversionUtils.fromBytes(null, tuple2.f0)).isNull();
+        }
+    }
 }
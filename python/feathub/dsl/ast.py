@@ -50,6 +50,31 @@ class ExprAST(ABC):
     def __init__(self, node_type: str) -> None:
         self.node_type = node_type
 
+    def __setattr__(self, key: str, value: Any) -> None:
+        if self.__dict__.get("_frozen", False):
+            raise FeathubException(
+                f"Cannot set attribute {key} of {self.node_type}, because the AST "
+                f"is frozen."
+            )
+        super().__setattr__(key, value)
+
+    def freeze(self) -> None:
+        """
+        Makes this node and all its descendants immutable, so that the AST can be
+        safely shared, e.g. cached by the parser.
+        """
+        if self.__dict__.get("_frozen", False):
+            return
+        for key, value in list(self.__dict__.items()):
+            if isinstance(value, ExprAST):
+                value.freeze()
+            elif isinstance(value, list):
+                for item in value:
+                    if isinstance(item, ExprAST):
+                        item.freeze()
+                self.__dict__[key] = tuple(value)
+        self.__dict__["_frozen"] = True
+
     @abstractmethod
     def to_json(self) -> Dict:
         """
@@ -129,7 +154,7 @@ class UminusOp(AbstractUnaryOp):
     def to_json(self) -> Dict:
         return {
             "node_type": "UminusOp",
-            "child": self.child,
+            "child": self.child.to_json(),
         }
 
 
@@ -246,7 +271,7 @@ class GroupNode(AbstractUnaryOp):
         return self.child.eval_dtype(variable_types)
 
     def to_json(self) -> Dict:
-        return {"node_type": "GroupNode", "child": self.child}
+        return {"node_type": "GroupNode", "child": self.child.to_json()}
 
 
 class NullNode(ExprAST):
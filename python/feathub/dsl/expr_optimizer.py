@@ -0,0 +1,401 @@
+# Copyright 2022 The FeatHub Authors
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+import re
+from typing import Any, Dict, List, Optional
+
+from feathub.common.types import DType, Bool, get_type_by_name
+from feathub.dsl.ast import (
+    ExprAST,
+    ArgListNode,
+    BinaryOp,
+    BracketOp,
+    CaseOp,
+    CastOp,
+    CompareOp,
+    FuncCallOp,
+    GroupNode,
+    IsOp,
+    LogicalOp,
+    NullNode,
+    UminusOp,
+    ValueNode,
+    VariableNode,
+)
+
+_INT32_MIN = -(2**31)
+_INT32_MAX = 2**31 - 1
+
+_INTEGER_REGEX = re.compile(r"-?[0-9]+")
+
+# The cast types whose casts are eliminated if the operand is known to be of the type
+# in all processors.
+_ELIMINABLE_CAST_TYPES = {"STRING", "INTEGER", "BIGINT", "FLOAT", "DOUBLE", "BOOLEAN"}
+
+# The nodes whose textual form in SQL is self-delimited, thus do not need to be
+# enclosed in parentheses.
+_SELF_DELIMITED_NODES = (
+    VariableNode,
+    NullNode,
+    FuncCallOp,
+    CastOp,
+    CaseOp,
+    BracketOp,
+    GroupNode,
+)
+
+
+def optimize_expr(
+    ast: ExprAST, variable_types: Optional[Dict[str, DType]] = None
+) -> ExprAST:
+    """
+    Rewrites the given AST into an equivalent AST which is cheaper to evaluate. The
+    rewrite folds constant sub-expressions, simplifies boolean expressions with
+    constant operands, prunes the branches of CASE whose conditions are constant,
+    eliminates casts whose operands are casts or boolean expressions of the target
+    type and removes redundant parentheses.
+
+    The rewrites are valid under the semantics of all processors, so the result can
+    be evaluated by any AST evaluator. Constants are only folded if the folded value
+    has the same type and value in Python, Flink SQL and Spark SQL.
+
+    :param ast: The AST to optimize. It is not modified.
+    :param variable_types: Map from variable name to its type. The rewrites that
+                           depend on the type of a sub-expression are skipped if the
+                           type cannot be derived from the given variable types.
+    :return: The optimized AST, which is frozen.
+    """
+    optimizer = _ExprOptimizer({} if variable_types is None else variable_types)
+    result = optimizer.optimize(ast)
+
+    # Parentheses enclosing the whole expression are redundant.
+    while isinstance(result, GroupNode):
+        result = result.child
+
+    result.freeze()
+    return result
+
+
+class _ExprOptimizer:
+    def __init__(self, variable_types: Dict[str, DType]):
+        self.variable_types = variable_types
+
+    def optimize(self, ast: ExprAST) -> ExprAST:
+        if isinstance(ast, GroupNode):
+            return self._optimize_group_node(ast)
+        if isinstance(ast, UminusOp):
+            return self._optimize_uminus_op(ast)
+        if isinstance(ast, BinaryOp):
+            return self._optimize_binary_op(ast)
+        if isinstance(ast, CompareOp):
+            return self._optimize_compare_op(ast)
+        if isinstance(ast, LogicalOp):
+            return self._optimize_logical_op(ast)
+        if isinstance(ast, IsOp):
+            return self._optimize_is_op(ast)
+        if isinstance(ast, CastOp):
+            return self._optimize_cast_op(ast)
+        if isinstance(ast, CaseOp):
+            return self._optimize_case_op(ast)
+        if isinstance(ast, FuncCallOp):
+            return self._optimize_func_call_op(ast)
+        if isinstance(ast, BracketOp):
+            left_child = self.optimize(ast.left_child)
+            right_child = self.optimize(ast.right_child)
+            if left_child is ast.left_child and right_child is ast.right_child:
+                return ast
+            return BracketOp(left_child, right_child)
+        return ast
+
+    def _optimize_group_node(self, ast: GroupNode) -> ExprAST:
+        child = self.optimize(ast.child)
+        if _is_self_delimited(child):
+            return child
+        if child is ast.child:
+            return ast
+        return GroupNode(child)
+
+    def _optimize_uminus_op(self, ast: UminusOp) -> ExprAST:
+        child = self.optimize(ast.child)
+        value = _get_number(child)
+        if value is not None and (not isinstance(value, int) or _is_int32(-value)):
+            return _to_value_node(-value)
+        if child is ast.child:
+            return ast
+        return UminusOp(child)
+
+    def _optimize_binary_op(self, ast: BinaryOp) -> ExprAST:
+        left_child = self.optimize(ast.left_child)
+        right_child = self.optimize(ast.right_child)
+
+        # Only integer arithmetic without division is folded, as the division and
+        # the floating-point literals have different semantics among processors.
+        left_value = _get_int(left_child)
+        right_value = _get_int(right_child)
+        if left_value is not None and right_value is not None:
+            result = None
+            if ast.op_type == "+":
+                result = left_value + right_value
+            elif ast.op_type == "-":
+                result = left_value - right_value
+            elif ast.op_type == "*":
+                result = left_value * right_value
+            if result is not None and _is_int32(result):
+                return _to_value_node(result)
+
+        if left_child is ast.left_child and right_child is ast.right_child:
+            return ast
+        return BinaryOp(ast.op_type, left_child, right_child)
+
+    def _optimize_compare_op(self, ast: CompareOp) -> ExprAST:
+        left_child = self.optimize(ast.left_child)
+        right_child = self.optimize(ast.right_child)
+
+        left_value = _get_int(left_child)
+        right_value = _get_int(right_child)
+        if left_value is not None and right_value is not None:
+            return ValueNode(_compare(ast.op_type, left_value, right_value))
+
+        # Strings are only compared for equality, as their ordering depends on the
+        # collation of each processor.
+        left_str = _get_str(left_child)
+        right_str = _get_str(right_child)
+        if left_str is not None and right_str is not None:
+            if ast.op_type == "=":
+                return ValueNode(left_str == right_str)
+            if ast.op_type == "<>":
+                return ValueNode(left_str != right_str)
+
+        if left_child is ast.left_child and right_child is ast.right_child:
+            return ast
+        return CompareOp(ast.op_type, left_child, right_child)
+
+    def _optimize_logical_op(self, ast: LogicalOp) -> ExprAST:
+        left_child = self.optimize(ast.left_child)
+        right_child = self.optimize(ast.right_child)
+        left_value = _get_bool(left_child)
+        right_value = _get_bool(right_child)
+
+        # A constant operand is only removed if the result is the same for all the
+        # values of the other operand, including NULL, under the three-valued logic
+        # of SQL as well as the Python semantics of LocalProcessor. As Python returns
+        # the left operand of "and" and "or" as is, the rewrites with a constant right
+        # operand also require the left operand to be boolean.
+        is_left_bool = right_value is not None and self._get_dtype(left_child) == Bool
+        if ast.op_type == "AND":
+            if left_value is True:
+                return right_child
+            if left_value is False or (right_value is True and is_left_bool):
+                return left_child
+        elif ast.op_type == "OR":
+            if left_value is True:
+                return left_child
+            if left_value is False or (right_value is True and is_left_bool):
+                return right_child
+
+        if left_child is ast.left_child and right_child is ast.right_child:
+            return ast
+        return LogicalOp(ast.op_type, left_child, right_child)
+
+    def _optimize_is_op(self, ast: IsOp) -> ExprAST:
+        left_child = self.optimize(ast.left_child)
+        if isinstance(left_child, NullNode):
+            return ValueNode(not ast.is_not)
+        if isinstance(left_child, ValueNode) and not isinstance(
+            left_child.value, float
+        ):
+            return ValueNode(ast.is_not)
+
+        if left_child is ast.left_child:
+            return ast
+        return IsOp(left_child, ast.right_child, ast.is_not)
+
+    def _optimize_cast_op(self, ast: CastOp) -> ExprAST:
+        child = self.optimize(ast.child)
+
+        if isinstance(child, ValueNode) and not isinstance(child.value, bool):
+            value = child.value
+            if ast.type_name == "STRING" and isinstance(value, (str, int)):
+                return ValueNode(str(value))
+            if ast.type_name == "INTEGER":
+                if isinstance(value, str) and _INTEGER_REGEX.fullmatch(value):
+                    value = int(value)
+                if isinstance(value, int) and _is_int32(value):
+                    return _to_value_node(value)
+
+        if ast.type_name in _ELIMINABLE_CAST_TYPES:
+            child_type = _get_cast_operand_dtype(child)
+            if child_type is not None and child_type == get_type_by_name(ast.type_name):
+                return _enclose(child)
+
+        if child is ast.child:
+            return ast
+        return CastOp(child, ast.type_name, ast.exception_on_failure)
+
+    def _optimize_case_op(self, ast: CaseOp) -> ExprAST:
+        all_conditions = [self.optimize(x) for x in ast.conditions]
+        all_results = [self.optimize(x) for x in ast.results]
+        all_default = self.optimize(ast.default)
+        optimized_case = CaseOp(all_conditions, all_results, all_default)
+        if (
+            all(x is y for x, y in zip(all_conditions, ast.conditions))
+            and all(x is y for x, y in zip(all_results, ast.results))
+            and all_default is ast.default
+        ):
+            optimized_case = ast
+
+        conditions: List[ExprAST] = []
+        results: List[ExprAST] = []
+        default = all_default
+        for condition, result in zip(all_conditions, all_results):
+            condition_value = _get_bool(condition)
+            if condition_value is False:
+                continue
+            if condition_value is True:
+                # The branches following a branch which is always taken are dead.
+                default = result
+                break
+            conditions.append(condition)
+            results.append(result)
+
+        if len(conditions) == len(all_conditions):
+            return optimized_case
+
+        if conditions:
+            pruned: ExprAST = CaseOp(conditions, results, default)
+        elif not isinstance(default, NullNode):
+            pruned = _enclose(default)
+        else:
+            # An untyped NULL is not a valid expression in some processors.
+            return optimized_case
+
+        # The branches are only pruned if it does not change the type of the result.
+        case_type = self._get_dtype(optimized_case)
+        if case_type is None or case_type != self._get_dtype(pruned):
+            return optimized_case
+        return pruned
+
+    def _optimize_func_call_op(self, ast: FuncCallOp) -> ExprAST:
+        args = [self.optimize(x) for x in ast.args.values]
+        values = [_get_str(x) for x in args]
+
+        if values and all(x is not None for x in values):
+            if ast.func_name == "CONCAT":
+                return ValueNode("".join(values))
+            if ast.func_name == "LOWER" and len(values) == 1 and values[0].isascii():
+                return ValueNode(values[0].lower())
+
+        if all(x is y for x, y in zip(args, ast.args.values)):
+            return ast
+        return FuncCallOp(ast.func_name, ArgListNode(args))
+
+    def _get_dtype(self, ast: ExprAST) -> Optional[DType]:
+        try:
+            return ast.eval_dtype(self.variable_types)
+        except Exception:
+            return None
+
+
+def _is_self_delimited(ast: ExprAST) -> bool:
+    if isinstance(ast, ValueNode):
+        # Negative numbers are enclosed to avoid producing e.g. "a --1", where "--"
+        # starts a comment in SQL.
+        return not isinstance(ast.value, (int, float)) or ast.value >= 0
+    return isinstance(ast, _SELF_DELIMITED_NODES)
+
+
+def _enclose(ast: ExprAST) -> ExprAST:
+    """
+    Encloses the given AST in parentheses if needed, so that it can replace a
+    self-delimited node without changing the precedence of the operators.
+    """
+    if _is_self_delimited(ast):
+        return ast
+    return GroupNode(ast)
+
+
+def _to_value_node(value: Any) -> ExprAST:
+    return _enclose(ValueNode(value))
+
+
+def _unwrap(ast: ExprAST) -> ExprAST:
+    while isinstance(ast, GroupNode):
+        ast = ast.child
+    return ast
+
+
+def _get_cast_operand_dtype(ast: ExprAST) -> Optional[DType]:
+    """
+    Returns the type of the given operand of a cast if it is the same in all
+    processors, which is the case for casts and boolean expressions. The types of
+    literals and variables are not used, as e.g. 0.1 is a DOUBLE in Python but a
+    DECIMAL in Flink SQL and Spark SQL, and the values of a variable might not be
+    of its declared type in LocalProcessor.
+    """
+    ast = _unwrap(ast)
+    if isinstance(ast, CastOp):
+        return get_type_by_name(ast.type_name)
+    if isinstance(ast, (CompareOp, LogicalOp, IsOp)):
+        return Bool
+    return None
+
+
+def _get_bool(ast: ExprAST) -> Optional[bool]:
+    ast = _unwrap(ast)
+    if isinstance(ast, ValueNode) and isinstance(ast.value, bool):
+        return ast.value
+    return None
+
+
+def _get_int(ast: ExprAST) -> Optional[int]:
+    ast = _unwrap(ast)
+    if (
+        isinstance(ast, ValueNode)
+        and isinstance(ast.value, int)
+        and not isinstance(ast.value, bool)
+        and _is_int32(ast.value)
+    ):
+        return ast.value
+    return None
+
+
+def _get_number(ast: ExprAST) -> Optional[Any]:
+    ast = _unwrap(ast)
+    if isinstance(ast, ValueNode) and isinstance(ast.value, float):
+        return ast.value
+    return _get_int(ast)
+
+
+def _get_str(ast: ExprAST) -> Optional[str]:
+    ast = _unwrap(ast)
+    if isinstance(ast, ValueNode) and isinstance(ast.value, str):
+        return ast.value
+    return None
+
+
+def _is_int32(value: int) -> bool:
+    return _INT32_MIN <= value <= _INT32_MAX
+
+
+def _compare(op_type: str, left_value: Any, right_value: Any) -> bool:
+    if op_type == "<":
+        return left_value < right_value
+    if op_type == "<=":
+        return left_value <= right_value
+    if op_type == ">":
+        return left_value > right_value
+    if op_type == ">=":
+        return left_value >= right_value
+    if op_type == "=":
+        return left_value == right_value
+    return left_value != right_value
@@ -12,8 +12,9 @@
 #  See the License for the specific language governing permissions and
 #  limitations under the License.
 
-import logging
-from typing import Any
+import threading
+from collections import OrderedDict
+from typing import Any, Optional
 
 from ply import lex, yacc
 
@@ -38,12 +39,28 @@ from feathub.dsl.ast import (
 from feathub.dsl.expr_lexer_rules import ExprLexerRules
 
 
+# The module containing the pre-generated LALR parsing tables of ExprParser. PLY
+# verifies the signature of the tables against the grammar and falls back to
+# generating the tables in memory if they are stale. The module should be regenerated
+# with `python -m feathub.dsl.expr_parser` whenever the grammar is changed.
+_PARSE_TABLE_MODULE = "feathub.dsl.expr_parsetab"
+
+DEFAULT_PARSE_CACHE_SIZE = 4096
+
+
 class ExprParser:
     """
     Expr Parser parses the FeatHub expression and builds the Abstract Syntax Tree(AST).
     The AST will be further evaluated by the AST evaluator of each Processor.
+
+    Parsed ASTs are cached in a bounded LRU cache keyed by the expression string. The
+    ASTs returned by the parser are frozen and may be shared among callers. Use
+    ExprParser.get_instance() to get the parser shared within the process.
     """
 
+    INSTANCE: Optional["ExprParser"] = None
+    _INSTANCE_LOCK = threading.Lock()
+
     precedence = (
         ("left", "OR"),
         ("left", "AND"),
@@ -53,18 +70,40 @@ class ExprParser:
         ("right", "UMINUS"),
     )
 
-    def __init__(self, **kwargs: Any) -> None:
-        logging.basicConfig(
-            level=logging.DEBUG,
-            filename=".parser.out",
-            filemode="w",
-            format="%(filename)10s:%(lineno)4d:%(message)s",
-        )
-        log = logging.getLogger()
+    def __init__(
+        self, cache_size: int = DEFAULT_PARSE_CACHE_SIZE, **kwargs: Any
+    ) -> None:
+        """
+        :param cache_size: The maximum number of parsed expressions kept in the cache.
+                           The cache is disabled if it is 0.
+        :param kwargs: The keyword arguments used to build the PLY lexer.
+        """
         feathub_expr_lexer_rules = ExprLexerRules()
         self.lexer = lex.lex(module=feathub_expr_lexer_rules, **kwargs)
         self.tokens = feathub_expr_lexer_rules.tokens
-        self.yacc = yacc.yacc(module=self, write_tables=False, debuglog=log)
+        self.yacc = yacc.yacc(
+            module=self,
+            tabmodule=_PARSE_TABLE_MODULE,
+            write_tables=False,
+            debug=False,
+        )
+        self.cache_size = cache_size
+
+        # The PLY lexer and parser are stateful, thus parsing is serialized.
+        self._parse_lock = threading.Lock()
+        self._cache_lock = threading.Lock()
+        self._cache: "OrderedDict[str, ExprAST]" = OrderedDict()
+
+    @staticmethod
+    def get_instance() -> "ExprParser":
+        """
+        Returns the ExprParser shared within the process.
+        """
+        if ExprParser.INSTANCE is None:
+            with ExprParser._INSTANCE_LOCK:
+                if ExprParser.INSTANCE is None:
+                    ExprParser.INSTANCE = ExprParser()
+        return ExprParser.INSTANCE
 
     def p_expression_binop(self, p: yacc.YaccProduction) -> None:
         """
@@ -208,4 +247,47 @@ class ExprParser:
             raise FeathubExpressionException("Syntax error at EOF")
 
     def parse(self, expr: str) -> ExprAST:
-        return self.yacc.parse(expr)
+        """
+        Parses the given FeatHub expression into a frozen AST.
+        """
+        with self._cache_lock:
+            ast = self._cache.get(expr)
+            if ast is not None:
+                self._cache.move_to_end(expr)
+                return ast
+
+        with self._parse_lock:
+            ast = self.yacc.parse(expr, lexer=self.lexer)
+        ast.freeze()
+
+        if self.cache_size > 0:
+            with self._cache_lock:
+                self._cache[expr] = ast
+                self._cache.move_to_end(expr)
+                while len(self._cache) > self.cache_size:
+                    self._cache.popitem(last=False)
+        return ast
+
+    def clear_cache(self) -> None:
+        """
+        Removes all the parsed expressions from the cache.
+        """
+        with self._cache_lock:
+            self._cache.clear()
+
+
+def _write_parse_table(output_dir: str) -> None:
+    # PLY only writes the tables if the existing ones do not match the grammar.
+    yacc.yacc(
+        module=ExprParser(cache_size=0),
+        tabmodule=_PARSE_TABLE_MODULE,
+        outputdir=output_dir,
+        write_tables=True,
+        debug=False,
+    )
+
+
+if __name__ == "__main__":
+    import os
+
+    _write_parse_table(os.path.dirname(os.path.abspath(__file__)))
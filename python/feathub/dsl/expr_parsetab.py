@@ -0,0 +1,64 @@
+
+# expr_parsetab.py
+# This file is automatically generated. Do not edit.
+# pylint: disable=W,C,R
+_tabversion = '3.10'
+
+_lr_method = 'LALR'
+
+_lr_signature = "leftORleftANDleftLTLEGTGEEQNEISNOTleft+-left*/rightUMINUSAND AS CASE CAST COMMA DTYPE ELSE END EQ FALSE FLOAT GE GT ID INTEGER IS LBRACKET LE LPAREN LT NE NOT NULL OR RBRACKET RPAREN STRING THEN TRUE TRY_CAST WHEN\n        expression : expression '+' expression\n                   | expression '-' expression\n                   | expression '*' expression\n                   | expression '/' expression\n        expression : '-' expression %prec UMINUS\n        expression : expression LT expression\n                   | expression LE expression\n                   | expression GT expression\n                   | expression GE expression\n                   | expression EQ expression\n                   | expression NE expression\n        expression : LPAREN expression RPAREN\n        expression : FLOAT\n                   | INTEGER\n        \n        expression : STRING\n        \n        expression : TRUE\n                   | FALSE\n        \n        expression : ID LPAREN arglist RPAREN\n                   | ID LPAREN RPAREN\n        \n        arglist : arglist COMMA expression\n                | expression\n        expression : ID\n        expression : CAST LPAREN expression AS DTYPE RPAREN\n                   | TRY_CAST LPAREN expression AS DTYPE RPAREN\n        \n        expression : expression OR expression\n                   | expression AND expression\n        expression : NULL\n        expression : expression IS expression\n                   | expression IS NOT expression\n        \n        expression : CASE caselist END\n                   | CASE caselist ELSE expression END\n        \n        caselist : caselist WHEN expression THEN expression\n                 | WHEN expression THEN expression\n        \n        expression : expression LBRACKET expression RBRACKET\n        "
+    
+_lr_action_items = {'-':([0,1,2,3,4,5,6,7,8,9,12,14,15,16,17,18,19,20,21,22,23,24,25,26,27,28,29,30,31,32,34,35,36,37,38,39,40,41,42,43,44,45,46,47,48,49,50,52,53,54,55,56,57,58,59,60,61,62,63,66,67,68,69,72,73,74,75,76,77,],[2,15,2,2,-13,-14,-15,-16,-17,-22,-27,2,2,2,2,2,2,2,2,2,2,2,2,2,2,-5,15,2,2,2,2,-1,-2,-3,-4,15,15,15,15,15,15,15,15,15,2,15,-12,-19,15,15,15,-30,2,2,15,15,-34,-18,2,15,15,2,15,-31,2,15,-23,-24,15,]),'LPAREN':([0,2,3,9,10,11,14,15,16,17,18,19,20,21,22,23,24,25,26,27,30,31,32,34,48,57,58,63,68,73,],[3,3,3,30,31,32,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,]),'FLOAT':([0,2,3,14,15,16,17,18,19,20,21,22,23,24,25,26,27,30,31,32,34,48,57,58,63,68,73,],[4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,]),'INTEGER':([0,2,3,14,15,16,17,18,19,20,21,22,23,24,25,26,27,30,31,32,34,48,57,58,63,68,73,],[5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,]),'STRING':([0,2,3,14,15,16,17,18,19,20,21,22,23,24,25,26,27,30,31,32,34,48,57,58,63,68,73,],[6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,]),'TRUE':([0,2,3,14,15,16,17,18,19,20,21,22,23,24,25,26,27,30,31,32,34,48,57,58,63,68,73,],[7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,]),'FALSE':([0,2,3,14,15,16,17,18,19,20,21,22,23,24,25,26,27,30,31,32,34,48,57,58,63,68,73,],[8,8,8,8,8,8,8,8,8,8,8,8,8,8,8,8,8,8,8,8,8,8,8,8,8,8,8,]),'ID':([0,2,3,14,15,16,17,18,19,20,21,22,23,24,25,26,27,30,31,32,34,48,57,58,63,68,73,],[9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,]),'CAST':([0,2,3,14,15,16,17,18,19,20,21,22,23,24,25,26,27,30,31,32,34,48,57,58,63,68,73,],[10,10,10,10,10,10,10,10,10,10,10,10,10,10,10,10,10,10,10,10,10,10,10,10,10,10,10,]),'TRY_CAST':([0,2,3,14,15,16,17,18,19,20,21,22,23,24,25,26,27,30,31,32,34,48,57,58,63,68,73,],[11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,]),'NULL':([0,2,3,14,15,16,17,18,19,20,21,22,23,24,25,26,27,30,31,32,34,48,57,58,63,68,73,],[12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,]),'CASE':([0,2,3,14,15,16,17,18,19,20,21,22,23,24,25,26,27,30,31,32,34,48,57,58,63,68,73,],[13,13,13,13,13,13,13,13,13,13,13,13,13,13,13,13,13,13,13,13,13,13,13,13,13,13,13,]),'$end':([1,4,5,6,7,8,9,12,28,35,36,37,38,39,40,41,42,43,44,45,46,47,50,52,56,60,61,62,72,75,76,],[0,-13,-14,-15,-16,-17,-22,-27,-5,-1,-2,-3,-4,-6,-7,-8,-9,-10,-11,-25,-26,-28,-12,-19,-30,-29,-34,-18,-31,-23,-24,]),'+':([1,4,5,6,7,8,9,12,28,29,35,36,37,38,39,40,41,42,43,44,45,46,47,49,50,52,53,54,55,56,59,60,61,62,66,67,69,72,74,75,76,77,],[14,-13,-14,-15,-16,-17,-22,-27,-5,14,-1,-2,-3,-4,14,14,14,14,14,14,14,14,14,14,-12,-19,14,14,14,-30,14,14,-34,-18,14,14,14,-31,14,-23,-24,14,]),'*':([1,4,5,6,7,8,9,12,28,29,35,36,37,38,39,40,41,42,43,44,45,46,47,49,50,52,53,54,55,56,59,60,61,62,66,67,69,72,74,75,76,77,],[16,-13,-14,-15,-16,-17,-22,-27,-5,16,16,16,-3,-4,16,16,16,16,16,16,16,16,16,16,-12,-19,16,16,16,-30,16,16,-34,-18,16,16,16,-31,16,-23,-24,16,]),'/':([1,4,5,6,7,8,9,12,28,29,35,36,37,38,39,40,41,42,43,44,45,46,47,49,50,52,53,54,55,56,59,60,61,62,66,67,69,72,74,75,76,77,],[17,-13,-14,-15,-16,-17,-22,-27,-5,17,17,17,-3,-4,17,17,17,17,17,17,17,17,17,17,-12,-19,17,17,17,-30,17,17,-34,-18,17,17,17,-31,17,-23,-24,17,]),'LT':([1,4,5,6,7,8,9,12,28,29,35,36,37,38,39,40,41,42,43,44,45,46,47,49,50,52,53,54,55,56,59,60,61,62,66,67,69,72,74,75,76,77,],[18,-13,-14,-15,-16,-17,-22,-27,-5,18,-1,-2,-3,-4,-6,-7,-8,-9,-10,-11,18,18,-28,18,-12,-19,18,18,18,-30,18,-29,-34,-18,18,18,18,-31,18,-23,-24,18,]),'LE':([1,4,5,6,7,8,9,12,28,29,35,36,37,38,39,40,41,42,43,44,45,46,47,49,50,52,53,54,55,56,59,60,61,62,66,67,69,72,74,75,76,77,],[19,-13,-14,-15,-16,-17,-22,-27,-5,19,-1,-2,-3,-4,-6,-7,-8,-9,-10,-11,19,19,-28,19,-12,-19,19,19,19,-30,19,-29,-34,-18,19,19,19,-31,19,-23,-24,19,]),'GT':([1,4,5,6,7,8,9,12,28,29,35,36,37,38,39,40,41,42,43,44,45,46,47,49,50,52,53,54,55,56,59,60,61,62,66,67,69,72,74,75,76,77,],[20,-13,-14,-15,-16,-17,-22,-27,-5,20,-1,-2,-3,-4,-6,-7,-8,-9,-10,-11,20,20,-28,20,-12,-19,20,20,20,-30,20,-29,-34,-18,20,20,20,-31,20,-23,-24,20,]),'GE':([1,4,5,6,7,8,9,12,28,29,35,36,37,38,39,40,41,42,43,44,45,46,47,49,50,52,53,54,55,56,59,60,61,62,66,67,69,72,74,75,76,77,],[21,-13,-14,-15,-16,-17,-22,-27,-5,21,-1,-2,-3,-4,-6,-7,-8,-9,-10,-11,21,21,-28,21,-12,-19,21,21,21,-30,21,-29,-34,-18,21,21,21,-31,21,-23,-24,21,]),'EQ':([1,4,5,6,7,8,9,12,28,29,35,36,37,38,39,40,41,42,43,44,45,46,47,49,50,52,53,54,55,56,59,60,61,62,66,67,69,72,74,75,76,77,],[22,-13,-14,-15,-16,-17,-22,-27,-5,22,-1,-2,-3,-4,-6,-7,-8,-9,-10,-11,22,22,-28,22,-12,-19,22,22,22,-30,22,-29,-34,-18,22,22,22,-31,22,-23,-24,22,]),'NE':([1,4,5,6,7,8,9,12,28,29,35,36,37,38,39,40,41,42,43,44,45,46,47,49,50,52,53,54,55,56,59,60,61,62,66,67,69,72,74,75,76,77,],[23,-13,-14,-15,-16,-17,-22,-27,-5,23,-1,-2,-3,-4,-6,-7,-8,-9,-10,-11,23,23,-28,23,-12,-19,23,23,23,-30,23,-29,-34,-18,23,23,23,-31,23,-23,-24,23,]),'OR':([1,4,5,6,7,8,9,12,28,29,35,36,37,38,39,40,41,42,43,44,45,46,47,49,50,52,53,54,55,56,59,60,61,62,66,67,69,72,74,75,76,77,],[24,-13,-14,-15,-16,-17,-22,-27,-5,24,-1,-2,-3,-4,-6,-7,-8,-9,-10,-11,-25,-26,-28,24,-12,-19,24,24,24,-30,24,-29,-34,-18,24,24,24,-31,24,-23,-24,24,]),'AND':([1,4,5,6,7,8,9,12,28,29,35,36,37,38,39,40,41,42,43,44,45,46,47,49,50,52,53,54,55,56,59,60,61,62,66,67,69,72,74,75,76,77,],[25,-13,-14,-15,-16,-17,-22,-27,-5,25,-1,-2,-3,-4,-6,-7,-8,-9,-10,-11,25,-26,-28,25,-12,-19,25,25,25,-30,25,-29,-34,-18,25,25,25,-31,25,-23,-24,25,]),'IS':([1,4,5,6,7,8,9,12,28,29,35,36,37,38,39,40,41,42,43,44,45,46,47,49,50,52,53,54,55,56,59,60,61,62,66,67,69,72,74,75,76,77,],[26,-13,-14,-15,-16,-17,-22,-27,-5,26,-1,-2,-3,-4,-6,-7,-8,-9,-10,-11,26,26,-28,26,-12,-19,26,26,26,-30,26,-29,-34,-18,26,26,26,-31,26,-23,-24,26,]),'LBRACKET':([1,4,5,6,7,8,9,12,28,29,35,36,37,38,39,40,41,42,43,44,45,46,47,49,50,52,53,54,55,56,59,60,61,62,66,67,69,72,74,75,76,77,],[27,-13,-14,-15,-16,-17,-22,-27,-5,27,-1,-2,-3,-4,-6,-7,-8,-9,-10,-11,-25,-26,-28,27,-12,-19,27,27,27,-30,27,-29,-34,-18,27,27,27,-31,27,-23,-24,27,]),'RPAREN':([4,5,6,7,8,9,12,28,29,30,35,36,37,38,39,40,41,42,43,44,45,46,47,50,51,52,53,56,60,61,62,69,70,71,72,75,76,],[-13,-14,-15,-16,-17,-22,-27,-5,50,52,-1,-2,-3,-4,-6,-7,-8,-9,-10,-11,-25,-26,-28,-12,62,-19,-21,-30,-29,-34,-18,-20,75,76,-31,-23,-24,]),'RBRACKET':([4,5,6,7,8,9,12,28,35,36,37,38,39,40,41,42,43,44,45,46,47,49,50,52,56,60,61,62,72,75,76,],[-13,-14,-15,-16,-17,-22,-27,-5,-1,-2,-3,-4,-6,-7,-8,-9,-10,-11,-25,-26,-28,61,-12,-19,-30,-29,-34,-18,-31,-23,-24,]),'COMMA':([4,5,6,7,8,9,12,28,35,36,37,38,39,40,41,42,43,44,45,46,47,50,51,52,53,56,60,61,62,69,72,75,76,],[-13,-14,-15,-16,-17,-22,-27,-5,-1,-2,-3,-4,-6,-7,-8,-9,-10,-11,-25,-26,-28,-12,63,-19,-21,-30,-29,-34,-18,-20,-31,-23,-24,]),'AS':([4,5,6,7,8,9,12,28,35,36,37,38,39,40,41,42,43,44,45,46,47,50,52,54,55,56,60,61,62,72,75,76,],[-13,-14,-15,-16,-17,-22,-27,-5,-1,-2,-3,-4,-6,-7,-8,-9,-10,-11,-25,-26,-28,-12,-19,64,65,-30,-29,-34,-18,-31,-23,-24,]),'THEN':([4,5,6,7,8,9,12,28,35,36,37,38,39,40,41,42,43,44,45,46,47,50,52,56,59,60,61,62,67,72,75,76,],[-13,-14,-15,-16,-17,-22,-27,-5,-1,-2,-3,-4,-6,-7,-8,-9,-10,-11,-25,-26,-28,-12,-19,-30,68,-29,-34,-18,73,-31,-23,-24,]),'END':([4,5,6,7,8,9,12,28,33,35,36,37,38,39,40,41,42,43,44,45,46,47,50,52,56,60,61,62,66,72,74,75,76,77,],[-13,-14,-15,-16,-17,-22,-27,-5,56,-1,-2,-3,-4,-6,-7,-8,-9,-10,-11,-25,-26,-28,-12,-19,-30,-29,-34,-18,72,-31,-33,-23,-24,-32,]),'ELSE':([4,5,6,7,8,9,12,28,33,35,36,37,38,39,40,41,42,43,44,45,46,47,50,52,56,60,61,62,72,74,75,76,77,],[-13,-14,-15,-16,-17,-22,-27,-5,57,-1,-2,-3,-4,-6,-7,-8,-9,-10,-11,-25,-26,-28,-12,-19,-30,-29,-34,-18,-31,-33,-23,-24,-32,]),'WHEN':([4,5,6,7,8,9,12,13,28,33,35,36,37,38,39,40,41,42,43,44,45,46,47,50,52,56,60,61,62,72,74,75,76,77,],[-13,-14,-15,-16,-17,-22,-27,34,-5,58,-1,-2,-3,-4,-6,-7,-8,-9,-10,-11,-25,-26,-28,-12,-19,-30,-29,-34,-18,-31,-33,-23,-24,-32,]),'NOT':([26,],[48,]),'DTYPE':([64,65,],[70,71,]),}
+
+_lr_action = {}
+for _k, _v in _lr_action_items.items():
+   for _x,_y in zip(_v[0],_v[1]):
+      if not _x in _lr_action:  _lr_action[_x] = {}
+      _lr_action[_x][_k] = _y
+del _lr_action_items
+
+_lr_goto_items = {'expression':([0,2,3,14,15,16,17,18,19,20,21,22,23,24,25,26,27,30,31,32,34,48,57,58,63,68,73,],[1,28,29,35,36,37,38,39,40,41,42,43,44,45,46,47,49,53,54,55,59,60,66,67,69,74,77,]),'caselist':([13,],[33,]),'arglist':([30,],[51,]),}
+
+_lr_goto = {}
+for _k, _v in _lr_goto_items.items():
+   for _x, _y in zip(_v[0], _v[1]):
+       if not _x in _lr_goto: _lr_goto[_x] = {}
+       _lr_goto[_x][_k] = _y
+del _lr_goto_items
+_lr_productions = [
+  ("S' -> expression","S'",1,None,None,None),
+  ('expression -> expression + expression','expression',3,'p_expression_binop','expr_parser.py',110),
+  ('expression -> expression - expression','expression',3,'p_expression_binop','expr_parser.py',111),
+  ('expression -> expression * expression','expression',3,'p_expression_binop','expr_parser.py',112),
+  ('expression -> expression / expression','expression',3,'p_expression_binop','expr_parser.py',113),
+  ('expression -> - expression','expression',2,'p_expression_uminus','expr_parser.py',118),
+  ('expression -> expression LT expression','expression',3,'p_expression_compare','expr_parser.py',123),
+  ('expression -> expression LE expression','expression',3,'p_expression_compare','expr_parser.py',124),
+  ('expression -> expression GT expression','expression',3,'p_expression_compare','expr_parser.py',125),
+  ('expression -> expression GE expression','expression',3,'p_expression_compare','expr_parser.py',126),
+  ('expression -> expression EQ expression','expression',3,'p_expression_compare','expr_parser.py',127),
+  ('expression -> expression NE expression','expression',3,'p_expression_compare','expr_parser.py',128),
+  ('expression -> LPAREN expression RPAREN','expression',3,'p_expression_group','expr_parser.py',133),
+  ('expression -> FLOAT','expression',1,'p_expression_number','expr_parser.py',138),
+  ('expression -> INTEGER','expression',1,'p_expression_number','expr_parser.py',139),
+  ('expression -> STRING','expression',1,'p_expression_string','expr_parser.py',145),
+  ('expression -> TRUE','expression',1,'p_expression_boolean','expr_parser.py',151),
+  ('expression -> FALSE','expression',1,'p_expression_boolean','expr_parser.py',152),
+  ('expression -> ID LPAREN arglist RPAREN','expression',4,'p_expression_function_call','expr_parser.py',158),
+  ('expression -> ID LPAREN RPAREN','expression',3,'p_expression_function_call','expr_parser.py',159),
+  ('arglist -> arglist COMMA expression','arglist',3,'p_expression_arglist','expr_parser.py',168),
+  ('arglist -> expression','arglist',1,'p_expression_arglist','expr_parser.py',169),
+  ('expression -> ID','expression',1,'p_expression_variable','expr_parser.py',178),
+  ('expression -> CAST LPAREN expression AS DTYPE RPAREN','expression',6,'p_expression_cast','expr_parser.py',183),
+  ('expression -> TRY_CAST LPAREN expression AS DTYPE RPAREN','expression',6,'p_expression_cast','expr_parser.py',184),
+  ('expression -> expression OR expression','expression',3,'p_expression_logical_op','expr_parser.py',198),
+  ('expression -> expression AND expression','expression',3,'p_expression_logical_op','expr_parser.py',199),
+  ('expression -> NULL','expression',1,'p_expression_null_node','expr_parser.py',204),
+  ('expression -> expression IS expression','expression',3,'p_expression_is_op','expr_parser.py',209),
+  ('expression -> expression IS NOT expression','expression',4,'p_expression_is_op','expr_parser.py',210),
+  ('expression -> CASE caselist END','expression',3,'p_expression_case_op_enclose','expr_parser.py',219),
+  ('expression -> CASE caselist ELSE expression END','expression',5,'p_expression_case_op_enclose','expr_parser.py',220),
+  ('caselist -> caselist WHEN expression THEN expression','caselist',5,'p_expression_case_op_condition','expr_parser.py',229),
+  ('caselist -> WHEN expression THEN expression','caselist',4,'p_expression_case_op_condition','expr_parser.py',230),
+  ('expression -> expression LBRACKET expression RBRACKET','expression',4,'p_expression_bracket_op','expr_parser.py',239),
+]
@@ -23,7 +23,7 @@ from feathub.dsl.expr_lexer_rules import ExprLexerRules, ID_REGEX, VARIABLE_NAME
 from feathub.dsl.expr_parser import ExprParser
 
 lexer = lex.lex(module=ExprLexerRules())
-_parser = ExprParser()
+_parser = ExprParser.get_instance()
 
 
 def get_variables(feathub_expr: str) -> Set[str]:
@@ -0,0 +1,234 @@
+# Copyright 2022 The FeatHub Authors
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+import math
+import random
+import unittest
+from typing import Any, Dict, List
+
+from feathub.common import types
+from feathub.dsl.ast import (
+    BinaryOp,
+    CaseOp,
+    CompareOp,
+    GroupNode,
+    ValueNode,
+    VariableNode,
+)
+from feathub.dsl.expr_optimizer import optimize_expr
+from feathub.dsl.expr_parser import ExprParser
+from feathub.processors.flink.ast_evaluator.flink_ast_evaluator import FlinkAstEvaluator
+from feathub.processors.local.ast_evaluator.local_ast_evaluator import LocalAstEvaluator
+
+
+class ExprOptimizerTest(unittest.TestCase):
+    def setUp(self) -> None:
+        self.parser = ExprParser()
+
+    def _optimize(self, expr, variable_types=None):
+        return optimize_expr(self.parser.parse(expr), variable_types)
+
+    def _assert_optimized(self, expected_expr, expr, variable_types=None):
+        self.assertEqual(
+            self.parser.parse(expected_expr).to_json(),
+            self._optimize(expr, variable_types).to_json(),
+        )
+
+    def test_constant_folding(self):
+        self._assert_optimized("180", 'CAST("3" AS INTEGER) * 60')
+        self._assert_optimized("a + 5", "a + (2 + 3)")
+        self._assert_optimized("'3'", "CAST(1 + 2 AS STRING)")
+        self._assert_optimized("'ab'", "CONCAT('a', 'b')")
+        self._assert_optimized("'abc'", "LOWER('ABC')")
+        self._assert_optimized("true", "1 + 1 < 3")
+        self._assert_optimized("false", "'a' = 'b'")
+
+        # Division, floating-point numbers and integers beyond 32 bits are not
+        # folded, as their semantics differ among processors.
+        self._assert_optimized("1 / 2", "1 / 2")
+        self._assert_optimized("0.1 + 0.2", "0.1 + 0.2")
+        self._assert_optimized("2147483647 + 1", "2147483647 + 1")
+        self._assert_optimized("'a' < 'b'", "'a' < 'b'")
+        self._assert_optimized("CAST('3' AS BIGINT)", "CAST('3' AS BIGINT)")
+
+    def test_negative_number(self):
+        self.assertEqual(
+            BinaryOp("-", VariableNode("a"), GroupNode(ValueNode(-3))).to_json(),
+            self._optimize("a - -3").to_json(),
+        )
+        self.assertEqual(ValueNode(-3).to_json(), self._optimize("-3").to_json())
+        self.assertEqual(
+            "`a` - (-3)", FlinkAstEvaluator().eval(self._optimize("a - -3"), {})
+        )
+
+    def test_boolean_simplification(self):
+        self._assert_optimized("a > 1", "TRUE AND a > 1")
+        self._assert_optimized("a > 1", "a > 1 AND 1 = 1")
+        self._assert_optimized("false", "FALSE AND a > 1")
+        self._assert_optimized("true", "a > 1 OR TRUE")
+        self._assert_optimized("true", "TRUE OR a > 1")
+        self._assert_optimized("a > 1", "FALSE OR a > 1")
+        self._assert_optimized("true", "NULL IS NULL")
+        self._assert_optimized("false", "'a' IS NULL")
+
+        # Python returns a non-boolean left operand as is.
+        self._assert_optimized("s AND TRUE", "s AND TRUE")
+        self._assert_optimized("s OR TRUE", "s OR TRUE")
+        self._assert_optimized("s", "s AND TRUE", {"s": types.Bool})
+        self._assert_optimized("true", "s OR TRUE", {"s": types.Bool})
+
+        # Rewrites that differ when the other operand is NULL are not applied.
+        self._assert_optimized("a > 1 AND FALSE", "a > 1 AND FALSE")
+        self._assert_optimized("a > 1 OR FALSE", "a > 1 OR FALSE")
+
+    def test_case_pruning(self):
+        self._assert_optimized(
+            "CASE WHEN a > 1 THEN 2 ELSE 3 END",
+            "CASE WHEN FALSE THEN 1 WHEN a > 1 THEN 2 ELSE 3 END",
+        )
+        self._assert_optimized(
+            "CASE WHEN a > 1 THEN 2 ELSE 4 END",
+            "CASE WHEN a > 1 THEN 2 WHEN 1 = 1 THEN 4 WHEN a > 0 THEN 5 END",
+        )
+        self._assert_optimized("'x'", "CASE WHEN 1 = 1 THEN 'x' ELSE 'y' END")
+        self._assert_optimized("'y'", "CASE WHEN 1 = 2 THEN 'x' ELSE 'y' END")
+        self._assert_optimized(
+            "(a + 1) * 2",
+            "CASE WHEN TRUE THEN a + 1 ELSE a END * 2",
+            {"a": types.Int32},
+        )
+
+        # The branches are not pruned if it changes the type of the result, or the
+        # type cannot be derived.
+        self._assert_optimized(
+            "CASE WHEN TRUE THEN 1 ELSE 2.5 END", "CASE WHEN TRUE THEN 1 ELSE 2.5 END"
+        )
+        self._assert_optimized(
+            "CASE WHEN TRUE THEN a ELSE b END", "CASE WHEN TRUE THEN a ELSE b END"
+        )
+        self._assert_optimized(
+            "CASE WHEN FALSE THEN 1 END", "CASE WHEN FALSE THEN 1 END"
+        )
+
+    def test_cast_elimination(self):
+        self._assert_optimized(
+            "CAST(a AS INTEGER) * 2", "CAST(CAST(a AS INTEGER) AS INTEGER) * 2"
+        )
+        self._assert_optimized(
+            "TRY_CAST(s AS STRING)", "CAST(TRY_CAST(s AS STRING) AS STRING)"
+        )
+        self._assert_optimized("a > 1", "CAST(a > 1 AS BOOLEAN)")
+        self._assert_optimized(
+            "CAST(CAST(a AS INTEGER) AS BIGINT)", "CAST(CAST(a AS INTEGER) AS BIGINT)"
+        )
+
+        # The casts of variables are kept even if they are declared with the target
+        # type, as the values might not be of the type in LocalProcessor.
+        variable_types = {"a": types.Int32, "s": types.String}
+        self._assert_optimized(
+            "CAST(a AS INTEGER)", "CAST(a AS INTEGER)", variable_types
+        )
+        self._assert_optimized(
+            "TRY_CAST(s AS STRING)", "TRY_CAST(s AS STRING)", variable_types
+        )
+
+        # The casts of literals are kept, as the types of literals differ among
+        # processors, e.g. 0.1 is a DECIMAL in Flink SQL and Spark SQL.
+        self._assert_optimized("a * CAST(0.1 AS DOUBLE)", "a * CAST(0.1 AS DOUBLE)")
+        self._assert_optimized("CAST(TRUE AS BOOLEAN)", "CAST(TRUE AS BOOLEAN)")
+
+    def test_group_flattening(self):
+        self._assert_optimized("a", "((a))")
+        self._assert_optimized("(a + b) * c", "((a + b)) * c")
+        self._assert_optimized("a + b", "((a + b))")
+        self._assert_optimized("LOWER(a)", "(LOWER((a)))")
+
+    def test_unchanged_ast_reused(self):
+        ast = self.parser.parse("CASE WHEN a > 1 THEN LOWER(b) ELSE c END")
+        self.assertIs(ast, optimize_expr(ast))
+
+        ast = self.parser.parse("1 + 2")
+        optimize_expr(ast)
+        self.assertIsInstance(ast, BinaryOp)
+
+    def test_result_frozen(self):
+        ast = self._optimize("CASE WHEN FALSE THEN 1 WHEN a > 1 THEN 2 ELSE 3 END")
+        self.assertIsInstance(ast, CaseOp)
+        self.assertIsInstance(ast.conditions[0], CompareOp)
+        with self.assertRaises(Exception):
+            ast.default = ValueNode(4)
+
+    def test_same_results_as_unoptimized(self):
+        evaluator = LocalAstEvaluator()
+        rnd = random.Random(42)
+        variables_list: List[Dict[str, Any]] = [
+            {"a": 1, "b": 2, "s": "Hello"},
+            {"a": -3, "b": 0, "s": ""},
+            {"a": None, "b": 4, "s": None},
+        ]
+        for _ in range(1000):
+            expr = _random_expr(rnd, 4)
+            ast = self.parser.parse(expr)
+            optimized_ast = optimize_expr(ast)
+            for variables in variables_list:
+                try:
+                    expected = evaluator.eval(ast, variables)
+                except Exception:
+                    # The optimized expression may not raise the error, e.g. if the
+                    # erroneous sub-expression is never used.
+                    continue
+                actual = evaluator.eval(optimized_ast, variables)
+                msg = f"Expression {expr} with variables {variables}."
+                if isinstance(expected, float) and math.isnan(expected):
+                    self.assertTrue(math.isnan(actual), msg)
+                else:
+                    self.assertEqual(expected, actual, msg)
+                    self.assertEqual(type(expected), type(actual), msg)
+
+
+def _random_expr(rnd: random.Random, depth: int) -> str:
+    if depth <= 0 or rnd.random() < 0.2:
+        return rnd.choice(
+            ["a", "b", "s", "1", "-2", "2.5", "'K'", "'3'", "NULL", "TRUE", "FALSE"]
+        )
+
+    # Sub-expressions are enclosed in parentheses, as IS NULL has higher precedence
+    # than the arithmetic operators in the grammar.
+    def child() -> str:
+        return f"({_random_expr(rnd, depth - 1)})"
+
+    template = rnd.choice(
+        [
+            "{} + {}",
+            "{} - {}",
+            "{} * {}",
+            "{} / {}",
+            "-{}",
+            "({})",
+            "(({}))",
+            "{} > {}",
+            "{} = {}",
+            "{} <> {}",
+            "{} AND {}",
+            "{} OR {}",
+            "{} IS NULL",
+            "{} IS NOT NULL",
+            "CASE WHEN {} THEN {} ELSE {} END",
+            "CASE WHEN {} THEN {} WHEN {} THEN {} END",
+            "CAST({} AS STRING)",
+            "TRY_CAST({} AS INTEGER)",
+            "CONCAT({}, {})",
+            "LOWER({})",
+        ]
+    )
+    return template.format(*[child() for _ in range(template.count("{}"))])
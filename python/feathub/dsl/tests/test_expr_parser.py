@@ -12,7 +12,10 @@
 #  See the License for the specific language governing permissions and
 #  limitations under the License.
 import unittest
+from typing import cast
+from concurrent.futures import ThreadPoolExecutor
 
+from feathub.common.exceptions import FeathubException, FeathubExpressionException
 from feathub.dsl.ast import (
     FuncCallOp,
     ArgListNode,
@@ -111,3 +114,58 @@ class ExprParserTest(unittest.TestCase):
 
         for expr, node in expected_mappings.items():
             self.assertEqual(node.to_json(), self.parser.parse(expr).to_json())
+
+    def test_parse_cache(self):
+        expr = "CASE WHEN a > 1 THEN CONCAT(b, 'x') ELSE c END"
+        ast = self.parser.parse(expr)
+        self.assertIs(ast, self.parser.parse(expr))
+
+        self.parser.clear_cache()
+        self.assertIsNot(ast, self.parser.parse(expr))
+        self.assertEqual(ast.to_json(), self.parser.parse(expr).to_json())
+
+    def test_parse_cache_eviction(self):
+        parser = ExprParser(cache_size=2)
+        ast_a = parser.parse("a + 1")
+        parser.parse("b + 1")
+        self.assertIs(ast_a, parser.parse("a + 1"))
+
+        # "b + 1" is the least recently used expression and is evicted.
+        parser.parse("c + 1")
+        self.assertIs(ast_a, parser.parse("a + 1"))
+        self.assertEqual(2, len(parser._cache))
+        self.assertNotIn("b + 1", parser._cache)
+
+        parser = ExprParser(cache_size=0)
+        self.assertIsNot(parser.parse("a + 1"), parser.parse("a + 1"))
+
+    def test_parse_error_not_cached(self):
+        for _ in range(2):
+            with self.assertRaises(FeathubExpressionException):
+                self.parser.parse("a +")
+        self.assertEqual(0, len(self.parser._cache))
+
+    def test_parsed_ast_frozen(self):
+        ast = cast(
+            CaseOp,
+            self.parser.parse("CASE WHEN a > 1 THEN CONCAT(b, 'x') ELSE c END"),
+        )
+        self.assertIsInstance(ast, CaseOp)
+        with self.assertRaises(FeathubException):
+            ast.default = NullNode()
+        with self.assertRaises(FeathubException):
+            cast(CompareOp, ast.conditions[0]).left_child = VariableNode("d")
+        with self.assertRaises(AttributeError):
+            cast(FuncCallOp, ast.results[0]).args.values.append(VariableNode("d"))
+
+    def test_shared_instance(self):
+        self.assertIs(ExprParser.get_instance(), ExprParser.get_instance())
+
+    def test_parse_concurrently(self):
+        exprs = [f"a{i} + b{i} * {i}" for i in range(100)] * 4
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            results = list(executor.map(self.parser.parse, exprs))
+
+        uncached_parser = ExprParser(cache_size=0)
+        for expr, ast in zip(exprs, results):
+            self.assertEqual(uncached_parser.parse(expr).to_json(), ast.to_json())
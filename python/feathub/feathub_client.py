@@ -12,8 +12,13 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
-from typing import Union, Optional, Dict, List
+import logging
+import threading
+import time
+from typing import Union, Optional, Dict, List, Any, Callable, TypeVar, overload
+import numpy as np
 import pandas as pd
+import pyarrow as pa
 from datetime import datetime, timedelta
 
 from feathub.common.config import flatten_dict
@@ -23,16 +28,32 @@ from feathub.materialization_group import MaterializationGroup
 from feathub.metric_stores.metric_store import MetricStore
 from feathub.processors.processor import Processor
 from feathub.registries.registry import Registry
+from feathub.feature_service.feature_server import FeatureServer
 from feathub.feature_service.feature_service import FeatureService
+from feathub.table.output_format import (
+    OutputFormat,
+    convert_dataframe,
+    convert_records,
+)
 from feathub.table.table import Table
 from feathub.processors.processor_job import ProcessorJob
 from feathub.feature_views.on_demand_feature_view import OnDemandFeatureView
 from feathub.table.table_descriptor import TableDescriptor
 
+logger = logging.getLogger(__file__)
+
+T = TypeVar("T")
+
 
 class FeathubClient:
     """
     The FeatHub client provides APIs to manage features.
+
+    The registry, metric store, processor and feature service of the client are
+    instantiated on their first use, so that e.g. a process which only serves online
+    features does not instantiate the processor. The instantiation is thread-safe.
+    A component set on the client, e.g. a registry wrapping the original one, is used
+    by the components instantiated after it is set.
     """
 
     def __init__(self, props: Dict) -> None:
@@ -40,16 +61,107 @@ class FeathubClient:
         :param props: Provides the properties to initialize the client.
         """
         self.props = flatten_dict(props)
-        self.registry = Registry.instantiate(props=self.props)
-        self.metric_store = MetricStore.instantiate(props=self.props)
-        self.processor = Processor.instantiate(
-            props=self.props, registry=self.registry, metric_store=self.metric_store
+
+        # The lock is reentrant as instantiating a component may instantiate the
+        # components it depends on.
+        self._lock = threading.RLock()
+        self._components: Dict[str, Any] = {}
+        self._initialization_times: Dict[str, float] = {}
+
+    @property
+    def registry(self) -> Registry:
+        return self._get_component(
+            "registry", lambda: Registry.instantiate(props=self.props)
+        )
+
+    @registry.setter
+    def registry(self, registry: Registry) -> None:
+        self._set_component("registry", registry)
+
+    @property
+    def metric_store(self) -> Optional[MetricStore]:
+        return self._get_component(
+            "metric_store", lambda: MetricStore.instantiate(props=self.props)
+        )
+
+    @metric_store.setter
+    def metric_store(self, metric_store: Optional[MetricStore]) -> None:
+        self._set_component("metric_store", metric_store)
+
+    @property
+    def processor(self) -> Processor:
+        return self._get_component(
+            "processor",
+            lambda: Processor.instantiate(
+                props=self.props,
+                registry=self.registry,
+                metric_store=self.metric_store,
+            ),
         )
-        self.feature_service = FeatureService.instantiate(
-            props=self.props,
-            registry=self.registry,
+
+    @processor.setter
+    def processor(self, processor: Processor) -> None:
+        self._set_component("processor", processor)
+
+    @property
+    def feature_service(self) -> FeatureService:
+        return self._get_component(
+            "feature_service",
+            lambda: FeatureService.instantiate(
+                props=self.props,
+                registry=self.registry,
+                metric_store=self.metric_store,
+            ),
         )
 
+    @feature_service.setter
+    def feature_service(self, feature_service: FeatureService) -> None:
+        self._set_component("feature_service", feature_service)
+
+    def get_initialization_times(self) -> Dict[str, float]:
+        """
+        Returns the time in milliseconds each instantiated component took to be
+        instantiated, keyed by the name of the component. The time of a component
+        excludes the time to instantiate the components it depends on.
+        """
+        with self._lock:
+            return dict(self._initialization_times)
+
+    def close(self) -> None:
+        """
+        Closes the components instantiated by this client, e.g. stops the background
+        threads of the feature service and the registry. The components set by users
+        are not closed.
+        """
+        with self._lock:
+            # The feature service is closed before the registry it depends on.
+            for name in ["feature_service", "registry"]:
+                if name in self._initialization_times:
+                    self._components[name].close()
+
+    def _set_component(self, name: str, component: Any) -> None:
+        with self._lock:
+            self._components[name] = component
+            # The component set by users is not instantiated by this client.
+            self._initialization_times.pop(name, None)
+
+    def _get_component(self, name: str, factory: Callable[[], T]) -> T:
+        if name in self._components:
+            return self._components[name]
+
+        with self._lock:
+            if name not in self._components:
+                start_time = time.perf_counter()
+                dependency_time = sum(self._initialization_times.values())
+                component = factory()
+                elapsed_time = (time.perf_counter() - start_time) * 1000 - (
+                    sum(self._initialization_times.values()) - dependency_time
+                )
+                self._initialization_times[name] = elapsed_time
+                logger.info(f"Initialized {name} in {elapsed_time:.1f} ms.")
+                self._components[name] = component
+            return self._components[name]
+
     @deprecated_alias(features="feature_descriptor")
     def get_features(
         self,
@@ -136,23 +248,96 @@ class FeathubClient:
         """
         return MaterializationGroup(self.processor)
 
+    @overload
+    def get_online_features(
+        self,
+        request_df: Dict[str, Any],
+        feature_view: Union[str, OnDemandFeatureView],
+        feature_names: Optional[List[str]] = None,
+    ) -> Dict[str, Any]:
+        ...
+
+    @overload
+    def get_online_features(
+        self,
+        request_df: List[Dict[str, Any]],
+        feature_view: Union[str, OnDemandFeatureView],
+        feature_names: Optional[List[str]] = None,
+    ) -> List[Dict[str, Any]]:
+        ...
+
+    @overload
     def get_online_features(
         self,
         request_df: pd.DataFrame,
         feature_view: Union[str, OnDemandFeatureView],
         feature_names: Optional[List[str]] = None,
     ) -> pd.DataFrame:
+        ...
+
+    @overload
+    def get_online_features(
+        self,
+        request_df: Union[pd.DataFrame, Dict[str, Any], List[Dict[str, Any]]],
+        feature_view: Union[str, OnDemandFeatureView],
+        feature_names: Optional[List[str]] = None,
+        *,
+        output_format: Union[str, OutputFormat],
+    ) -> Union[pd.DataFrame, pa.Table, Dict[str, np.ndarray]]:
+        ...
+
+    def get_online_features(
+        self,
+        request_df: Union[pd.DataFrame, Dict[str, Any], List[Dict[str, Any]]],
+        feature_view: Union[str, OnDemandFeatureView],
+        feature_names: Optional[List[str]] = None,
+        output_format: Optional[Union[str, OutputFormat]] = None,
+    ) -> Any:
         """
         Queries features for the given keys from the online store.
 
-        :return: A DataFrame consisting of the input_data and the requested
-                 feature_names.
+        :param request_df: The request to query features for. It can be a DataFrame,
+                           a dict holding the fields of one request row, or a list of
+                           such dicts. Requests in dicts are computed without
+                           constructing pandas objects, which has a lower latency for
+                           small requests.
+        :param output_format: Optional. The format of the returned features. See
+                              OutputFormat for the supported formats. If it is None,
+                              the features are returned in the same format as the
+                              request, i.e. a DataFrame, a dict or a list of dicts.
+        :return: The input data and the requested feature_names.
         """
-        return self.feature_service.get_online_features(
+        if isinstance(request_df, dict) or isinstance(request_df, list):
+            requests = [request_df] if isinstance(request_df, dict) else request_df
+            records = self.feature_service.get_online_feature_records(
+                requests=requests,
+                feature_view=feature_view,
+                feature_names=feature_names,
+            )
+            if output_format is not None:
+                if records:
+                    field_names = list(records[0].keys())
+                else:
+                    field_names = [] if feature_names is None else feature_names
+                return convert_records(records, field_names, output_format)
+            return records[0] if isinstance(request_df, dict) else records
+
+        features = self.feature_service.get_online_features(
             request_df=request_df,
             feature_view=feature_view,
             feature_names=feature_names,
         )
+        if output_format is not None:
+            return convert_dataframe(features, output_format)
+        return features
+
+    def create_feature_server(self) -> FeatureServer:
+        """
+        Creates a FeatureServer that serves online features with the feature service
+        of this client. Concurrent requests of the same OnDemandFeatureView sent to the
+        server are computed together in batches.
+        """
+        return FeatureServer(feature_service=self.feature_service, props=self.props)
 
     @deprecated_alias(features_list="feature_descriptors")
     def build_features(
@@ -0,0 +1,361 @@
+# Copyright 2022 The FeatHub Authors
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+import json
+import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Optional, List, Union, Dict, Tuple, Any
+
+import pandas as pd
+
+from feathub.common.exceptions import FeathubException
+from feathub.feature_service.feature_server_config import (
+    FeatureServerConfig,
+    MAX_WAIT_MS_CONFIG,
+    MAX_BATCH_SIZE_CONFIG,
+    NUM_WORKERS_CONFIG,
+)
+from feathub.feature_service.feature_service import FeatureService
+from feathub.feature_views.on_demand_feature_view import OnDemandFeatureView
+
+
+class LatencyStatistics:
+    """
+    Statistics about the latencies of a stage of serving online features.
+    """
+
+    def __init__(self) -> None:
+        self.count = 0
+        self.total_ms = 0.0
+        self.max_ms = 0.0
+
+    @property
+    def mean_ms(self) -> float:
+        return self.total_ms / self.count if self.count > 0 else 0.0
+
+    def record(self, latency_ms: float) -> None:
+        self.count += 1
+        self.total_ms += latency_ms
+        self.max_ms = max(self.max_ms, latency_ms)
+
+    def copy(self) -> "LatencyStatistics":
+        statistics = LatencyStatistics()
+        statistics.count = self.count
+        statistics.total_ms = self.total_ms
+        statistics.max_ms = self.max_ms
+        return statistics
+
+    def __repr__(self) -> str:
+        return (
+            f"LatencyStatistics(count={self.count}, mean_ms={self.mean_ms}, "
+            f"max_ms={self.max_ms})"
+        )
+
+
+class FeatureServerStatistics:
+    """
+    Statistics about the requests served by a FeatureServer.
+    """
+
+    def __init__(
+        self,
+        request_count: int,
+        batch_count: int,
+        queueing_latency: LatencyStatistics,
+        execution_latency: LatencyStatistics,
+    ):
+        """
+        :param request_count: The number of requests served.
+        :param batch_count: The number of batched calls to the feature service.
+        :param queueing_latency: The time requests waited to be batched, measured per
+                                 request.
+        :param execution_latency: The time to compute the features of a batch,
+                                  measured per batch.
+        """
+        self.request_count = request_count
+        self.batch_count = batch_count
+        self.queueing_latency = queueing_latency
+        self.execution_latency = execution_latency
+
+    def __repr__(self) -> str:
+        return (
+            f"FeatureServerStatistics(request_count={self.request_count}, "
+            f"batch_count={self.batch_count}, "
+            f"queueing_latency={self.queueing_latency}, "
+            f"execution_latency={self.execution_latency})"
+        )
+
+
+class _PendingRequest:
+    def __init__(
+        self,
+        request_df: pd.DataFrame,
+        feature_view: Union[str, OnDemandFeatureView],
+        feature_names: Optional[List[str]],
+    ):
+        self.request_df = request_df
+        self.feature_view = feature_view
+        self.feature_names = feature_names
+        self.enqueue_time = time.monotonic()
+        self.future: Future = Future()
+
+
+class _PendingBatch:
+    def __init__(self, deadline: float):
+        self.deadline = deadline
+        self.requests: List[_PendingRequest] = []
+        self.num_rows = 0
+
+
+class FeatureServer:
+    """
+    A FeatureServer serves online features with a FeatureService. It coalesces the
+    concurrent requests for the same OnDemandFeatureView that arrive within a small
+    time window into one batched call to the FeatureService, and splits the result
+    back to each request.
+
+    Requests can be sent through the in-process API `get_online_features`, or through
+    the HTTP server started by `start_http_server`.
+    """
+
+    def __init__(
+        self, feature_service: FeatureService, props: Optional[Dict] = None
+    ) -> None:
+        """
+        :param feature_service: The feature service to compute features with.
+        :param props: The properties of the server. See FeatureServerConfig for the
+                      supported properties.
+        """
+        config = FeatureServerConfig({} if props is None else props)
+        self.max_wait_ms = config.get(MAX_WAIT_MS_CONFIG)
+        self.max_batch_size = config.get(MAX_BATCH_SIZE_CONFIG)
+
+        self.feature_service = feature_service
+        self._executor = ThreadPoolExecutor(max_workers=config.get(NUM_WORKERS_CONFIG))
+        self._condition = threading.Condition()
+        self._pending_batches: Dict[Tuple, _PendingBatch] = {}
+        self._closed = False
+
+        self._request_count = 0
+        self._batch_count = 0
+        self._queueing_latency = LatencyStatistics()
+        self._execution_latency = LatencyStatistics()
+
+        self._http_server: Optional[ThreadingHTTPServer] = None
+
+        self._dispatcher = threading.Thread(target=self._dispatch, daemon=True)
+        self._dispatcher.start()
+
+    def get_online_features(
+        self,
+        request_df: pd.DataFrame,
+        feature_view: Union[str, OnDemandFeatureView],
+        feature_names: Optional[List[str]] = None,
+    ) -> pd.DataFrame:
+        """
+        Returns a DataFrame obtained by applying the given OnDemandFeatureView on the
+        given request_df. The request may be computed together with other concurrent
+        requests for the same feature view.
+
+        See FeatureService#get_online_features for the description of the
+        parameters.
+        """
+        return self.submit(request_df, feature_view, feature_names).result()
+
+    def submit(
+        self,
+        request_df: pd.DataFrame,
+        feature_view: Union[str, OnDemandFeatureView],
+        feature_names: Optional[List[str]] = None,
+    ) -> Future:
+        """
+        Submits a request without waiting for its result.
+
+        :return: A Future holding the DataFrame of the request's features.
+        """
+        request = _PendingRequest(request_df, feature_view, feature_names)
+        batch_key = (
+            # Inline feature views with the same name might have different
+            # definitions, so only the requests for the same object are coalesced.
+            # The object is kept alive by the pending request, so its id is not
+            # reused while the batch is pending.
+            feature_view if isinstance(feature_view, str) else id(feature_view),
+            None if feature_names is None else tuple(feature_names),
+            tuple(request_df.columns),
+        )
+
+        with self._condition:
+            if self._closed:
+                raise FeathubException("The FeatureServer has been closed.")
+            batch = self._pending_batches.get(batch_key)
+            if batch is None:
+                batch = _PendingBatch(request.enqueue_time + self.max_wait_ms / 1000)
+                self._pending_batches[batch_key] = batch
+            batch.requests.append(request)
+            batch.num_rows += len(request_df)
+            if batch.num_rows >= self.max_batch_size:
+                self._pending_batches.pop(batch_key)
+                self._executor.submit(self._execute, batch)
+            else:
+                self._condition.notify()
+
+        return request.future
+
+    def get_statistics(self) -> FeatureServerStatistics:
+        """
+        Returns the statistics of the requests served by this FeatureServer.
+        """
+        with self._condition:
+            return FeatureServerStatistics(
+                request_count=self._request_count,
+                batch_count=self._batch_count,
+                queueing_latency=self._queueing_latency.copy(),
+                execution_latency=self._execution_latency.copy(),
+            )
+
+    def start_http_server(self, host: str = "127.0.0.1", port: int = 0) -> int:
+        """
+        Starts an HTTP server in a background thread that serves online features with
+        this FeatureServer.
+
+        The server accepts POST requests with a JSON body like
+        `{"feature_view": "name", "request": [{"key": value}], "feature_names": []}`,
+        where `request` holds the rows of the request and `feature_names` is optional.
+        It responds with the rows of the features in the same format as `request`.
+
+        :param host: The host to bind the server to.
+        :param port: The port to bind the server to. An available port is chosen if it
+                     is 0.
+        :return: The port the server listens on.
+        """
+        if self._http_server is not None:
+            raise FeathubException("The HTTP server has already been started.")
+
+        self._http_server = ThreadingHTTPServer(
+            (host, port), _create_request_handler(self)
+        )
+        self._http_server.daemon_threads = True
+        threading.Thread(target=self._http_server.serve_forever, daemon=True).start()
+        return self._http_server.server_address[1]
+
+    def close(self) -> None:
+        """
+        Stops the HTTP server if it is started, executes the pending requests, and
+        releases the resources of this FeatureServer.
+        """
+        if self._http_server is not None:
+            self._http_server.shutdown()
+            self._http_server.server_close()
+            self._http_server = None
+
+        with self._condition:
+            self._closed = True
+            self._condition.notify()
+        self._dispatcher.join()
+        self._executor.shutdown(wait=True)
+
+    def _dispatch(self) -> None:
+        while True:
+            with self._condition:
+                now = time.monotonic()
+                expired_keys = [
+                    key
+                    for key, batch in self._pending_batches.items()
+                    if batch.deadline <= now or self._closed
+                ]
+                for key in expired_keys:
+                    self._executor.submit(self._execute, self._pending_batches.pop(key))
+
+                if self._closed:
+                    return
+
+                if self._pending_batches:
+                    timeout: Optional[float] = max(
+                        0.0,
+                        min(b.deadline for b in self._pending_batches.values()) - now,
+                    )
+                else:
+                    timeout = None
+                self._condition.wait(timeout)
+
+    def _execute(self, batch: _PendingBatch) -> None:
+        start_time = time.monotonic()
+        requests = batch.requests
+        try:
+            if len(requests) == 1:
+                # The feature service might add columns to the request DataFrame in
+                # place, which should not be visible to the caller.
+                batch_df = requests[0].request_df.copy()
+            else:
+                batch_df = pd.concat(
+                    [request.request_df for request in requests], ignore_index=True
+                )
+            result_df = self.feature_service.get_online_features(
+                request_df=batch_df,
+                feature_view=requests[0].feature_view,
+                feature_names=requests[0].feature_names,
+            )
+        except BaseException as e:
+            for request in requests:
+                request.future.set_exception(e)
+            return
+        finally:
+            end_time = time.monotonic()
+            with self._condition:
+                self._request_count += len(requests)
+                self._batch_count += 1
+                for request in requests:
+                    self._queueing_latency.record(
+                        (start_time - request.enqueue_time) * 1000
+                    )
+                self._execution_latency.record((end_time - start_time) * 1000)
+
+        offset = 0
+        for request in requests:
+            end = offset + len(request.request_df)
+            request.future.set_result(
+                result_df.iloc[offset:end].set_index(request.request_df.index)
+            )
+            offset = end
+
+
+def _create_request_handler(server: FeatureServer) -> Any:
+    class _RequestHandler(BaseHTTPRequestHandler):
+        def do_POST(self) -> None:  # noqa: N802
+            try:
+                content_length = int(self.headers.get("Content-Length", 0))
+                body = json.loads(self.rfile.read(content_length))
+                features = server.get_online_features(
+                    request_df=pd.DataFrame(body["request"]),
+                    feature_view=body["feature_view"],
+                    feature_names=body.get("feature_names"),
+                )
+                status = 200
+                response = features.to_json(orient="records")
+            except Exception as e:
+                status = 400 if isinstance(e, (KeyError, ValueError)) else 500
+                response = json.dumps({"error": str(e)})
+
+            response_bytes = response.encode("utf-8")
+            self.send_response(status)
+            self.send_header("Content-Type", "application/json")
+            self.send_header("Content-Length", str(len(response_bytes)))
+            self.end_headers()
+            self.wfile.write(response_bytes)
+
+        def log_message(self, format: str, *args: Any) -> None:
+            pass
+
+    return _RequestHandler
@@ -0,0 +1,65 @@
+#  Copyright 2022 The FeatHub Authors
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#      https://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+from typing import Dict, Any, List
+
+from feathub.common.config import ConfigDef, BaseConfig
+from feathub.common.validators import gt_eq, gt
+from feathub.feature_service.feature_service_config import FEATURE_SERVICE_PREFIX
+
+FEATURE_SERVER_PREFIX = FEATURE_SERVICE_PREFIX + "server."
+
+MAX_WAIT_MS_CONFIG = FEATURE_SERVER_PREFIX + "max_wait_ms"
+MAX_WAIT_MS_DOC = (
+    "The maximum time in milliseconds a request waits for other requests of the same "
+    "feature view to be computed together in one batch."
+)
+
+MAX_BATCH_SIZE_CONFIG = FEATURE_SERVER_PREFIX + "max_batch_size"
+MAX_BATCH_SIZE_DOC = (
+    "The maximum number of rows in a batch. A batch is computed without waiting "
+    "further once it reaches this size."
+)
+
+NUM_WORKERS_CONFIG = FEATURE_SERVER_PREFIX + "num_workers"
+NUM_WORKERS_DOC = "The maximum number of batches computed concurrently."
+
+feature_server_config_defs: List[ConfigDef] = [
+    ConfigDef(
+        name=MAX_WAIT_MS_CONFIG,
+        value_type=float,
+        description=MAX_WAIT_MS_DOC,
+        default_value=2.0,
+        validator=gt_eq(0),  # type: ignore
+    ),
+    ConfigDef(
+        name=MAX_BATCH_SIZE_CONFIG,
+        value_type=int,
+        description=MAX_BATCH_SIZE_DOC,
+        default_value=256,
+        validator=gt(0),
+    ),
+    ConfigDef(
+        name=NUM_WORKERS_CONFIG,
+        value_type=int,
+        description=NUM_WORKERS_DOC,
+        default_value=4,
+        validator=gt(0),
+    ),
+]
+
+
+class FeatureServerConfig(BaseConfig):
+    def __init__(self, props: Dict[str, Any]) -> None:
+        super().__init__(props)
+        self.update_config_values(feature_server_config_defs)
@@ -16,13 +16,14 @@ from __future__ import annotations
 
 import pandas as pd
 from abc import ABC, abstractmethod
-from typing import Optional, List, Union, Dict
+from typing import Optional, List, Union, Dict, Any
 
 from feathub.feature_service.feature_service_config import (
     FeatureServiceConfig,
     FEATURE_SERVICE_TYPE_CONFIG,
     FeatureServiceType,
 )
+from feathub.metric_stores.metric_store import MetricStore
 from feathub.registries.registry import Registry
 from feathub.feature_views.on_demand_feature_view import OnDemandFeatureView
 
@@ -40,6 +41,13 @@ class FeatureService(ABC):
     def __init__(self) -> None:
         pass
 
+    def close(self) -> None:
+        """
+        Releases the resources held by this feature service, e.g. its background
+        threads. The feature service should not be used after it is closed.
+        """
+        pass
+
     @abstractmethod
     def get_online_features(
         self,
@@ -62,10 +70,41 @@ class FeatureService(ABC):
         """
         pass
 
+    def get_online_feature_records(
+        self,
+        requests: List[Dict[str, Any]],
+        feature_view: Union[str, OnDemandFeatureView],
+        feature_names: Optional[List[str]] = None,
+    ) -> List[Dict[str, Any]]:
+        """
+        Returns a list of dicts obtained by applying the given OnDemandFeatureView on
+        the given requests. Unlike `get_online_features`, the requests and the results
+        are held in plain Python dicts, which saves the cost of constructing pandas
+        objects for small requests.
+
+        :param requests: A list of dicts, each of which contains the request fields of
+                         one row.
+        :param feature_view: Describes the features to be included in the output. If it
+                             is a string, it refers to the name of a OnDemandFeatureView
+                             in the entity registry.
+        :param feature_names: Optional. The names of fields of values that should be
+                               included in the output dicts. If it is None, all
+                               fields of the specified table should be outputted.
+        :return: A list of dicts, one for each request, obtained according to the
+                 specified criteria.
+        """
+        if not requests:
+            return []
+        result_df = self.get_online_features(
+            pd.DataFrame(requests), feature_view, feature_names
+        )
+        return result_df.to_dict("records")
+
     @staticmethod
     def instantiate(
         props: Dict,
         registry: Registry,
+        metric_store: Optional[MetricStore] = None,
     ) -> FeatureService:
         """
         Instantiates a feature service using the given properties and the store
@@ -81,6 +120,8 @@ class FeatureService(ABC):
                 LocalFeatureService,
             )
 
-            return LocalFeatureService(props=props, registry=registry)
+            return LocalFeatureService(
+                props=props, registry=registry, metric_store=metric_store
+            )
 
         raise RuntimeError(f"Failed to instantiate feature service with props={props}.")
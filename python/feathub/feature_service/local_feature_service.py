@@ -12,23 +12,46 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import time
+from collections import OrderedDict
+
+import numpy as np
 import pandas as pd
-from typing import Optional, List, Dict, Union
+from typing import Optional, List, Dict, Union, Hashable, Any, Tuple, cast
 
 from feathub.common.exceptions import FeathubException
-from feathub.dsl.expr_utils import is_id, get_var_name
 from feathub.feature_service.feature_service import FeatureService
+from feathub.feature_service.local_feature_service_config import (
+    LocalFeatureServiceConfig,
+    CACHE_MAX_SIZE_CONFIG,
+    CACHE_TTL_SEC_CONFIG,
+    CACHE_MISSING_KEYS_CONFIG,
+)
+from feathub.feature_service.on_demand_feature_view_plan import (
+    OnDemandFeatureViewPlan,
+    JoinStep,
+    ExpressionStep,
+)
+from feathub.feature_service.online_feature_cache import (
+    OnlineFeatureCache,
+    CacheStatistics,
+)
 from feathub.feature_tables.feature_table import FeatureTable
 from feathub.feature_tables.sources.mysql_source import MySQLSource
 from feathub.feature_tables.sources.redis_source import RedisSource
+from feathub.metric_stores.metric_store import MetricStore
+from feathub.metric_stores.online_metrics import (
+    OnlineMetrics,
+    OnlineMetricsReporter,
+    ONLINE_FEATURES_METRIC,
+    ONLINE_FEATURES_STAGE_METRIC,
+    ONLINE_STORE_METRIC,
+)
 from feathub.online_stores.online_store_client import OnlineStoreClient
-from feathub.processors.local.ast_evaluator.local_ast_evaluator import LocalAstEvaluator
+from feathub.processors.local.ast_evaluator.local_ast_compiler import LocalAstCompiler
 from feathub.registries.registry import Registry
 from feathub.feature_views.on_demand_feature_view import OnDemandFeatureView
-from feathub.feature_views.transforms.join_transform import JoinTransform
-from feathub.feature_views.transforms.expression_transform import ExpressionTransform
 from feathub.feature_tables.sources.memory_store_source import MemoryStoreSource
-from feathub.feature_views.feature import Feature
 from feathub.dsl.expr_parser import ExprParser
 from feathub.online_stores.memory_online_store import MemoryOnlineStore
 
@@ -40,14 +63,45 @@ class LocalFeatureService(FeatureService):
 
     SERVICE_TYPE = "local"
 
-    def __init__(self, props: Dict, registry: Registry):
+    def __init__(
+        self,
+        props: Dict,
+        registry: Registry,
+        metric_store: Optional[MetricStore] = None,
+    ):
+        """
+        :param props: The properties of the feature service.
+        :param registry: The registry to get feature views from.
+        :param metric_store: Optional. If it is not None, the latencies of serving
+                             online features are periodically reported to it.
+        """
         super().__init__()
         self.props = props
         self.registry = registry
-        self.parser = ExprParser()
-        self.ast_evaluator = LocalAstEvaluator()
+        self.metrics = OnlineMetrics()
+        self.metrics_reporter: Optional[OnlineMetricsReporter] = None
+        if metric_store is not None:
+            self.metrics_reporter = OnlineMetricsReporter(self.metrics, metric_store)
+            self.metrics_reporter.start()
+        self.parser = ExprParser.get_instance()
+        self.ast_compiler = LocalAstCompiler()
         self.online_store_clients: Dict[str, OnlineStoreClient] = {}
 
+        config = LocalFeatureServiceConfig(props)
+        self.cache_max_size = config.get(CACHE_MAX_SIZE_CONFIG)
+        self.cache_ttl_sec = config.get(CACHE_TTL_SEC_CONFIG)
+        self.cache_missing_keys = config.get(CACHE_MISSING_KEYS_CONFIG)
+        self.online_feature_caches: Dict[str, OnlineFeatureCache] = {}
+        self.plans: Dict[str, OnDemandFeatureViewPlan] = {}
+
+    def close(self) -> None:
+        """
+        Stops reporting the online metrics after reporting them for the last time, and
+        deletes them from the metric store.
+        """
+        if self.metrics_reporter is not None:
+            self.metrics_reporter.stop()
+
     def get_online_features(
         self,
         request_df: pd.DataFrame,
@@ -67,30 +121,119 @@ class LocalFeatureService(FeatureService):
                                fields of the specified table should be outputted.
         :return: A DataFrame obtained according to the specified criteria.
         """
-        if isinstance(feature_view, str):
-            feature_view = self._get_on_demand_feature_view_from_registry(feature_view)
-        elif feature_view.is_unresolved():
-            feature_view = self._get_on_demand_feature_view_from_registry(
-                feature_view.name
-            )
+        start_time = time.perf_counter()
+        feature_view = self._resolve_feature_view(feature_view)
 
+        metric_labels = {"feature_view": feature_view.name}
+        timer = self.metrics.create_stage_timer(
+            ONLINE_FEATURES_STAGE_METRIC, metric_labels
+        )
+        timer.start("plan")
         input_fields = request_df.columns.tolist()
-        for feature in feature_view.get_resolved_features():
-            if isinstance(feature.transform, JoinTransform):
-                request_df = self._evaluate_join_transform(request_df, feature)
-            elif isinstance(feature.transform, ExpressionTransform):
-                request_df = self._evaluate_expression_transform(request_df, feature)
+        plan = self._get_plan(feature_view)
+        for step in plan.steps:
+            if isinstance(step, JoinStep):
+                timer.start("join")
+                request_df = self._execute_join_step(request_df, step)
             else:
-                raise RuntimeError(
-                    f"Unsupported transformation type for feature {feature.to_json()}."
-                )
+                timer.start("expression")
+                request_df = self._execute_expression_step(request_df, step)
+
+        timer.start("output")
+        if feature_names is not None:
+            output_fields = feature_names
+        else:
+            output_fields = feature_view.get_output_fields(input_fields)
+        result_df = request_df[output_fields]
+
+        timer.record()
+        self.metrics.record(
+            ONLINE_FEATURES_METRIC,
+            metric_labels,
+            (time.perf_counter() - start_time) * 1000,
+            num_rows=len(result_df),
+        )
+        return result_df
 
+    def get_online_feature_records(
+        self,
+        requests: List[Dict[str, Any]],
+        feature_view: Union[str, OnDemandFeatureView],
+        feature_names: Optional[List[str]] = None,
+    ) -> List[Dict[str, Any]]:
+        """
+        Returns a list of dicts obtained by applying the given OnDemandFeatureView on
+        the given requests, without constructing pandas objects.
+
+        :param requests: A list of dicts, each of which contains the request fields of
+                         one row.
+        :param feature_view: Describes the features to be included in the output. If it
+                             is a string, it refers to the name of a OnDemandFeatureView
+                             in the entity registry.
+        :param feature_names: Optional. The names of fields of values that should be
+                               included in the output dicts. If it is None, all
+                               fields of the specified table should be outputted.
+        :return: A list of dicts, one for each request, obtained according to the
+                 specified criteria.
+        """
+        start_time = time.perf_counter()
+        feature_view = self._resolve_feature_view(feature_view)
+
+        metric_labels = {"feature_view": feature_view.name}
+        timer = self.metrics.create_stage_timer(
+            ONLINE_FEATURES_STAGE_METRIC, metric_labels
+        )
+        timer.start("plan")
+        records = [dict(request) for request in requests]
+        input_fields = list(records[0].keys()) if records else []
+        plan = self._get_plan(feature_view)
+        for step in plan.steps:
+            if isinstance(step, JoinStep):
+                timer.start("join")
+                records = self._execute_join_step_on_records(records, step)
+            else:
+                timer.start("expression")
+                for record in records:
+                    record[step.feature_name] = step.expr_func(record)
+
+        timer.start("output")
         if feature_names is not None:
             output_fields = feature_names
         else:
             output_fields = feature_view.get_output_fields(input_fields)
+        results = [
+            {field: record[field] for field in output_fields} for record in records
+        ]
+
+        timer.record()
+        self.metrics.record(
+            ONLINE_FEATURES_METRIC,
+            metric_labels,
+            (time.perf_counter() - start_time) * 1000,
+            num_rows=len(results),
+        )
+        return results
 
-        return request_df[output_fields]
+    def get_cache_statistics(self) -> Dict[str, CacheStatistics]:
+        """
+        Returns the statistics of the in-process cache of each table joined from an
+        online store, keyed by the name of the table. The lookups and evictions of
+        the caches are also counted in the online metrics, so that they are reported
+        to the metric store.
+        """
+        return {
+            table_name: cache.get_statistics()
+            for table_name, cache in self.online_feature_caches.items()
+        }
+
+    def _resolve_feature_view(
+        self, feature_view: Union[str, OnDemandFeatureView]
+    ) -> OnDemandFeatureView:
+        if isinstance(feature_view, str):
+            return self._get_on_demand_feature_view_from_registry(feature_view)
+        if feature_view.is_unresolved():
+            return self._get_on_demand_feature_view_from_registry(feature_view.name)
+        return feature_view
 
     def _get_on_demand_feature_view_from_registry(
         self, feature_view_name: str
@@ -103,49 +246,179 @@ class LocalFeatureService(FeatureService):
             )
         return feature_view
 
-    def _evaluate_expression_transform(
-        self, df: pd.DataFrame, feature: Feature
+    def _get_plan(self, feature_view: OnDemandFeatureView) -> OnDemandFeatureViewPlan:
+        plan = self.plans.get(feature_view.name)
+        # Recompiles the plan if the feature view has been rebuilt since the plan was
+        # compiled.
+        if plan is None or plan.feature_view is not feature_view:
+            plan = OnDemandFeatureViewPlan.compile(
+                feature_view, self.registry, self.parser, self.ast_compiler
+            )
+            self.plans[feature_view.name] = plan
+        return plan
+
+    def _execute_expression_step(
+        self, df: pd.DataFrame, step: ExpressionStep
     ) -> pd.DataFrame:
-        expression_transform = feature.transform
-        if not isinstance(expression_transform, ExpressionTransform):
-            raise FeathubException(f"Feature {feature} should use ExpressionTransform.")
-        expr_node = self.parser.parse(expression_transform.expr)
-        df[feature.name] = df.apply(
-            lambda row: self.ast_evaluator.eval(expr_node, row), axis=1
-        ).tolist()
+        df[step.feature_name] = df.apply(step.expr_func, axis=1).tolist()
         return df
 
-    def _evaluate_join_transform(
-        self, input_df: pd.DataFrame, feature: Feature
+    def _execute_join_step(
+        self, input_df: pd.DataFrame, step: JoinStep
     ) -> pd.DataFrame:
-        join_transform = feature.transform
-        if not isinstance(join_transform, JoinTransform):
-            raise RuntimeError(f"Feature '{feature.name}' should use JoinTransform.")
+        source = step.source
 
-        if not is_id(join_transform.expr):
-            raise FeathubException(
-                "It is not supported to use Feathub expression in JoinTransform when "
-                "getting online features."
+        if isinstance(source, MemoryStoreSource):
+            start_time = time.perf_counter()
+            result_df = MemoryOnlineStore.get_instance().get(
+                table_name=source.table_name,
+                input_data=input_df,
+                feature_names=list(step.feature_names),
+            )
+            self.metrics.record(
+                ONLINE_STORE_METRIC,
+                {"store": "memory", "table": source.name},
+                (time.perf_counter() - start_time) * 1000,
+                num_rows=len(input_df),
             )
+            return result_df
 
-        source = self.registry.get_features(join_transform.table_name)
+        if isinstance(source, RedisSource) or isinstance(source, MySQLSource):
+            client = self._get_online_store_client(source)
+            if self.cache_max_size > 0:
+                return self._get_features_with_cache(
+                    source, client, input_df, step.feature_names
+                )
+            return client.get(input_data=input_df, feature_names=step.feature_names)
+
+        raise RuntimeError(f"Unsupported source {source.to_json()}.")
+
+    def _execute_join_step_on_records(
+        self, records: List[Dict[str, Any]], step: JoinStep
+    ) -> List[Dict[str, Any]]:
+        source = step.source
 
         if isinstance(source, MemoryStoreSource):
-            return MemoryOnlineStore.get_instance().get(
-                table_name=source.table_name, input_data=input_df
+            start_time = time.perf_counter()
+            results = MemoryOnlineStore.get_instance().get_records(
+                table_name=source.table_name,
+                records=records,
+                feature_names=step.feature_names,
             )
+            self.metrics.record(
+                ONLINE_STORE_METRIC,
+                {"store": "memory", "table": source.name},
+                (time.perf_counter() - start_time) * 1000,
+                num_rows=len(records),
+            )
+            return results
 
         if isinstance(source, RedisSource) or isinstance(source, MySQLSource):
             client = self._get_online_store_client(source)
-            return client.get(
-                input_data=input_df, feature_names=[get_var_name(join_transform.expr)]
-            )
+            if self.cache_max_size > 0:
+                if records and not set(source.keys) <= records[0].keys():
+                    raise RuntimeError(
+                        f"Input record's field names {list(records[0].keys())} "
+                        f"should contain all of source key field names "
+                        f"{source.keys}."
+                    )
+                keys = [tuple(record[k] for k in source.keys) for record in records]
+                values = self._get_cached_feature_values(
+                    source, client, keys, step.feature_names, missing_value=None
+                )
+                return [
+                    {
+                        **record,
+                        **{name: values[(key, name)] for name in step.feature_names},
+                    }
+                    for record, key in zip(records, keys)
+                ]
+            return client.get_records(records=records, feature_names=step.feature_names)
 
         raise RuntimeError(f"Unsupported source {source.to_json()}.")
 
+    def _get_features_with_cache(
+        self,
+        source: FeatureTable,
+        client: OnlineStoreClient,
+        input_df: pd.DataFrame,
+        feature_names: List[str],
+    ) -> pd.DataFrame:
+        key_names = source.keys
+        if not set(key_names) <= set(input_df.columns.values):
+            raise RuntimeError(
+                f"Input dataframe's column names {input_df.columns.values} "
+                f"should contain all of source key field names {key_names}."
+            )
+
+        keys = list(input_df[key_names].itertuples(index=False, name=None))
+        values = self._get_cached_feature_values(
+            source, client, keys, feature_names, missing_value=np.nan
+        )
+        return input_df.assign(
+            **{name: [values[(key, name)] for key in keys] for name in feature_names}
+        )
+
+    def _get_cached_feature_values(
+        self,
+        source: FeatureTable,
+        client: OnlineStoreClient,
+        keys: List[Tuple],
+        feature_names: List[str],
+        missing_value: Any,
+    ) -> Dict[Hashable, Any]:
+        key_names = source.keys
+
+        def _load(cache_keys: List[Hashable]) -> Dict[Hashable, Any]:
+            # Reads all missing features of all missing keys with one lookup.
+            keys = list(OrderedDict.fromkeys(cast(Tuple, k)[0] for k in cache_keys))
+            names = list(OrderedDict.fromkeys(cast(Tuple, k)[1] for k in cache_keys))
+            features = client.get_records(
+                records=[dict(zip(key_names, key)) for key in keys],
+                feature_names=names,
+            )
+            values: Dict[Hashable, Any] = {
+                (key, name): record[name]
+                for name in names
+                for key, record in zip(keys, features)
+            }
+            # Keys whose feature value is null are treated as missing keys.
+            return {
+                cache_key: values[cache_key]
+                for cache_key in cache_keys
+                if not _is_null(values[cache_key])
+            }
+
+        cache_keys: List[Hashable] = [
+            (key, name) for name in feature_names for key in keys
+        ]
+        return self._get_online_feature_cache(source).get_all(
+            cache_keys, _load, missing_value=missing_value
+        )
+
+    def _get_online_feature_cache(self, source: FeatureTable) -> OnlineFeatureCache:
+        if source.name not in self.online_feature_caches:
+            # Uses setdefault so that concurrent requests share the same cache.
+            self.online_feature_caches.setdefault(
+                source.name,
+                OnlineFeatureCache(
+                    max_size=self.cache_max_size,
+                    ttl_sec=self.cache_ttl_sec,
+                    cache_missing_keys=self.cache_missing_keys,
+                    metrics=self.metrics,
+                    metric_labels={"table": source.name},
+                ),
+            )
+
+        return self.online_feature_caches[source.name]
+
     def _get_online_store_client(self, source: FeatureTable) -> OnlineStoreClient:
         if source.name not in self.online_store_clients:
-            client = OnlineStoreClient.instantiate(source)
+            client = OnlineStoreClient.instantiate(source, self.props, self.metrics)
             self.online_store_clients[source.name] = client
 
         return self.online_store_clients[source.name]
+
+
+def _is_null(value: Any) -> bool:
+    return value is None or (isinstance(value, float) and np.isnan(value))
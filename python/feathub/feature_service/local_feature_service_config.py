@@ -0,0 +1,71 @@
+#  Copyright 2022 The FeatHub Authors
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#      https://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+from typing import Dict, Any, List
+
+from feathub.common.config import ConfigDef
+from feathub.common.validators import gt_eq, gt
+from feathub.feature_service.feature_service_config import (
+    FeatureServiceConfig,
+    FEATURE_SERVICE_PREFIX,
+)
+
+LOCAL_FEATURE_SERVICE_PREFIX = FEATURE_SERVICE_PREFIX + "local."
+
+CACHE_MAX_SIZE_CONFIG = LOCAL_FEATURE_SERVICE_PREFIX + "cache.max_size"
+CACHE_MAX_SIZE_DOC = (
+    "The maximum number of entries cached in process for each table joined from an "
+    "online store. An entry holds the value of one feature of one key. Caching is "
+    "disabled if it is 0."
+)
+
+CACHE_TTL_SEC_CONFIG = LOCAL_FEATURE_SERVICE_PREFIX + "cache.ttl_sec"
+CACHE_TTL_SEC_DOC = (
+    "The time in seconds a cached entry stays valid after it is read from the online "
+    "store. It bounds how stale the features served from the cache can be."
+)
+
+CACHE_MISSING_KEYS_CONFIG = LOCAL_FEATURE_SERVICE_PREFIX + "cache.cache_missing_keys"
+CACHE_MISSING_KEYS_DOC = (
+    "Whether to cache the keys that do not exist in the online store, so that "
+    "repeated lookups of missing keys do not read the online store."
+)
+
+local_feature_service_config_defs: List[ConfigDef] = [
+    ConfigDef(
+        name=CACHE_MAX_SIZE_CONFIG,
+        value_type=int,
+        description=CACHE_MAX_SIZE_DOC,
+        default_value=0,
+        validator=gt_eq(0),
+    ),
+    ConfigDef(
+        name=CACHE_TTL_SEC_CONFIG,
+        value_type=float,
+        description=CACHE_TTL_SEC_DOC,
+        default_value=1.0,
+        validator=gt(0),  # type: ignore
+    ),
+    ConfigDef(
+        name=CACHE_MISSING_KEYS_CONFIG,
+        value_type=bool,
+        description=CACHE_MISSING_KEYS_DOC,
+        default_value=True,
+    ),
+]
+
+
+class LocalFeatureServiceConfig(FeatureServiceConfig):
+    def __init__(self, props: Dict[str, Any]) -> None:
+        super().__init__(props)
+        self.update_config_values(local_feature_service_config_defs)
@@ -0,0 +1,193 @@
+# Copyright 2022 The FeatHub Authors
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+from typing import List, Dict, Tuple, Sequence, Set, Union, Optional
+
+from feathub.common.exceptions import FeathubException
+from feathub.dsl.ast import ExprAST
+from feathub.dsl.expr_parser import ExprParser
+from feathub.dsl.expr_optimizer import optimize_expr
+from feathub.dsl.expr_utils import is_id, get_var_name, get_variables
+from feathub.feature_views.feature import Feature
+from feathub.feature_views.on_demand_feature_view import OnDemandFeatureView
+from feathub.feature_views.transforms.expression_transform import ExpressionTransform
+from feathub.feature_views.transforms.join_transform import JoinTransform
+from feathub.processors.local.ast_evaluator.local_ast_compiler import (
+    LocalAstCompiler,
+    CompiledExpr,
+)
+from feathub.registries.registry import Registry
+from feathub.table.table_descriptor import TableDescriptor
+
+
+class JoinStep:
+    """
+    A step that looks up features from one table in an online store with one request.
+    """
+
+    def __init__(self, source: TableDescriptor, feature_names: List[str]):
+        """
+        :param source: The table to look up features from.
+        :param feature_names: The names of the features to look up from the table.
+        """
+        self.source = source
+        self.feature_names = feature_names
+
+
+class ExpressionStep:
+    """
+    A step that computes a feature by evaluating an expression on each row.
+    """
+
+    def __init__(self, feature_name: str, expr_node: ExprAST, expr_func: CompiledExpr):
+        """
+        :param feature_name: The name of the computed feature.
+        :param expr_node: The parsed expression of the feature.
+        :param expr_func: The compiled expression of the feature, which evaluates the
+                          expression on a row.
+        """
+        self.feature_name = feature_name
+        self.expr_node = expr_node
+        self.expr_func = expr_func
+
+
+PlanStep = Union[JoinStep, ExpressionStep]
+
+
+class OnDemandFeatureViewPlan:
+    """
+    An execution plan compiled from a resolved OnDemandFeatureView. The plan holds the
+    parsed expressions of the features, and groups the join features of the same
+    table into one lookup. Its steps are ordered so that each step is executed after
+    the steps computing the fields it depends on.
+    """
+
+    def __init__(self, feature_view: OnDemandFeatureView, steps: List[PlanStep]):
+        """
+        :param feature_view: The resolved OnDemandFeatureView the plan is compiled
+                             from.
+        :param steps: The steps to execute in order.
+        """
+        self.feature_view = feature_view
+        self.steps = steps
+
+    @staticmethod
+    def compile(
+        feature_view: OnDemandFeatureView,
+        registry: Registry,
+        parser: ExprParser,
+        compiler: LocalAstCompiler,
+    ) -> "OnDemandFeatureViewPlan":
+        """
+        Compiles the given resolved OnDemandFeatureView into an execution plan.
+
+        :param feature_view: The resolved OnDemandFeatureView.
+        :param registry: The registry to get the tables joined by the feature view.
+        :param parser: The parser to parse the expressions of the features.
+        :param compiler: The compiler to compile the parsed expressions.
+        """
+        features = feature_view.get_resolved_features()
+        levels = _get_feature_levels(features, feature_view.request_schema.field_names)
+
+        # Maps from the level and the table name to the join step.
+        join_steps: Dict[Tuple[int, str], JoinStep] = {}
+        expression_steps: List[Tuple[int, ExpressionStep]] = []
+        for feature, level in zip(features, levels):
+            transform = feature.transform
+            if isinstance(transform, JoinTransform):
+                if not is_id(transform.expr):
+                    raise FeathubException(
+                        "It is not supported to use Feathub expression in "
+                        "JoinTransform when getting online features."
+                    )
+                step_key = (level, transform.table_name)
+                if step_key not in join_steps:
+                    join_steps[step_key] = JoinStep(
+                        source=registry.get_features(transform.table_name),
+                        feature_names=[],
+                    )
+                join_steps[step_key].feature_names.append(get_var_name(transform.expr))
+            elif isinstance(transform, ExpressionTransform):
+                expr_node = optimize_expr(parser.parse(transform.expr))
+                expression_steps.append(
+                    (
+                        level,
+                        ExpressionStep(
+                            feature.name, expr_node, compiler.compile(expr_node)
+                        ),
+                    )
+                )
+            else:
+                raise RuntimeError(
+                    f"Unsupported transformation type for feature {feature.to_json()}."
+                )
+
+        # Within the same level, steps do not depend on each other. Join steps are
+        # executed before expression steps, and steps of the same type are executed
+        # in the order their features are declared.
+        steps: List[PlanStep] = []
+        for level in sorted(set(levels)):
+            steps.extend(step for (lv, _), step in join_steps.items() if lv == level)
+            steps.extend(step for lv, step in expression_steps if lv == level)
+
+        return OnDemandFeatureViewPlan(feature_view, steps)
+
+
+def _get_feature_levels(
+    features: Sequence[Feature], request_fields: Sequence[str]
+) -> List[int]:
+    """
+    Returns the level of each feature in the dependency graph of the features. A
+    feature has a higher level than the features computing the fields it reads. If a
+    feature reads a request field that is overwritten by a feature declared after it,
+    the overwriting feature has a higher level than the reading feature.
+    """
+    feature_indices = {feature.name: i for i, feature in enumerate(features)}
+    dependencies: List[Set[int]] = [set() for _ in features]
+    for i, feature in enumerate(features):
+        for field in _get_dependent_fields(feature):
+            j = feature_indices.get(field)
+            if j is None or j == i:
+                continue
+            if j < i or field not in request_fields:
+                dependencies[i].add(j)
+            else:
+                dependencies[j].add(i)
+
+    levels: List[Optional[int]] = [None] * len(features)
+    visiting: Set[int] = set()
+
+    def _get_level(index: int) -> int:
+        level = levels[index]
+        if level is not None:
+            return level
+        if index in visiting:
+            raise FeathubException(
+                f"Feature {features[index].name} has circular dependency on itself."
+            )
+        visiting.add(index)
+        level = 1 + max([_get_level(j) for j in dependencies[index]] + [0])
+        visiting.remove(index)
+        levels[index] = level
+        return level
+
+    return [_get_level(i) for i in range(len(features))]
+
+
+def _get_dependent_fields(feature: Feature) -> Set[str]:
+    transform = feature.transform
+    if isinstance(transform, JoinTransform):
+        return set(feature.keys if feature.keys is not None else [])
+    if isinstance(transform, ExpressionTransform):
+        return get_variables(transform.expr)
+    return set()
@@ -0,0 +1,244 @@
+# Copyright 2022 The FeatHub Authors
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import Future
+from typing import Any, Callable, Dict, Hashable, List, Tuple, Optional
+
+from feathub.metric_stores.online_metrics import (
+    OnlineMetrics,
+    ONLINE_FEATURE_CACHE_METRIC,
+)
+
+# Placeholder of a cached value whose key does not exist in the online store.
+_MISSING = object()
+
+
+class CacheStatistics:
+    """
+    Statistics about the lookups served by an OnlineFeatureCache.
+    """
+
+    def __init__(
+        self,
+        hit_count: int,
+        miss_count: int,
+        coalesced_count: int,
+        eviction_count: int,
+        size: int,
+    ):
+        """
+        :param hit_count: The number of lookups served from the cache.
+        :param miss_count: The number of lookups that were read from the backend.
+        :param coalesced_count: The number of lookups that missed the cache and waited
+                                for a concurrent backend read of the same key instead
+                                of reading the backend by themselves.
+        :param eviction_count: The number of entries evicted because the cache is
+                               full.
+        :param size: The number of entries currently in the cache.
+        """
+        self.hit_count = hit_count
+        self.miss_count = miss_count
+        self.coalesced_count = coalesced_count
+        self.eviction_count = eviction_count
+        self.size = size
+
+    @property
+    def request_count(self) -> int:
+        return self.hit_count + self.miss_count + self.coalesced_count
+
+    @property
+    def hit_rate(self) -> float:
+        """
+        The ratio of lookups that did not read the backend by themselves.
+        """
+        if self.request_count == 0:
+            return 0.0
+        return (self.hit_count + self.coalesced_count) / self.request_count
+
+    def __repr__(self) -> str:
+        return (
+            f"CacheStatistics(hit_count={self.hit_count}, "
+            f"miss_count={self.miss_count}, "
+            f"coalesced_count={self.coalesced_count}, "
+            f"eviction_count={self.eviction_count}, size={self.size})"
+        )
+
+
+class OnlineFeatureCache:
+    """
+    A thread-safe in-process cache of values read from an online store.
+
+    Entries expire after a TTL and the least recently used entries are evicted when
+    the cache is full. Keys that do not exist in the online store are cached as well,
+    so that repeated lookups of missing keys do not read the backend. Concurrent
+    misses of the same key are coalesced into one backend read.
+    """
+
+    def __init__(
+        self,
+        max_size: int,
+        ttl_sec: float,
+        cache_missing_keys: bool = True,
+        metrics: Optional[OnlineMetrics] = None,
+        metric_labels: Optional[Dict[str, str]] = None,
+    ):
+        """
+        :param max_size: The maximum number of entries kept in the cache.
+        :param ttl_sec: The time in seconds an entry stays valid after it is read
+                        from the backend.
+        :param cache_missing_keys: Whether to cache the keys that do not exist in the
+                                   backend.
+        :param metrics: Optional. If it is not None, the hits, misses, coalesced
+                        lookups and evictions of this cache are counted in it.
+        :param metric_labels: Optional. The labels of the counters in the metrics.
+        """
+        self.max_size = max_size
+        self.ttl_sec = ttl_sec
+        self.cache_missing_keys = cache_missing_keys
+        self.metrics = metrics
+        self.metric_labels = {} if metric_labels is None else metric_labels
+
+        self._lock = threading.Lock()
+        # Maps from key to a tuple of the value and its expiration time.
+        self._entries: "OrderedDict[Hashable, Tuple[Any, float]]" = OrderedDict()
+        self._pending_loads: Dict[Hashable, Future] = {}
+
+        self._hit_count = 0
+        self._miss_count = 0
+        self._coalesced_count = 0
+        self._eviction_count = 0
+
+    def get_all(
+        self,
+        keys: List[Hashable],
+        loader: Callable[[List[Hashable]], Dict[Hashable, Any]],
+        missing_value: Any = None,
+    ) -> Dict[Hashable, Any]:
+        """
+        Returns the values of the given keys. Values not found in the cache are read
+        with the loader.
+
+        :param keys: The keys to look up.
+        :param loader: A function that reads the values of the given keys from the
+                       backend. Keys that do not exist in the backend should be
+                       absent from the returned dict.
+        :param missing_value: The value returned for keys that do not exist in the
+                              backend.
+        :return: A dict from each key to its value.
+        """
+        results: Dict[Hashable, Any] = {}
+        keys_to_load: List[Hashable] = []
+        loading_futures: Dict[Hashable, Future] = {}
+        waiting_futures: Dict[Hashable, Future] = {}
+        hit_count = 0
+
+        with self._lock:
+            now = time.monotonic()
+            for key in keys:
+                if key in results or key in loading_futures or key in waiting_futures:
+                    continue
+                entry = self._entries.get(key)
+                if entry is not None and entry[1] > now:
+                    self._entries.move_to_end(key)
+                    results[key] = entry[0]
+                    hit_count += 1
+                elif key in self._pending_loads:
+                    waiting_futures[key] = self._pending_loads[key]
+                else:
+                    future: Future = Future()
+                    self._pending_loads[key] = future
+                    loading_futures[key] = future
+                    keys_to_load.append(key)
+            self._hit_count += hit_count
+            self._coalesced_count += len(waiting_futures)
+            self._miss_count += len(keys_to_load)
+
+        self._record_counter("hit", hit_count)
+        self._record_counter("coalesced", len(waiting_futures))
+        self._record_counter("miss", len(keys_to_load))
+
+        if keys_to_load:
+            try:
+                loaded_values = loader(keys_to_load)
+            except BaseException as e:
+                with self._lock:
+                    for key in keys_to_load:
+                        self._pending_loads.pop(key, None)
+                for future in loading_futures.values():
+                    future.set_exception(e)
+                raise
+
+            eviction_count = 0
+            with self._lock:
+                expiration_time = time.monotonic() + self.ttl_sec
+                for key in keys_to_load:
+                    value = loaded_values.get(key, _MISSING)
+                    self._pending_loads.pop(key, None)
+                    if value is not _MISSING or self.cache_missing_keys:
+                        eviction_count += self._put(key, value, expiration_time)
+                    results[key] = value
+            self._record_counter("eviction", eviction_count)
+
+            for key in keys_to_load:
+                loading_futures[key].set_result(results[key])
+
+        for key, future in waiting_futures.items():
+            results[key] = future.result()
+
+        return {
+            key: missing_value if value is _MISSING else value
+            for key, value in results.items()
+        }
+
+    def get_statistics(self) -> CacheStatistics:
+        """
+        Returns the statistics of lookups served by this cache.
+        """
+        with self._lock:
+            return CacheStatistics(
+                hit_count=self._hit_count,
+                miss_count=self._miss_count,
+                coalesced_count=self._coalesced_count,
+                eviction_count=self._eviction_count,
+                size=len(self._entries),
+            )
+
+    def clear(self) -> None:
+        """
+        Removes all entries from the cache.
+        """
+        with self._lock:
+            self._entries.clear()
+
+    def _put(self, key: Hashable, value: Any, expiration_time: float) -> int:
+        """
+        Puts the given entry in the cache and returns the number of entries evicted.
+        """
+        self._entries[key] = (value, expiration_time)
+        self._entries.move_to_end(key)
+        eviction_count = 0
+        while len(self._entries) > self.max_size:
+            self._entries.popitem(last=False)
+            eviction_count += 1
+        self._eviction_count += eviction_count
+        return eviction_count
+
+    def _record_counter(self, event: str, count: int) -> None:
+        if self.metrics is None or count == 0:
+            return
+        self.metrics.increment_counter(
+            ONLINE_FEATURE_CACHE_METRIC, {**self.metric_labels, "event": event}, count
+        )
@@ -0,0 +1,170 @@
+# Copyright 2022 The FeatHub Authors
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+import json
+import threading
+import unittest
+import urllib.error
+import urllib.request
+from typing import Optional, List, Union
+
+import pandas as pd
+
+from feathub.common import types
+from feathub.feature_service.feature_server import FeatureServer
+from feathub.feature_service.feature_server_config import (
+    MAX_WAIT_MS_CONFIG,
+    MAX_BATCH_SIZE_CONFIG,
+)
+from feathub.feature_service.feature_service import FeatureService
+from feathub.feature_views.on_demand_feature_view import OnDemandFeatureView
+from feathub.table.schema import Schema
+
+
+class _DoublingFeatureService(FeatureService):
+    def __init__(self) -> None:
+        super().__init__()
+        self.request_dfs: List[pd.DataFrame] = []
+        self.feature_views: List[Union[str, OnDemandFeatureView]] = []
+        self.lock = threading.Lock()
+
+    def get_online_features(
+        self,
+        request_df: pd.DataFrame,
+        feature_view: Union[str, OnDemandFeatureView],
+        feature_names: Optional[List[str]] = None,
+    ) -> pd.DataFrame:
+        name = feature_view if isinstance(feature_view, str) else feature_view.name
+        if name != "doubling_fv":
+            raise RuntimeError(f"Unknown feature view {feature_view}.")
+        with self.lock:
+            self.request_dfs.append(request_df)
+            self.feature_views.append(feature_view)
+        # Adds the feature to the request DataFrame in place like
+        # LocalFeatureService.
+        request_df["doubled"] = request_df["value"] * 2
+        return request_df
+
+
+class FeatureServerTest(unittest.TestCase):
+    def setUp(self) -> None:
+        self.feature_service = _DoublingFeatureService()
+
+    def _create_server(self, max_wait_ms: float, max_batch_size: int):
+        server = FeatureServer(
+            self.feature_service,
+            props={
+                MAX_WAIT_MS_CONFIG: max_wait_ms,
+                MAX_BATCH_SIZE_CONFIG: max_batch_size,
+            },
+        )
+        self.addCleanup(server.close)
+        return server
+
+    def test_coalesce_concurrent_requests(self):
+        server = self._create_server(max_wait_ms=60000, max_batch_size=4)
+        futures = [
+            server.submit(pd.DataFrame({"value": [i, i + 10]}), "doubling_fv")
+            for i in range(2)
+        ]
+
+        self.assertEqual(
+            [[0, 20], [2, 22]],
+            [future.result()["doubled"].tolist() for future in futures],
+        )
+        self.assertEqual(1, len(self.feature_service.request_dfs))
+        self.assertEqual(
+            [0, 10, 1, 11], self.feature_service.request_dfs[0]["value"].tolist()
+        )
+
+        statistics = server.get_statistics()
+        self.assertEqual(2, statistics.request_count)
+        self.assertEqual(1, statistics.batch_count)
+        self.assertEqual(2, statistics.queueing_latency.count)
+        self.assertEqual(1, statistics.execution_latency.count)
+
+    def test_execute_batch_after_max_wait(self):
+        server = self._create_server(max_wait_ms=1, max_batch_size=100)
+        result_df = server.get_online_features(
+            pd.DataFrame({"value": [1]}, index=[5]), "doubling_fv"
+        )
+
+        self.assertEqual([5], result_df.index.tolist())
+        self.assertEqual([2], result_df["doubled"].tolist())
+
+    def test_request_df_not_modified(self):
+        server = self._create_server(max_wait_ms=1, max_batch_size=100)
+        request_df = pd.DataFrame({"value": [1]})
+        server.get_online_features(request_df, "doubling_fv")
+
+        self.assertEqual(["value"], request_df.columns.tolist())
+
+    def test_separate_batches_of_inline_feature_views_with_same_name(self):
+        server = self._create_server(max_wait_ms=10, max_batch_size=100)
+        feature_views = [
+            OnDemandFeatureView(
+                name="doubling_fv",
+                features=[],
+                request_schema=Schema.new_builder()
+                .column("value", types.Int64)
+                .build(),
+            )
+            for _ in range(2)
+        ]
+        futures = [
+            server.submit(pd.DataFrame({"value": [i]}), feature_view)
+            for i, feature_view in enumerate(feature_views)
+        ]
+
+        self.assertEqual(
+            [[0], [2]], [future.result()["doubled"].tolist() for future in futures]
+        )
+        self.assertEqual(2, server.get_statistics().batch_count)
+        self.assertCountEqual(
+            [id(feature_view) for feature_view in feature_views],
+            [id(feature_view) for feature_view in self.feature_service.feature_views],
+        )
+
+    def test_separate_batches_of_different_feature_views(self):
+        server = self._create_server(max_wait_ms=10, max_batch_size=100)
+        future_1 = server.submit(pd.DataFrame({"value": [1]}), "doubling_fv")
+        future_2 = server.submit(pd.DataFrame({"value": [1]}), "unknown_fv")
+
+        self.assertEqual([2], future_1.result()["doubled"].tolist())
+        with self.assertRaises(RuntimeError):
+            future_2.result()
+        self.assertEqual(2, server.get_statistics().batch_count)
+
+    def test_http_server(self):
+        server = self._create_server(max_wait_ms=1, max_batch_size=100)
+        port = server.start_http_server()
+
+        def _post(body):
+            request = urllib.request.Request(
+                f"http://127.0.0.1:{port}",
+                data=json.dumps(body).encode("utf-8"),
+                method="POST",
+            )
+            with urllib.request.urlopen(request) as response:
+                return json.loads(response.read())
+
+        self.assertEqual(
+            [{"value": 1, "doubled": 2}, {"value": 3, "doubled": 6}],
+            _post(
+                {"feature_view": "doubling_fv", "request": [{"value": 1}, {"value": 3}]}
+            ),
+        )
+
+        with self.assertRaises(urllib.error.HTTPError) as context:
+            _post({"request": [{"value": 1}]})
+        self.assertEqual(400, context.exception.code)
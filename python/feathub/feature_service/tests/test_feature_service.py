@@ -14,7 +14,7 @@
 import shutil
 import tempfile
 import unittest
-from typing import List, Optional
+from typing import List, Optional, Dict
 
 import pandas as pd
 
@@ -26,9 +26,18 @@ from feathub.feature_service.local_feature_service import LocalFeatureService
 from feathub.feature_tables.sinks.memory_store_sink import MemoryStoreSink
 from feathub.feature_tables.sources.file_system_source import FileSystemSource
 from feathub.feature_tables.sources.memory_store_source import MemoryStoreSource
+from feathub.feature_tables.sources.mysql_source import MySQLSource
 from feathub.feature_views.feature import Feature
 from feathub.feature_views.on_demand_feature_view import OnDemandFeatureView
+from feathub.metric_stores.online_metrics import (
+    ONLINE_FEATURES_METRIC,
+    ONLINE_FEATURES_STAGE_METRIC,
+    ONLINE_STORE_METRIC,
+    ONLINE_FEATURE_CACHE_METRIC,
+)
+from feathub.metric_stores.tests.test_online_metrics import _CollectingMetricStore
 from feathub.online_stores.memory_online_store import MemoryOnlineStore
+from feathub.online_stores.online_store_client import OnlineStoreClient
 from feathub.processors.local.local_processor import LocalProcessor
 from feathub.processors.materialization_descriptor import (
     MaterializationDescriptor,
@@ -37,6 +46,28 @@ from feathub.registries.local_registry import LocalRegistry
 from feathub.table.schema import Schema
 
 
+class _DictOnlineStoreClient(OnlineStoreClient):
+    def __init__(self, key: str, features: Dict[str, Dict]):
+        super().__init__()
+        self.key = key
+        self.features = features
+        self.requested_keys: List = []
+
+    def get(
+        self, input_data: pd.DataFrame, feature_names: Optional[List[str]] = None
+    ) -> pd.DataFrame:
+        self.requested_keys.extend(input_data[self.key].tolist())
+        values = pd.DataFrame(
+            [
+                [self.features.get(key, {}).get(name) for name in feature_names]
+                for key in input_data[self.key]
+            ],
+            columns=feature_names,
+            index=input_data.index,
+        )
+        return input_data.join(values)
+
+
 class FeatureServiceTest(unittest.TestCase):
     def setUp(self):
         self.registry = LocalRegistry(props={})
@@ -182,6 +213,61 @@ class FeatureServiceTest(unittest.TestCase):
         )
         self.assertTrue(expected_online_features.equals(online_features))
 
+    def test_online_metrics(self):
+        on_demand_fv = OnDemandFeatureView(
+            name="on_demand_fv",
+            features=[
+                f"{self.online_source_1.name}.cost",
+                Feature(name="double_cost", transform="cost * 2"),
+            ],
+            request_schema=Schema.new_builder().column("name", types.String).build(),
+        )
+        self.registry.build_features([on_demand_fv])
+        for _ in range(2):
+            self.feature_service.get_online_features(
+                request_df=pd.DataFrame([["Alex"], ["Emma"]], columns=["name"]),
+                feature_view=on_demand_fv,
+            )
+
+        metrics = self.feature_service.metrics
+        labels = {"feature_view": "on_demand_fv"}
+        self.assertEqual(2, metrics.get_histogram(ONLINE_FEATURES_METRIC, labels).count)
+        self.assertEqual(4, metrics.get_row_count(ONLINE_FEATURES_METRIC, labels))
+        for stage in ["plan", "join", "expression", "output"]:
+            self.assertEqual(
+                2,
+                metrics.get_histogram(
+                    ONLINE_FEATURES_STAGE_METRIC, {**labels, "stage": stage}
+                ).count,
+            )
+
+        store_labels = {"store": "memory", "table": self.online_source_1.name}
+        self.assertEqual(4, metrics.get_row_count(ONLINE_STORE_METRIC, store_labels))
+
+    def test_close_reports_online_metrics(self):
+        metric_store = _CollectingMetricStore()
+        feature_service = LocalFeatureService(
+            props={}, registry=self.registry, metric_store=metric_store
+        )
+        on_demand_fv = OnDemandFeatureView(
+            name="on_demand_fv",
+            features=[f"{self.online_source_1.name}.cost"],
+            request_schema=Schema.new_builder().column("name", types.String).build(),
+        )
+        self.registry.build_features([on_demand_fv])
+        feature_service.get_online_features(
+            request_df=pd.DataFrame([["Alex"]], columns=["name"]),
+            feature_view=on_demand_fv,
+        )
+        num_reports = len(metric_store.reported_texts)
+
+        feature_service.close()
+        self.assertEqual(num_reports + 1, len(metric_store.reported_texts))
+        self.assertIn(ONLINE_FEATURES_METRIC, metric_store.reported_texts[-1])
+
+        feature_service.close()
+        self.assertEqual(num_reports + 1, len(metric_store.reported_texts))
+
     def test_selected_features(self):
         request_df = pd.DataFrame(
             [
@@ -255,3 +341,193 @@ class FeatureServiceTest(unittest.TestCase):
             columns=["name", "extra_field", "cost"],
         )
         self.assertTrue(expected_online_features.equals(online_features))
+
+    def test_online_feature_cache(self):
+        feature_service = LocalFeatureService(
+            props={
+                "feature_service.local.cache.max_size": 100,
+                "feature_service.local.cache.ttl_sec": 60,
+            },
+            registry=self.registry,
+        )
+        source = MySQLSource(
+            name="mysql_source",
+            database="database",
+            table="table",
+            schema=Schema.new_builder()
+            .column("name", types.String)
+            .column("cost", types.Int64)
+            .build(),
+            host="127.0.0.1",
+            username="user",
+            password="password",
+            keys=["name"],
+        )
+        client = _DictOnlineStoreClient(
+            key="name", features={"Alex": {"cost": 600}, "Emma": {"cost": 200}}
+        )
+        feature_service.online_store_clients[source.name] = client
+
+        on_demand_fv = OnDemandFeatureView(
+            name="on_demand_fv",
+            features=[f"{source.name}.cost"],
+            keep_source_fields=True,
+            request_schema=Schema.new_builder().column("name", types.String).build(),
+        )
+        self.registry.build_features([source, on_demand_fv])
+
+        request_df = pd.DataFrame([["Alex"], ["Emma"], ["Alex"]], columns=["name"])
+        expected_online_features = pd.DataFrame(
+            [["Alex", 600], ["Emma", 200], ["Alex", 600]],
+            columns=["name", "cost"],
+        )
+        for _ in range(2):
+            online_features = feature_service.get_online_features(
+                request_df=request_df,
+                feature_view=on_demand_fv,
+            )
+            self.assertTrue(expected_online_features.equals(online_features))
+
+        request_df = pd.DataFrame([["Jack"], ["Emma"], ["Jack"]], columns=["name"])
+        for _ in range(2):
+            online_features = feature_service.get_online_features(
+                request_df=request_df,
+                feature_view=on_demand_fv,
+            )
+            self.assertEqual(["Jack", "Emma", "Jack"], online_features["name"].tolist())
+            self.assertTrue(online_features["cost"].isna().tolist()[0])
+            self.assertEqual(200, online_features["cost"][1])
+
+        # Each key is read from the online store once, including the missing key.
+        self.assertEqual(["Alex", "Emma", "Jack"], client.requested_keys)
+
+        statistics = feature_service.get_cache_statistics()[source.name]
+        self.assertEqual(3, statistics.miss_count)
+        self.assertEqual(5, statistics.hit_count)
+        self.assertEqual(
+            5,
+            feature_service.metrics.get_counter(
+                ONLINE_FEATURE_CACHE_METRIC, {"table": source.name, "event": "hit"}
+            ),
+        )
+
+    def test_online_feature_cache_with_records(self):
+        feature_service = LocalFeatureService(
+            props={"feature_service.local.cache.max_size": 100},
+            registry=self.registry,
+        )
+        source = MySQLSource(
+            name="mysql_source",
+            database="database",
+            table="table",
+            schema=Schema.new_builder()
+            .column("name", types.String)
+            .column("cost", types.Int64)
+            .build(),
+            host="127.0.0.1",
+            username="user",
+            password="password",
+            keys=["name"],
+        )
+        client = _DictOnlineStoreClient(key="name", features={"Alex": {"cost": 600}})
+        feature_service.online_store_clients[source.name] = client
+
+        on_demand_fv = OnDemandFeatureView(
+            name="on_demand_fv",
+            features=[f"{source.name}.cost"],
+            keep_source_fields=True,
+            request_schema=Schema.new_builder().column("name", types.String).build(),
+        )
+        self.registry.build_features([source, on_demand_fv])
+
+        for _ in range(2):
+            online_features = feature_service.get_online_feature_records(
+                requests=[{"name": "Alex"}, {"name": "Jack"}],
+                feature_view=on_demand_fv,
+            )
+            self.assertEqual(
+                [{"name": "Alex", "cost": 600}, {"name": "Jack", "cost": None}],
+                online_features,
+            )
+        self.assertEqual(["Alex", "Jack"], client.requested_keys)
+
+    def test_get_online_feature_records(self):
+        on_demand_fv = OnDemandFeatureView(
+            name="on_demand_fv",
+            features=[
+                f"{self.online_source_1.name}.cost",
+                f"{self.online_source_2.name}.distance",
+                Feature(
+                    name="avg_cost",
+                    transform="cost / distance",
+                ),
+                Feature(
+                    name="derived_extra_field",
+                    transform="distance * extra_field",
+                ),
+            ],
+            request_schema=Schema.new_builder()
+            .column("name", types.String)
+            .column("extra_field", types.Float32)
+            .build(),
+        )
+        self.registry.build_features([on_demand_fv])
+
+        online_features = self.feature_service.get_online_feature_records(
+            requests=[
+                {"name": "Alex", "extra_field": 100},
+                {"name": "Emma", "extra_field": 300},
+            ],
+            feature_view=on_demand_fv,
+        )
+        self.assertEqual(
+            [
+                {
+                    "name": "Alex",
+                    "cost": 600,
+                    "distance": 800,
+                    "avg_cost": 0.75,
+                    "derived_extra_field": 80000,
+                },
+                {
+                    "name": "Emma",
+                    "cost": 200,
+                    "distance": 250,
+                    "avg_cost": 0.8,
+                    "derived_extra_field": 75000,
+                },
+            ],
+            online_features,
+        )
+
+        online_features = self.feature_service.get_online_feature_records(
+            requests=[{"name": "Alex", "extra_field": 100}],
+            feature_view="on_demand_fv",
+            feature_names=["avg_cost"],
+        )
+        self.assertEqual([{"avg_cost": 0.75}], online_features)
+
+    def test_reuse_compiled_plan(self):
+        request_df = pd.DataFrame([["Alex"], ["Emma"]], columns=["name"])
+        on_demand_fv = OnDemandFeatureView(
+            name="on_demand_fv",
+            features=[
+                f"{self.online_source_1.name}.cost",
+                Feature(name="double_cost", transform="cost * 2"),
+            ],
+            request_schema=Schema.new_builder().column("name", types.String).build(),
+        )
+        self.registry.build_features([on_demand_fv])
+
+        self.feature_service.get_online_features(request_df, "on_demand_fv")
+        plan = self.feature_service.plans["on_demand_fv"]
+        online_features = self.feature_service.get_online_features(
+            request_df, "on_demand_fv"
+        )
+        self.assertIs(plan, self.feature_service.plans["on_demand_fv"])
+        self.assertEqual([1200, 400], online_features["double_cost"].tolist())
+
+        # Rebuilding the feature view invalidates the compiled plan.
+        self.registry.build_features([on_demand_fv])
+        self.feature_service.get_online_features(request_df, "on_demand_fv")
+        self.assertIsNot(plan, self.feature_service.plans["on_demand_fv"])
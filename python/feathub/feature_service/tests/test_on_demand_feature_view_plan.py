@@ -0,0 +1,131 @@
+# Copyright 2022 The FeatHub Authors
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+import unittest
+from typing import cast, List
+
+from feathub.common import types
+from feathub.dsl.expr_parser import ExprParser
+from feathub.processors.local.ast_evaluator.local_ast_compiler import LocalAstCompiler
+from feathub.feature_service.on_demand_feature_view_plan import (
+    OnDemandFeatureViewPlan,
+    JoinStep,
+    ExpressionStep,
+)
+from feathub.feature_tables.sources.mysql_source import MySQLSource
+from feathub.feature_views.feature import Feature
+from feathub.feature_views.on_demand_feature_view import OnDemandFeatureView
+from feathub.registries.local_registry import LocalRegistry
+from feathub.table.schema import Schema
+
+
+class OnDemandFeatureViewPlanTest(unittest.TestCase):
+    def setUp(self) -> None:
+        self.registry = LocalRegistry(props={})
+        self.source_1 = self._create_source(
+            "source_1", ["name"], ["name", "cost", "distance"]
+        )
+        self.source_2 = self._create_source("source_2", ["city"], ["city", "price"])
+        self.registry.build_features([self.source_1, self.source_2])
+
+    @staticmethod
+    def _create_source(name: str, keys: List[str], fields: List[str]) -> MySQLSource:
+        schema_builder = Schema.new_builder()
+        for field in fields:
+            schema_builder.column(
+                field, types.String if field in keys else types.Float64
+            )
+        return MySQLSource(
+            name=name,
+            database="database",
+            table=name,
+            schema=schema_builder.build(),
+            host="127.0.0.1",
+            username="user",
+            password="password",
+            keys=keys,
+        )
+
+    def _compile(self, features) -> OnDemandFeatureViewPlan:
+        feature_view = OnDemandFeatureView(
+            name="on_demand_fv",
+            features=features,
+            request_schema=Schema.new_builder()
+            .column("name", types.String)
+            .column("extra", types.Float64)
+            .build(),
+        )
+        built_feature_view = cast(
+            OnDemandFeatureView, self.registry.build_features([feature_view])[0]
+        )
+        return OnDemandFeatureViewPlan.compile(
+            built_feature_view, self.registry, ExprParser(), LocalAstCompiler()
+        )
+
+    def test_group_join_features_of_same_table(self):
+        plan = self._compile(
+            [
+                "source_1.cost",
+                Feature(name="avg_cost", transform="cost / distance"),
+                "source_1.distance",
+                Feature(name="double_extra", transform="extra * 2"),
+            ]
+        )
+
+        self.assertEqual(3, len(plan.steps))
+        join_step = cast(JoinStep, plan.steps[0])
+        self.assertIsInstance(join_step, JoinStep)
+        self.assertEqual("source_1", join_step.source.name)
+        self.assertEqual(["cost", "distance"], join_step.feature_names)
+        self.assertEqual(
+            ["double_extra", "avg_cost"],
+            [cast(ExpressionStep, step).feature_name for step in plan.steps[1:]],
+        )
+
+    def test_join_on_computed_key(self):
+        plan = self._compile(
+            [
+                Feature(name="city", transform="LOWER(name)", dtype=types.String),
+                "source_2.price",
+                "source_1.cost",
+                Feature(name="total", transform="price + cost"),
+            ]
+        )
+
+        self.assertEqual(
+            [
+                ("join", "source_1"),
+                ("expression", "city"),
+                ("join", "source_2"),
+                ("expression", "total"),
+            ],
+            [
+                ("join", step.source.name)
+                if isinstance(step, JoinStep)
+                else ("expression", step.feature_name)
+                for step in plan.steps
+            ],
+        )
+
+    def test_overwrite_field_read_by_preceding_feature(self):
+        plan = self._compile(
+            [
+                Feature(name="double_extra", transform="extra * 2"),
+                Feature(name="extra", transform="extra + 1"),
+            ]
+        )
+
+        self.assertEqual(
+            ["double_extra", "extra"],
+            [cast(ExpressionStep, step).feature_name for step in plan.steps],
+        )
@@ -0,0 +1,140 @@
+# Copyright 2022 The FeatHub Authors
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+import threading
+import time
+import unittest
+from concurrent.futures import ThreadPoolExecutor
+from typing import List
+
+from feathub.feature_service.online_feature_cache import OnlineFeatureCache
+from feathub.metric_stores.online_metrics import (
+    OnlineMetrics,
+    ONLINE_FEATURE_CACHE_METRIC,
+)
+
+
+class _CountingLoader:
+    def __init__(self, values, delay_sec: float = 0.0):
+        self.values = values
+        self.delay_sec = delay_sec
+        self.loaded_keys: List = []
+        self.lock = threading.Lock()
+
+    def __call__(self, keys):
+        with self.lock:
+            self.loaded_keys.extend(keys)
+        time.sleep(self.delay_sec)
+        return {key: self.values[key] for key in keys if key in self.values}
+
+
+class OnlineFeatureCacheTest(unittest.TestCase):
+    def test_hit_and_miss(self):
+        cache = OnlineFeatureCache(max_size=10, ttl_sec=60)
+        loader = _CountingLoader({"a": 1, "b": 2})
+
+        self.assertEqual({"a": 1, "b": 2}, cache.get_all(["a", "b", "a"], loader))
+        self.assertEqual({"a": 1}, cache.get_all(["a"], loader))
+        self.assertEqual(["a", "b"], loader.loaded_keys)
+
+        statistics = cache.get_statistics()
+        self.assertEqual(1, statistics.hit_count)
+        self.assertEqual(2, statistics.miss_count)
+        self.assertEqual(2, statistics.size)
+        self.assertAlmostEqual(1 / 3, statistics.hit_rate)
+
+    def test_ttl(self):
+        cache = OnlineFeatureCache(max_size=10, ttl_sec=0.05)
+        loader = _CountingLoader({"a": 1})
+
+        cache.get_all(["a"], loader)
+        cache.get_all(["a"], loader)
+        self.assertEqual(["a"], loader.loaded_keys)
+
+        time.sleep(0.1)
+        cache.get_all(["a"], loader)
+        self.assertEqual(["a", "a"], loader.loaded_keys)
+
+    def test_lru_eviction(self):
+        cache = OnlineFeatureCache(max_size=2, ttl_sec=60)
+        loader = _CountingLoader({"a": 1, "b": 2, "c": 3})
+
+        cache.get_all(["a", "b"], loader)
+        # Accesses "a" so that "b" becomes the least recently used entry.
+        cache.get_all(["a"], loader)
+        cache.get_all(["c"], loader)
+        cache.get_all(["a"], loader)
+        self.assertEqual(["a", "b", "c"], loader.loaded_keys)
+
+        cache.get_all(["b"], loader)
+        self.assertEqual(["a", "b", "c", "b"], loader.loaded_keys)
+        self.assertEqual(2, cache.get_statistics().eviction_count)
+
+    def test_record_counters_to_metrics(self):
+        metrics = OnlineMetrics()
+        cache = OnlineFeatureCache(
+            max_size=2, ttl_sec=60, metrics=metrics, metric_labels={"table": "t"}
+        )
+        loader = _CountingLoader({"a": 1, "b": 2, "c": 3})
+
+        cache.get_all(["a", "b"], loader)
+        cache.get_all(["a", "c"], loader)
+
+        def _get_counter(event):
+            return metrics.get_counter(
+                ONLINE_FEATURE_CACHE_METRIC, {"table": "t", "event": event}
+            )
+
+        self.assertEqual(1, _get_counter("hit"))
+        self.assertEqual(3, _get_counter("miss"))
+        self.assertEqual(0, _get_counter("coalesced"))
+        self.assertEqual(1, _get_counter("eviction"))
+
+    def test_missing_keys(self):
+        loader = _CountingLoader({})
+        cache = OnlineFeatureCache(max_size=10, ttl_sec=60)
+        self.assertEqual({"a": None}, cache.get_all(["a"], loader))
+        self.assertEqual({"a": -1}, cache.get_all(["a"], loader, missing_value=-1))
+        self.assertEqual(["a"], loader.loaded_keys)
+
+        loader = _CountingLoader({})
+        cache = OnlineFeatureCache(max_size=10, ttl_sec=60, cache_missing_keys=False)
+        cache.get_all(["a"], loader)
+        cache.get_all(["a"], loader)
+        self.assertEqual(["a", "a"], loader.loaded_keys)
+
+    def test_coalesce_concurrent_misses(self):
+        cache = OnlineFeatureCache(max_size=10, ttl_sec=60)
+        loader = _CountingLoader({"a": 1}, delay_sec=0.2)
+
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            futures = [executor.submit(cache.get_all, ["a"], loader) for _ in range(4)]
+            results = [future.result() for future in futures]
+
+        self.assertEqual([{"a": 1}] * 4, results)
+        self.assertEqual(["a"], loader.loaded_keys)
+        statistics = cache.get_statistics()
+        self.assertEqual(1, statistics.miss_count)
+        self.assertEqual(3, statistics.coalesced_count)
+
+    def test_loader_failure(self):
+        cache = OnlineFeatureCache(max_size=10, ttl_sec=60)
+
+        def _failing_loader(keys):
+            raise RuntimeError("Failed to read backend.")
+
+        with self.assertRaises(RuntimeError):
+            cache.get_all(["a"], _failing_loader)
+
+        loader = _CountingLoader({"a": 1})
+        self.assertEqual({"a": 1}, cache.get_all(["a"], loader))
@@ -11,14 +11,18 @@
 #  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
 #  See the License for the specific language governing permissions and
 #  limitations under the License.
-from typing import Dict, Union
+from typing import Dict, Union, Optional
 
 from feathub.common.exceptions import FeathubException
 from feathub.common.utils import append_metadata_to_json
 from feathub.feature_tables.sinks.sink import Sink
 from feathub.feature_tables.sources.redis_source import (
     RedisMode,
+    RedisValueEncoding,
+    RedisStorageLayout,
     NAMESPACE_KEYWORD,
+    get_default_key_expr,
+    check_hash_per_row_key_expr,
 )
 
 
@@ -32,9 +36,13 @@ class RedisSink(Sink):
         password: str = None,
         db_num: int = 0,
         namespace: str = "default",
-        key_expr: str = 'CONCAT_WS(":", __NAMESPACE__, __KEYS__, __FEATURE_NAME__)',
+        key_expr: Optional[str] = None,
         enable_hash_partial_update: bool = False,
         keep_timestamp_field: bool = True,
+        value_encoding: Union[RedisValueEncoding, str] = RedisValueEncoding.TEXT,
+        storage_layout: Union[RedisStorageLayout, str] = (
+            RedisStorageLayout.KEY_PER_FEATURE
+        ),
     ):
         """
         :param host: The host of the Redis instance to connect.
@@ -61,13 +69,27 @@ class RedisSink(Sink):
                            to Redis.
                          If not explicitly specified, the key would be a combination of
                          the namespace, all key field values, and the name of the
-                         feature.
+                         feature. With the HASH_PER_ROW storage layout, the key is
+                         that of the hash holding all features of a row, so it must
+                         not contain __FEATURE_NAME__, and the name of the feature is
+                         excluded from the default key.
         :param enable_hash_partial_update: If true, map-typed data (or hash in Redis)
                                            would be partially updated instead of
                                            completely overridden by new data.
         :param keep_timestamp_field: True if the timestamp field of the feature table
                                      should be persisted to the external system through
                                      the sink.
+        :param value_encoding: The encoding or the name of the encoding of the feature
+                               values in Redis. With the binary encoding, each feature
+                               value is saved as one compact binary string, which is
+                               cheaper to decode than the text encoding, especially
+                               for numeric vectors. Partial update of map-typed data is
+                               not supported with the binary encoding.
+        :param storage_layout: The layout or the name of the layout of the feature
+                               values in Redis. With the HASH_PER_ROW layout, all
+                               features of a row are saved as the fields of one Redis
+                               hash, and written with one command. Partial update of
+                               map-typed data is not supported with this layout.
         """
         super().__init__(
             name="",
@@ -87,8 +109,19 @@ class RedisSink(Sink):
         self.username = username
         self.password = password
         self.db_num = db_num
-        self.key_expr = key_expr
         self.enable_hash_partial_update = enable_hash_partial_update
+        self.value_encoding = (
+            value_encoding
+            if isinstance(value_encoding, RedisValueEncoding)
+            else RedisValueEncoding(value_encoding)
+        )
+        self.storage_layout = (
+            storage_layout
+            if isinstance(storage_layout, RedisStorageLayout)
+            else RedisStorageLayout(storage_layout)
+        )
+        key_expr = get_default_key_expr(self.storage_layout, key_expr)
+        self.key_expr = key_expr
 
         if NAMESPACE_KEYWORD not in key_expr:
             raise FeathubException(
@@ -96,6 +129,22 @@ class RedisSink(Sink):
                 f"to guarantee the uniqueness of feature keys in Redis."
             )
 
+        if (
+            self.value_encoding == RedisValueEncoding.BINARY
+            and enable_hash_partial_update
+        ):
+            raise FeathubException(
+                "Hash partial update is not supported with the binary value encoding."
+            )
+
+        if self.storage_layout == RedisStorageLayout.HASH_PER_ROW:
+            check_hash_per_row_key_expr(key_expr)
+            if enable_hash_partial_update:
+                raise FeathubException(
+                    "Hash partial update is not supported with the "
+                    f"{RedisStorageLayout.HASH_PER_ROW.name} storage layout."
+                )
+
         if mode == RedisMode.CLUSTER and db_num != 0:
             raise FeathubException(
                 "Selecting database is not supported in Cluster mode."
@@ -114,6 +163,8 @@ class RedisSink(Sink):
             "key_expr": self.key_expr,
             "enable_hash_partial_update": self.enable_hash_partial_update,
             "keep_timestamp_field": self.keep_timestamp_field,
+            "value_encoding": self.value_encoding.value,
+            "storage_layout": self.storage_layout.value,
         }
 
     @classmethod
@@ -122,11 +173,17 @@ class RedisSink(Sink):
             namespace=json_dict["namespace"],
             host=json_dict["host"],
             port=json_dict["port"],
-            mode=json_dict["namespace"],
+            mode=json_dict["mode"],
             username=json_dict["username"],
             password=json_dict["password"],
             db_num=json_dict["db_num"],
             key_expr=json_dict["key_expr"],
             enable_hash_partial_update=json_dict["enable_hash_partial_update"],
             keep_timestamp_field=json_dict["keep_timestamp_field"],
+            value_encoding=json_dict.get(
+                "value_encoding", RedisValueEncoding.TEXT.value
+            ),
+            storage_layout=json_dict.get(
+                "storage_layout", RedisStorageLayout.KEY_PER_FEATURE.value
+            ),
         )
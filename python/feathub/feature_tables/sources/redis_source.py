@@ -30,10 +30,42 @@ class RedisMode(Enum):
     CLUSTER = "cluster"
 
 
+class RedisValueEncoding(Enum):
+    """
+    Supported encodings of feature values in Redis.
+
+    - TEXT: Values are saved as UTF-8 strings. Vectors and maps are saved as Redis
+      lists and hashes, whose nested elements are saved as JSON strings.
+    - BINARY: Values are saved as compact little-endian binary strings. Numeric
+      vectors are packed into fixed-width arrays, and maps are saved as
+      length-prefixed entries.
+    """
+
+    TEXT = "text"
+    BINARY = "binary"
+
+
+class RedisStorageLayout(Enum):
+    """
+    Supported layouts of feature values in Redis.
+
+    - KEY_PER_FEATURE: Each feature of a row is saved under its own Redis key.
+    - HASH_PER_ROW: All features of a row are saved as the fields of one Redis hash,
+      whose field names are the feature names. Any subset of the features of a row
+      can be read with one command.
+    """
+
+    KEY_PER_FEATURE = "key_per_feature"
+    HASH_PER_ROW = "hash_per_row"
+
+
 NAMESPACE_KEYWORD = "__NAMESPACE__"
 KEYS_KEYWORD = "__KEYS__"
 FEATURE_NAME_KEYWORD = "__FEATURE_NAME__"
 
+DEFAULT_KEY_EXPR = 'CONCAT_WS(":", __NAMESPACE__, __KEYS__, __FEATURE_NAME__)'
+DEFAULT_HASH_PER_ROW_KEY_EXPR = 'CONCAT_WS(":", __NAMESPACE__, __KEYS__)'
+
 KEY_COLUMN_PREFIX = "__KEY__"
 
 
@@ -56,7 +88,11 @@ class RedisSource(FeatureTable):
         db_num: int = 0,
         namespace: str = "default",
         timestamp_field: Optional[str] = None,
-        key_expr: str = 'CONCAT_WS(":", __NAMESPACE__, __KEYS__, __FEATURE_NAME__)',
+        key_expr: Optional[str] = None,
+        value_encoding: Union[RedisValueEncoding, str] = RedisValueEncoding.TEXT,
+        storage_layout: Union[RedisStorageLayout, str] = (
+            RedisStorageLayout.KEY_PER_FEATURE
+        ),
     ):
         """
         :param name: The name that uniquely identifies this source in a registry.
@@ -89,7 +125,18 @@ class RedisSource(FeatureTable):
                            to Redis.
                          If not explicitly specified, the key would be a combination of
                          the namespace, all key field values, and the name of the
-                         feature.
+                         feature. With the HASH_PER_ROW storage layout, the key is
+                         that of the hash holding all features of a row, so it must
+                         not contain __FEATURE_NAME__, and the name of the feature is
+                         excluded from the default key.
+        :param value_encoding: The encoding or the name of the encoding of the feature
+                               values in Redis. It must be equal to the value encoding
+                               of the corresponding RedisSink when the features were
+                               written to Redis.
+        :param storage_layout: The layout or the name of the layout of the feature
+                               values in Redis. It must be equal to the storage layout
+                               of the corresponding RedisSink when the features were
+                               written to Redis.
         """
         super().__init__(
             name=name,
@@ -112,6 +159,17 @@ class RedisSource(FeatureTable):
         self.password = password
         self.db_num = db_num
         self.namespace = namespace
+        self.value_encoding = (
+            value_encoding
+            if isinstance(value_encoding, RedisValueEncoding)
+            else RedisValueEncoding(value_encoding)
+        )
+        self.storage_layout = (
+            storage_layout
+            if isinstance(storage_layout, RedisStorageLayout)
+            else RedisStorageLayout(storage_layout)
+        )
+        key_expr = get_default_key_expr(self.storage_layout, key_expr)
         self.key_expr = key_expr
 
         if NAMESPACE_KEYWORD not in key_expr:
@@ -120,7 +178,9 @@ class RedisSource(FeatureTable):
                 f"to guarantee the uniqueness of feature keys in Redis."
             )
 
-        if FEATURE_NAME_KEYWORD not in key_expr:
+        if self.storage_layout == RedisStorageLayout.HASH_PER_ROW:
+            check_hash_per_row_key_expr(key_expr)
+        elif FEATURE_NAME_KEYWORD not in key_expr:
             feature_names = [x for x in schema.field_names if x not in keys]
             if len(feature_names) > 1:
                 raise FeathubException(
@@ -156,6 +216,8 @@ class RedisSource(FeatureTable):
             "namespace": self.namespace,
             "timestamp_field": self.timestamp_field,
             "key_expr": self.key_expr,
+            "value_encoding": self.value_encoding.value,
+            "storage_layout": self.storage_layout.value,
         }
 
     @classmethod
@@ -173,4 +235,36 @@ class RedisSource(FeatureTable):
             namespace=json_dict["namespace"],
             timestamp_field=json_dict["timestamp_field"],
             key_expr=json_dict["key_expr"],
+            value_encoding=json_dict.get(
+                "value_encoding", RedisValueEncoding.TEXT.value
+            ),
+            storage_layout=json_dict.get(
+                "storage_layout", RedisStorageLayout.KEY_PER_FEATURE.value
+            ),
+        )
+
+
+def get_default_key_expr(
+    storage_layout: RedisStorageLayout, key_expr: Optional[str]
+) -> str:
+    """
+    Returns the given key_expr, or the default key_expr of the storage layout if it
+    is None.
+    """
+    if key_expr is not None:
+        return key_expr
+    if storage_layout == RedisStorageLayout.HASH_PER_ROW:
+        return DEFAULT_HASH_PER_ROW_KEY_EXPR
+    return DEFAULT_KEY_EXPR
+
+
+def check_hash_per_row_key_expr(key_expr: str) -> None:
+    """
+    Checks that the key_expr can be used with the HASH_PER_ROW storage layout.
+    """
+    if FEATURE_NAME_KEYWORD in key_expr:
+        raise FeathubException(
+            f"key_expr {key_expr} should not contain {FEATURE_NAME_KEYWORD} with "
+            f"the {RedisStorageLayout.HASH_PER_ROW.name} storage layout, as all "
+            f"features of a row are saved under the same key."
         )
@@ -29,6 +29,7 @@ from feathub.common.test_utils import to_epoch_millis
 from feathub.feature_tables.sinks.redis_sink import RedisSink
 from feathub.feature_tables.sources.redis_source import (
     RedisSource,
+    RedisValueEncoding,
 )
 from feathub.feature_views.derived_feature_view import DerivedFeatureView
 from feathub.feature_views.feature import Feature
@@ -42,7 +43,8 @@ from feathub.feature_views.transforms.python_udf_transform import PythonUdfTrans
 from feathub.feature_views.transforms.sliding_window_transform import (
     SlidingWindowTransform,
 )
-from feathub.online_stores.conversion_utils import to_python_object
+from feathub.online_stores.conversion_utils import compile_decoders
+from feathub.online_stores.online_store_client import OnlineStoreClient
 from feathub.table.schema import Schema
 from feathub.tests.feathub_it_test_base import FeathubITTestBase
 
@@ -209,6 +211,7 @@ def _test_redis_sink(
         # Cluster client do not scan all nodes in the KEYS command
         self.assertEquals(len(redis_client.keys("*")), len(redis_data))
 
+    decoders = compile_decoders(schema, RedisValueEncoding.TEXT)
     for data in redis_data:
         feature_name = data[0].decode("utf-8").split(":")[-1]
         field_type = schema.get_field_type(feature_name)
@@ -223,7 +226,7 @@ def _test_redis_sink(
 
         self.assertEquals(
             dataframe_data[feature_name][int(keys) - 1],
-            to_python_object(actual_result, field_type),
+            decoders[feature_name](actual_result),
         )
 
     redis_client.close()
@@ -469,6 +472,7 @@ def _test_redis_sink_not_keep_timestamp(
         # Cluster client do not scan all nodes in the KEYS command
         self.assertEquals(len(redis_client.keys("*")), len(redis_data))
 
+    decoders = compile_decoders(schema, RedisValueEncoding.TEXT)
     for data in redis_data:
         feature_name = data[0].decode("utf-8").split(":")[-1]
         field_type = schema.get_field_type(feature_name)
@@ -483,7 +487,7 @@ def _test_redis_sink_not_keep_timestamp(
 
         self.assertEquals(
             dataframe_data[feature_name][int(keys) - 1],
-            to_python_object(actual_result, field_type),
+            decoders[feature_name](actual_result),
         )
 
     redis_client.close()
@@ -1040,6 +1044,94 @@ def _test_python_udf_on_redis_source_join(
     redis_client.close()
 
 
+def _test_redis_hash_per_row(
+    self: FeathubITTestBase,
+    host: str,
+    port: int,
+    mode: str,
+    redis_client: Union[Redis, RedisCluster],
+):
+    dataframe_data, _, schema = _generate_test_data()
+
+    source = self.create_file_source(
+        dataframe_data,
+        keys=["id"],
+        schema=schema,
+        timestamp_field="ts",
+        timestamp_format="%Y-%m-%d %H:%M:%S",
+        data_format="json",
+    )
+
+    sink = RedisSink(
+        namespace="test_namespace",
+        mode=mode,
+        host=host,
+        port=port,
+        storage_layout="hash_per_row",
+    )
+
+    self.client.materialize_features(
+        feature_descriptor=source, sink=sink, allow_overwrite=True
+    ).wait(30000)
+
+    self.assertEquals(
+        [b"1", b"2022-01-01 00:00:00", b'["1.0","2.0"]'],
+        redis_client.hmget("test_namespace:1", ["val", "ts", "list"]),
+    )
+    self.assertEquals(
+        {b"ts": b"2022-01-01 00:00:03"}, redis_client.hgetall("test_namespace:4")
+    )
+
+    redis_source = RedisSource(
+        name="redis_source",
+        namespace="test_namespace",
+        mode=mode,
+        host=host,
+        port=port,
+        keys=["id"],
+        schema=schema,
+        storage_layout="hash_per_row",
+    )
+
+    input_data = pd.DataFrame([[1], [2], [3], [4]], columns=["id"])
+
+    feature_view = DerivedFeatureView(
+        name="feature_view",
+        source=self.create_file_source(
+            df=input_data,
+            keys=["id"],
+            schema=Schema.new_builder().column("id", types.Int64).build(),
+            timestamp_field=None,
+            data_format="csv",
+        ),
+        features=["id"]
+        + [f"{redis_source.name}.{x}" for x in schema.field_names if x != "id"],
+        keep_source_fields=False,
+    )
+
+    [_, built_feature_view] = self.client.build_features([redis_source, feature_view])
+
+    result_df = (
+        self.client.get_features(feature_descriptor=built_feature_view)
+        .to_pandas()
+        .sort_values(by=["id"])
+        .reset_index(drop=True)
+    )
+
+    self.assertTrue(result_df.equals(dataframe_data))
+
+    online_store_client = OnlineStoreClient.instantiate(redis_source)
+    online_features = online_store_client.get(
+        input_data.iloc[:3], ["list", "nested_map"]
+    )
+    self.assertEquals(
+        dataframe_data[["id", "list", "nested_map"]].iloc[:3].to_dict("records"),
+        online_features.to_dict("records"),
+    )
+
+    redis_client.close()
+
+
 class RedisSourceSinkStandaloneModeITTest(ABC, FeathubITTestBase):
     redis_container: RedisContainer
 
@@ -1127,6 +1219,19 @@ class RedisSourceSinkStandaloneModeITTest(ABC, FeathubITTestBase):
             self.redis_container.get_client(),
         )
 
+    def test_redis_hash_per_row_standalone_mode(self):
+        _test_redis_hash_per_row(
+            self,
+            "127.0.0.1",
+            int(
+                self.redis_container.get_exposed_port(
+                    self.redis_container.port_to_expose
+                )
+            ),
+            "standalone",
+            self.redis_container.get_client(),
+        )
+
     def test_key_expr_without_namespace(self):
         try:
             RedisSink(
@@ -1145,6 +1250,35 @@ class RedisSourceSinkStandaloneModeITTest(ABC, FeathubITTestBase):
                 "to guarantee the uniqueness of feature keys in Redis.",
             )
 
+    def test_binary_value_encoding_with_hash_partial_update(self):
+        with self.assertRaises(FeathubException) as cm:
+            RedisSink(
+                host="127.0.0.1",
+                enable_hash_partial_update=True,
+                value_encoding="binary",
+            )
+        self.assertEqual(
+            "Hash partial update is not supported with the binary value encoding.",
+            str(cm.exception),
+        )
+
+    def test_hash_per_row_key_expr_with_feature_name(self):
+        with self.assertRaises(FeathubException) as cm:
+            RedisSink(
+                host="127.0.0.1",
+                key_expr='CONCAT_WS(":", __NAMESPACE__, __KEYS__, __FEATURE_NAME__)',
+                storage_layout="hash_per_row",
+            )
+        self.assertEqual(
+            'key_expr CONCAT_WS(":", __NAMESPACE__, __KEYS__, __FEATURE_NAME__) '
+            "should not contain __FEATURE_NAME__ with the HASH_PER_ROW storage "
+            "layout, as all features of a row are saved under the same key.",
+            str(cm.exception),
+        )
+
+        sink = RedisSink(host="127.0.0.1", storage_layout="hash_per_row")
+        self.assertEqual('CONCAT_WS(":", __NAMESPACE__, __KEYS__)', sink.key_expr)
+
     def test_key_expr_without_feature_name(self):
         input_data = pd.DataFrame(
             [
@@ -1361,6 +1495,15 @@ class RedisSourceSinkClusterModeITTest(ABC, FeathubITTestBase):
             self.redis_cluster_container.get_client(),
         )
 
+    def test_redis_hash_per_row_cluster_mode(self):
+        _test_redis_hash_per_row(
+            self,
+            "127.0.0.1",
+            7000,
+            "cluster",
+            self.redis_cluster_container.get_client(),
+        )
+
     def test_redis_source_join_cluster_mode(self):
         _test_redis_source_join(
             self,
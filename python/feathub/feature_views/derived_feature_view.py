@@ -33,7 +33,7 @@ from feathub.registries.registry import Registry
 from feathub.table.table_descriptor import TableDescriptor
 
 
-_parser = ExprParser()
+_parser = ExprParser.get_instance()
 
 
 class DerivedFeatureView(FeatureView):
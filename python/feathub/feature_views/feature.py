@@ -13,7 +13,8 @@
 # limitations under the License.
 
 from __future__ import annotations
-from typing import Union, Optional, Dict, Sequence, Collection
+from hashlib import sha256
+from typing import Union, Optional, Dict, Sequence, Collection, Any
 import json
 
 from feathub.common.exceptions import FeathubException
@@ -145,8 +146,27 @@ class Feature:
     def __repr__(self) -> str:
         return self.__str__()
 
+    def get_digest(self) -> str:
+        """
+        Returns the SHA-256 digest of the json-formatted object representing this
+        feature. The digest is cached until an attribute of this feature is assigned.
+        """
+        digest = self.__dict__.get("_digest")
+        if digest is None:
+            digest = sha256(
+                json.dumps(self.to_json(), sort_keys=True, default=repr).encode("utf-8")
+            ).hexdigest()
+            self.__dict__["_digest"] = digest
+        return digest
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        super().__setattr__(name, value)
+        self.__dict__.pop("_digest", None)
+
     def __hash__(self) -> int:
-        return hash(((k, v) for k, v in self.to_json().items()))
+        return hash(self.get_digest())
 
     def __eq__(self, other: object) -> bool:
-        return isinstance(other, Feature) and self.to_json() == other.to_json()
+        return self is other or (
+            isinstance(other, Feature) and self.get_digest() == other.get_digest()
+        )
@@ -29,7 +29,7 @@ from feathub.feature_views.transforms.sliding_window_transform import (
 )
 from feathub.table.table_descriptor import TableDescriptor
 
-feathub_expr_parser = ExprParser()
+feathub_expr_parser = ExprParser.get_instance()
 
 
 class FeatureView(TableDescriptor, ABC):
@@ -113,12 +113,24 @@ class FeatureView(TableDescriptor, ABC):
                 feature_names.add(feature.name)
 
     def is_unresolved(self) -> bool:
-        return (
-            isinstance(self.source, str)
-            or (isinstance(self.source, FeatureView) and self.source.is_unresolved())
-            or any(isinstance(f, str) for f in self.features)
+        # Whether a feature view is resolved only changes when its source or features
+        # are assigned, so it is cached even if the feature view is unresolved.
+        return self._get_cached(
+            "is_unresolved",
+            lambda: (
+                isinstance(self.source, str)
+                or (
+                    isinstance(self.source, FeatureView) and self.source.is_unresolved()
+                )
+                or any(isinstance(f, str) for f in self.features)
+            ),
+            check_immutable=False,
         )
 
+    def _is_immutable(self) -> bool:
+        # The features of an unresolved feature view are modified when it is built.
+        return not self.is_unresolved()
+
     # TODO: Remove this method and add a method to OnDemandFeatureView to get output
     #  features with source fields.
     def get_output_fields(self, source_fields: List[str]) -> List[str]:
@@ -161,6 +173,27 @@ class FeatureView(TableDescriptor, ABC):
         if self.is_unresolved():
             raise RuntimeError("Build this feature view before getting features.")
 
+        return list(self._get_cached("output_features", self._get_output_features))
+
+    def get_dependent_features(self) -> List[Feature]:
+        """
+        Returns the features of this feature view along with their input features,
+        without duplicates, in an order where each feature follows its input features.
+        This method should be called after the FeatureView is resolved.
+        """
+        return list(
+            self._get_cached("dependent_features", self._get_dependent_features)
+        )
+
+    def _get_dependent_features(self) -> List[Feature]:
+        dependent_features: Dict[Feature, None] = {}
+        for feature in self.get_resolved_features():
+            for input_feature in feature.input_features:
+                dependent_features.setdefault(input_feature)
+            dependent_features.setdefault(feature)
+        return list(dependent_features)
+
+    def _get_output_features(self) -> List[Feature]:
         source_features = self.get_resolved_source().get_output_features()
         features = {
             **{f.name: f for f in source_features},
@@ -184,6 +217,24 @@ class FeatureView(TableDescriptor, ABC):
             raise RuntimeError("This feature view is unresolved.")
         return cast(TableDescriptor, self.source)
 
+    def get_dependent_table_names(self) -> List[str]:
+        if isinstance(self.source, str):
+            table_names = [self.source]
+        else:
+            # The tables referred to by an inline source are read again whenever
+            # this feature view is built.
+            table_names = self.source.get_dependent_table_names()
+        for feature in self.features:
+            if isinstance(feature, str):
+                # A feature in the format {table_name}.{feature_name} refers to a
+                # feature in another table.
+                parts = feature.split(".", 1)
+                if len(parts) == 2:
+                    table_names.append(parts[0])
+            elif isinstance(feature.transform, JoinTransform):
+                table_names.append(feature.transform.table_name)
+        return list(dict.fromkeys(table_names))
+
     def _get_keys(self) -> Optional[List[str]]:
         key_fields: List[str] = []
 
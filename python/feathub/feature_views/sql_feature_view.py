@@ -104,6 +104,10 @@ class SqlFeatureView(FeatureView):
     def is_unresolved(self) -> bool:
         return False
 
+    def get_dependent_table_names(self) -> List[str]:
+        # The tables used in the SQL statement are not parsed.
+        return []
+
     def get_output_fields(self, source_fields: List[str]) -> List[str]:
         return self.schema.field_names.copy()
 
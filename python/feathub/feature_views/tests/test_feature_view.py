@@ -13,6 +13,7 @@
 # limitations under the License.
 
 import unittest
+from typing import cast
 
 from feathub.common.exceptions import FeathubException
 from feathub.common.types import Int64, String
@@ -20,6 +21,7 @@ from feathub.feature_tables.sources.datagen_source import DataGenSource
 from feathub.feature_tables.sources.file_system_source import FileSystemSource
 from feathub.feature_views.feature import Feature
 from feathub.feature_views.derived_feature_view import DerivedFeatureView
+from feathub.feature_views.transforms.join_transform import JoinTransform
 from feathub.registries.local_registry import LocalRegistry
 from feathub.common import types
 from feathub.table.schema import Schema
@@ -272,3 +274,108 @@ class FeatureViewTest(unittest.TestCase):
             ["time", "val3", "val2", "val1", "id"],
             built_feature_view_3.get_output_fields(field_names),  # type: ignore
         )
+
+    def test_get_dependent_table_names(self):
+        feature_view = DerivedFeatureView(
+            name="feature_view",
+            source="source_1",
+            features=[
+                "source_2.b",
+                Feature(
+                    name="c",
+                    transform=JoinTransform(table_name="source_3", expr="c"),
+                ),
+                "source_2.d",
+                Feature(name="e", transform="a + 1"),
+            ],
+            keep_source_fields=True,
+        )
+        self.assertEqual(
+            ["source_1", "source_2", "source_3"],
+            feature_view.get_dependent_table_names(),
+        )
+
+        source = FileSystemSource(
+            name="source_1",
+            path="dummy_source_file",
+            data_format="csv",
+            schema=Schema(["id", "a", "time"], [String, Int64, String]),
+            keys=["id"],
+            timestamp_field="time",
+            timestamp_format="%Y-%m-%d %H:%M:%S",
+        )
+        self.assertEqual([], source.get_dependent_table_names())
+
+        # The tables referred to by an inline source are included.
+        inline_feature_view = DerivedFeatureView(
+            name="inline_feature_view",
+            source=feature_view,
+            features=[Feature(name="f", transform="e + 1"), "source_4.g"],
+        )
+        self.assertEqual(
+            ["source_1", "source_2", "source_3", "source_4"],
+            inline_feature_view.get_dependent_table_names(),
+        )
+
+    def test_digest_and_cached_metadata(self):
+        source = FileSystemSource(
+            name="source_1",
+            path="dummy_source_file",
+            data_format="csv",
+            schema=Schema(["id", "a", "time"], [String, Int64, String]),
+            keys=["id"],
+            timestamp_field="time",
+            timestamp_format="%Y-%m-%d %H:%M:%S",
+        )
+        feature_1 = Feature(name="feature_1", transform="a + 1")
+        feature_view = DerivedFeatureView(
+            name="feature_view",
+            source="source_1",
+            features=[
+                feature_1,
+                Feature(
+                    name="feature_2",
+                    transform="a + 2",
+                    input_features=[feature_1],
+                ),
+            ],
+            keep_source_fields=True,
+        )
+
+        self.registry.build_features([source])
+        built_feature_view = cast(
+            DerivedFeatureView, self.registry.build_features([feature_view])[0]
+        )
+        rebuilt_feature_view = self.registry.build_features([feature_view])[0]
+
+        self.assertIsNot(built_feature_view, rebuilt_feature_view)
+        self.assertEqual(
+            built_feature_view.get_digest(), rebuilt_feature_view.get_digest()
+        )
+        self.assertEqual(built_feature_view, rebuilt_feature_view)
+        self.assertEqual(hash(built_feature_view), hash(rebuilt_feature_view))
+        self.assertNotEqual(source.get_digest(), built_feature_view.get_digest())
+
+        copied_feature_1 = Feature.from_json(feature_1.to_json())
+        self.assertEqual(feature_1, copied_feature_1)
+        self.assertEqual(hash(feature_1), hash(copied_feature_1))
+        self.assertEqual({feature_1}, {feature_1, copied_feature_1})
+
+        self.assertEqual(
+            ["feature_1", "feature_2"],
+            [f.name for f in built_feature_view.get_dependent_features()],
+        )
+        self.assertIs(
+            built_feature_view.get_output_features()[-1],
+            built_feature_view.get_output_features()[-1],
+        )
+
+        # Assigning an attribute drops the cached values.
+        copied_feature_1.description = "description"
+        self.assertNotEqual(feature_1, copied_feature_1)
+        built_feature_view.keep_source_fields = False
+        self.assertEqual(
+            ["id", "time", "feature_1", "feature_2"],
+            [f.name for f in built_feature_view.get_output_features()],
+        )
+        self.assertNotEqual(built_feature_view, rebuilt_feature_view)
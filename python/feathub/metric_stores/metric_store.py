@@ -17,6 +17,7 @@ from abc import ABC, abstractmethod
 from datetime import timedelta
 from typing import Dict, List, Optional, OrderedDict, Tuple, Sequence
 
+from feathub.common.exceptions import FeathubException
 from feathub.common.types import Unknown
 from feathub.common.utils import generate_random_name
 from feathub.feature_tables.sinks.sink import Sink
@@ -29,6 +30,7 @@ from feathub.metric_stores.metric import Metric
 from feathub.metric_stores.metric_store_config import (
     MetricStoreConfig,
 )
+from feathub.metric_stores.online_metrics import OnlineMetrics
 from feathub.metric_stores.metric_store_config import (
     MetricStoreType,
     METRIC_STORE_TYPE_CONFIG,
@@ -269,6 +271,25 @@ class MetricStore(ABC):
             tag_value = tag_value.replace(char, f"\\{char}")
         return tag_value
 
+    def report_online_metrics(self, metrics: OnlineMetrics) -> None:
+        """
+        Reports the latency histograms and the row counts collected while serving
+        online features to this metric store.
+
+        :param metrics: The metrics to report.
+        """
+        raise FeathubException(
+            f"{self.__class__.__name__} does not support reporting online metrics."
+        )
+
+    def delete_online_metrics(self) -> None:
+        """
+        Deletes the online metrics reported by this process from this metric store,
+        e.g. when the feature service reporting them is closed. It is a no-op for
+        metric stores that do not keep the reported online metrics.
+        """
+        pass
+
     @abstractmethod
     def _get_metrics_sink(self, data_sink: Sink) -> Sink:
         pass
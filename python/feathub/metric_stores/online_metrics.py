@@ -0,0 +1,472 @@
+# Copyright 2022 The FeatHub Authors
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+import bisect
+import logging
+import threading
+import time
+from typing import Dict, Tuple, Optional, List, Sequence, TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from feathub.metric_stores.metric_store import MetricStore
+
+logger = logging.getLogger(__file__)
+
+# The upper bounds in milliseconds of the buckets of latency histograms.
+DEFAULT_LATENCY_BUCKET_BOUNDS_MS: Tuple[float, ...] = (
+    0.1,
+    0.25,
+    0.5,
+    1,
+    2.5,
+    5,
+    10,
+    25,
+    50,
+    100,
+    250,
+    500,
+    1000,
+    2500,
+    5000,
+    10000,
+)
+
+# The name of the metric holding the end-to-end latency of getting online features
+# with a feature view. It is labeled by `feature_view`.
+ONLINE_FEATURES_METRIC = "online_features"
+
+# The name of the metric holding the latency of each stage of getting online
+# features with a feature view. It is labeled by `feature_view` and `stage`.
+ONLINE_FEATURES_STAGE_METRIC = "online_features_stage"
+
+# The name of the metric holding the latency of looking up features from an online
+# store. It is labeled by `store` and `table`.
+ONLINE_STORE_METRIC = "online_store_get"
+
+# The name of the metric holding the latency of each stage of looking up features
+# from an online store. It is labeled by `store`, `table` and `stage`.
+ONLINE_STORE_STAGE_METRIC = "online_store_get_stage"
+
+# The name of the counter of the lookups served by the in-process cache of an online
+# store table and of the entries evicted from it. It is labeled by `table` and
+# `event`, where event is one of `hit`, `miss`, `coalesced` and `eviction`.
+ONLINE_FEATURE_CACHE_METRIC = "online_feature_cache"
+
+_MetricKey = Tuple[str, Tuple[Tuple[str, str], ...]]
+
+
+class LatencyHistogram:
+    """
+    A histogram of latencies with fixed bucket bounds.
+    """
+
+    def __init__(
+        self, bucket_bounds_ms: Sequence[float] = DEFAULT_LATENCY_BUCKET_BOUNDS_MS
+    ):
+        """
+        :param bucket_bounds_ms: The ascending upper bounds in milliseconds of the
+                                 buckets. Latencies larger than the last bound are
+                                 counted in an overflow bucket.
+        """
+        self.bucket_bounds_ms = tuple(bucket_bounds_ms)
+        self.bucket_counts = [0] * (len(self.bucket_bounds_ms) + 1)
+        self.count = 0
+        self.sum_ms = 0.0
+        self.max_ms = 0.0
+
+    @property
+    def mean_ms(self) -> float:
+        return self.sum_ms / self.count if self.count > 0 else 0.0
+
+    def record(self, latency_ms: float) -> None:
+        self.bucket_counts[bisect.bisect_left(self.bucket_bounds_ms, latency_ms)] += 1
+        self.count += 1
+        self.sum_ms += latency_ms
+        self.max_ms = max(self.max_ms, latency_ms)
+
+    def get_quantile(self, quantile: float) -> float:
+        """
+        Returns the estimated latency in milliseconds at the given quantile, assuming
+        the latencies are evenly distributed within each bucket.
+
+        :param quantile: The quantile between 0 and 1, e.g. 0.99 for p99.
+        """
+        if self.count == 0:
+            return 0.0
+
+        rank = quantile * self.count
+        cumulative_count = 0
+        for i, bucket_count in enumerate(self.bucket_counts):
+            if bucket_count == 0 or cumulative_count + bucket_count < rank:
+                cumulative_count += bucket_count
+                continue
+            lower_bound = self.bucket_bounds_ms[i - 1] if i > 0 else 0.0
+            upper_bound = (
+                self.bucket_bounds_ms[i] if i < len(self.bucket_bounds_ms) else None
+            )
+            if upper_bound is None or upper_bound > self.max_ms:
+                upper_bound = self.max_ms
+            fraction = (rank - cumulative_count) / bucket_count
+            return lower_bound + (upper_bound - lower_bound) * fraction
+        return self.max_ms
+
+    def copy(self) -> "LatencyHistogram":
+        histogram = LatencyHistogram(self.bucket_bounds_ms)
+        histogram.bucket_counts = list(self.bucket_counts)
+        histogram.count = self.count
+        histogram.sum_ms = self.sum_ms
+        histogram.max_ms = self.max_ms
+        return histogram
+
+    def __repr__(self) -> str:
+        return (
+            f"LatencyHistogram(count={self.count}, mean_ms={self.mean_ms}, "
+            f"p50_ms={self.get_quantile(0.5)}, p99_ms={self.get_quantile(0.99)}, "
+            f"max_ms={self.max_ms})"
+        )
+
+
+class OnlineMetrics:
+    """
+    OnlineMetrics collects the latency histograms, the row counts and the counters of
+    serving online features in process. Each histogram or counter is identified by a
+    metric name and a dict of labels, e.g. the name of the feature view or the stage
+    being measured.
+
+    The collected metrics can be read in process with `get_histogram`,
+    `get_row_count` and `get_counter`, or exported to a metric store with
+    MetricStore#report_online_metrics.
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._histograms: Dict[_MetricKey, LatencyHistogram] = {}
+        self._row_counts: Dict[_MetricKey, int] = {}
+        self._counters: Dict[_MetricKey, int] = {}
+
+    def record(
+        self,
+        name: str,
+        labels: Dict[str, str],
+        latency_ms: float,
+        num_rows: Optional[int] = None,
+    ) -> None:
+        """
+        Records a latency of the given metric.
+
+        :param name: The name of the metric.
+        :param labels: The labels of the metric.
+        :param latency_ms: The latency in milliseconds.
+        :param num_rows: Optional. The number of rows processed within the latency.
+        """
+        key = _get_metric_key(name, labels)
+        with self._lock:
+            histogram = self._histograms.get(key)
+            if histogram is None:
+                histogram = LatencyHistogram()
+                self._histograms[key] = histogram
+            histogram.record(latency_ms)
+            if num_rows is not None:
+                self._row_counts[key] = self._row_counts.get(key, 0) + num_rows
+
+    def increment_counter(
+        self, name: str, labels: Dict[str, str], count: int = 1
+    ) -> None:
+        """
+        Increments the given counter.
+
+        :param name: The name of the counter.
+        :param labels: The labels of the counter.
+        :param count: The number to add to the counter.
+        """
+        key = _get_metric_key(name, labels)
+        with self._lock:
+            self._counters[key] = self._counters.get(key, 0) + count
+
+    def create_stage_timer(self, name: str, labels: Dict[str, str]) -> "StageTimer":
+        """
+        Creates a StageTimer that records the latency of each stage of an operation
+        to the given metric, with the stage name as the `stage` label.
+        """
+        return StageTimer(self, name, labels)
+
+    def get_histogram(
+        self, name: str, labels: Dict[str, str]
+    ) -> Optional[LatencyHistogram]:
+        """
+        Returns a copy of the histogram of the given metric, or None if no latency
+        has been recorded to it.
+        """
+        with self._lock:
+            histogram = self._histograms.get(_get_metric_key(name, labels))
+            return None if histogram is None else histogram.copy()
+
+    def get_row_count(self, name: str, labels: Dict[str, str]) -> int:
+        """
+        Returns the total number of rows recorded to the given metric.
+        """
+        with self._lock:
+            return self._row_counts.get(_get_metric_key(name, labels), 0)
+
+    def get_counter(self, name: str, labels: Dict[str, str]) -> int:
+        """
+        Returns the value of the given counter, or 0 if it has not been incremented.
+        """
+        with self._lock:
+            return self._counters.get(_get_metric_key(name, labels), 0)
+
+    def get_metrics(self) -> List[Tuple[str, Dict[str, str], LatencyHistogram, int]]:
+        """
+        Returns a snapshot of all the metrics as tuples of the metric name, the labels,
+        the histogram and the row count.
+        """
+        with self._lock:
+            return [
+                (name, dict(labels), histogram.copy(), self._row_counts.get(key, 0))
+                for key, histogram in self._histograms.items()
+                for name, labels in (key,)
+            ]
+
+    def get_counters(self) -> List[Tuple[str, Dict[str, str], int]]:
+        """
+        Returns a snapshot of all the counters as tuples of the counter name, the
+        labels and the value.
+        """
+        with self._lock:
+            return [
+                (name, dict(labels), count)
+                for (name, labels), count in self._counters.items()
+            ]
+
+    def is_empty(self) -> bool:
+        """
+        Returns whether no latency has been recorded and no counter incremented.
+        """
+        with self._lock:
+            return not self._histograms and not self._counters
+
+    def clear(self) -> None:
+        """
+        Removes all the recorded metrics.
+        """
+        with self._lock:
+            self._histograms.clear()
+            self._row_counts.clear()
+            self._counters.clear()
+
+    def to_prometheus_text(self, namespace: str) -> str:
+        """
+        Returns the metrics in the Prometheus text exposition format. Each metric is
+        exported as a histogram named `{namespace}_{name}_latency_ms`, along with a
+        counter `{namespace}_{name}_rows_total` if rows are recorded to the metric.
+        Each counter is exported as a counter named `{namespace}_{name}_total`.
+        """
+        histograms: Dict[str, List[str]] = {}
+        counters: Dict[str, List[str]] = {}
+        for name, labels, histogram, row_count in self.get_metrics():
+            metric_name = f"{namespace}_{name}_latency_ms"
+            lines = histograms.setdefault(metric_name, [])
+            cumulative_count = 0
+            for bound, bucket_count in zip(
+                histogram.bucket_bounds_ms, histogram.bucket_counts
+            ):
+                cumulative_count += bucket_count
+                lines.append(
+                    f"{metric_name}_bucket"
+                    f"{_format_labels(labels, le=_format_number(bound))} "
+                    f"{cumulative_count}"
+                )
+            lines.append(
+                f"{metric_name}_bucket{_format_labels(labels, le='+Inf')} "
+                f"{histogram.count}"
+            )
+            lines.append(
+                f"{metric_name}_sum{_format_labels(labels)} "
+                f"{_format_number(histogram.sum_ms)}"
+            )
+            lines.append(
+                f"{metric_name}_count{_format_labels(labels)} {histogram.count}"
+            )
+            if row_count > 0:
+                row_metric_name = f"{namespace}_{name}_rows_total"
+                counters.setdefault(row_metric_name, []).append(
+                    f"{row_metric_name}{_format_labels(labels)} {row_count}"
+                )
+        for name, labels, count in self.get_counters():
+            counter_name = f"{namespace}_{name}_total"
+            counters.setdefault(counter_name, []).append(
+                f"{counter_name}{_format_labels(labels)} {count}"
+            )
+
+        text_lines = []
+        for metric_name, lines in histograms.items():
+            text_lines.append(f"# TYPE {metric_name} histogram")
+            text_lines.extend(lines)
+        for metric_name, lines in counters.items():
+            text_lines.append(f"# TYPE {metric_name} counter")
+            text_lines.extend(lines)
+        return "".join(line + "\n" for line in text_lines)
+
+
+class StageTimer:
+    """
+    A StageTimer measures the consecutive stages of an operation. The latency of a
+    stage is accumulated between `start` and `stop`, so that a stage can be measured
+    in several parts, e.g. in each iteration of a loop. The accumulated latencies are
+    recorded with `record`.
+    """
+
+    def __init__(self, metrics: OnlineMetrics, name: str, labels: Dict[str, str]):
+        self._metrics = metrics
+        self._name = name
+        self._labels = labels
+        self._stage_latencies_ms: Dict[str, float] = {}
+        self._current_stage: Optional[str] = None
+        self._current_stage_start = 0.0
+
+    def start(self, stage: str) -> None:
+        """
+        Starts measuring the given stage. The stage being measured is stopped.
+        """
+        self.stop()
+        self._current_stage = stage
+        self._current_stage_start = time.perf_counter()
+
+    def stop(self) -> None:
+        """
+        Stops measuring the current stage if there is one.
+        """
+        if self._current_stage is None:
+            return
+        latency_ms = (time.perf_counter() - self._current_stage_start) * 1000
+        self._stage_latencies_ms[self._current_stage] = (
+            self._stage_latencies_ms.get(self._current_stage, 0.0) + latency_ms
+        )
+        self._current_stage = None
+
+    def record(self) -> None:
+        """
+        Stops measuring the current stage and records the accumulated latency of each
+        stage.
+        """
+        self.stop()
+        for stage, latency_ms in self._stage_latencies_ms.items():
+            self._metrics.record(
+                self._name, {**self._labels, "stage": stage}, latency_ms
+            )
+        self._stage_latencies_ms.clear()
+
+
+class OnlineMetricsReporter:
+    """
+    An OnlineMetricsReporter periodically reports OnlineMetrics to a metric store in
+    a daemon thread.
+    """
+
+    def __init__(
+        self,
+        metrics: OnlineMetrics,
+        metric_store: "MetricStore",
+        report_interval_sec: Optional[float] = None,
+    ):
+        """
+        :param metrics: The metrics to report.
+        :param metric_store: The metric store to report the metrics to.
+        :param report_interval_sec: Optional. The interval in seconds to report the
+                                    metrics. The report interval of the metric store
+                                    is used if it is None.
+        """
+        self.metrics = metrics
+        self.metric_store = metric_store
+        self.report_interval_sec = (
+            metric_store.report_interval_sec
+            if report_interval_sec is None
+            else report_interval_sec
+        )
+        self._stop_event = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+        # Whether any metrics have been reported, and whether the last report failed.
+        self._reported = False
+        self._failing = False
+
+    def start(self) -> None:
+        if self._thread is not None:
+            return
+        self._stop_event.clear()
+        self._thread = threading.Thread(target=self._run, daemon=True)
+        self._thread.start()
+
+    def stop(self) -> None:
+        """
+        Stops the reporter after reporting the metrics for the last time, and deletes
+        the reported metrics from the metric store.
+        """
+        if self._thread is None:
+            return
+        self._stop_event.set()
+        self._thread.join()
+        self._thread = None
+        if not self._reported:
+            return
+        try:
+            self.metric_store.delete_online_metrics()
+        except Exception as e:
+            logger.warning(f"Failed to delete online metrics: {e}")
+
+    def report(self) -> None:
+        """
+        Reports the metrics if any latency has been recorded or any counter has been
+        incremented.
+        """
+        if self.metrics.is_empty():
+            return
+        try:
+            self.metric_store.report_online_metrics(self.metrics)
+        except Exception as e:
+            # Logs only the first of consecutive failures, so that an unavailable
+            # metric store does not flood the log every report interval.
+            if not self._failing:
+                logger.warning(f"Failed to report online metrics: {e}")
+            self._failing = True
+            return
+        if self._failing:
+            logger.info("Resumed reporting online metrics.")
+        self._failing = False
+        self._reported = True
+
+    def _run(self) -> None:
+        while not self._stop_event.wait(self.report_interval_sec):
+            self.report()
+        self.report()
+
+
+def _get_metric_key(name: str, labels: Dict[str, str]) -> _MetricKey:
+    return name, tuple(sorted(labels.items()))
+
+
+def _format_labels(labels: Dict[str, str], **extra_labels: str) -> str:
+    all_labels = {**labels, **extra_labels}
+    if not all_labels:
+        return ""
+    label_strs = []
+    for key, value in all_labels.items():
+        escaped_value = (
+            value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+        )
+        label_strs.append(f'{key}="{escaped_value}"')
+    return "{" + ",".join(label_strs) + "}"
+
+
+def _format_number(value: float) -> str:
+    return repr(float(value))
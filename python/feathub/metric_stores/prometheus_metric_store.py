@@ -11,9 +11,13 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 import collections
+import os
+import socket
 from datetime import timedelta
 from typing import Any
 from typing import Dict, List, OrderedDict
+from urllib import request
+from urllib.parse import quote
 
 from feathub.common.config import ConfigDef
 from feathub.feature_tables.sinks.prometheus_sink import PrometheusSink
@@ -24,6 +28,7 @@ from feathub.metric_stores.metric_store import MetricStore
 from feathub.metric_stores.metric_store_config import (
     METRIC_STORE_PREFIX,
 )
+from feathub.metric_stores.online_metrics import OnlineMetrics
 from feathub.metric_stores.metric_store_config import (
     MetricStoreConfig,
 )
@@ -86,6 +91,45 @@ class PrometheusMetricStore(MetricStore):
             DELETE_ON_SHUTDOWN_CONFIG
         )
 
+    def report_online_metrics(self, metrics: OnlineMetrics) -> None:
+        """
+        Pushes the online metrics to the push gateway. The metrics are grouped by the
+        namespace as the job and the host and process as the instance, so that the
+        metrics pushed by different processes do not overwrite each other.
+        """
+        push_request = request.Request(
+            self._get_online_metrics_url(),
+            data=metrics.to_prometheus_text(self.namespace).encode("utf-8"),
+            headers={"Content-Type": "text/plain; version=0.0.4"},
+            method="PUT",
+        )
+        with request.urlopen(push_request, timeout=self.report_interval_sec):
+            pass
+
+    def delete_online_metrics(self) -> None:
+        """
+        Deletes the group of online metrics pushed by this process from the push
+        gateway if `delete_on_shutdown` is true, so that the push gateway does not
+        keep exposing the last pushed values after the process stops.
+        """
+        if not self.delete_on_shutdown:
+            return
+        delete_request = request.Request(
+            self._get_online_metrics_url(), method="DELETE"
+        )
+        with request.urlopen(delete_request, timeout=self.report_interval_sec):
+            pass
+
+    def _get_online_metrics_url(self) -> str:
+        server_url = self.server_url
+        if "://" not in server_url:
+            server_url = "http://" + server_url
+        instance = quote(f"{socket.gethostname()}_{os.getpid()}", safe="")
+        return (
+            f"{server_url.rstrip('/')}/metrics/job/{quote(self.namespace, safe='')}"
+            f"/instance/{instance}"
+        )
+
     def _get_metric_tags(
         self, metric: Metric, feature: Feature, data_sink: Sink
     ) -> OrderedDict[str, str]:
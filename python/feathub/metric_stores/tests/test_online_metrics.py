@@ -0,0 +1,214 @@
+# Copyright 2022 The FeatHub Authors
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+import unittest
+from typing import List
+from unittest.mock import patch, MagicMock
+
+from feathub.feature_tables.sinks.sink import Sink
+from feathub.metric_stores.metric_store import MetricStore
+from feathub.metric_stores.online_metrics import (
+    LatencyHistogram,
+    OnlineMetrics,
+    OnlineMetricsReporter,
+    logger as online_metrics_logger,
+)
+from feathub.metric_stores.prometheus_metric_store import PrometheusMetricStore
+
+
+class _CollectingMetricStore(MetricStore):
+    def __init__(self) -> None:
+        super().__init__({})
+        self.reported_texts: List[str] = []
+        self.fail_to_report = False
+        self.delete_count = 0
+
+    def report_online_metrics(self, metrics: OnlineMetrics) -> None:
+        if self.fail_to_report:
+            raise IOError("Metric store is unavailable.")
+        self.reported_texts.append(metrics.to_prometheus_text(self.namespace))
+
+    def delete_online_metrics(self) -> None:
+        self.delete_count += 1
+
+    def _get_metrics_sink(self, data_sink: Sink) -> Sink:
+        raise Exception()
+
+
+class OnlineMetricsTest(unittest.TestCase):
+    def test_latency_histogram(self):
+        histogram = LatencyHistogram(bucket_bounds_ms=[1, 10, 100])
+        for latency_ms in [0.5, 2, 4, 6, 8, 50, 200]:
+            histogram.record(latency_ms)
+
+        self.assertEqual([1, 4, 1, 1], histogram.bucket_counts)
+        self.assertEqual(7, histogram.count)
+        self.assertAlmostEqual(270.5, histogram.sum_ms)
+        self.assertEqual(200, histogram.max_ms)
+        self.assertAlmostEqual(1 + 9 * (3.5 - 1) / 4, histogram.get_quantile(0.5))
+        self.assertEqual(200, histogram.get_quantile(1.0))
+        self.assertEqual(0.0, LatencyHistogram().get_quantile(0.99))
+
+    def test_record_and_read(self):
+        metrics = OnlineMetrics()
+        metrics.record("lookup", {"table": "a"}, 1.0, num_rows=3)
+        metrics.record("lookup", {"table": "a"}, 3.0, num_rows=2)
+        metrics.record("lookup", {"table": "b"}, 5.0)
+
+        histogram = metrics.get_histogram("lookup", {"table": "a"})
+        self.assertEqual(2, histogram.count)
+        self.assertEqual(2.0, histogram.mean_ms)
+        self.assertEqual(5, metrics.get_row_count("lookup", {"table": "a"}))
+        self.assertEqual(0, metrics.get_row_count("lookup", {"table": "b"}))
+        self.assertIsNone(metrics.get_histogram("lookup", {"table": "c"}))
+        self.assertEqual(2, len(metrics.get_metrics()))
+
+        metrics.clear()
+        self.assertEqual([], metrics.get_metrics())
+
+    def test_counter(self):
+        metrics = OnlineMetrics()
+        self.assertTrue(metrics.is_empty())
+        metrics.increment_counter("cache", {"event": "hit"})
+        metrics.increment_counter("cache", {"event": "hit"}, 2)
+        metrics.increment_counter("cache", {"event": "miss"})
+
+        self.assertFalse(metrics.is_empty())
+        self.assertEqual(3, metrics.get_counter("cache", {"event": "hit"}))
+        self.assertEqual(0, metrics.get_counter("cache", {"event": "eviction"}))
+        self.assertEqual(
+            [("cache", {"event": "hit"}, 3), ("cache", {"event": "miss"}, 1)],
+            metrics.get_counters(),
+        )
+        self.assertEqual([], metrics.get_metrics())
+
+        lines = metrics.to_prometheus_text("ns").splitlines()
+        self.assertEqual("# TYPE ns_cache_total counter", lines[0])
+        self.assertIn('ns_cache_total{event="hit"} 3', lines)
+        self.assertIn('ns_cache_total{event="miss"} 1', lines)
+
+        metrics.clear()
+        self.assertTrue(metrics.is_empty())
+
+    def test_stage_timer(self):
+        metrics = OnlineMetrics()
+        timer = metrics.create_stage_timer("lookup", {"table": "a"})
+        for _ in range(3):
+            timer.start("query")
+            timer.start("decode")
+        timer.record()
+
+        for stage in ["query", "decode"]:
+            histogram = metrics.get_histogram("lookup", {"table": "a", "stage": stage})
+            self.assertEqual(1, histogram.count)
+
+    def test_to_prometheus_text(self):
+        metrics = OnlineMetrics()
+        metrics.record("lookup", {"table": 'a"b'}, 0.2, num_rows=2)
+
+        lines = metrics.to_prometheus_text("ns").splitlines()
+        self.assertEqual("# TYPE ns_lookup_latency_ms histogram", lines[0])
+        self.assertIn('ns_lookup_latency_ms_bucket{table="a\\"b",le="0.1"} 0', lines)
+        self.assertIn('ns_lookup_latency_ms_bucket{table="a\\"b",le="0.25"} 1', lines)
+        self.assertIn('ns_lookup_latency_ms_bucket{table="a\\"b",le="+Inf"} 1', lines)
+        self.assertIn('ns_lookup_latency_ms_sum{table="a\\"b"} 0.2', lines)
+        self.assertIn('ns_lookup_latency_ms_count{table="a\\"b"} 1', lines)
+        self.assertIn("# TYPE ns_lookup_rows_total counter", lines)
+        self.assertIn('ns_lookup_rows_total{table="a\\"b"} 2', lines)
+
+    def test_reporter(self):
+        metrics = OnlineMetrics()
+        metric_store = _CollectingMetricStore()
+        reporter = OnlineMetricsReporter(metrics, metric_store, report_interval_sec=60)
+
+        reporter.start()
+        reporter.stop()
+        self.assertEqual([], metric_store.reported_texts)
+
+        metrics.record("lookup", {}, 1.0)
+        reporter.start()
+        reporter.stop()
+        self.assertEqual(1, len(metric_store.reported_texts))
+        self.assertIn(
+            "default_lookup_latency_ms_count 1", metric_store.reported_texts[0]
+        )
+
+        metrics.clear()
+        metrics.increment_counter("cache", {})
+        reporter.start()
+        reporter.stop()
+        self.assertEqual(2, len(metric_store.reported_texts))
+        self.assertIn("default_cache_total 1", metric_store.reported_texts[1])
+
+    def test_reporter_logs_consecutive_failures_once(self):
+        metrics = OnlineMetrics()
+        metrics.record("lookup", {}, 1.0)
+        metric_store = _CollectingMetricStore()
+        reporter = OnlineMetricsReporter(metrics, metric_store, report_interval_sec=60)
+
+        metric_store.fail_to_report = True
+        with self.assertLogs(online_metrics_logger, "INFO") as logs:
+            for _ in range(3):
+                reporter.report()
+            metric_store.fail_to_report = False
+            reporter.report()
+            metric_store.fail_to_report = True
+            reporter.report()
+
+        self.assertEqual(
+            ["WARNING", "INFO", "WARNING"],
+            [record.levelname for record in logs.records],
+        )
+        self.assertEqual(1, len(metric_store.reported_texts))
+
+    def test_reporter_deletes_metrics_on_stop(self):
+        metrics = OnlineMetrics()
+        metric_store = _CollectingMetricStore()
+        reporter = OnlineMetricsReporter(metrics, metric_store, report_interval_sec=60)
+
+        reporter.start()
+        reporter.stop()
+        self.assertEqual(0, metric_store.delete_count)
+
+        metrics.record("lookup", {}, 1.0)
+        reporter.start()
+        reporter.stop()
+        self.assertEqual(1, metric_store.delete_count)
+
+    @patch("feathub.metric_stores.prometheus_metric_store.request.urlopen")
+    def test_prometheus_metric_store_push_and_delete(self, urlopen: MagicMock):
+        metrics = OnlineMetrics()
+        metrics.record("lookup", {}, 1.0)
+        metric_store = PrometheusMetricStore(
+            {
+                "metric_store.type": "prometheus",
+                "metric_store.namespace": "ns",
+                "metric_store.prometheus.server_url": "localhost:9091",
+            }
+        )
+
+        metric_store.report_online_metrics(metrics)
+        metric_store.delete_online_metrics()
+
+        push_request, delete_request = [call[0][0] for call in urlopen.call_args_list]
+        self.assertEqual("PUT", push_request.get_method())
+        self.assertEqual("DELETE", delete_request.get_method())
+        self.assertTrue(
+            push_request.full_url.startswith("http://localhost:9091/metrics/job/ns/")
+        )
+        self.assertEqual(push_request.full_url, delete_request.full_url)
+
+        urlopen.reset_mock()
+        metric_store.delete_on_shutdown = False
+        metric_store.delete_online_metrics()
+        urlopen.assert_not_called()
@@ -12,79 +12,226 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 import json
+import struct
 from datetime import datetime
-from typing import List, Dict, Any, Union
+from typing import List, Dict, Any, Union, Callable, Optional, Tuple
+
+import numpy as np
 
 from feathub.common import types
+from feathub.common.types import BasicDType
 from feathub.common.exceptions import FeathubException
+from feathub.feature_tables.sources.redis_source import RedisValueEncoding
+from feathub.table.schema import Schema
+
+Decoder = Callable[[Any], Any]
 
 
-def to_python_object(
-    serialized_data: Union[bytes, Dict[bytes, bytes], List[bytes]],
-    data_type: types.DType,
-) -> Any:
+def compile_decoders(
+    schema: Schema, value_encoding: RedisValueEncoding
+) -> Dict[str, Decoder]:
     """
-    Converts a feature from serialized bytes to a Python object according to
-    the data type.
+    Compiles a decoder for each field of the schema, which converts the feature value
+    read from Redis to a Python object. The type dispatch is resolved once when the
+    decoders are compiled, rather than on each decoded value. A decoder returns None
+    if the value read from Redis is None.
+
+    With the binary value encoding, vectors of numeric values are decoded into NumPy
+    arrays if they contain no null value.
+
+    :param schema: The schema of the feature values.
+    :param value_encoding: The encoding of the feature values in Redis.
     """
+    if value_encoding == RedisValueEncoding.BINARY:
+        get_decoder = _get_binary_decoder
+    else:
+        get_decoder = _get_text_decoder
+
+    decoders = {}
+    for field_name, field_type in zip(schema.field_names, schema.field_types):
+        decoders[field_name] = _skip_none(get_decoder(field_type))
+    return decoders
+
+
+def _skip_none(decoder: Decoder) -> Decoder:
+    def _decode(data: Any) -> Any:
+        return None if data is None else decoder(data)
+
+    return _decode
+
+
+def _get_text_decoder(data_type: types.DType) -> Decoder:
     if isinstance(data_type, types.VectorType):
-        if isinstance(serialized_data, bytes):
-            list_data = [x.encode("utf-8") for x in json.loads(serialized_data)]
-        elif isinstance(serialized_data, List):
-            list_data = serialized_data
-        else:
-            raise FeathubException(
-                f"Cannot parse {type(serialized_data)} data according to "
-                f"type {data_type}."
-            )
-        return [to_python_object(x, data_type.dtype) for x in list_data]
+        element_decoder = _skip_none(_get_text_decoder(data_type.dtype))
+
+        def _decode_vector(data: Union[bytes, List[bytes]]) -> List:
+            if isinstance(data, bytes):
+                data = [
+                    None if x is None else x.encode("utf-8") for x in json.loads(data)
+                ]
+            return [element_decoder(x) for x in data]
+
+        return _decode_vector
 
     if isinstance(data_type, types.MapType):
-        if isinstance(serialized_data, bytes):
-            map_data = {
-                k.encode("utf-8"): v.encode("utf-8")
-                for k, v in json.loads(serialized_data).items()
-            }
-        elif isinstance(serialized_data, Dict):
-            map_data = serialized_data
-        else:
-            raise FeathubException(
-                f"Cannot parse {type(serialized_data)} data according to "
-                f"type {data_type}."
-            )
-        return {
-            to_python_object(key, data_type.key_dtype): to_python_object(
-                value, data_type.value_dtype
-            )
-            for key, value in map_data.items()
-        }
+        key_decoder = _skip_none(_get_text_decoder(data_type.key_dtype))
+        value_decoder = _skip_none(_get_text_decoder(data_type.value_dtype))
 
-    if not isinstance(serialized_data, bytes):
-        raise FeathubException(
-            f"Cannot parse {type(serialized_data)} data according to "
-            f"type {data_type}."
-        )
+        def _decode_map(data: Union[bytes, Dict[bytes, bytes]]) -> Dict:
+            if isinstance(data, bytes):
+                data = {
+                    k.encode("utf-8"): None if v is None else v.encode("utf-8")
+                    for k, v in json.loads(data).items()
+                }
+            return {key_decoder(k): value_decoder(v) for k, v in data.items()}
+
+        return _decode_map
 
     if data_type == types.Bytes:
-        return serialized_data
+        return bytes
+    if data_type == types.String:
+        return lambda data: data.decode("utf-8")
+    if data_type == types.Bool:
+        return lambda data: data == b"true"
+    if data_type in (types.Int32, types.Int64):
+        return int
+    if data_type in (types.Float32, types.Float64):
+        return float
+    if data_type == types.Timestamp:
+        return lambda data: datetime.fromtimestamp(int(data) / 1000.0)
+
+    raise FeathubException(f"Cannot decode data with type {data_type}.")
+
+
+# The NumPy dtypes of the fixed-width types in the binary value encoding.
+_BINARY_FIXED_WIDTH_DTYPES: Dict[BasicDType, np.dtype] = {
+    BasicDType.BOOL: np.dtype("?"),
+    BasicDType.INT32: np.dtype("<i4"),
+    BasicDType.INT64: np.dtype("<i8"),
+    BasicDType.FLOAT32: np.dtype("<f4"),
+    BasicDType.FLOAT64: np.dtype("<f8"),
+    BasicDType.TIMESTAMP: np.dtype("<i8"),
+}
+
+# The struct formats of the fixed-width numeric types in the binary value encoding.
+_BINARY_NUMERIC_FORMATS: Dict[BasicDType, str] = {
+    BasicDType.INT32: "<i",
+    BasicDType.INT64: "<q",
+    BasicDType.FLOAT32: "<f",
+    BasicDType.FLOAT64: "<d",
+}
+
+_INT32 = struct.Struct("<i")
+
+
+def _get_binary_decoder(data_type: types.DType) -> Decoder:
+    if isinstance(data_type, types.VectorType):
+        return _get_binary_vector_decoder(data_type)
+
+    if isinstance(data_type, types.MapType):
+        key_decoder = _get_binary_decoder(data_type.key_dtype)
+        value_decoder = _get_binary_decoder(data_type.value_dtype)
+
+        def _decode_map(data: Any) -> Dict:
+            data = memoryview(data)
+            size = _INT32.unpack_from(data)[0]
+            offset = _INT32.size
+            result = {}
+            for _ in range(size):
+                key, offset = _read_length_prefixed(data, offset, key_decoder)
+                value, offset = _read_length_prefixed(data, offset, value_decoder)
+                result[key] = value
+            return result
 
-    data = serialized_data.decode("utf-8")
+        return _decode_map
 
+    if data_type == types.Bytes:
+        return bytes
     if data_type == types.String:
-        return data
-    elif data_type == types.Bool:
-        return data == "true"
-    elif data_type == types.Int32:
-        return int(data)
-    elif data_type == types.Int64:
-        return int(data)
-    elif data_type == types.Float32:
-        return float(data)
-    elif data_type == types.Float64:
-        return float(data)
-    elif data_type == types.Timestamp:
-        return datetime.fromtimestamp(int(data) / 1000.0)
-
-    raise FeathubException(
-        f"Cannot parse {type(serialized_data)} data according to type {data_type}."
-    )
+        return lambda data: str(data, "utf-8")
+    if data_type == types.Timestamp:
+        return lambda data: datetime.fromtimestamp(
+            struct.unpack_from("<q", data)[0] / 1000.0
+        )
+    if data_type == types.Bool:
+        return lambda data: data[0] != 0
+
+    numeric_format = _BINARY_NUMERIC_FORMATS.get(_get_basic_dtype(data_type))
+    if numeric_format is not None:
+        unpack_from = struct.Struct(numeric_format).unpack_from
+        return lambda data: unpack_from(data)[0]
+
+    raise FeathubException(f"Cannot decode data with type {data_type}.")
+
+
+def _get_binary_vector_decoder(data_type: types.VectorType) -> Decoder:
+    element_type = data_type.dtype
+    element_dtype = _BINARY_FIXED_WIDTH_DTYPES.get(_get_basic_dtype(element_type))
+
+    if element_dtype is None:
+        element_decoder = _get_binary_decoder(element_type)
+
+        def _decode_variable_width_vector(data: Any) -> List:
+            data = memoryview(data)
+            size = _INT32.unpack_from(data)[0]
+            offset = _INT32.size
+            result = []
+            for _ in range(size):
+                element, offset = _read_length_prefixed(data, offset, element_decoder)
+                result.append(element)
+            return result
+
+        return _decode_variable_width_vector
+
+    to_element: Optional[Callable[[Any], Any]] = None
+    if element_type == types.Timestamp:
+        to_element = _millis_to_datetime
+
+    def _decode_fixed_width_vector(data: Any) -> Any:
+        size = _INT32.unpack_from(data)[0]
+        has_null = data[_INT32.size] != 0
+        offset = _INT32.size + 1
+        null_mask = None
+        if has_null:
+            bitmap_size = (size + 7) // 8
+            null_mask = np.unpackbits(
+                np.frombuffer(data, np.uint8, bitmap_size, offset),
+                count=size,
+                bitorder="little",
+            )
+            offset += bitmap_size
+
+        values = np.frombuffer(data, element_dtype, size, offset)
+        if null_mask is None and to_element is None:
+            return values.copy()
+
+        elements = values.tolist()
+        if to_element is not None:
+            elements = [to_element(x) for x in elements]
+        if null_mask is not None:
+            for i in np.flatnonzero(null_mask):
+                elements[i] = None
+        return elements
+
+    return _decode_fixed_width_vector
+
+
+def _get_basic_dtype(data_type: types.DType) -> Optional[BasicDType]:
+    if isinstance(data_type, types.PrimitiveType):
+        return data_type.basic_dtype
+    return None
+
+
+def _read_length_prefixed(
+    data: memoryview, offset: int, decoder: Decoder
+) -> Tuple[Any, int]:
+    length = _INT32.unpack_from(data, offset)[0]
+    offset += _INT32.size
+    if length < 0:
+        return None, offset
+    end = offset + length
+    return decoder(data[offset:end]), end
+
+
+def _millis_to_datetime(millis: int) -> datetime:
+    return datetime.fromtimestamp(millis / 1000.0)
@@ -13,8 +13,9 @@
 from __future__ import annotations
 
 from collections import OrderedDict
-from typing import Dict, List, Optional
+from typing import Dict, List, Optional, Any
 
+import numpy as np
 import pandas as pd
 
 import feathub.common.utils as utils
@@ -183,6 +184,51 @@ class MemoryOnlineStore:
             features = features.drop(columns=[field_to_drop])
         return features
 
+    def get_records(
+        self,
+        table_name: str,
+        records: List[Dict[str, Any]],
+        feature_names: Optional[List[str]] = None,
+    ) -> List[Dict[str, Any]]:
+        """
+        Gets values matching the given keys from the specified table in the kv store.
+        Unlike `get`, the keys and the values are held in plain Python dicts.
+
+        :param table_name: The name of the table containing the features.
+        :param records: A list of dicts, each of which contains the keys of this table.
+        :param feature_names: Optional. The names of fields of values that should be
+                               included in the output dicts. If it is None, all
+                               fields of the specified table except the timestamp
+                               field should be outputted.
+        :return: A list of dicts, each of which consists of the corresponding input
+                 record and the requested feature_names.
+        """
+        table_info = self.table_infos[table_name]
+        table = table_info.table
+        key_fields = table_info.key_fields
+        if feature_names is None:
+            feature_names = [
+                field_name
+                for field_name in table_info.schema.field_names
+                if field_name not in key_fields
+                and field_name != table_info.timestamp_field
+            ]
+
+        results = []
+        for record in records:
+            if not all(key_field in record for key_field in key_fields):
+                raise RuntimeError(
+                    f"Input data does not have all the keys {key_fields}."
+                )
+            row = table[
+                tuple((key_field, record[key_field]) for key_field in key_fields)
+            ]
+            result = dict(record)
+            for feature_name in feature_names:
+                result[feature_name] = _to_python_value(row[feature_name])
+            results.append(result)
+        return results
+
     def reset(self) -> None:
         self.table_infos = {}
 
@@ -192,3 +238,8 @@ class MemoryOnlineStore:
             MemoryOnlineStore.INSTANCE = MemoryOnlineStore()
 
         return MemoryOnlineStore.INSTANCE
+
+
+def _to_python_value(value: Any) -> Any:
+    # Converts numpy scalars in the stored rows to Python objects.
+    return value.item() if isinstance(value, np.generic) else value
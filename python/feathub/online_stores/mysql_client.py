@@ -11,16 +11,30 @@
 #  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
 #  See the License for the specific language governing permissions and
 #  limitations under the License.
-from typing import Optional, List, Any
+import threading
+import time
+from typing import Optional, List, Any, Sequence, Dict
 
 import mysql.connector
 import pandas as pd
+from mysql.connector.pooling import MySQLConnectionPool
 
+from feathub.metric_stores.online_metrics import (
+    OnlineMetrics,
+    ONLINE_STORE_METRIC,
+    ONLINE_STORE_STAGE_METRIC,
+)
 from feathub.online_stores.online_store_client import OnlineStoreClient
 from feathub.table.schema import Schema
 
 
 class MySQLClient(OnlineStoreClient):
+    """
+    An online store client that reads feature values from MySQL. Connections are
+    kept in a pool that is shared by all lookups of the client, and the keys of a
+    lookup are queried in batches with `WHERE (k1, k2) IN (...)` predicates.
+    """
+
     def __init__(
         self,
         database: str,
@@ -32,8 +46,27 @@ class MySQLClient(OnlineStoreClient):
         password: str,
         keys: Optional[List[str]] = None,
         timestamp_field: Optional[str] = None,
+        pool_size: int = 4,
+        lookup_batch_size: int = 1000,
+        table_name: Optional[str] = None,
+        metrics: Optional[OnlineMetrics] = None,
     ):
-        super().__init__()
+        """
+        :param pool_size: The number of connections kept in the connection pool.
+        :param lookup_batch_size: The maximum number of keys to look up in one query.
+        :param table_name: Optional. The name of the table identifying the lookups of
+                           this client in the metrics. The MySQL table name is used if
+                           it is None.
+        :param metrics: Optional. The OnlineMetrics to record the latencies of lookups
+                        to.
+        """
+        super().__init__(
+            metrics=metrics,
+            metric_labels={
+                "store": "mysql",
+                "table": table if table_name is None else table_name,
+            },
+        )
         self.table = table
         self.keys = keys
         self.schema = schema
@@ -42,11 +75,16 @@ class MySQLClient(OnlineStoreClient):
         self.username = username
         self.password = password
         self.database = database
+        self.pool_size = pool_size
+        self.lookup_batch_size = lookup_batch_size
 
         self.all_feature_names = [
             x for x in schema.field_names if x not in self.keys and x != timestamp_field
         ]
 
+        self._pool: Optional[MySQLConnectionPool] = None
+        self._pool_lock = threading.Lock()
+
     def get(
         self, input_data: pd.DataFrame, feature_names: Optional[List[str]] = None
     ) -> pd.DataFrame:
@@ -59,50 +97,146 @@ class MySQLClient(OnlineStoreClient):
         if feature_names is None:
             feature_names = self.all_feature_names
 
+        start_time = time.perf_counter()
+        timer = self.metrics.create_stage_timer(
+            ONLINE_STORE_STAGE_METRIC, self.metric_labels
+        )
         selected_field_names = [*self.keys, *feature_names]
 
-        key_values = []
-        for _, row in input_data.iterrows():
-            row_dict = row.to_dict()
-            key_values.append([row_dict[key] for key in self.keys])
+        timer.start("key")
+        key_values = list(
+            input_data[self.keys].drop_duplicates().itertuples(index=False, name=None)
+        )
+
+        timer.start("query")
+        rows = self._query_rows_with_primary_key(selected_field_names, key_values)
 
-        features = pd.DataFrame(
-            data=self._query_rows_with_primary_key(selected_field_names, key_values),
-            columns=selected_field_names,
-        ).set_index(self.keys)
+        timer.start("output")
+        features = pd.DataFrame(data=rows, columns=selected_field_names).set_index(
+            self.keys
+        )
         features = input_data.join(features, on=self.keys)
+        timer.record()
+        self.metrics.record(
+            ONLINE_STORE_METRIC,
+            self.metric_labels,
+            (time.perf_counter() - start_time) * 1000,
+            num_rows=len(input_data),
+        )
         return features
 
-    def _query_rows_with_primary_key(
-        self, select_fields: List[str], key_values: List[List[Any]]
-    ) -> List[Any]:
-        conn = None
-        cursor = None
-        primary_keys_predicate = " AND ".join([f"`{key}`=%s" for key in self.keys])
-        select_field_str = ",".join([f"`{f}`" for f in select_fields])
-        sql = (
-            f"SELECT {select_field_str} FROM {self.table} "
-            f"WHERE {primary_keys_predicate}"
+    def get_records(
+        self,
+        records: List[Dict[str, Any]],
+        feature_names: Optional[List[str]] = None,
+    ) -> List[Dict[str, Any]]:
+        if records and not set(self.keys) <= records[0].keys():
+            raise RuntimeError(
+                f"Input record's field names {list(records[0].keys())} "
+                f"should contain all of source key field names {self.keys}."
+            )
+
+        if feature_names is None:
+            feature_names = self.all_feature_names
+
+        start_time = time.perf_counter()
+        timer = self.metrics.create_stage_timer(
+            ONLINE_STORE_STAGE_METRIC, self.metric_labels
+        )
+        selected_field_names = [*self.keys, *feature_names]
+
+        timer.start("key")
+        record_key_values = [
+            tuple(record[key] for key in self.keys) for record in records
+        ]
+        key_values = list(dict.fromkeys(record_key_values))
+
+        timer.start("query")
+        rows = self._query_rows_with_primary_key(selected_field_names, key_values)
+
+        timer.start("output")
+        num_keys = len(self.keys)
+        features_by_key = {
+            tuple(row[:num_keys]): dict(zip(feature_names, row[num_keys:]))
+            for row in rows
+        }
+        missing_features = dict.fromkeys(feature_names)
+        features = [
+            {**record, **features_by_key.get(key_value, missing_features)}
+            for record, key_value in zip(records, record_key_values)
+        ]
+        timer.record()
+        self.metrics.record(
+            ONLINE_STORE_METRIC,
+            self.metric_labels,
+            (time.perf_counter() - start_time) * 1000,
+            num_rows=len(records),
         )
+        return features
 
+    def _get_pool(self) -> MySQLConnectionPool:
+        if self._pool is None:
+            with self._pool_lock:
+                if self._pool is None:
+                    self._pool = MySQLConnectionPool(
+                        pool_size=self.pool_size,
+                        host=self.host,
+                        port=self.port,
+                        user=self.username,
+                        password=self.password,
+                        database=self.database,
+                    )
+        return self._pool
+
+    def _get_connection(self) -> Any:
         try:
-            conn = mysql.connector.connect(
+            return self._get_pool().get_connection()
+        except mysql.connector.errors.PoolError:
+            # All pooled connections are in use by concurrent lookups. Falls back to
+            # a dedicated connection rather than failing the lookup.
+            return mysql.connector.connect(
                 host=self.host,
                 port=self.port,
                 user=self.username,
                 password=self.password,
                 database=self.database,
             )
-            cursor = conn.cursor()
 
-            results = []
-            for key_value in key_values:
-                cursor.execute(sql, key_value)
+    def _get_select_sql(self, select_fields: List[str], num_keys: int) -> str:
+        select_field_str = ",".join([f"`{f}`" for f in select_fields])
+        if len(self.keys) == 1:
+            key_field_str = f"`{self.keys[0]}`"
+            key_value_str = "%s"
+        else:
+            key_field_str = "(" + ",".join([f"`{key}`" for key in self.keys]) + ")"
+            key_value_str = "(" + ",".join(["%s"] * len(self.keys)) + ")"
+        key_values_str = ",".join([key_value_str] * num_keys)
+        return (
+            f"SELECT {select_field_str} FROM {self.table} "
+            f"WHERE {key_field_str} IN ({key_values_str})"
+        )
+
+    def _query_rows_with_primary_key(
+        self, select_fields: List[str], key_values: Sequence[Sequence[Any]]
+    ) -> List[Any]:
+        if len(key_values) == 0:
+            return []
 
-                result = cursor.fetchone()
+        conn = None
+        cursor = None
+        try:
+            conn = self._get_connection()
+            cursor = conn.cursor()
 
-                if result:
-                    results.append(result)
+            results: List[Any] = []
+            for start in range(0, len(key_values), self.lookup_batch_size):
+                end = start + self.lookup_batch_size
+                batch = key_values[start:end]
+                cursor.execute(
+                    self._get_select_sql(select_fields, len(batch)),
+                    [_to_sql_param(v) for key_value in batch for v in key_value],
+                )
+                results.extend(cursor.fetchall())
 
             return results
         finally:
@@ -110,4 +244,11 @@ class MySQLClient(OnlineStoreClient):
                 cursor.close()
 
             if conn is not None:
+                # Returns the connection to the pool if it is a pooled connection.
                 conn.close()
+
+
+def _to_sql_param(value: Any) -> Any:
+    # Converts numpy scalars, e.g. those in an int64 column of the input DataFrame, to
+    # Python objects that are accepted by the MySQL connector.
+    return value.item() if hasattr(value, "item") else value
@@ -15,13 +15,20 @@
 from __future__ import annotations
 
 from abc import ABC, abstractmethod
-from typing import Optional, List
+import math
+from typing import Optional, List, Dict, Any
 
 import pandas as pd
 
 from feathub.feature_tables.feature_table import FeatureTable
 from feathub.feature_tables.sources.mysql_source import MySQLSource
 from feathub.feature_tables.sources.redis_source import RedisSource
+from feathub.metric_stores.online_metrics import OnlineMetrics
+from feathub.online_stores.online_store_client_config import (
+    OnlineStoreClientConfig,
+    MYSQL_POOL_SIZE_CONFIG,
+    MYSQL_LOOKUP_BATCH_SIZE_CONFIG,
+)
 
 
 class OnlineStoreClient(ABC):
@@ -30,8 +37,19 @@ class OnlineStoreClient(ABC):
     provide a uniform interface to interact with kv stores such as Redis.
     """
 
-    def __init__(self) -> None:
-        pass
+    def __init__(
+        self,
+        metrics: Optional[OnlineMetrics] = None,
+        metric_labels: Optional[Dict[str, str]] = None,
+    ) -> None:
+        """
+        :param metrics: Optional. The OnlineMetrics to record the latencies of lookups
+                        to. A new one is created if it is None.
+        :param metric_labels: Optional. The labels identifying the lookups of this
+                              client in the metrics.
+        """
+        self.metrics = OnlineMetrics() if metrics is None else metrics
+        self.metric_labels = {} if metric_labels is None else metric_labels
 
     # TODO: replace input_data with keys.
     @abstractmethod
@@ -51,11 +69,47 @@ class OnlineStoreClient(ABC):
         """
         pass
 
+    def get_records(
+        self,
+        records: List[Dict[str, Any]],
+        feature_names: Optional[List[str]] = None,
+    ) -> List[Dict[str, Any]]:
+        """
+        Gets values matching the given keys from the specified table in the kv store.
+        Unlike `get`, the keys and the values are held in plain Python dicts, which
+        saves the cost of constructing pandas objects for small requests.
+
+        :param records: A list of dicts, each of which contains the keys of this
+                        table.
+        :param feature_names: Optional. The names of fields of values that should be
+                               included in the output dicts. If it is None, all
+                               feature fields of the specified table should be
+                               outputted.
+        :return: A list of dicts, each of which consists of the corresponding input
+                 record and the requested feature_names. A feature whose key is not
+                 found has the value None.
+        """
+        features = self.get(pd.DataFrame(records), feature_names)
+        return [
+            {k: None if _is_nan(v) else v for k, v in record.items()}
+            for record in features.to_dict("records")
+        ]
+
     @staticmethod
-    def instantiate(source: FeatureTable) -> OnlineStoreClient:
+    def instantiate(
+        source: FeatureTable,
+        props: Optional[Dict] = None,
+        metrics: Optional[OnlineMetrics] = None,
+    ) -> OnlineStoreClient:
         """
         Instantiates an OnlineStoreClient from the provided source.
+
+        :param source: The source describing the table in the online store.
+        :param props: Optional. The global properties used to configure the client.
+        :param metrics: Optional. The OnlineMetrics to record the latencies of lookups
+                        to.
         """
+        config = OnlineStoreClientConfig({} if props is None else props)
 
         if isinstance(source, RedisSource):
             from feathub.online_stores.redis_client import RedisClient
@@ -72,6 +126,10 @@ class OnlineStoreClient(ABC):
                 keys=source.keys,
                 timestamp_field=source.timestamp_field,
                 key_expr=source.key_expr,
+                value_encoding=source.value_encoding,
+                storage_layout=source.storage_layout,
+                table_name=source.name,
+                metrics=metrics,
             )
 
         if isinstance(source, MySQLSource):
@@ -87,8 +145,16 @@ class OnlineStoreClient(ABC):
                 password=source.password,
                 keys=source.keys,
                 timestamp_field=source.timestamp_field,
+                pool_size=config.get(MYSQL_POOL_SIZE_CONFIG),
+                lookup_batch_size=config.get(MYSQL_LOOKUP_BATCH_SIZE_CONFIG),
+                table_name=source.name,
+                metrics=metrics,
             )
 
         raise RuntimeError(
             f"Failed to instantiate online store client from source {source}."
         )
+
+
+def _is_nan(value: Any) -> bool:
+    return isinstance(value, float) and math.isnan(value)
@@ -0,0 +1,56 @@
+#  Copyright 2022 The FeatHub Authors
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#      https://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+from typing import Dict, Any, List
+
+from feathub.common.config import ConfigDef, BaseConfig
+from feathub.common.validators import gt
+
+ONLINE_STORE_PREFIX = "online_store."
+
+MYSQL_ONLINE_STORE_PREFIX = ONLINE_STORE_PREFIX + "mysql."
+
+MYSQL_POOL_SIZE_CONFIG = MYSQL_ONLINE_STORE_PREFIX + "pool_size"
+MYSQL_POOL_SIZE_DOC = (
+    "The number of connections kept in the connection pool of a MySQL online store "
+    "client."
+)
+
+MYSQL_LOOKUP_BATCH_SIZE_CONFIG = MYSQL_ONLINE_STORE_PREFIX + "lookup_batch_size"
+MYSQL_LOOKUP_BATCH_SIZE_DOC = (
+    "The maximum number of keys that are looked up in one query by a MySQL online "
+    "store client. Requests with more keys are split into multiple queries."
+)
+
+online_store_client_config_defs: List[ConfigDef] = [
+    ConfigDef(
+        name=MYSQL_POOL_SIZE_CONFIG,
+        value_type=int,
+        description=MYSQL_POOL_SIZE_DOC,
+        default_value=4,
+        validator=gt(0),
+    ),
+    ConfigDef(
+        name=MYSQL_LOOKUP_BATCH_SIZE_CONFIG,
+        value_type=int,
+        description=MYSQL_LOOKUP_BATCH_SIZE_DOC,
+        default_value=1000,
+        validator=gt(0),
+    ),
+]
+
+
+class OnlineStoreClientConfig(BaseConfig):
+    def __init__(self, props: Dict[str, Any]) -> None:
+        super().__init__(props)
+        self.update_config_values(online_store_client_config_defs)
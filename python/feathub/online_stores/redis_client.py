@@ -11,7 +11,8 @@
 # WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
 # See the License for the specific language governing permissions and
 # limitations under the License.
-from typing import Union, Optional, List, Any
+import time
+from typing import Union, Optional, List, Any, Dict
 
 import pandas as pd
 import redis
@@ -20,12 +21,24 @@ from feathub.common.types import MapType, VectorType
 from feathub.dsl.expr_parser import ExprParser
 from feathub.feature_tables.sinks.redis_sink import RedisMode
 from feathub.feature_tables.sources.redis_source import (
+    RedisValueEncoding,
+    RedisStorageLayout,
     NAMESPACE_KEYWORD,
     KEYS_KEYWORD,
+    FEATURE_NAME_KEYWORD,
 )
-from feathub.online_stores.conversion_utils import to_python_object
+from feathub.metric_stores.online_metrics import (
+    OnlineMetrics,
+    ONLINE_STORE_METRIC,
+    ONLINE_STORE_STAGE_METRIC,
+    StageTimer,
+)
+from feathub.online_stores.conversion_utils import compile_decoders
 from feathub.online_stores.online_store_client import OnlineStoreClient
-from feathub.processors.local.ast_evaluator.local_ast_evaluator import LocalAstEvaluator
+from feathub.processors.local.ast_evaluator.local_ast_compiler import (
+    LocalAstCompiler,
+    CompiledExpr,
+)
 from feathub.table.schema import Schema
 
 
@@ -47,8 +60,27 @@ class RedisClient(OnlineStoreClient):
         keys: List[str],
         timestamp_field: str,
         key_expr: str,
+        table_name: Optional[str] = None,
+        metrics: Optional[OnlineMetrics] = None,
+        value_encoding: RedisValueEncoding = RedisValueEncoding.TEXT,
+        storage_layout: RedisStorageLayout = RedisStorageLayout.KEY_PER_FEATURE,
     ):
-        super().__init__()
+        """
+        :param value_encoding: The encoding of the feature values in Redis.
+        :param storage_layout: The layout of the feature values in Redis.
+        :param table_name: Optional. The name of the table identifying the lookups of
+                           this client in the metrics. The namespace is used if it is
+                           None.
+        :param metrics: Optional. The OnlineMetrics to record the latencies of lookups
+                        to.
+        """
+        super().__init__(
+            metrics=metrics,
+            metric_labels={
+                "store": "redis",
+                "table": namespace if table_name is None else table_name,
+            },
+        )
         self.namespace = namespace
         self.schema = schema
         self.key_names = keys
@@ -58,8 +90,24 @@ class RedisClient(OnlineStoreClient):
             NAMESPACE_KEYWORD, f'"{namespace}"'
         ).replace(KEYS_KEYWORD, ", ".join(keys))
 
-        self.parser = ExprParser()
-        self.ast_evaluator = LocalAstEvaluator()
+        self.parser = ExprParser.get_instance()
+        self.ast_compiler = LocalAstCompiler()
+
+        self.value_encoding = value_encoding
+        self.storage_layout = storage_layout
+        self.decoders = compile_decoders(schema, value_encoding)
+
+        # The compiled key expressions of the features, which are compiled on their
+        # first lookup rather than on each lookup.
+        self.key_expr_funcs: Dict[str, CompiledExpr] = {}
+
+        # With the HASH_PER_ROW layout, the key does not depend on the feature name,
+        # so it is compiled only once.
+        self.row_key_expr_func = (
+            self.ast_compiler.compile(self.parser.parse(self.key_expr_template))
+            if storage_layout == RedisStorageLayout.HASH_PER_ROW
+            else None
+        )
 
         self.all_feature_names = [
             x
@@ -104,30 +152,121 @@ class RedisClient(OnlineStoreClient):
         if feature_names is None:
             feature_names = self.all_feature_names
 
+        start_time = time.perf_counter()
+        timer = self.metrics.create_stage_timer(
+            ONLINE_STORE_STAGE_METRIC, self.metric_labels
+        )
+        results_list = self._get_feature_values(
+            input_data.to_dict("records"), feature_names, timer
+        )
+
+        timer.start("output")
+        features = pd.DataFrame(results_list, columns=feature_names)
+        features = input_data.join(features)
+        timer.record()
+        self.metrics.record(
+            ONLINE_STORE_METRIC,
+            self.metric_labels,
+            (time.perf_counter() - start_time) * 1000,
+            num_rows=len(input_data),
+        )
+        return features
+
+    def get_records(
+        self,
+        records: List[Dict[str, Any]],
+        feature_names: Optional[List[str]] = None,
+    ) -> List[Dict[str, Any]]:
+        if records and not set(self.key_names) <= records[0].keys():
+            raise RuntimeError(
+                f"Input record's field names {list(records[0].keys())} "
+                f"should contain all of source key field names {self.key_names}."
+            )
+
+        if feature_names is None:
+            feature_names = self.all_feature_names
+
+        start_time = time.perf_counter()
+        timer = self.metrics.create_stage_timer(
+            ONLINE_STORE_STAGE_METRIC, self.metric_labels
+        )
+        results_list = self._get_feature_values(records, feature_names, timer)
+
+        timer.start("output")
+        features = [
+            {**record, **dict(zip(feature_names, results))}
+            for record, results in zip(records, results_list)
+        ]
+        timer.record()
+        self.metrics.record(
+            ONLINE_STORE_METRIC,
+            self.metric_labels,
+            (time.perf_counter() - start_time) * 1000,
+            num_rows=len(records),
+        )
+        return features
+
+    def _get_feature_values(
+        self,
+        records: List[Dict[str, Any]],
+        feature_names: List[str],
+        timer: StageTimer,
+    ) -> List[List[Any]]:
         results_list = []
-        for _, row in input_data.iterrows():
-            row_dict = row.to_dict()
+        for record in records:
+            if self.row_key_expr_func is not None:
+                results_list.append(
+                    self._get_row_from_hash(record, feature_names, timer)
+                )
+                continue
+
             result = []
             for feature_name in feature_names:
-                key_expr = self.key_expr_template.replace(
-                    "__FEATURE_NAME__", f'"{feature_name}"'
-                )
-                expr_node = self.parser.parse(key_expr)
-                key = self.ast_evaluator.eval(expr_node, row_dict)
+                timer.start("key")
+                key = self._get_key_expr_func(feature_name)(record)
 
+                timer.start("query")
                 field_type = self.schema.get_field_type(feature_name)
-                if isinstance(field_type, MapType):
-                    redis_data: Any = self.redis_client.hgetall(key)
+                if self.value_encoding == RedisValueEncoding.BINARY:
+                    redis_data: Any = self.redis_client.get(key)
+                elif isinstance(field_type, MapType):
+                    redis_data = self.redis_client.hgetall(key)
                 elif isinstance(field_type, VectorType):
                     redis_data = self.redis_client.lrange(key, 0, -1)
                 else:
                     redis_data = self.redis_client.get(key)
-                result.append(to_python_object(redis_data, field_type))
+
+                timer.start("decode")
+                result.append(self.decoders[feature_name](redis_data))
             results_list.append(result)
+        return results_list
 
-        features = pd.DataFrame(results_list, columns=feature_names)
-        features = input_data.join(features)
-        return features
+    def _get_key_expr_func(self, feature_name: str) -> CompiledExpr:
+        expr_func = self.key_expr_funcs.get(feature_name)
+        if expr_func is None:
+            expr_node = self.parser.parse(
+                self.key_expr_template.replace(
+                    FEATURE_NAME_KEYWORD, f'"{feature_name}"'
+                )
+            )
+            expr_func = self.ast_compiler.compile(expr_node)
+            self.key_expr_funcs[feature_name] = expr_func
+        return expr_func
+
+    def _get_row_from_hash(
+        self, record: Dict[str, Any], feature_names: List[str], timer: StageTimer
+    ) -> List[Any]:
+        timer.start("key")
+        key = self.row_key_expr_func(record)
+
+        timer.start("query")
+        redis_data = self.redis_client.hmget(key, feature_names)
+
+        timer.start("decode")
+        return [
+            self.decoders[feature_name](data)
+            for feature_name, data in zip(feature_names, redis_data)
+        ]
 
     def __del__(self) -> None:
         self.redis_client.close()
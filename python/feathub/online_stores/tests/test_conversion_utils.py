@@ -0,0 +1,138 @@
+# Copyright 2022 The FeatHub Authors
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+import struct
+import unittest
+from datetime import datetime
+from typing import Optional, List
+
+import numpy as np
+
+from feathub.common import types
+from feathub.feature_tables.sources.redis_source import RedisValueEncoding
+from feathub.online_stores.conversion_utils import compile_decoders
+from feathub.table.schema import Schema
+
+
+def _length_prefixed(data: Optional[bytes]) -> bytes:
+    if data is None:
+        return struct.pack("<i", -1)
+    return struct.pack("<i", len(data)) + data
+
+
+def _fixed_width_vector(fmt: str, values: List) -> bytes:
+    null_indices = [i for i, value in enumerate(values) if value is None]
+    result = struct.pack("<ib", len(values), 1 if null_indices else 0)
+    if null_indices:
+        bitmap = bytearray((len(values) + 7) // 8)
+        for i in null_indices:
+            bitmap[i // 8] |= 1 << (i % 8)
+        result += bytes(bitmap)
+    for value in values:
+        result += struct.pack(fmt, 0 if value is None else value)
+    return result
+
+
+class ConversionUtilsTest(unittest.TestCase):
+    def test_binary_decoders(self):
+        schema = (
+            Schema.new_builder()
+            .column("string", types.String)
+            .column("bytes", types.Bytes)
+            .column("bool", types.Bool)
+            .column("int32", types.Int32)
+            .column("int64", types.Int64)
+            .column("float64", types.Float64)
+            .column("timestamp", types.Timestamp)
+            .column("float32_vector", types.VectorType(types.Float32))
+            .column("int64_vector", types.VectorType(types.Int64))
+            .column("string_vector", types.VectorType(types.String))
+            .column(
+                "map",
+                types.MapType(types.String, types.VectorType(types.Float64)),
+            )
+            .build()
+        )
+        decoders = compile_decoders(schema, RedisValueEncoding.BINARY)
+
+        self.assertEqual("abc", decoders["string"](b"abc"))
+        self.assertEqual(b"\x00\x01", decoders["bytes"](b"\x00\x01"))
+        self.assertEqual(True, decoders["bool"](b"\x01"))
+        self.assertEqual(-3, decoders["int32"](struct.pack("<i", -3)))
+        self.assertEqual(2**40, decoders["int64"](struct.pack("<q", 2**40)))
+        self.assertEqual(1.5, decoders["float64"](struct.pack("<d", 1.5)))
+        self.assertEqual(
+            datetime.fromtimestamp(1000),
+            decoders["timestamp"](struct.pack("<q", 1000000)),
+        )
+
+        vector = decoders["float32_vector"](_fixed_width_vector("<f", [1.0, 2.5, -1.0]))
+        self.assertIsInstance(vector, np.ndarray)
+        self.assertEqual(np.float32, vector.dtype)
+        self.assertEqual([1.0, 2.5, -1.0], vector.tolist())
+
+        values = [1, None, 3, 4, 5, 6, 7, 8, None]
+        self.assertEqual(
+            values, decoders["int64_vector"](_fixed_width_vector("<q", values))
+        )
+
+        self.assertEqual(
+            ["a", None, ""],
+            decoders["string_vector"](
+                struct.pack("<i", 3)
+                + _length_prefixed(b"a")
+                + _length_prefixed(None)
+                + _length_prefixed(b"")
+            ),
+        )
+
+        decoded_map = decoders["map"](
+            struct.pack("<i", 2)
+            + _length_prefixed(b"a")
+            + _length_prefixed(_fixed_width_vector("<d", [1.0, None]))
+            + _length_prefixed(b"b")
+            + _length_prefixed(None)
+        )
+        self.assertEqual({"a": [1.0, None], "b": None}, decoded_map)
+
+        for decoder in decoders.values():
+            self.assertIsNone(decoder(None))
+
+    def test_text_decoders(self):
+        schema = (
+            Schema.new_builder()
+            .column("string", types.String)
+            .column("bool", types.Bool)
+            .column("int64", types.Int64)
+            .column("float64", types.Float64)
+            .column("timestamp", types.Timestamp)
+            .column("vector", types.VectorType(types.VectorType(types.Int32)))
+            .column("map", types.MapType(types.String, types.Float64))
+            .build()
+        )
+        decoders = compile_decoders(schema, RedisValueEncoding.TEXT)
+
+        self.assertEqual("abc", decoders["string"](b"abc"))
+        self.assertEqual(True, decoders["bool"](b"true"))
+        self.assertEqual(3, decoders["int64"](b"3"))
+        self.assertEqual(1.5, decoders["float64"](b"1.5"))
+        self.assertEqual(
+            datetime.fromtimestamp(1000), decoders["timestamp"](b"1000000")
+        )
+        self.assertEqual([[1, 2], [3]], decoders["vector"]([b'["1", "2"]', b'["3"]']))
+        self.assertEqual(
+            {"a": 1.0, "b": 2.0}, decoders["map"]({b"a": b"1.0", b"b": b"2.0"})
+        )
+
+        for decoder in decoders.values():
+            self.assertIsNone(decoder(None))
@@ -73,3 +73,28 @@ class MemoryOnlineStoreTest(unittest.TestCase):
             columns=["name", "cost", "time"],
         )
         self.assertTrue(expected_result_df.equals(result_df))
+
+    def test_put_and_get_records(self):
+        store = MemoryOnlineStore.get_instance()
+        store.put(
+            table_name="table_1",
+            features=self.features,
+            schema=self.schema,
+            key_fields=["name"],
+            timestamp_field="time",
+            timestamp_format="%Y-%m-%d %H:%M:%S",
+        )
+
+        result = store.get_records(
+            table_name="table_1",
+            records=[{"name": "Alex", "extra": 1}, {"name": "Jack", "extra": 2}],
+        )
+
+        self.assertEqual(
+            [
+                {"name": "Alex", "extra": 1, "cost": 300, "distance": 200},
+                {"name": "Jack", "extra": 2, "cost": 500, "distance": 500},
+            ],
+            result,
+        )
+        self.assertTrue(all(type(r["cost"]) is int for r in result))
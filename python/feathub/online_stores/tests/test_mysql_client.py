@@ -0,0 +1,185 @@
+#  Copyright 2022 The FeatHub Authors
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#      https://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+import unittest
+from typing import cast
+from unittest.mock import patch, MagicMock
+
+import numpy as np
+import pandas as pd
+from pandas._testing import assert_frame_equal
+
+from feathub.common.types import Int64, String
+from feathub.metric_stores.online_metrics import (
+    ONLINE_STORE_METRIC,
+    ONLINE_STORE_STAGE_METRIC,
+)
+from feathub.online_stores.mysql_client import MySQLClient
+from feathub.online_stores.online_store_client import OnlineStoreClient
+from feathub.feature_tables.sources.mysql_source import MySQLSource
+from feathub.table.schema import Schema
+
+
+class _FakeCursor:
+    def __init__(self, rows):
+        self.rows = rows
+        self.executed = []
+        self._result = []
+
+    def execute(self, sql, params):
+        self.executed.append((sql, params))
+        num_keys = len(params) // 2
+        requested = {(params[2 * i], params[2 * i + 1]) for i in range(num_keys)}
+        self._result = [row for row in self.rows if (row[0], row[1]) in requested]
+
+    def fetchall(self):
+        return self._result
+
+    def close(self):
+        pass
+
+
+class MySQLClientTest(unittest.TestCase):
+    def setUp(self) -> None:
+        self.schema = (
+            Schema.new_builder()
+            .column("id", Int64)
+            .column("name", String)
+            .column("val", Int64)
+            .column("ts", String)
+            .build()
+        )
+        self.cursor = _FakeCursor(
+            [
+                (1, "a", 10),
+                (2, "b", 20),
+                (3, "c", 30),
+            ]
+        )
+        connection = MagicMock()
+        connection.cursor.return_value = self.cursor
+        self.pool = MagicMock()
+        self.pool.get_connection.return_value = connection
+
+    def _create_client(self, lookup_batch_size: int) -> MySQLClient:
+        return MySQLClient(
+            database="database",
+            table="table",
+            schema=self.schema,
+            host="127.0.0.1",
+            port=3306,
+            username="user",
+            password="password",
+            keys=["id", "name"],
+            timestamp_field="ts",
+            lookup_batch_size=lookup_batch_size,
+        )
+
+    def test_batched_lookup(self):
+        with patch(
+            "feathub.online_stores.mysql_client.MySQLConnectionPool",
+            return_value=self.pool,
+        ) as pool_class:
+            client = self._create_client(lookup_batch_size=2)
+            input_data = pd.DataFrame(
+                [[1, "a"], [3, "c"], [1, "a"], [4, "d"], [2, "b"]],
+                columns=["id", "name"],
+            )
+            result = client.get(input_data)
+            client.get(input_data)
+
+        expected_result = pd.DataFrame(
+            [[1, "a", 10], [3, "c", 30], [1, "a", 10], [4, "d", np.nan], [2, "b", 20]],
+            columns=["id", "name", "val"],
+        )
+        assert_frame_equal(expected_result, result)
+
+        # The connection pool is created once and reused across lookups.
+        self.assertEqual(1, pool_class.call_count)
+        self.assertEqual(2, self.pool.get_connection.call_count)
+
+        # Duplicated keys are looked up once and 4 distinct keys are looked up with
+        # 2 queries in each call.
+        self.assertEqual(4, len(self.cursor.executed))
+        sql, params = self.cursor.executed[0]
+        self.assertEqual(
+            "SELECT `id`,`name`,`val` FROM table "
+            "WHERE (`id`,`name`) IN ((%s,%s),(%s,%s))",
+            sql,
+        )
+        self.assertEqual([1, "a", 3, "c"], params)
+        self.assertTrue(all(type(param) in (int, str) for param in params))
+
+        metric_labels = {"store": "mysql", "table": "table"}
+        self.assertEqual(
+            2, client.metrics.get_histogram(ONLINE_STORE_METRIC, metric_labels).count
+        )
+        self.assertEqual(
+            10, client.metrics.get_row_count(ONLINE_STORE_METRIC, metric_labels)
+        )
+        self.assertIsNotNone(
+            client.metrics.get_histogram(
+                ONLINE_STORE_STAGE_METRIC, {**metric_labels, "stage": "query"}
+            )
+        )
+
+    def test_get_records(self):
+        with patch(
+            "feathub.online_stores.mysql_client.MySQLConnectionPool",
+            return_value=self.pool,
+        ):
+            client = self._create_client(lookup_batch_size=2)
+            result = client.get_records(
+                [
+                    {"id": 1, "name": "a"},
+                    {"id": 4, "name": "d"},
+                    {"id": 1, "name": "a"},
+                ]
+            )
+
+        self.assertEqual(
+            [
+                {"id": 1, "name": "a", "val": 10},
+                {"id": 4, "name": "d", "val": None},
+                {"id": 1, "name": "a", "val": 10},
+            ],
+            result,
+        )
+        self.assertEqual(1, len(self.cursor.executed))
+        self.assertEqual([1, "a", 4, "d"], self.cursor.executed[0][1])
+
+    def test_instantiate_with_props(self):
+        source = MySQLSource(
+            name="source",
+            database="database",
+            table="table",
+            schema=self.schema,
+            host="127.0.0.1",
+            username="user",
+            password="password",
+            keys=["id", "name"],
+            timestamp_field="ts",
+        )
+        client = cast(
+            MySQLClient,
+            OnlineStoreClient.instantiate(
+                source,
+                {
+                    "online_store.mysql.pool_size": 8,
+                    "online_store.mysql.lookup_batch_size": 100,
+                },
+            ),
+        )
+        self.assertIsInstance(client, MySQLClient)
+        self.assertEqual(8, client.pool_size)
+        self.assertEqual(100, client.lookup_batch_size)
@@ -12,16 +12,22 @@
 #  See the License for the specific language governing permissions and
 #  limitations under the License.
 import typing
-from collections import defaultdict
 from datetime import timedelta, datetime
-from typing import Optional, Union, Any, Dict, List
+from typing import Optional, Union, Any, Dict, List, Iterator, Generator
 
 import numpy as np
 import pandas as pd
+import pyarrow as pa
+import pytz
+from pyflink.java_gateway import get_gateway
 from pyflink.table import (
     Table as NativeFlinkTable,
     DataTypes,
 )
+from pyflink.table.serializers import ArrowSerializer
+from pyflink.table.table_result import CloseableIterator
+from pyflink.table.table_schema import TableSchema
+from pyflink.table.types import create_arrow_schema
 
 from feathub.common.exceptions import FeathubException
 from feathub.common.types import MapType
@@ -34,7 +40,7 @@ from feathub.processors.materialization_descriptor import (
 from feathub.processors.type_utils import cast_dataframe_dtype
 from feathub.processors.processor_job import ProcessorJob
 from feathub.table.schema import Schema
-from feathub.table.table import Table
+from feathub.table.table import Table, DEFAULT_CHUNK_SIZE
 from feathub.table.table_descriptor import TableDescriptor
 
 if typing.TYPE_CHECKING:
@@ -53,29 +59,170 @@ FLINK_DATA_TYPE_TO_NUMPY_TYPE: Dict = {
 }
 
 
-# PyFlink Table#to_pandas currently doesn't support Map type. We have to collect the
-# result and construct the pandas DataFrame.
-# TODO: Use PyFlink Table#to_pandas after
-#  https://issues.apache.org/jira/projects/FLINK/issues/FLINK-30607 is resolved.
 def flink_table_to_pandas(table: NativeFlinkTable) -> pd.DataFrame:
     """
-    Converting the given flink table to pandas dataframe.
+    Converting the given flink table to pandas dataframe. Rows are transferred from the
+    JVM in Arrow batches if all fields of the table can be represented in Arrow, which
+    avoids converting each value into a Python object across Py4J.
     """
     schema = table.get_schema()
-    field_names = schema.get_field_names()
-    field_types = {
+    arrow_schema = _get_arrow_schema(table)
+    if arrow_schema is not None:
+        arrow_table = pa.Table.from_batches(
+            _collect_arrow_batches(
+                table, arrow_schema, _get_max_arrow_batch_size(table)
+            ),
+            schema=arrow_schema,
+        )
+        return _arrow_table_to_pandas(arrow_table, _get_numpy_types(schema))
+
+    with table.execute().collect() as results:
+        return _rows_to_pandas(list(results), schema)
+
+
+def flink_table_to_pandas_iterator(
+    table: NativeFlinkTable, chunk_size: int = DEFAULT_CHUNK_SIZE
+) -> Generator[pd.DataFrame, None, None]:
+    """
+    Converting the given flink table to an iterator of pandas dataframes, each of which
+    contains at most `chunk_size` rows of the table. Only one chunk of rows is held in
+    Python memory at a time.
+
+    The job computing the table is submitted when this method is called, while the
+    rows are fetched as the returned generator is iterated. The generator should be
+    closed if it is not exhausted, so that the iterator collecting the rows is
+    released.
+    """
+    schema = table.get_schema()
+    arrow_schema = _get_arrow_schema(table)
+    if arrow_schema is not None:
+        return _arrow_batches_to_pandas_iterator(
+            _collect_arrow_batches(table, arrow_schema, chunk_size),
+            arrow_schema,
+            _get_numpy_types(schema),
+        )
+
+    return _rows_to_pandas_iterator(table.execute().collect(), schema, chunk_size)
+
+
+def flink_table_to_arrow(table: NativeFlinkTable) -> pa.Table:
+    """
+    Converting the given flink table to pyarrow Table. Rows are transferred from the
+    JVM in Arrow batches if all fields of the table can be represented in Arrow.
+    """
+    arrow_schema = _get_arrow_schema(table)
+    if arrow_schema is None:
+        return pa.Table.from_pandas(flink_table_to_pandas(table), preserve_index=False)
+
+    return pa.Table.from_batches(
+        _collect_arrow_batches(table, arrow_schema, _get_max_arrow_batch_size(table)),
+        schema=arrow_schema,
+    )
+
+
+def _get_arrow_schema(table: NativeFlinkTable) -> Optional[pa.Schema]:
+    schema = table.get_schema()
+    try:
+        return create_arrow_schema(
+            schema.get_field_names(), schema.get_field_data_types()
+        )
+    except (TypeError, ValueError):
+        # PyFlink Table#to_pandas currently doesn't support Map type. Tables with such
+        # fields have to be collected row by row.
+        # TODO: Remove the fallback after
+        #  https://issues.apache.org/jira/projects/FLINK/issues/FLINK-30607 is
+        #  resolved.
+        return None
+
+
+def _get_max_arrow_batch_size(table: NativeFlinkTable) -> int:
+    gateway = get_gateway()
+    return (
+        table._j_table.getTableEnvironment()
+        .getConfig()
+        .get(gateway.jvm.org.apache.flink.python.PythonOptions.MAX_ARROW_BATCH_SIZE)
+    )
+
+
+def _collect_arrow_batches(
+    table: NativeFlinkTable, arrow_schema: pa.Schema, max_batch_size: int
+) -> Iterator[pa.RecordBatch]:
+    table._t_env._before_execute()
+    j_table = table._j_table
+    arrow_utils = get_gateway().jvm.org.apache.flink.table.runtime.arrow.ArrowUtils
+    batches_iterator = arrow_utils.collectAsPandasDataFrame(j_table, max_batch_size)
+    timezone = pytz.timezone(
+        j_table.getTableEnvironment().getConfig().getLocalTimeZone().getId()
+    )
+    serializer = ArrowSerializer(
+        arrow_schema, table.get_schema().to_row_data_type(), timezone
+    )
+    return serializer.load_from_iterator(batches_iterator)
+
+
+def _arrow_batches_to_pandas_iterator(
+    batches: Iterator[pa.RecordBatch],
+    arrow_schema: pa.Schema,
+    numpy_types: Dict[str, Any],
+) -> Generator[pd.DataFrame, None, None]:
+    for batch in batches:
+        yield _arrow_table_to_pandas(
+            pa.Table.from_batches([batch], schema=arrow_schema), numpy_types
+        )
+
+
+def _rows_to_pandas_iterator(
+    results: CloseableIterator, schema: TableSchema, chunk_size: int
+) -> Generator[pd.DataFrame, None, None]:
+    try:
+        rows: List[Any] = []
+        for row in results:
+            rows.append(row)
+            if len(rows) >= chunk_size:
+                yield _rows_to_pandas(rows, schema)
+                rows = []
+        if rows:
+            yield _rows_to_pandas(rows, schema)
+    finally:
+        results.close()
+
+
+def _get_numpy_types(schema: TableSchema) -> Dict[str, Any]:
+    return {
         name: FLINK_DATA_TYPE_TO_NUMPY_TYPE.get(type(schema.get_field_data_type(name)))
-        for name in field_names
+        for name in schema.get_field_names()
         if type(schema.get_field_data_type(name)) in FLINK_DATA_TYPE_TO_NUMPY_TYPE
     }
-    with table.execute().collect() as results:
-        data: Dict[str, List[Any]] = defaultdict(list)
-        for row in results:
-            for name, value in zip(field_names, row):
-                data[name].append(value)
 
-        df = pd.DataFrame({name: pd.Series(values) for name, values in data.items()})
-        return cast_dataframe_dtype(df, field_types)
+
+def _arrow_table_to_pandas(
+    arrow_table: pa.Table, numpy_types: Dict[str, Any]
+) -> pd.DataFrame:
+    df = arrow_table.to_pandas()
+    # Arrow converts list values to NumPy arrays. Keeps them as Python lists, which
+    # is the same as the values collected row by row.
+    for field in arrow_table.schema:
+        if pa.types.is_list(field.type):
+            df[field.name] = pd.Series(
+                arrow_table.column(field.name).to_pylist(), dtype=object
+            )
+    return cast_dataframe_dtype(df, numpy_types)
+
+
+def _rows_to_pandas(rows: List[Any], schema: TableSchema) -> pd.DataFrame:
+    field_names = schema.get_field_names()
+    data: Dict[str, List[Any]] = {name: [] for name in field_names}
+    for row in rows:
+        for name, value in zip(field_names, row):
+            data[name].append(value)
+
+    df = pd.DataFrame(
+        {
+            name: pd.Series(values, dtype=None if values else object)
+            for name, values in data.items()
+        }
+    )
+    return cast_dataframe_dtype(df, _get_numpy_types(schema))
 
 
 class FlinkTable(Table):
@@ -128,12 +275,41 @@ class FlinkTable(Table):
         return to_feathub_schema(schema)
 
     def to_pandas(self, force_bounded: bool = False) -> pd.DataFrame:
+        feature = self._get_feature_to_collect("to_pandas", force_bounded)
+        with self.flink_processor.flink_table_builder.class_loader:
+            return flink_table_to_pandas(
+                self._get_flink_table(feature),
+            )
+
+    def to_pandas_iterator(
+        self, force_bounded: bool = False, chunk_size: int = DEFAULT_CHUNK_SIZE
+    ) -> Iterator[pd.DataFrame]:
+        feature = self._get_feature_to_collect("to_pandas_iterator", force_bounded)
+        # Only the job submission needs the class loader, so that the class loader is
+        # not left as the context class loader while the caller consumes the chunks.
+        with self.flink_processor.flink_table_builder.class_loader:
+            chunks = flink_table_to_pandas_iterator(
+                self._get_flink_table(feature), chunk_size
+            )
+        try:
+            yield from chunks
+        finally:
+            chunks.close()
+
+    def to_arrow(self, force_bounded: bool = False) -> pa.Table:
+        feature = self._get_feature_to_collect("to_arrow", force_bounded)
+        with self.flink_processor.flink_table_builder.class_loader:
+            return flink_table_to_arrow(self._get_flink_table(feature))
+
+    def _get_feature_to_collect(
+        self, method_name: str, force_bounded: bool
+    ) -> TableDescriptor:
         if self.flink_processor.deployment_mode not in (
             DeploymentMode.CLI,
             DeploymentMode.SESSION,
         ):
             raise FeathubException(
-                "Table.to_pandas is only supported in cli mode and session mode."
+                f"Table.{method_name} is only supported in cli mode and session mode."
             )
 
         feature = self.feature
@@ -144,11 +320,7 @@ class FlinkTable(Table):
                     "set force_bounded to True to convert the Table to DataFrame."
                 )
             feature = feature.get_bounded_view()
-
-        with self.flink_processor.flink_table_builder.class_loader:
-            return flink_table_to_pandas(
-                self._get_flink_table(feature),
-            )
+        return feature
 
     def execute_insert(
         self,
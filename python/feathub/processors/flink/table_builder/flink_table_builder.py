@@ -278,7 +278,7 @@ class FlinkTableBuilder:
     ) -> NativeFlinkTable:
         source_table = self._get_table(feature_view.source)
         source_fields = list(source_table.get_schema().get_field_names())
-        dependent_features = self._get_dependent_features(feature_view)
+        dependent_features = feature_view.get_dependent_features()
         tmp_table = source_table
 
         if len(feature_view.get_resolved_features()) == 1:
@@ -512,7 +512,7 @@ class FlinkTableBuilder:
         source_table = self._get_table(feature_view.source)
         source_fields = source_table.get_schema().get_field_names()
 
-        dependent_features = self._get_dependent_features(feature_view)
+        dependent_features = feature_view.get_dependent_features()
 
         tmp_table = source_table
 
@@ -690,17 +690,6 @@ class FlinkTableBuilder:
             return table
         return table.filter(native_flink_expr.call_sql(to_flink_sql_expr(filter_expr)))
 
-    @staticmethod
-    def _get_dependent_features(feature_view: FeatureView) -> List[Feature]:
-        dependent_features = []
-        for feature in feature_view.get_resolved_features():
-            for input_feature in feature.input_features:
-                if input_feature not in dependent_features:
-                    dependent_features.append(input_feature)
-            if feature not in dependent_features:
-                dependent_features.append(feature)
-        return dependent_features
-
     @staticmethod
     def _evaluate_expression_transform(
         source_table: NativeFlinkTable,
@@ -37,6 +37,8 @@ from feathub.feature_tables.sources.redis_source import (
     NAMESPACE_KEYWORD,
     KEYS_KEYWORD,
     RedisSource,
+    RedisValueEncoding,
+    RedisStorageLayout,
     FEATURE_NAME_KEYWORD,
     KEY_COLUMN_PREFIX,
 )
@@ -121,6 +123,14 @@ def optimize_redis_source_lookup_map(
     if not isinstance(table_descriptor, RedisSource):
         return table
 
+    # Map-typed features are saved as Redis hashes only with the text encoding and
+    # the KEY_PER_FEATURE storage layout.
+    if (
+        table_descriptor.value_encoding != RedisValueEncoding.TEXT
+        or table_descriptor.storage_layout != RedisStorageLayout.KEY_PER_FEATURE
+    ):
+        return table
+
     fully_acquired_field_names = set()
     hash_fields: Dict[str, List[str]] = dict()
     for descriptor in join_field_descriptors.values():
@@ -249,6 +259,8 @@ def get_table_from_redis_source(
         .option("port", str(source.port))
         .option("dbNum", str(source.db_num))
         .option("keyFields", ",".join(source.keys))
+        .option("valueEncoding", source.value_encoding.name)
+        .option("storageLayout", source.storage_layout.name)
     )
 
     if source.username is not None:
@@ -293,7 +305,11 @@ def add_redis_sink_to_statement_set(
         x for x in features_table.get_schema().get_field_names() if x not in keys
     ]
 
-    if FEATURE_NAME_KEYWORD not in sink.key_expr and len(feature_names) > 1:
+    if (
+        sink.storage_layout == RedisStorageLayout.KEY_PER_FEATURE
+        and FEATURE_NAME_KEYWORD not in sink.key_expr
+        and len(feature_names) > 1
+    ):
         raise FeathubException(
             "In order to guarantee the uniqueness of feature keys in Redis, "
             f"key_expr {sink.key_expr} should contain {FEATURE_NAME_KEYWORD},"
@@ -320,6 +336,8 @@ def add_redis_sink_to_statement_set(
         .option("port", str(sink.port))
         .option("dbNum", str(sink.db_num))
         .option("enableHashPartialUpdate", str(sink.enable_hash_partial_update))
+        .option("valueEncoding", sink.value_encoding.name)
+        .option("storageLayout", sink.storage_layout.name)
     )
 
     if sink.username is not None:
@@ -0,0 +1,390 @@
+# Copyright 2022 The FeatHub Authors
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+import operator
+from datetime import datetime, timezone, tzinfo
+from typing import Any, Callable, Dict, Optional, Tuple
+
+import numpy as np
+
+from feathub.common.exceptions import FeathubException, FeathubExpressionException
+from feathub.dsl.ast import (
+    ExprAST,
+    ArgListNode,
+    VariableNode,
+    FuncCallOp,
+    ValueNode,
+    CompareOp,
+    UminusOp,
+    BinaryOp,
+    LogicalOp,
+    CastOp,
+    GroupNode,
+    IsOp,
+    NullNode,
+    CaseOp,
+    BracketOp,
+)
+from feathub.processors.local.ast_evaluator.local_ast_evaluator import (
+    _TRUE_STRINGS,
+    _FALSE_STRINGS,
+)
+from feathub.processors.local.ast_evaluator.local_func_evaluator import (
+    LocalFuncEvaluator,
+)
+
+# A compiled expression, which takes the map from variable name to its value and
+# returns the result of the expression.
+CompiledExpr = Callable[[Optional[Dict]], Any]
+
+# A compiled expression and whether it is constant, i.e. its result does not depend
+# on the variables.
+_CompiledChild = Tuple[CompiledExpr, bool]
+
+# A compiled expression and its compiled children.
+_CompiledNode = Tuple[CompiledExpr, Tuple[_CompiledChild, ...]]
+
+_BINARY_OPS: Dict[str, Callable[[Any, Any], Any]] = {
+    "+": operator.add,
+    "-": operator.sub,
+    "*": operator.mul,
+    "/": operator.truediv,
+}
+
+_COMPARE_OPS: Dict[str, Callable[[Any, Any], Any]] = {
+    "<": operator.lt,
+    "<=": operator.le,
+    ">": operator.gt,
+    ">=": operator.ge,
+    "=": operator.eq,
+    "<>": operator.ne,
+}
+
+# The types of the values that can be folded into a compiled expression. Values of
+# other types, e.g. the dict returned by MAP, are mutable and are computed on each
+# evaluation so that the results of different evaluations are not shared.
+_FOLDABLE_TYPES = (type(None), bool, int, float, str, bytes, datetime)
+
+
+class LocalAstCompiler:
+    """
+    LocalAstCompiler compiles an AST into a nested Python closure, which evaluates the
+    expression with the same semantics as LocalAstEvaluator. The node types, operators
+    and functions are resolved once at compilation, and the sub-expressions without
+    variables are folded into constants, so that evaluating the compiled expression
+    for each row does not dispatch on the AST again.
+    """
+
+    def __init__(self, tz: tzinfo = timezone.utc):
+        self.func_evaluator = LocalFuncEvaluator(tz)
+
+    def compile(self, ast: ExprAST) -> CompiledExpr:
+        """
+        Compiles the AST into a function which takes the map from variable name to
+        its value and returns the result of the expression.
+        """
+        return self._compile(ast)[0]
+
+    def _compile(self, ast: ExprAST) -> _CompiledChild:
+        if isinstance(ast, ValueNode):
+            return _constant(ast.value), True
+        if isinstance(ast, NullNode):
+            return _constant(None), True
+        if isinstance(ast, VariableNode):
+            return _compile_variable_node(ast), False
+        if isinstance(ast, GroupNode):
+            return self._compile(ast.child)
+
+        if isinstance(ast, BinaryOp):
+            func, children = self._compile_binary_op(ast)
+        elif isinstance(ast, UminusOp):
+            func, children = self._compile_uminus_op(ast)
+        elif isinstance(ast, CompareOp):
+            func, children = self._compile_compare_op(ast)
+        elif isinstance(ast, FuncCallOp):
+            func, children = self._compile_func_call_op(ast)
+        elif isinstance(ast, ArgListNode):
+            func, children = self._compile_arglist_node(ast)
+        elif isinstance(ast, CastOp):
+            func, children = self._compile_cast_op(ast)
+        elif isinstance(ast, LogicalOp):
+            func, children = self._compile_logical_op(ast)
+        elif isinstance(ast, IsOp):
+            func, children = self._compile_is_op(ast)
+        elif isinstance(ast, CaseOp):
+            func, children = self._compile_case_op(ast)
+        elif isinstance(ast, BracketOp):
+            func, children = self._compile_bracket_op(ast)
+        else:
+            raise FeathubExpressionException(f"Unknown AST node {type(ast)}.")
+
+        if all(is_constant for _, is_constant in children):
+            return _fold(func)
+        return func, False
+
+    def _compile_children(self, *asts: ExprAST) -> Tuple[_CompiledChild, ...]:
+        return tuple(self._compile(ast) for ast in asts)
+
+    def _compile_binary_op(self, ast: BinaryOp) -> _CompiledNode:
+        children = self._compile_children(ast.left_child, ast.right_child)
+        (left, _), (right, _) = children
+        op = _BINARY_OPS.get(ast.op_type)
+        if op is None:
+            op = _unsupported_op(ast.op_type)
+
+        def eval_binary_op(variables: Optional[Dict]) -> Any:
+            left_value = left(variables)
+            right_value = right(variables)
+            if left_value is None or right_value is None:
+                return None
+            return op(left_value, right_value)
+
+        return eval_binary_op, children
+
+    def _compile_uminus_op(self, ast: UminusOp) -> _CompiledNode:
+        children = self._compile_children(ast.child)
+        ((child, _),) = children
+
+        def eval_uminus_op(variables: Optional[Dict]) -> Any:
+            return -child(variables)
+
+        return eval_uminus_op, children
+
+    def _compile_compare_op(self, ast: CompareOp) -> _CompiledNode:
+        children = self._compile_children(ast.left_child, ast.right_child)
+        (left, _), (right, _) = children
+        op = _COMPARE_OPS.get(ast.op_type)
+        if op is None:
+            op = _unsupported_op(ast.op_type)
+
+        def eval_compare_op(variables: Optional[Dict]) -> Any:
+            return op(left(variables), right(variables))
+
+        return eval_compare_op, children
+
+    def _compile_func_call_op(self, ast: FuncCallOp) -> _CompiledNode:
+        children = self._compile_children(*ast.args.values)
+        args = tuple(arg for arg, _ in children)
+        func = self.func_evaluator.get_func(ast.func_name)
+
+        def eval_func_call_op(variables: Optional[Dict]) -> Any:
+            return func([arg(variables) for arg in args])
+
+        return eval_func_call_op, children
+
+    def _compile_arglist_node(self, ast: ArgListNode) -> _CompiledNode:
+        children = self._compile_children(*ast.values)
+        values = tuple(value for value, _ in children)
+
+        def eval_arglist_node(variables: Optional[Dict]) -> Any:
+            return [value(variables) for value in values]
+
+        return eval_arglist_node, children
+
+    def _compile_cast_op(self, ast: CastOp) -> _CompiledNode:
+        children = self._compile_children(ast.child)
+        ((child, _),) = children
+        cast = _get_cast_func(ast.type_name)
+        exception_on_failure = ast.exception_on_failure
+
+        def eval_cast_op(variables: Optional[Dict]) -> Any:
+            try:
+                val = child(variables)
+                if val is None:
+                    return None
+                return cast(val)
+            except Exception as e:
+                if exception_on_failure:
+                    raise e
+                return None
+
+        return eval_cast_op, children
+
+    def _compile_logical_op(self, ast: LogicalOp) -> _CompiledNode:
+        children = self._compile_children(ast.left_child, ast.right_child)
+        (left, _), (right, _) = children
+
+        # Both operands are evaluated before the operator is applied, which is
+        # consistent with LocalAstEvaluator.
+        if ast.op_type == "AND":
+
+            def eval_logical_op(variables: Optional[Dict]) -> Any:
+                left_value = left(variables)
+                right_value = right(variables)
+                return left_value and right_value
+
+        elif ast.op_type == "OR":
+
+            def eval_logical_op(variables: Optional[Dict]) -> Any:
+                left_value = left(variables)
+                right_value = right(variables)
+                return left_value or right_value
+
+        else:
+
+            def eval_logical_op(variables: Optional[Dict]) -> Any:
+                left(variables)
+                right(variables)
+                return None
+
+        return eval_logical_op, children
+
+    def _compile_is_op(self, ast: IsOp) -> _CompiledNode:
+        # Only the left operand is evaluated, as the right operand is always NULL.
+        children = self._compile_children(ast.left_child)
+        ((left, _),) = children
+        is_not = ast.is_not
+
+        def eval_is_op(variables: Optional[Dict]) -> Any:
+            left_value = left(variables)
+            is_none = left_value is None
+
+            # NAN is treated as None, which is consistent with LocalAstEvaluator.
+            if isinstance(left_value, float) or isinstance(left_value, np.generic):
+                is_none = np.isnan(left_value)
+
+            if is_not:
+                return not is_none
+            return is_none
+
+        return eval_is_op, children
+
+    def _compile_case_op(self, ast: CaseOp) -> _CompiledNode:
+        branch_children = self._compile_children(*ast.conditions, *ast.results)
+        num_branches = len(ast.conditions)
+        branches = tuple(
+            (condition, result)
+            for (condition, _), (result, _) in zip(
+                branch_children[:num_branches], branch_children[num_branches:]
+            )
+        )
+        if ast.default is not None:
+            default_child = self._compile(ast.default)
+            children = branch_children + (default_child,)
+            default: Optional[CompiledExpr] = default_child[0]
+        else:
+            children = branch_children
+            default = None
+
+        def eval_case_op(variables: Optional[Dict]) -> Any:
+            for condition, result in branches:
+                condition_res = condition(variables)
+                if not isinstance(condition_res, bool):
+                    raise FeathubExpressionException(
+                        "The condition expression should all be boolean type."
+                    )
+                if condition_res is True:
+                    return result(variables)
+
+            if default is not None:
+                return default(variables)
+
+            return None
+
+        return eval_case_op, children
+
+    def _compile_bracket_op(self, ast: BracketOp) -> _CompiledNode:
+        children = self._compile_children(ast.left_child, ast.right_child)
+        (left, _), (right, _) = children
+
+        def eval_bracket_op(variables: Optional[Dict]) -> Any:
+            left_value = left(variables)
+            right_value = right(variables)
+            return left_value[right_value] if right_value in left_value else None
+
+        return eval_bracket_op, children
+
+
+def _constant(value: Any) -> CompiledExpr:
+    def eval_constant(variables: Optional[Dict]) -> Any:
+        return value
+
+    return eval_constant
+
+
+def _fold(func: CompiledExpr) -> _CompiledChild:
+    """
+    Evaluates the given compiled expression without variables and replaces it with
+    the result. The expression is kept as is if the evaluation fails, so that the
+    failure is raised when the expression is evaluated, or if the result is mutable.
+    """
+    try:
+        value = func(None)
+    except Exception:
+        return func, True
+
+    if not isinstance(value, _FOLDABLE_TYPES):
+        return func, True
+    return _constant(value), True
+
+
+def _compile_variable_node(ast: VariableNode) -> CompiledExpr:
+    var_name = ast.var_name
+
+    def eval_variable_node(variables: Optional[Dict]) -> Any:
+        if var_name not in variables:
+            raise RuntimeError(f"Variable '{var_name}' is not found in {variables}.")
+
+        return variables[var_name]
+
+    return eval_variable_node
+
+
+def _unsupported_op(op_type: str) -> Callable[[Any, Any], Any]:
+    def unsupported_op(left_value: Any, right_value: Any) -> Any:
+        raise RuntimeError(f"Unsupported op type: {op_type}.")
+
+    return unsupported_op
+
+
+def _cast_to_bytes(val: Any) -> Any:
+    if isinstance(val, str):
+        return bytes(val, "utf-8")
+    raise FeathubException(f"Cannot cast '{val}' to bytes")
+
+
+def _cast_to_boolean(val: Any) -> Any:
+    if isinstance(val, str):
+        if val.lower() in _TRUE_STRINGS:
+            return True
+        if val.lower() in _FALSE_STRINGS:
+            return False
+        raise FeathubException(f"Cannot parser '{val}' as BOOLEAN")
+    return bool(val)
+
+
+def _cast_to_timestamp(val: Any) -> Any:
+    return datetime.strptime(val, "%Y-%m-%d %H:%M:%S.%f")
+
+
+_CAST_FUNCS: Dict[str, Callable[[Any], Any]] = {
+    "BYTES": _cast_to_bytes,
+    "STRING": str,
+    "INTEGER": int,
+    "BIGINT": int,
+    "FLOAT": float,
+    "DOUBLE": float,
+    "BOOLEAN": _cast_to_boolean,
+    "TIMESTAMP": _cast_to_timestamp,
+}
+
+
+def _get_cast_func(type_name: str) -> Callable[[Any], Any]:
+    cast = _CAST_FUNCS.get(type_name)
+    if cast is not None:
+        return cast
+
+    def unknown_cast(val: Any) -> Any:
+        raise FeathubExpressionException(f"Unknown datatype: {type_name}.")
+
+    return unknown_cast
@@ -13,7 +13,7 @@
 # limitations under the License.
 import json
 from datetime import tzinfo, timezone
-from typing import Any
+from typing import Any, Callable, Dict, List
 
 from feathub.common.exceptions import FeathubException
 from feathub.common.utils import to_unix_timestamp
@@ -22,34 +22,71 @@ from feathub.common.utils import to_unix_timestamp
 class LocalFuncEvaluator:
     def __init__(self, tz: tzinfo = timezone.utc):
         self.tz = tz
+        self._funcs: Dict[str, Callable[[List[Any]], Any]] = {
+            "LOWER": self._lower,
+            "CONCAT": self._concat,
+            "CONCAT_WS": self._concat_ws,
+            "UNIX_TIMESTAMP": self._unix_timestamp,
+            "JSON_STRING": self._json_string,
+            "MAP": self._map,
+            "SIZE": self._size,
+        }
 
     def eval(self, func_name: str, values: Any) -> Any:
-        if func_name == "LOWER":
-            return values[0].lower()
-        elif func_name == "CONCAT":
-            return "".join([str(x) for x in values])
-        elif func_name == "CONCAT_WS":
-            return values[0].join([str(x) for x in values[1:]])
-        elif func_name == "UNIX_TIMESTAMP":
-            if values[0] is None:
-                return None
-            if len(values) == 1:
-                return int(to_unix_timestamp(values[0], tz=self.tz))
-            else:
-                return int(to_unix_timestamp(values[0], values[1], self.tz))
-        elif func_name == "JSON_STRING":
-            if values[0] is None:
-                return None
-            return json.dumps(values[0], separators=(",", ":"))
-        elif func_name == "MAP":
-            if len(values) % 2 != 0:
-                raise FeathubException("Map requires an even number of arguments.")
-            res = {}
-            for i in range(0, len(values), 2):
-                res[values[i]] = values[i + 1]
-            return res
-        elif func_name == "SIZE":
-            if values[0] is None:
-                return None
-            return len(values[0])
-        raise RuntimeError(f"Unsupported function: {func_name}.")
+        return self.get_func(func_name)(values)
+
+    def get_func(self, func_name: str) -> Callable[[List[Any]], Any]:
+        """
+        Returns the function with the given name, which takes the list of the
+        evaluated arguments and returns the result of the function. The returned
+        function raises on invocation if the function is not supported.
+        """
+        func = self._funcs.get(func_name)
+        if func is not None:
+            return func
+
+        def unsupported_func(values: List[Any]) -> Any:
+            raise RuntimeError(f"Unsupported function: {func_name}.")
+
+        return unsupported_func
+
+    @staticmethod
+    def _lower(values: List[Any]) -> Any:
+        return values[0].lower()
+
+    @staticmethod
+    def _concat(values: List[Any]) -> Any:
+        return "".join([str(x) for x in values])
+
+    @staticmethod
+    def _concat_ws(values: List[Any]) -> Any:
+        return values[0].join([str(x) for x in values[1:]])
+
+    def _unix_timestamp(self, values: List[Any]) -> Any:
+        if values[0] is None:
+            return None
+        if len(values) == 1:
+            return int(to_unix_timestamp(values[0], tz=self.tz))
+        else:
+            return int(to_unix_timestamp(values[0], values[1], self.tz))
+
+    @staticmethod
+    def _json_string(values: List[Any]) -> Any:
+        if values[0] is None:
+            return None
+        return json.dumps(values[0], separators=(",", ":"))
+
+    @staticmethod
+    def _map(values: List[Any]) -> Any:
+        if len(values) % 2 != 0:
+            raise FeathubException("Map requires an even number of arguments.")
+        res = {}
+        for i in range(0, len(values), 2):
+            res[values[i]] = values[i + 1]
+        return res
+
+    @staticmethod
+    def _size(values: List[Any]) -> Any:
+        if values[0] is None:
+            return None
+        return len(values[0])
@@ -0,0 +1,221 @@
+# Copyright 2022 The FeatHub Authors
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+import math
+import random
+import unittest
+from datetime import datetime, timezone, timedelta
+from typing import Any, Dict, List, Optional
+
+import numpy as np
+
+from feathub.dsl.expr_parser import ExprParser
+from feathub.processors.local.ast_evaluator.local_ast_compiler import LocalAstCompiler
+from feathub.processors.local.ast_evaluator.local_ast_evaluator import LocalAstEvaluator
+from feathub.processors.local.ast_evaluator.tests.test_local_ast_evaluator import (
+    LocalAstEvaluatorTest,
+)
+
+
+class LocalAstCompilerTest(LocalAstEvaluatorTest):
+    """
+    Runs the test cases of LocalAstEvaluator against the compiled expressions.
+    """
+
+    def __init__(self, *args, **kwargs) -> None:
+        super().__init__(*args, **kwargs)
+        self.ast_compiler = LocalAstCompiler()
+
+    def _eval(self, expr, variables=None):
+        return self.ast_compiler.compile(self.parser.parse(expr))(variables)
+
+    def test_constant_folding(self):
+        ast = self.parser.parse("CAST(1 + 2 AS STRING)")
+        self.assertEqual("3", self.ast_compiler.compile(ast)(None))
+
+        # Mutable results are not shared between evaluations.
+        func = self.ast_compiler.compile(self.parser.parse("MAP('a', 1)"))
+        self.assertIsNot(func(None), func(None))
+        self.assertEqual({"a": 1}, func(None))
+
+    def test_errors_raised_on_evaluation(self):
+        for expr in ["1 / 0", "UNKNOWN_FUNC(1)", "CAST('a' AS INTEGER)"]:
+            func = self.ast_compiler.compile(self.parser.parse(expr))
+            with self.assertRaises(Exception):
+                func({})
+
+        func = self.ast_compiler.compile(self.parser.parse("TRY_CAST(1 / 0 AS DOUBLE)"))
+        self.assertIsNone(func({}))
+
+
+_VARIABLES: List[Dict[str, Any]] = [
+    {"a": 1, "b": 2, "c": 2.5, "s": "Hello", "t": "true", "m": {"k": 1}},
+    {"a": -3, "b": 0, "c": 0.0, "s": "", "t": "n", "m": {}},
+    {"a": None, "b": 4, "c": float("nan"), "s": None, "t": "x", "m": {"k": None}},
+    {"a": np.int64(7), "b": np.int32(7), "c": np.float64(1.5), "s": "K", "t": "1"},
+    {"a": True, "b": False, "c": np.nan, "s": "2022-01-01 00:00:00.001", "t": None},
+]
+
+_EXPRESSIONS = [
+    "a + b * 3 - c",
+    "(a + b) / b",
+    "-a + c",
+    "a > b",
+    "a <= c",
+    "a = b",
+    "a <> b",
+    "a IS NULL",
+    "c IS NOT NULL",
+    "s IS NULL OR a > 0",
+    "a > 0 AND b > 0",
+    "a AND b",
+    "a OR b",
+    "CASE WHEN a > b THEN 'x' WHEN a < b THEN s ELSE NULL END",
+    "CASE WHEN a THEN 1 END",
+    "CASE WHEN b = 0 THEN 0 ELSE a / b END",
+    "CAST(a AS STRING)",
+    "CAST(a AS BIGINT) + 1",
+    "CAST(c AS INTEGER)",
+    "CAST(t AS BOOLEAN)",
+    "TRY_CAST(t AS BOOLEAN)",
+    "TRY_CAST(s AS DOUBLE)",
+    "CAST(s AS BYTES)",
+    "TRY_CAST(s AS TIMESTAMP)",
+    "CONCAT(s, '-', a)",
+    "CONCAT_WS('|', s, a, b)",
+    "LOWER(s)",
+    "SIZE(s)",
+    "SIZE(m)",
+    "JSON_STRING(m)",
+    "MAP('a', a, 'b', b)",
+    "MAP('a', a, 'b')",
+    "m['k']",
+    "m[s]",
+    "MAP('x', a)['x'] + 1",
+    "UNIX_TIMESTAMP(s)",
+    "UNKNOWN_FUNC(a)",
+    "d + 1",
+    "1 / 0",
+    "(1 + 2) * 3 / 4 - 5",
+    "CASE WHEN 1 < 2 THEN CONCAT('a', 'b') ELSE 'c' END",
+    "TRY_CAST(1 / 0 AS DOUBLE)",
+    "NULL IS NULL",
+]
+
+
+def _evaluate(func: Any) -> Any:
+    try:
+        return "result", func()
+    except Exception as e:
+        return "exception", (type(e), str(e))
+
+
+def _random_expr(rnd: random.Random, depth: int) -> str:
+    if depth <= 0 or rnd.random() < 0.2:
+        return rnd.choice(["a", "b", "c", "s", "1", "2.5", "0", "'K'", "NULL", "true"])
+
+    # Sub-expressions are enclosed in parentheses, as IS NULL has higher precedence
+    # than the arithmetic operators in the grammar.
+    def child() -> str:
+        return f"({_random_expr(rnd, depth - 1)})"
+
+    template = rnd.choice(
+        [
+            "{} + {}",
+            "{} - {}",
+            "{} * {}",
+            "{} / {}",
+            "-{}",
+            "({})",
+            "{} > {}",
+            "{} = {}",
+            "{} <> {}",
+            "{} AND {}",
+            "{} OR {}",
+            "{} IS NULL",
+            "{} IS NOT NULL",
+            "CASE WHEN {} THEN {} ELSE {} END",
+            "CASE WHEN {} THEN {} WHEN {} THEN {} END",
+            "CAST({} AS STRING)",
+            "TRY_CAST({} AS DOUBLE)",
+            "TRY_CAST({} AS INTEGER)",
+            "CONCAT({}, {})",
+            "SIZE({})",
+            "MAP('k', {})['k']",
+        ]
+    )
+    return template.format(*[child() for _ in range(template.count("{}"))])
+
+
+class LocalAstCompilerDifferentialTest(unittest.TestCase):
+    """
+    Verifies that the compiled expressions return the same results, or raise the same
+    exceptions, as LocalAstEvaluator.
+    """
+
+    def setUp(self) -> None:
+        self.parser = ExprParser()
+
+    def _assert_same_behavior(
+        self,
+        expr: str,
+        variables: Optional[Dict[str, Any]],
+        evaluator: LocalAstEvaluator,
+        compiler: LocalAstCompiler,
+    ) -> None:
+        ast = self.parser.parse(expr)
+        func = compiler.compile(ast)
+        expected = _evaluate(lambda: evaluator.eval(ast, variables))
+        actual = _evaluate(lambda: func(variables))
+
+        msg = f"Expression {expr} with variables {variables}."
+        self.assertEqual(expected[0], actual[0], msg)
+        if expected[0] == "exception":
+            self.assertEqual(expected[1], actual[1], msg)
+            return
+
+        expected_value, actual_value = expected[1], actual[1]
+        self.assertEqual(type(expected_value), type(actual_value), msg)
+        if isinstance(expected_value, float) and math.isnan(expected_value):
+            self.assertTrue(math.isnan(actual_value), msg)
+        else:
+            self.assertEqual(expected_value, actual_value, msg)
+
+    def test_expressions(self):
+        for tz in [timezone.utc, timezone(timedelta(hours=8))]:
+            evaluator = LocalAstEvaluator(tz)
+            compiler = LocalAstCompiler(tz)
+            for expr in _EXPRESSIONS:
+                for variables in _VARIABLES:
+                    self._assert_same_behavior(expr, variables, evaluator, compiler)
+
+    def test_random_expressions(self):
+        evaluator = LocalAstEvaluator()
+        compiler = LocalAstCompiler()
+        rnd = random.Random(42)
+        for _ in range(500):
+            expr = _random_expr(rnd, 4)
+            for variables in _VARIABLES:
+                self._assert_same_behavior(expr, variables, evaluator, compiler)
+
+    def test_timestamp_cast(self):
+        evaluator = LocalAstEvaluator()
+        compiler = LocalAstCompiler()
+        variables = {"s": "2022-01-01 00:00:00.001"}
+        self._assert_same_behavior(
+            "CAST(s AS TIMESTAMP)", variables, evaluator, compiler
+        )
+        self.assertEqual(
+            datetime(2022, 1, 1, 0, 0, 0, 1000),
+            compiler.compile(self.parser.parse("CAST(s AS TIMESTAMP)"))(variables),
+        )
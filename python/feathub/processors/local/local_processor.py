@@ -30,6 +30,7 @@ from feathub.common.config import TIMEZONE_CONFIG
 from feathub.common.exceptions import FeathubException, FeathubTransformationException
 from feathub.common.types import to_numpy_dtype
 from feathub.dsl.expr_parser import ExprParser
+from feathub.dsl.expr_optimizer import optimize_expr
 from feathub.dsl.expr_utils import is_id, get_var_name
 from feathub.feature_tables.feature_table import FeatureTable
 from feathub.feature_tables.sinks.black_hole_sink import BlackHoleSink
@@ -59,7 +60,10 @@ from feathub.feature_views.transforms.sliding_window_transform import (
 from feathub.online_stores.memory_online_store import MemoryOnlineStore
 from feathub.processors.constants import EVENT_TIME_ATTRIBUTE_NAME
 from feathub.processors.local.aggregation_utils import AGG_FUNCTIONS
-from feathub.processors.local.ast_evaluator.local_ast_evaluator import LocalAstEvaluator
+from feathub.processors.local.ast_evaluator.local_ast_compiler import (
+    LocalAstCompiler,
+    CompiledExpr,
+)
 from feathub.processors.local.file_system_utils import (
     insert_into_file_sink,
     get_dataframe_from_file_source,
@@ -123,8 +127,8 @@ class LocalProcessor(Processor):
         self.config = LocalProcessorConfig(props)
         self.timezone = tz.gettz(self.config.get(TIMEZONE_CONFIG))
 
-        self.parser = ExprParser()
-        self.ast_evaluator = LocalAstEvaluator(tz=self.timezone)
+        self.parser = ExprParser.get_instance()
+        self.ast_compiler = LocalAstCompiler(tz=self.timezone)
 
         self.spark_session: Optional[Any] = None
         self.executor = ThreadPoolExecutor()
@@ -357,10 +361,8 @@ class LocalProcessor(Processor):
     def _evaluate_expression_transform(
         self, df: pd.DataFrame, transform: ExpressionTransform
     ) -> List:
-        expr_node = self.parser.parse(transform.expr)
-        return df.apply(
-            lambda row: self.ast_evaluator.eval(expr_node, row), axis=1
-        ).tolist()
+        expr_func = self._compile_expr(transform.expr)
+        return df.apply(expr_func, axis=1).tolist()
 
     def _get_table_from_derived_feature_view(
         self, feature_view: DerivedFeatureView
@@ -369,7 +371,7 @@ class LocalProcessor(Processor):
         source_table = self._get_table(feature_view.source)
         source_df = source_table.df
         source_fields = list(source_table.get_schema().field_names)
-        dependent_features = self._get_dependent_features(feature_view)
+        dependent_features = feature_view.get_dependent_features()
 
         table_names = set(
             [
@@ -542,11 +544,9 @@ class LocalProcessor(Processor):
                     f"Group-by key '{key}' is not found in {df.columns}."
                 )
 
-        expr_node = self.parser.parse(transform.expr)
+        expr_func = self._compile_expr(transform.expr)
         df_copy = df.copy()
-        df_copy[temp_column] = df_copy.apply(
-            lambda row: self.ast_evaluator.eval(expr_node, row), axis=1
-        )
+        df_copy[temp_column] = df_copy.apply(expr_func, axis=1)
 
         # Append an internal unix time column.
         append_unix_time_column(
@@ -559,9 +559,9 @@ class LocalProcessor(Processor):
                 for idx in group:
                     group_by_idx[idx] = group
 
-        filter_expr_node = None
+        filter_expr_func = None
         if transform.filter_expr is not None:
-            filter_expr_node = self.parser.parse(transform.filter_expr)
+            filter_expr_func = self._compile_expr(transform.filter_expr)
         result: List[Any] = []
         # TODO: optimize the performance for the following code.
         # Computes the feature's value for each row in the group.
@@ -583,10 +583,9 @@ class LocalProcessor(Processor):
             predicate = rows_in_group[EVENT_TIME_ATTRIBUTE_NAME].transform(
                 lambda timestamp: min_timestamp <= timestamp <= max_timestamp
             )
-            if filter_expr_node is not None:
+            if filter_expr_func is not None:
                 predicate = predicate & rows_in_group.apply(
-                    lambda r: self.ast_evaluator.eval(filter_expr_node, r.to_dict()),
-                    axis=1,
+                    lambda r: filter_expr_func(r.to_dict()), axis=1
                 )
             rows_in_group_and_window = rows_in_group[predicate]
             limit = transform.limit
@@ -622,7 +621,7 @@ class LocalProcessor(Processor):
         source_table = self._get_table(feature_view.source)
         source_df = source_table.df
         source_fields = list(source_table.get_schema().field_names)
-        dependent_features = self._get_dependent_features(feature_view)
+        dependent_features = feature_view.get_dependent_features()
 
         sliding_window_descriptor: Optional[SlidingWindowDescriptor] = None
         agg_field_descriptors: List[AggregationFieldDescriptor] = []
@@ -693,7 +692,7 @@ class LocalProcessor(Processor):
             agg_descriptors=agg_field_descriptors,
             tz=self.timezone,
             parser=self.parser,
-            ast_evaluator=self.ast_evaluator,
+            ast_compiler=self.ast_compiler,
         )
 
         for feature in per_row_transform_features_following_first_sliding_feature:
@@ -723,29 +722,27 @@ class LocalProcessor(Processor):
             timestamp_format=feature_view.timestamp_format,
         )
 
-    def _get_dependent_features(self, feature_view: FeatureView) -> Sequence[Feature]:
-        dependent_features = []
-        for feature in feature_view.get_resolved_features():
-            for input_feature in feature.input_features:
-                if input_feature not in dependent_features:
-                    dependent_features.append(input_feature)
-            if feature not in dependent_features:
-                dependent_features.append(feature)
-        return dependent_features
-
     def _filter_dataframe(self, df: pd.DataFrame, filter_expr: str) -> pd.DataFrame:
-        filter_ast = self.parser.parse(filter_expr)
-        return df[df.apply(lambda r: self.ast_evaluator.eval(filter_ast, r), axis=1)]
+        filter_func = self._compile_expr(filter_expr)
+        return df[df.apply(filter_func, axis=1)]
+
+    def _compile_expr(self, expr: str) -> CompiledExpr:
+        return self.ast_compiler.compile(optimize_expr(self.parser.parse(expr)))
 
     def _init_spark_session_local_mode(self) -> None:
         if self.spark_session is not None:
             return
 
         from pyspark.sql import SparkSession
+        from feathub.processors.spark.spark_processor_config import (
+            ARROW_NATIVE_CONFIGS,
+        )
 
         spark_session_builder = SparkSession.builder
         spark_session_builder = spark_session_builder.master("local[*]")
         spark_session_builder = spark_session_builder.config(
             "spark.sql.session.timeZone", self.config.get(TIMEZONE_CONFIG)
         )
+        for k, v in ARROW_NATIVE_CONFIGS.items():
+            spark_session_builder = spark_session_builder.config(k, v)
         self.spark_session = spark_session_builder.getOrCreate()
@@ -13,13 +13,15 @@
 # limitations under the License.
 import typing
 from datetime import timedelta
-from typing import Optional
+from typing import Optional, Dict
 
+import numpy as np
 import pandas as pd
 
 from feathub.common import types
 from feathub.feature_tables.sinks.sink import Sink
 from feathub.processors.processor_job import ProcessorJob
+from feathub.table.output_format import dataframe_to_numpy
 from feathub.table.schema import Schema
 from feathub.table.table import Table
 from feathub.table.table_descriptor import TableDescriptor
@@ -68,6 +70,9 @@ class LocalTable(Table):
     def to_pandas(self, force_bounded: bool = False) -> pd.DataFrame:
         return self.df
 
+    def to_numpy(self, force_bounded: bool = False) -> Dict[str, np.ndarray]:
+        return dataframe_to_numpy(self.df)
+
     def execute_insert(
         self,
         sink: Sink,
@@ -18,8 +18,8 @@ import pandas as pd
 
 from feathub.common.exceptions import FeathubException
 from feathub.common.types import to_numpy_dtype
-from feathub.dsl.ast import ExprAST
 from feathub.dsl.expr_parser import ExprParser
+from feathub.dsl.expr_optimizer import optimize_expr
 from feathub.feature_views.feature import Feature
 from feathub.feature_views.sliding_feature_view import SlidingFeatureView
 from feathub.feature_views.transforms.agg_func import AggFunc
@@ -28,7 +28,10 @@ from feathub.feature_views.transforms.sliding_window_transform import (
 )
 from feathub.processors.constants import EVENT_TIME_ATTRIBUTE_NAME
 from feathub.processors.local.aggregation_utils import AGG_FUNCTIONS
-from feathub.processors.local.ast_evaluator.local_ast_evaluator import LocalAstEvaluator
+from feathub.processors.local.ast_evaluator.local_ast_compiler import (
+    LocalAstCompiler,
+    CompiledExpr,
+)
 from feathub.processors.local.time_utils import append_unix_time_column
 from feathub.processors.type_utils import cast_dataframe_dtype
 
@@ -120,7 +123,7 @@ def evaluate_sliding_window(
     agg_descriptors: List[AggregationFieldDescriptor],
     tz: tzinfo,
     parser: ExprParser,
-    ast_evaluator: LocalAstEvaluator,
+    ast_compiler: LocalAstCompiler,
 ) -> pd.DataFrame:
     """
     Evaluate the sliding window on the input DataFrame.
@@ -142,7 +145,7 @@ def evaluate_sliding_window(
                 agg_field_descriptors=agg_descriptors,
                 tz=tz,
                 parser=parser,
-                ast_evaluator=ast_evaluator,
+                ast_compiler=ast_compiler,
             )
         )
     else:
@@ -152,7 +155,7 @@ def evaluate_sliding_window(
             agg_field_descriptors=agg_descriptors,
             tz=tz,
             parser=parser,
-            ast_evaluator=ast_evaluator,
+            ast_compiler=ast_compiler,
         )
 
     agg_df = agg_df.reset_index(drop=True)
@@ -187,7 +190,7 @@ def _sliding_window_func(
     agg_field_descriptors: Sequence[AggregationFieldDescriptor],
     tz: tzinfo,
     parser: ExprParser,
-    ast_evaluator: LocalAstEvaluator,
+    ast_compiler: LocalAstCompiler,
 ) -> Optional[pd.DataFrame]:
 
     if df.shape[0] <= 0:
@@ -205,8 +208,10 @@ def _sliding_window_func(
     keys_dict = {k: first_row[k] for k in sliding_window_descriptor.group_by_keys}
     agg_field_names = [d.field_name for d in agg_field_descriptors]
 
-    filter_ast_map: Dict[AggregationFieldDescriptor, ExprAST] = {
-        descriptor: parser.parse(descriptor.filter_expr)
+    filter_func_map: Dict[AggregationFieldDescriptor, CompiledExpr] = {
+        descriptor: ast_compiler.compile(
+            optimize_expr(parser.parse(descriptor.filter_expr))
+        )
         for descriptor in agg_field_descriptors
         if descriptor.filter_expr is not None
     }
@@ -217,10 +222,10 @@ def _sliding_window_func(
     step_size_millis = int(sliding_window_descriptor.step_size.total_seconds() * 1000)
 
     for agg_field_descriptor in agg_field_descriptors:
-        expr_node = parser.parse(agg_field_descriptor.expr)
-        df_copy[agg_field_descriptor.field_name] = df_copy.apply(
-            lambda r: ast_evaluator.eval(expr_node, r), axis=1
+        expr_func = ast_compiler.compile(
+            optimize_expr(parser.parse(agg_field_descriptor.expr))
         )
+        df_copy[agg_field_descriptor.field_name] = df_copy.apply(expr_func, axis=1)
 
     res_df = pd.DataFrame()
     idx_map: Dict[AggregationFieldDescriptor, Tuple[int, int]] = {}
@@ -265,15 +270,10 @@ def _sliding_window_func(
                 all_reach_end = False
                 rows_in_window = df_copy.iloc[left_idx:right_idx]
 
-            if agg_field_descriptor in filter_ast_map and rows_in_window.shape[0] > 0:
+            if agg_field_descriptor in filter_func_map and rows_in_window.shape[0] > 0:
                 # Filter the rows in the window
                 rows_in_window = rows_in_window[
-                    rows_in_window.apply(
-                        lambda r: ast_evaluator.eval(
-                            filter_ast_map.get(agg_field_descriptor), r
-                        ),
-                        axis=1,
-                    )
+                    rows_in_window.apply(filter_func_map[agg_field_descriptor], axis=1)
                 ]
 
             limit = agg_field_descriptor.limit
@@ -12,6 +12,7 @@
 #  See the License for the specific language governing permissions and
 #  limitations under the License.
 from datetime import timedelta
+from typing import Optional
 
 from feathub.common.exceptions import FeathubException
 from feathub.feature_views.feature import Feature
@@ -39,12 +40,16 @@ class AggregationFieldDescriptor:
         expr: str,
         agg_func: AggFunc,
         window_size: timedelta,
+        filter_expr: Optional[str] = None,
+        limit: Optional[int] = None,
     ) -> None:
         self.field_name = field_name
         self.field_data_type = field_data_type
         self.expr = expr
         self.agg_func = agg_func
         self.window_size = window_size
+        self.filter_expr = filter_expr
+        self.limit = limit
 
     @staticmethod
     def from_feature(feature: Feature) -> "AggregationFieldDescriptor":
@@ -62,4 +67,8 @@ class AggregationFieldDescriptor:
             to_spark_sql_expr(transform.expr),
             transform.agg_func,
             transform.window_size,
+            to_spark_sql_expr(transform.filter_expr)
+            if transform.filter_expr is not None
+            else None,
+            transform.limit,
         )
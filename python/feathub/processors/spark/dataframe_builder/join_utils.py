@@ -17,6 +17,7 @@ from feathub.processors.constants import EVENT_TIME_ATTRIBUTE_NAME
 from feathub.processors.spark.spark_types_utils import to_spark_type
 from feathub.table.table_descriptor import TableDescriptor
 from pyspark.sql import (
+    Column,
     DataFrame as NativeSparkDataFrame,
     functions,
     Window,
@@ -69,13 +70,32 @@ class JoinFieldDescriptor:
         )
 
 
+# Names of the internal columns used by temporal_join.
+_KEY_COLUMN_PREFIX = "__temporal_join_key_"
+_TIME_COLUMN = "__temporal_join_time__"
+_IS_LEFT_COLUMN = "__temporal_join_is_left__"
+_RIGHT_ORDER_COLUMN = "__temporal_join_right_order__"
+_LEFT_ROW_COLUMN = "__temporal_join_left_row__"
+_RIGHT_ROW_COLUMN = "__temporal_join_right_row__"
+
+
 def temporal_join(
     left: NativeSparkDataFrame,
     right: NativeSparkDataFrame,
     keys: Sequence[str],
 ) -> NativeSparkDataFrame:
     """
-    Temporal join the right dataframe to the left dataframe.
+    Temporal join the right dataframe to the left dataframe. Each row in the left
+    dataframe is joined with the latest row in the right dataframe that has the same
+    keys and an event time no later than that of the left row. Among the right rows
+    with the same keys and event time, the first one in the right dataframe is
+    joined, like in LocalProcessor. Rows with null keys or event time in either
+    dataframe are not matched.
+
+    The join is performed as a sort-merge as-of join. Rows of both dataframes are
+    unioned, partitioned by keys and sorted by event time, and the latest right row
+    is carried forward to the left rows following it. Thus the cost is linear to the
+    size of the inputs instead of the number of matching pairs of rows.
 
     :param left: The left dataframe.
     :param right: The right dataframe.
@@ -89,27 +109,76 @@ def temporal_join(
 
     right_aliased = _rename_fields(right, overlapping_field_names)
 
-    equality_predicates = " and ".join([f"{k} = right_{k}" for k in keys])
-    time_predicates = (
-        f"{EVENT_TIME_ATTRIBUTE_NAME} >= right_{EVENT_TIME_ATTRIBUTE_NAME}"
+    # Right rows with null keys or event time could not match any left row.
+    right_aliased = right_aliased.filter(
+        " and ".join(
+            f"`right_{field_name}` is not null"
+            for field_name in [*keys, EVENT_TIME_ATTRIBUTE_NAME]
+        )
     )
-    join_predicates = " and ".join([equality_predicates, time_predicates])
 
-    partitioned_keys = [f"`{k}`" for k in keys]
-    partitioned_keys.append(EVENT_TIME_ATTRIBUTE_NAME)
-    window = Window.partitionBy(partitioned_keys).orderBy(
-        functions.col(f"right_{EVENT_TIME_ATTRIBUTE_NAME}").desc()
+    key_columns = [f"{_KEY_COLUMN_PREFIX}{i}__" for i in range(len(keys))]
+
+    # Each row of the left or right dataframe is packed into a struct column, so
+    # that the latest right row is carried forward as a whole, including its null
+    # values.
+    left_tagged = left.select(
+        *[functions.col(f"`{k}`").alias(c) for k, c in zip(keys, key_columns)],
+        functions.col(EVENT_TIME_ATTRIBUTE_NAME).alias(_TIME_COLUMN),
+        functions.lit(True).alias(_IS_LEFT_COLUMN),
+        functions.lit(None).cast("bigint").alias(_RIGHT_ORDER_COLUMN),
+        _to_struct(left).alias(_LEFT_ROW_COLUMN),
+        functions.lit(None).cast(right_aliased.schema).alias(_RIGHT_ROW_COLUMN),
+    )
+    right_tagged = right_aliased.select(
+        *[functions.col(f"`right_{k}`").alias(c) for k, c in zip(keys, key_columns)],
+        functions.col(f"right_{EVENT_TIME_ATTRIBUTE_NAME}").alias(_TIME_COLUMN),
+        functions.lit(False).alias(_IS_LEFT_COLUMN),
+        functions.monotonically_increasing_id().alias(_RIGHT_ORDER_COLUMN),
+        functions.lit(None).cast(left.schema).alias(_LEFT_ROW_COLUMN),
+        _to_struct(right_aliased).alias(_RIGHT_ROW_COLUMN),
+    )
+
+    # Right rows are sorted before left rows with the same event time, as they
+    # should be joined with these left rows. Right rows with the same event time are
+    # sorted in the reverse order of their positions, so that the first one is
+    # carried forward.
+    window = (
+        Window.partitionBy(*key_columns)
+        .orderBy(
+            _TIME_COLUMN,
+            _IS_LEFT_COLUMN,
+            functions.col(_RIGHT_ORDER_COLUMN).desc(),
+        )
+        .rowsBetween(Window.unboundedPreceding, Window.currentRow)
     )
 
     result_table = (
-        left.join(right_aliased, functions.expr(join_predicates), "left_outer")
-        .withColumn("row_num", functions.row_number().over(window))
-        .filter("row_num == 1")
+        left_tagged.union(right_tagged)
+        .withColumn(
+            _RIGHT_ROW_COLUMN,
+            functions.last(_RIGHT_ROW_COLUMN, ignorenulls=True).over(window),
+        )
+        .filter(_IS_LEFT_COLUMN)
+        .select(
+            *[
+                functions.col(_LEFT_ROW_COLUMN).getField(name).alias(name)
+                for name in left.schema.fieldNames()
+            ],
+            *[
+                functions.col(_RIGHT_ROW_COLUMN).getField(name).alias(name)
+                for name in right_aliased.schema.fieldNames()
+            ],
+        )
     )
 
     return result_table
 
 
+def _to_struct(df: NativeSparkDataFrame) -> Column:
+    return functions.struct(*[functions.col(f"`{name}`") for name in df.columns])
+
+
 def _rename_fields(
     df: NativeSparkDataFrame, fields: Sequence[str]
 ) -> NativeSparkDataFrame:
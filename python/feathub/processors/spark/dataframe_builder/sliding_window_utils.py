@@ -0,0 +1,580 @@
+#  Copyright 2022 The FeatHub Authors
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#      https://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+from datetime import timedelta, datetime
+from typing import Sequence, List, Union
+
+from dateutil import tz
+from pyspark.sql import DataFrame as NativeSparkDataFrame, Column, functions
+from pyspark.sql.types import MapType
+from pyspark.sql.window import Window, WindowSpec
+
+from feathub.common.exceptions import FeathubException, FeathubTransformationException
+from feathub.feature_views.sliding_feature_view import (
+    SlidingFeatureView,
+    SlidingFeatureViewConfig,
+    ENABLE_EMPTY_WINDOW_OUTPUT_CONFIG,
+    SKIP_SAME_WINDOW_OUTPUT_CONFIG,
+)
+from feathub.feature_views.transforms.agg_func import AggFunc
+from feathub.processors.constants import EVENT_TIME_ATTRIBUTE_NAME
+from feathub.processors.spark.dataframe_builder.aggregation_utils import (
+    AggregationFieldDescriptor,
+)
+
+# Names of the internal columns used to evaluate sliding windows.
+_ORDER_COLUMN = "__sliding_window_order__"
+_IS_PANE_COLUMN = "__sliding_window_is_pane__"
+_NUM_ROWS_COLUMN = "__sliding_window_num_rows__"
+_HAS_ROW_COLUMN = "__sliding_window_has_row__"
+_RESULT_COLUMN = "__sliding_window_result__"
+_IS_OUTPUT_COLUMN = "__sliding_window_is_output__"
+
+# Aggregation functions whose partial results are the raw rows in a pane, like the
+# raw data accumulating aggregation functions of FlinkProcessor.
+_RAW_DATA_AGG_FUNCS = {AggFunc.VALUE_COUNTS, AggFunc.COLLECT_LIST}
+
+
+class SlidingWindowDescriptor:
+    """
+    Descriptor of a sliding window.
+    """
+
+    def __init__(
+        self,
+        step_size: timedelta,
+        group_by_keys: Sequence[str],
+    ) -> None:
+        self.step_size = step_size
+        self.group_by_keys = group_by_keys
+
+    @staticmethod
+    def from_sliding_feature_view(
+        sliding_feature_view: SlidingFeatureView,
+    ) -> "SlidingWindowDescriptor":
+        return SlidingWindowDescriptor(
+            sliding_feature_view.step_size,
+            sliding_feature_view.group_by_keys,
+        )
+
+    def __eq__(self, other: object) -> bool:
+        return (
+            isinstance(other, self.__class__)
+            and self.step_size == other.step_size
+            and self.group_by_keys == other.group_by_keys
+        )
+
+    def __hash__(self) -> int:
+        return hash((self.step_size, tuple(self.group_by_keys)))
+
+
+def evaluate_sliding_window_transform(
+    dataframe: NativeSparkDataFrame,
+    window_descriptor: SlidingWindowDescriptor,
+    agg_descriptors: List[AggregationFieldDescriptor],
+    config: SlidingFeatureViewConfig,
+) -> NativeSparkDataFrame:
+    """
+    Evaluate the sliding window transforms on the given dataframe and return the
+    result dataframe, which contains the group-by keys, the aggregation fields and the
+    event time column holding the window time.
+
+    Rows are first pre-aggregated into panes, i.e. tumbling windows whose size equals
+    the step size, per group-by keys. Each sliding window is then computed by
+    combining the panes it covers, so that each row is only aggregated once no matter
+    how many sliding windows it belongs to. The output follows the semantics of
+    FlinkProcessor, including the enable_empty_window_output and
+    skip_same_window_output configs.
+
+    :param dataframe: The input Spark dataframe.
+    :param window_descriptor: The descriptor of the sliding window.
+    :param agg_descriptors: A list of descriptor that descriptor the aggregation to
+                            perform.
+    :param config: The config of the SlidingFeatureView that the window_descriptor
+                   belongs to.
+    :return: The result dataframe.
+    """
+    step_size_ms = int(window_descriptor.step_size / timedelta(milliseconds=1))
+    if step_size_ms == 0:
+        return _evaluate_infinite_size_sliding_window(
+            dataframe, window_descriptor, agg_descriptors, config
+        )
+
+    enable_empty_window_output = config.get(ENABLE_EMPTY_WINDOW_OUTPUT_CONFIG)
+    skip_same_window_output = config.get(SKIP_SAME_WINDOW_OUTPUT_CONFIG)
+    keys = [f"`{key}`" for key in window_descriptor.group_by_keys]
+    window_sizes_ms = [
+        int(descriptor.window_size / timedelta(milliseconds=1))
+        for descriptor in agg_descriptors
+    ]
+    max_window_size_ms = max(window_sizes_ms)
+
+    panes = _pre_aggregate_panes(
+        dataframe,
+        keys,
+        agg_descriptors,
+        step_size_ms,
+        _get_raw_offset_ms(dataframe),
+    )
+
+    # The window times at which the sliding window might output. Like in
+    # FlinkProcessor, if skip_same_window_output is true, the result can only change
+    # when a pane enters or leaves a window. Otherwise, the result is output at every
+    # step until the last pane leaves the largest window.
+    if skip_same_window_output:
+        window_times = functions.array_distinct(
+            functions.array(
+                functions.col(EVENT_TIME_ATTRIBUTE_NAME),
+                *[
+                    functions.col(EVENT_TIME_ATTRIBUTE_NAME) + functions.lit(size)
+                    for size in window_sizes_ms
+                ],
+            )
+        )
+    else:
+        window_times = functions.sequence(
+            functions.col(EVENT_TIME_ATTRIBUTE_NAME),
+            functions.col(EVENT_TIME_ATTRIBUTE_NAME)
+            + functions.lit(max_window_size_ms),
+            functions.lit(step_size_ms).cast("bigint"),
+        )
+    windows = (
+        panes.select(
+            *keys,
+            functions.explode(window_times).alias(EVENT_TIME_ATTRIBUTE_NAME),
+        )
+        .distinct()
+        .withColumn(_IS_PANE_COLUMN, functions.lit(False))
+    )
+
+    # Panes and windows are unioned, so that every window can aggregate the partial
+    # results of the panes in its range (window_time - window_size, window_time].
+    tmp_dataframe = panes.withColumn(_IS_PANE_COLUMN, functions.lit(True)).unionByName(
+        windows, allowMissingColumns=True
+    )
+    tmp_dataframe = tmp_dataframe.withColumns(
+        {
+            descriptor.field_name: _combine_panes(
+                descriptor, _get_range_window_spec(keys, window_size_ms)
+            )
+            for descriptor, window_size_ms in zip(agg_descriptors, window_sizes_ms)
+        }
+    )
+    tmp_dataframe = tmp_dataframe.withColumn(
+        _HAS_ROW_COLUMN,
+        functions.coalesce(
+            functions.sum(_NUM_ROWS_COLUMN).over(
+                _get_range_window_spec(keys, max_window_size_ms)
+            ),
+            functions.lit(0),
+        )
+        > 0,
+    ).filter(~functions.col(_IS_PANE_COLUMN))
+
+    # A window is empty if none of the aggregation fields has rows in its window.
+    tmp_dataframe = tmp_dataframe.withColumns(
+        {
+            descriptor.field_name: functions.when(
+                functions.col(_HAS_ROW_COLUMN),
+                functions.col(f"`{descriptor.field_name}`"),
+            ).otherwise(_get_empty_window_value(descriptor))
+            for descriptor in agg_descriptors
+        }
+    )
+
+    if skip_same_window_output:
+        order_window_spec = _get_window_spec(keys).orderBy(EVENT_TIME_ATTRIBUTE_NAME)
+        tmp_dataframe = tmp_dataframe.withColumn(
+            _RESULT_COLUMN,
+            functions.struct(
+                *[_to_comparable_column(descriptor) for descriptor in agg_descriptors]
+            ),
+        )
+        # The last output row is reset when a window becomes empty, so that the next
+        # non-empty window is always output.
+        tmp_dataframe = tmp_dataframe.withColumn(
+            _IS_OUTPUT_COLUMN,
+            ~functions.col(_HAS_ROW_COLUMN)
+            | ~functions.coalesce(
+                functions.lag(_HAS_ROW_COLUMN).over(order_window_spec),
+                functions.lit(False),
+            )
+            | ~functions.col(_RESULT_COLUMN).eqNullSafe(
+                functions.lag(_RESULT_COLUMN).over(order_window_spec)
+            ),
+        ).filter(functions.col(_IS_OUTPUT_COLUMN))
+
+    if not enable_empty_window_output:
+        tmp_dataframe = tmp_dataframe.filter(functions.col(_HAS_ROW_COLUMN))
+
+    return tmp_dataframe.select(
+        *keys,
+        *[
+            functions.col(f"`{descriptor.field_name}`")
+            .cast(descriptor.field_data_type)
+            .alias(descriptor.field_name)
+            for descriptor in agg_descriptors
+        ],
+        EVENT_TIME_ATTRIBUTE_NAME,
+    )
+
+
+def _evaluate_infinite_size_sliding_window(
+    dataframe: NativeSparkDataFrame,
+    window_descriptor: SlidingWindowDescriptor,
+    agg_descriptors: List[AggregationFieldDescriptor],
+    config: SlidingFeatureViewConfig,
+) -> NativeSparkDataFrame:
+    """
+    Evaluate the sliding window transforms with zero step size and window size, i.e.
+    windows of infinite size, on the given dataframe and return the result dataframe.
+
+    Like the global window of FlinkProcessor, each row outputs the aggregation of all
+    rows with the same group-by keys up to this row at the time of this row, unless
+    the result equals the previous output. Each row is pre-aggregated as a pane of
+    its own, so that the results are combined as those of sliding windows.
+    """
+    if not config.get(SKIP_SAME_WINDOW_OUTPUT_CONFIG):
+        raise FeathubException(
+            "When step size is 0, skip_same_window_output must be true."
+        )
+
+    keys = [f"`{key}`" for key in window_descriptor.group_by_keys]
+    rows = _pre_aggregate(
+        _with_order_and_values(dataframe, agg_descriptors),
+        [*keys, _ORDER_COLUMN, EVENT_TIME_ATTRIBUTE_NAME],
+        agg_descriptors,
+    )
+
+    order_window_spec = _get_window_spec(keys).orderBy(_ORDER_COLUMN)
+    tmp_dataframe = rows.withColumns(
+        {
+            descriptor.field_name: _combine_panes(
+                descriptor,
+                order_window_spec.rowsBetween(
+                    Window.unboundedPreceding, Window.currentRow
+                ),
+            )
+            for descriptor in agg_descriptors
+        }
+    )
+    tmp_dataframe = tmp_dataframe.withColumn(
+        _RESULT_COLUMN,
+        functions.struct(
+            *[_to_comparable_column(descriptor) for descriptor in agg_descriptors]
+        ),
+    )
+    tmp_dataframe = tmp_dataframe.withColumn(
+        _IS_OUTPUT_COLUMN,
+        ~functions.col(_RESULT_COLUMN).eqNullSafe(
+            functions.lag(_RESULT_COLUMN).over(order_window_spec)
+        ),
+    ).filter(functions.col(_IS_OUTPUT_COLUMN))
+
+    return tmp_dataframe.select(
+        *keys,
+        *[
+            functions.col(f"`{descriptor.field_name}`")
+            .cast(descriptor.field_data_type)
+            .alias(descriptor.field_name)
+            for descriptor in agg_descriptors
+        ],
+        EVENT_TIME_ATTRIBUTE_NAME,
+    )
+
+
+def _pre_aggregate_panes(
+    dataframe: NativeSparkDataFrame,
+    keys: List[str],
+    agg_descriptors: List[AggregationFieldDescriptor],
+    step_size_ms: int,
+    raw_offset_ms: int,
+) -> NativeSparkDataFrame:
+    # Like FlinkProcessor, panes are aligned with 1970-01-01 00:00:00 in the session
+    # time zone, and the time of a pane is the last millisecond in the pane.
+    pane_offset_ms = -raw_offset_ms % step_size_ms
+    event_time = functions.col(EVENT_TIME_ATTRIBUTE_NAME)
+    pane_time = (
+        event_time
+        - functions.pmod(event_time - functions.lit(pane_offset_ms), step_size_ms)
+        + functions.lit(step_size_ms - 1)
+    )
+
+    return _pre_aggregate(
+        _with_order_and_values(dataframe, agg_descriptors),
+        [*keys, pane_time.alias(EVENT_TIME_ATTRIBUTE_NAME)],
+        agg_descriptors,
+    )
+
+
+def _with_order_and_values(
+    dataframe: NativeSparkDataFrame,
+    agg_descriptors: List[AggregationFieldDescriptor],
+) -> NativeSparkDataFrame:
+    # Adds the order of each row and the values to aggregate.
+    return dataframe.withColumns(
+        {
+            _ORDER_COLUMN: functions.struct(
+                functions.col(EVENT_TIME_ATTRIBUTE_NAME).alias("time"),
+                functions.monotonically_increasing_id().alias("id"),
+            ),
+            **{
+                _get_value_column_name(i): functions.expr(descriptor.expr)
+                for i, descriptor in enumerate(agg_descriptors)
+            },
+        }
+    )
+
+
+def _pre_aggregate(
+    dataframe: NativeSparkDataFrame,
+    group_by_columns: List[Union[str, Column]],
+    agg_descriptors: List[AggregationFieldDescriptor],
+) -> NativeSparkDataFrame:
+    return dataframe.groupBy(*group_by_columns).agg(
+        functions.count(functions.lit(1)).alias(_NUM_ROWS_COLUMN),
+        *[
+            _pre_aggregate_pane(descriptor, _get_value_column_name(i)).alias(
+                descriptor.field_name
+            )
+            for i, descriptor in enumerate(agg_descriptors)
+        ],
+    )
+
+
+def _pre_aggregate_pane(
+    descriptor: AggregationFieldDescriptor, value_column_name: str
+) -> Column:
+    def filtered(column: Column) -> Column:
+        # Rows that do not match the filter expression are not aggregated.
+        if descriptor.filter_expr is None:
+            return column
+        return functions.when(functions.expr(descriptor.filter_expr), column)
+
+    value = functions.col(value_column_name)
+    agg_func = descriptor.agg_func
+
+    if descriptor.limit is not None or agg_func in _RAW_DATA_AGG_FUNCS:
+        rows = functions.collect_list(
+            filtered(
+                functions.struct(
+                    functions.col(_ORDER_COLUMN).alias("order"),
+                    value.alias("value"),
+                )
+            )
+        )
+        if descriptor.limit is None:
+            return rows
+        # Only the most recent rows in a pane might be aggregated by a window.
+        return _take_last_rows(_sort_rows(rows), descriptor.limit)
+    elif agg_func == AggFunc.SUM:
+        return functions.sum(filtered(value))
+    elif agg_func == AggFunc.COUNT or agg_func == AggFunc.ROW_NUMBER:
+        return functions.count(filtered(functions.lit(1)))
+    elif agg_func == AggFunc.AVG:
+        return functions.struct(
+            functions.sum(filtered(value).cast("double")).alias("sum"),
+            functions.count(filtered(value)).alias("count"),
+        )
+    elif agg_func == AggFunc.MAX:
+        return functions.max(filtered(value))
+    elif agg_func == AggFunc.MIN:
+        return functions.min(filtered(value))
+    elif agg_func == AggFunc.FIRST_VALUE or agg_func == AggFunc.LAST_VALUE:
+        row = functions.struct(
+            functions.col(_ORDER_COLUMN).alias("order"), value.alias("value")
+        )
+        order = filtered(functions.col(_ORDER_COLUMN))
+        if agg_func == AggFunc.FIRST_VALUE:
+            return functions.min_by(row, order)
+        return functions.max_by(row, order)
+
+    raise FeathubTransformationException(
+        f"Unsupported aggregation for SparkProcessor {agg_func}."
+    )
+
+
+def _combine_panes(
+    descriptor: AggregationFieldDescriptor, window_spec: WindowSpec
+) -> Column:
+    partial = functions.col(f"`{descriptor.field_name}`")
+    agg_func = descriptor.agg_func
+
+    if descriptor.limit is not None or agg_func in _RAW_DATA_AGG_FUNCS:
+        rows = _sort_rows(
+            functions.flatten(functions.collect_list(partial).over(window_spec))
+        )
+        if descriptor.limit is not None:
+            rows = _take_last_rows(rows, descriptor.limit)
+        return _aggregate_rows(descriptor, rows)
+    elif (
+        agg_func == AggFunc.SUM
+        or agg_func == AggFunc.COUNT
+        or agg_func == AggFunc.ROW_NUMBER
+    ):
+        return functions.coalesce(
+            functions.sum(partial).over(window_spec),
+            functions.lit(0).cast(descriptor.field_data_type),
+        )
+    elif agg_func == AggFunc.AVG:
+        count = functions.sum(partial.getField("count")).over(window_spec)
+        return functions.when(
+            count > 0, functions.sum(partial.getField("sum")).over(window_spec) / count
+        )
+    elif agg_func == AggFunc.MAX:
+        return functions.max(partial).over(window_spec)
+    elif agg_func == AggFunc.MIN:
+        return functions.min(partial).over(window_spec)
+    elif agg_func == AggFunc.FIRST_VALUE:
+        return functions.min_by(
+            partial.getField("value"), partial.getField("order")
+        ).over(window_spec)
+    elif agg_func == AggFunc.LAST_VALUE:
+        return functions.max_by(
+            partial.getField("value"), partial.getField("order")
+        ).over(window_spec)
+
+    raise FeathubTransformationException(
+        f"Unsupported aggregation for SparkProcessor {agg_func}."
+    )
+
+
+def _aggregate_rows(descriptor: AggregationFieldDescriptor, rows: Column) -> Column:
+    # Aggregates an array of rows sorted by their order.
+    agg_func = descriptor.agg_func
+    values = functions.transform(rows, lambda row: row.getField("value"))
+    non_null_values = functions.filter(values, lambda value: value.isNotNull())
+
+    if agg_func == AggFunc.SUM:
+        return functions.aggregate(
+            non_null_values,
+            functions.lit(0).cast(descriptor.field_data_type),
+            lambda acc, value: acc + value,
+        )
+    elif agg_func == AggFunc.COUNT or agg_func == AggFunc.ROW_NUMBER:
+        return functions.size(rows).cast("bigint")
+    elif agg_func == AggFunc.AVG:
+        return functions.when(
+            functions.size(non_null_values) > 0,
+            functions.aggregate(
+                non_null_values,
+                functions.lit(0.0).cast("double"),
+                lambda acc, value: acc + value.cast("double"),
+            )
+            / functions.size(non_null_values),
+        )
+    elif agg_func == AggFunc.MAX:
+        return functions.array_max(values)
+    elif agg_func == AggFunc.MIN:
+        return functions.array_min(values)
+    elif agg_func == AggFunc.FIRST_VALUE:
+        return functions.when(
+            functions.size(values) > 0, functions.element_at(values, 1)
+        )
+    elif agg_func == AggFunc.LAST_VALUE:
+        return functions.when(
+            functions.size(values) > 0, functions.element_at(values, -1)
+        )
+    elif agg_func == AggFunc.COLLECT_LIST:
+        return values
+    elif agg_func == AggFunc.VALUE_COUNTS:
+        # Spark does not allow null map keys, so null values are not counted.
+        return functions.when(
+            functions.size(non_null_values) > 0,
+            functions.map_from_entries(
+                functions.transform(
+                    functions.array_distinct(non_null_values),
+                    lambda distinct_value: functions.struct(
+                        distinct_value,
+                        functions.size(
+                            functions.filter(
+                                non_null_values, lambda value: value == distinct_value
+                            )
+                        ).cast("bigint"),
+                    ),
+                )
+            ),
+        )
+
+    raise FeathubTransformationException(
+        f"Unsupported aggregation for SparkProcessor {agg_func}."
+    )
+
+
+def _sort_rows(rows: Column) -> Column:
+    # Sorts an array of rows by their order. The rows are sorted through their
+    # positions, as the values might not be orderable.
+    positions = functions.array_sort(
+        functions.transform(
+            rows,
+            lambda row, index: functions.struct(
+                row.getField("order").alias("order"), index.alias("index")
+            ),
+        )
+    )
+    return functions.transform(
+        positions,
+        lambda position: functions.element_at(rows, position.getField("index") + 1),
+    )
+
+
+def _take_last_rows(rows: Column, limit: int) -> Column:
+    return functions.slice(
+        rows,
+        functions.greatest(functions.size(rows) - limit + 1, functions.lit(1)),
+        functions.lit(limit),
+    )
+
+
+def _get_empty_window_value(descriptor: AggregationFieldDescriptor) -> Column:
+    # Like FlinkProcessor, empty windows output 0 for SUM and COUNT and null for the
+    # other aggregation functions, including the collection-typed ones.
+    if descriptor.agg_func == AggFunc.SUM or descriptor.agg_func == AggFunc.COUNT:
+        return functions.lit(0).cast(descriptor.field_data_type)
+    return functions.lit(None).cast(descriptor.field_data_type)
+
+
+def _to_comparable_column(descriptor: AggregationFieldDescriptor) -> Column:
+    column = functions.col(f"`{descriptor.field_name}`")
+    if isinstance(descriptor.field_data_type, MapType):
+        # Spark cannot compare maps, so they are compared as sorted entries instead.
+        column = functions.array_sort(functions.map_entries(column))
+    return column.alias(descriptor.field_name)
+
+
+def _get_window_spec(keys: List[str]) -> WindowSpec:
+    if len(keys) == 0:
+        return Window.partitionBy()
+    return Window.partitionBy(*keys)
+
+
+def _get_range_window_spec(keys: List[str], window_size_ms: int) -> WindowSpec:
+    return (
+        _get_window_spec(keys)
+        .orderBy(EVENT_TIME_ATTRIBUTE_NAME)
+        .rangeBetween(1 - window_size_ms, Window.currentRow)
+    )
+
+
+def _get_value_column_name(index: int) -> str:
+    return f"__sliding_window_value_{index}__"
+
+
+def _get_raw_offset_ms(dataframe: NativeSparkDataFrame) -> int:
+    # The offset of the session time zone from UTC without daylight saving time,
+    # which is used by Flink to align tumbling windows.
+    zone = tz.gettz(dataframe.sparkSession.conf.get("spark.sql.session.timeZone"))
+    if zone is None:
+        raise FeathubException("Unknown time zone of the Spark session.")
+    now = datetime.now(zone)
+    return int((now.utcoffset() - now.dst()) / timedelta(milliseconds=1))
@@ -12,12 +12,15 @@
 #  See the License for the specific language governing permissions and
 #  limitations under the License.
 from concurrent.futures import Executor, Future
+from typing import Optional, List, Callable, Any
 
+import numpy as np
+import pandas as pd
 from pyspark import Row
 from pyspark.sql import DataFrame as NativeSparkDataFrame, SparkSession
 
 from feathub.common.exceptions import FeathubException
-from feathub.common.utils import get_table_schema
+from feathub.common.utils import get_table_schema, to_unix_timestamp
 from feathub.feature_tables.feature_table import FeatureTable
 from feathub.feature_tables.sinks.black_hole_sink import BlackHoleSink
 from feathub.feature_tables.sinks.file_system_sink import FileSystemSink
@@ -33,8 +36,10 @@ from feathub.processors.spark.dataframe_builder.datagen_utils import (
 from feathub.processors.spark.dataframe_builder.time_utils import (
     append_unix_time_attribute_column,
 )
+from feathub.processors.spark.spark_table import spark_dataframe_to_pandas_iterator
 from feathub.processors.spark.spark_types_utils import to_spark_struct_type
 from feathub.table.schema import Schema
+from feathub.table.table import DEFAULT_CHUNK_SIZE
 from feathub.table.table_descriptor import TableDescriptor
 
 
@@ -112,30 +117,140 @@ def insert_into_sink(
 
         future = executor.submit(dataframe.foreach, f=nop)
     elif isinstance(sink, MemoryStoreSink):
-        future = executor.submit(
+        metrics = OnlineStoreWriteMetrics()
+        write_future = OnlineStoreWriteFuture(metrics)
+        executor.submit(
+            write_future.run,
             _write_features_to_online_store,
             dataframe=dataframe,
             features_desc=features_desc,
             schema=get_table_schema(features_desc),
             sink=sink,
+            metrics=metrics,
         )
+        future = write_future
     else:
         raise FeathubException(f"Unsupported sink type {type(sink)}.")
 
     return future
 
 
+class OnlineStoreWriteMetrics:
+    """
+    The progress of writing a Spark DataFrame to an online store. It is updated after
+    each chunk of rows is written, and is available as the `metrics` attribute of the
+    OnlineStoreWriteFuture returned by `insert_into_sink` as well as the result of
+    the Future.
+    """
+
+    def __init__(self) -> None:
+        # The number of rows read from the Spark DataFrame.
+        self.num_rows_read = 0
+        # The number of rows upserted into the online store after rows with the same
+        # key in a chunk are deduplicated.
+        self.num_rows_written = 0
+        # The number of chunks that have been written.
+        self.num_chunks = 0
+
+    def __repr__(self) -> str:
+        return (
+            f"OnlineStoreWriteMetrics(num_rows_read={self.num_rows_read}, "
+            f"num_rows_written={self.num_rows_written}, "
+            f"num_chunks={self.num_chunks})"
+        )
+
+
+class OnlineStoreWriteFuture(Future):
+    """
+    The Future of writing a Spark DataFrame to an online store, which exposes the
+    progress of the write through `metrics` while the write is still running.
+    """
+
+    def __init__(self, metrics: OnlineStoreWriteMetrics) -> None:
+        super().__init__()
+        self.metrics = metrics
+
+    def run(self, write: Callable[..., OnlineStoreWriteMetrics], **kwargs: Any) -> None:
+        """
+        Calls the given write function with the given arguments and completes this
+        Future with its result, unless this Future has been cancelled.
+        """
+        if not self.set_running_or_notify_cancel():
+            return
+        try:
+            self.set_result(write(**kwargs))
+        except BaseException as e:
+            self.set_exception(e)
+
+
 def _write_features_to_online_store(
     dataframe: NativeSparkDataFrame,
     features_desc: TableDescriptor,
     schema: Schema,
     sink: MemoryStoreSink,
-) -> None:
-    MemoryOnlineStore.get_instance().put(
-        table_name=sink.table_name,
-        features=dataframe.toPandas(),
-        schema=schema,
-        key_fields=features_desc.keys,
-        timestamp_field=features_desc.timestamp_field,
-        timestamp_format=features_desc.timestamp_format,
+    metrics: OnlineStoreWriteMetrics,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+) -> OnlineStoreWriteMetrics:
+    # Streams the DataFrame to the driver chunk by chunk, so that the driver only
+    # needs to hold one chunk of rows instead of the whole table.
+    online_store = MemoryOnlineStore.get_instance()
+
+    def put(features: pd.DataFrame) -> None:
+        online_store.put(
+            table_name=sink.table_name,
+            features=features,
+            schema=schema,
+            key_fields=features_desc.keys,
+            timestamp_field=features_desc.timestamp_field,
+            timestamp_format=features_desc.timestamp_format,
+        )
+
+    for features in spark_dataframe_to_pandas_iterator(dataframe, chunk_size):
+        metrics.num_rows_read += len(features)
+        features = _deduplicate_by_keys(
+            features,
+            features_desc.keys,
+            features_desc.timestamp_field,
+            features_desc.timestamp_format,
+        )
+        put(features)
+        metrics.num_rows_written += len(features)
+        metrics.num_chunks += 1
+
+    if metrics.num_chunks == 0:
+        # Puts an empty DataFrame so that the table is still created in the online
+        # store, and its schema is checked, if the DataFrame has no rows.
+        put(pd.DataFrame(columns=dataframe.columns))
+    return metrics
+
+
+def _deduplicate_by_keys(
+    features: pd.DataFrame,
+    key_fields: Optional[List[str]],
+    timestamp_field: Optional[str],
+    timestamp_format: Optional[str],
+) -> pd.DataFrame:
+    # Keeps only the row that MemoryOnlineStore#put would eventually store for each
+    # key, i.e. the first row with the largest timestamp, or the last row if there
+    # is no timestamp field.
+    if not key_fields or not set(key_fields).issubset(features.columns):
+        return features
+
+    if timestamp_field is None:
+        return features.drop_duplicates(subset=key_fields, keep="last")
+
+    if timestamp_format is None:
+        # Leaves it to MemoryOnlineStore#put to report the missing format.
+        return features
+
+    unix_times = features[timestamp_field].map(
+        lambda time: to_unix_timestamp(
+            time.item() if isinstance(time, np.generic) else time, timestamp_format
+        )
+    )
+    order = unix_times.sort_values(ascending=False, kind="stable").index
+    return (
+        features.loc[order]
+        .drop_duplicates(subset=key_fields, keep="first")
+        .sort_index()
     )
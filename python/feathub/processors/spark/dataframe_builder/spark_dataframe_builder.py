@@ -16,9 +16,11 @@ from typing import Dict, Tuple, List, Sequence, Union, Optional
 
 import pandas as pd
 
+from feathub.common.utils import to_java_date_format
 from feathub.dsl.expr_utils import is_id, get_var_name
 from feathub.feature_views.transforms.join_transform import JoinTransform
 from pyspark.sql import DataFrame as NativeSparkDataFrame, functions
+from pyspark import StorageLevel
 from pyspark.sql import SparkSession
 from pyspark.sql.functions import udf, struct
 
@@ -29,11 +31,16 @@ from feathub.common.exceptions import (
 from feathub.common.types import DType
 from feathub.feature_tables.feature_table import FeatureTable
 from feathub.feature_views.derived_feature_view import DerivedFeatureView
+from feathub.feature_views.feature import Feature
 from feathub.feature_views.feature_view import FeatureView
+from feathub.feature_views.sliding_feature_view import SlidingFeatureView
 from feathub.feature_views.transforms.agg_func import AggFunc
 from feathub.feature_views.transforms.expression_transform import ExpressionTransform
 from feathub.feature_views.transforms.over_window_transform import OverWindowTransform
 from feathub.feature_views.transforms.python_udf_transform import PythonUdfTransform
+from feathub.feature_views.transforms.sliding_window_transform import (
+    SlidingWindowTransform,
+)
 from feathub.processors.constants import EVENT_TIME_ATTRIBUTE_NAME
 from feathub.processors.spark.dataframe_builder.aggregation_utils import (
     AggregationFieldDescriptor,
@@ -42,6 +49,10 @@ from feathub.processors.spark.dataframe_builder.over_window_utils import (
     OverWindowDescriptor,
     evaluate_over_window_transform,
 )
+from feathub.processors.spark.dataframe_builder.sliding_window_utils import (
+    SlidingWindowDescriptor,
+    evaluate_sliding_window_transform,
+)
 from feathub.processors.spark.dataframe_builder.source_sink_utils import (
     get_dataframe_from_source,
 )
@@ -62,19 +73,30 @@ from feathub.table.table_descriptor import TableDescriptor
 class SparkDataFrameBuilder:
     """SparkDataFrameBuilder is used to convert FeatHub feature to a Spark DataFrame."""
 
-    def __init__(self, spark_session: SparkSession, registry: Registry):
+    def __init__(
+        self,
+        spark_session: SparkSession,
+        registry: Registry,
+        storage_level: Optional[StorageLevel] = None,
+    ):
         """
         Instantiate the SparkDataFrameBuilder.
 
         :param spark_session: The SparkSession where the DataFrames are created.
         :param registry: The FeatHub registry.
+        :param storage_level: Optional. If it is not None, the DataFrames that are
+                              reused by builds with `reuse_built_dataframes` are
+                              persisted with this storage level.
         """
         self._spark_session = spark_session
         self._registry = registry
+        self._storage_level = storage_level
 
         self._built_dataframes: Dict[
             str, Tuple[TableDescriptor, NativeSparkDataFrame]
         ] = {}
+        self._reuse_built_dataframes = False
+        self._persisted_dataframes: Dict[str, NativeSparkDataFrame] = {}
 
     def build(
         self,
@@ -82,6 +104,7 @@ class SparkDataFrameBuilder:
         keys: Union[pd.DataFrame, TableDescriptor, None] = None,
         start_datetime: Optional[datetime] = None,
         end_datetime: Optional[datetime] = None,
+        reuse_built_dataframes: bool = False,
     ) -> NativeSparkDataFrame:
         """
         Convert the given features to native Spark DataFrame.
@@ -103,6 +126,11 @@ class SparkDataFrameBuilder:
                              include features whose timestamp < end_datetime. If any
                              field (e.g. minute) is not specified in the end_datetime,
                              we assume this field has the maximum possible value.
+        :param reuse_built_dataframes: If it is True, the DataFrames built for the
+                                       features and the tables they depend on are kept
+                                       and reused by the following builds, until
+                                       `release_built_dataframes` is called. The
+                                       DataFrames used more than once are persisted.
         :return: The native Spark DataFrame that represents the given features.
         """
 
@@ -111,6 +139,7 @@ class SparkDataFrameBuilder:
                 "Trying to convert an unresolved FeatureView to native Spark DataFrame."
             )
 
+        self._reuse_built_dataframes = reuse_built_dataframes
         dataframe = self._get_spark_dataframe(features)
 
         if keys is not None:
@@ -129,10 +158,24 @@ class SparkDataFrameBuilder:
         if EVENT_TIME_ATTRIBUTE_NAME in dataframe.columns:
             dataframe = dataframe.drop(EVENT_TIME_ATTRIBUTE_NAME)
 
-        self._built_dataframes.clear()
+        if not reuse_built_dataframes:
+            self._built_dataframes.clear()
 
         return dataframe
 
+    def release_built_dataframes(self) -> List[NativeSparkDataFrame]:
+        """
+        Stop reusing the DataFrames kept by builds with `reuse_built_dataframes`.
+
+        :return: The DataFrames persisted by those builds. They should be unpersisted
+                 by the caller after the jobs using them complete.
+        """
+        persisted_dataframes = list(self._persisted_dataframes.values())
+        self._built_dataframes.clear()
+        self._reuse_built_dataframes = False
+        self._persisted_dataframes = {}
+        return persisted_dataframes
+
     def _filter_dataframe_by_keys(
         self,
         df: NativeSparkDataFrame,
@@ -159,12 +202,24 @@ class SparkDataFrameBuilder:
                     f"Encounter different TableDescriptor with same name. {features} "
                     f"and {self._built_dataframes[features.name][0]}."
                 )
-            return self._built_dataframes[features.name][1]
+            spark_dataframe = self._built_dataframes[features.name][1]
+            if (
+                self._reuse_built_dataframes
+                and self._storage_level is not None
+                and features.name not in self._persisted_dataframes
+            ):
+                # The DataFrame is used more than once, persist it so that it is only
+                # computed once.
+                spark_dataframe.persist(self._storage_level)
+                self._persisted_dataframes[features.name] = spark_dataframe
+            return spark_dataframe
 
         if isinstance(features, FeatureTable):
             spark_dataframe = get_dataframe_from_source(self._spark_session, features)
         elif isinstance(features, DerivedFeatureView):
             spark_dataframe = self._get_dataframe_from_derived_feature_view(features)
+        elif isinstance(features, SlidingFeatureView):
+            spark_dataframe = self._get_dataframe_from_sliding_feature_view(features)
         else:
             raise FeathubException(
                 f"Unsupported type '{type(features).__name__}' for '{features}'."
@@ -180,7 +235,6 @@ class SparkDataFrameBuilder:
         source_dataframe = self._get_spark_dataframe(feature_view.get_resolved_source())
         tmp_dataframe = source_dataframe
 
-        dependent_features = []
         window_agg_map: Dict[
             OverWindowDescriptor, List[AggregationFieldDescriptor]
         ] = {}
@@ -200,12 +254,7 @@ class SparkDataFrameBuilder:
             descriptors_by_names[name] = descriptor
             dataframe_by_names[name] = self._get_spark_dataframe(features=descriptor)
 
-        for feature in feature_view.get_resolved_features():
-            for input_feature in feature.input_features:
-                if input_feature not in dependent_features:
-                    dependent_features.append(input_feature)
-            if feature not in dependent_features:
-                dependent_features.append(feature)
+        dependent_features = feature_view.get_dependent_features()
 
         # The right_tables map keeps track of the information of the right table to join
         # with the source table. The key is a tuple of right_table_name and join_keys
@@ -357,6 +406,113 @@ class SparkDataFrameBuilder:
         )
         return tmp_dataframe.select(output_fields)
 
+    def _get_dataframe_from_sliding_feature_view(
+        self, feature_view: SlidingFeatureView
+    ) -> NativeSparkDataFrame:
+        source_dataframe = self._get_spark_dataframe(feature_view.get_resolved_source())
+        tmp_dataframe = source_dataframe
+
+        dependent_features = feature_view.get_dependent_features()
+
+        agg_descriptors: List[AggregationFieldDescriptor] = []
+
+        # This list contains all per-row transform features listed after the first
+        # SlidingWindowTransform feature in the dependent_features.
+        per_row_transform_features_following_first_sliding_feature: List[Feature] = []
+
+        for feature in dependent_features:
+            # The timestamp field is computed from the window time.
+            if feature.name == feature_view.timestamp_field:
+                continue
+
+            if isinstance(feature.transform, ExpressionTransform):
+                if len(agg_descriptors) > 0:
+                    per_row_transform_features_following_first_sliding_feature.append(
+                        feature
+                    )
+                else:
+                    tmp_dataframe = self._evaluate_expression_transform(
+                        tmp_dataframe,
+                        feature.transform,
+                        feature.name,
+                        feature.dtype,
+                    )
+            elif isinstance(feature.transform, PythonUdfTransform):
+                if len(agg_descriptors) > 0:
+                    per_row_transform_features_following_first_sliding_feature.append(
+                        feature
+                    )
+                else:
+                    tmp_dataframe = self._evaluate_python_udf_transform(
+                        tmp_dataframe, feature.transform, feature.name, feature.dtype
+                    )
+            elif isinstance(feature.transform, SlidingWindowTransform):
+                if feature_view.timestamp_field is None:
+                    raise FeathubException(
+                        "SlidingFeatureView must have timestamp field for "
+                        "SlidingWindowTransform."
+                    )
+                agg_descriptors.append(AggregationFieldDescriptor.from_feature(feature))
+            else:
+                raise FeathubTransformationException(
+                    f"Unsupported transformation type "
+                    f"{type(feature.transform).__name__} for feature {feature.name}."
+                )
+
+        tmp_dataframe = evaluate_sliding_window_transform(
+            tmp_dataframe,
+            SlidingWindowDescriptor.from_sliding_feature_view(feature_view),
+            agg_descriptors,
+            feature_view.config,
+        )
+
+        # Add the timestamp field according to the timestamp format from
+        # event time(window time).
+        if feature_view.timestamp_format == "epoch":
+            timestamp_column = functions.floor(
+                functions.col(EVENT_TIME_ATTRIBUTE_NAME) / 1000
+            ).cast("bigint")
+        elif feature_view.timestamp_format == "epoch_millis":
+            timestamp_column = functions.col(EVENT_TIME_ATTRIBUTE_NAME)
+        else:
+            timestamp_column = functions.date_format(
+                functions.expr(f"timestamp_millis({EVENT_TIME_ATTRIBUTE_NAME})"),
+                to_java_date_format(feature_view.timestamp_format),
+            )
+        tmp_dataframe = tmp_dataframe.withColumn(
+            feature_view.timestamp_field, timestamp_column
+        )
+
+        for feature in per_row_transform_features_following_first_sliding_feature:
+            if isinstance(feature.transform, ExpressionTransform):
+                tmp_dataframe = self._evaluate_expression_transform(
+                    tmp_dataframe,
+                    feature.transform,
+                    feature.name,
+                    feature.dtype,
+                )
+            elif isinstance(feature.transform, PythonUdfTransform):
+                tmp_dataframe = self._evaluate_python_udf_transform(
+                    tmp_dataframe, feature.transform, feature.name, feature.dtype
+                )
+            else:
+                raise RuntimeError(
+                    f"Unsupported transformation type "
+                    f"{type(feature.transform).__name__} for feature {feature.name}."
+                )
+
+        if feature_view.filter_expr is not None:
+            tmp_dataframe = tmp_dataframe.filter(
+                functions.expr(to_spark_sql_expr(feature_view.filter_expr))
+            )
+
+        # The event time column is kept so that the result can be joined with or
+        # ranged by time as other tables with timestamp field.
+        output_fields = feature_view.get_output_fields(
+            source_fields=source_dataframe.schema.fieldNames()
+        )
+        return tmp_dataframe.select(*output_fields, EVENT_TIME_ATTRIBUTE_NAME)
+
     @staticmethod
     def _filter_dataframe_by_time(
         dataframe: NativeSparkDataFrame,
@@ -0,0 +1,125 @@
+#  Copyright 2022 The FeatHub Authors
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#      https://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+import unittest
+from datetime import timedelta
+from typing import List, Tuple, Any
+
+from pyspark.sql import SparkSession, DataFrame as NativeSparkDataFrame
+from pyspark.sql.types import LongType
+
+from feathub.common.exceptions import FeathubException
+from feathub.feature_views.sliding_feature_view import (
+    SlidingFeatureViewConfig,
+    SKIP_SAME_WINDOW_OUTPUT_CONFIG,
+)
+from feathub.feature_views.transforms.agg_func import AggFunc
+from feathub.processors.constants import EVENT_TIME_ATTRIBUTE_NAME
+from feathub.processors.spark.dataframe_builder.aggregation_utils import (
+    AggregationFieldDescriptor,
+)
+from feathub.processors.spark.dataframe_builder.sliding_window_utils import (
+    SlidingWindowDescriptor,
+    evaluate_sliding_window_transform,
+)
+
+
+class SlidingWindowUtilsTest(unittest.TestCase):
+    spark_session: SparkSession
+
+    @classmethod
+    def setUpClass(cls) -> None:
+        cls.spark_session = (
+            SparkSession.builder.master("local[1]")
+            .config("spark.sql.session.timeZone", "UTC")
+            .getOrCreate()
+        )
+
+    @classmethod
+    def tearDownClass(cls) -> None:
+        cls.spark_session.stop()
+
+    def test_combine_panes(self):
+        dataframe = self._create_dataframe(
+            [("a", 1, 1000), ("a", 2, 4000), ("a", 3, 12000), ("b", 5, 1000)]
+        )
+
+        result = evaluate_sliding_window_transform(
+            dataframe,
+            SlidingWindowDescriptor(timedelta(seconds=10), ["key"]),
+            [self._get_sum_descriptor(timedelta(seconds=20))],
+            SlidingFeatureViewConfig({}),
+        )
+
+        # Rows are pre-aggregated into the panes ending at 9999 and 19999. An empty
+        # window outputs 0 once the last pane leaves the window.
+        self.assertEqual(
+            [
+                ("a", 3, 9999),
+                ("a", 6, 19999),
+                ("a", 3, 29999),
+                ("a", 0, 39999),
+                ("b", 5, 9999),
+                ("b", 0, 29999),
+            ],
+            self._collect(result),
+        )
+
+    def test_zero_step_size(self):
+        dataframe = self._create_dataframe(
+            [("a", 1, 1000), ("a", 0, 2000), ("a", 2, 3000), ("b", 5, 1500)]
+        )
+        window_descriptor = SlidingWindowDescriptor(timedelta(0), ["key"])
+        agg_descriptors = [self._get_sum_descriptor(timedelta(0))]
+
+        result = evaluate_sliding_window_transform(
+            dataframe, window_descriptor, agg_descriptors, SlidingFeatureViewConfig({})
+        )
+
+        # Each row outputs the aggregation of all rows so far, unless the result is
+        # the same as the previous output.
+        self.assertEqual(
+            [("a", 1, 1000), ("a", 3, 3000), ("b", 5, 1500)], self._collect(result)
+        )
+
+        with self.assertRaises(FeathubException):
+            evaluate_sliding_window_transform(
+                dataframe,
+                window_descriptor,
+                agg_descriptors,
+                SlidingFeatureViewConfig({SKIP_SAME_WINDOW_OUTPUT_CONFIG: False}),
+            )
+
+    def _create_dataframe(
+        self, rows: List[Tuple[str, int, int]]
+    ) -> NativeSparkDataFrame:
+        return self.spark_session.createDataFrame(
+            rows, ["key", "cost", EVENT_TIME_ATTRIBUTE_NAME]
+        )
+
+    @staticmethod
+    def _get_sum_descriptor(window_size: timedelta) -> AggregationFieldDescriptor:
+        return AggregationFieldDescriptor(
+            field_name="total_cost",
+            field_data_type=LongType(),
+            expr="`cost`",
+            agg_func=AggFunc.SUM,
+            window_size=window_size,
+        )
+
+    @staticmethod
+    def _collect(dataframe: NativeSparkDataFrame) -> List[Tuple[Any, ...]]:
+        rows = dataframe.select("key", "total_cost", EVENT_TIME_ATTRIBUTE_NAME)
+        return sorted(
+            (tuple(row) for row in rows.collect()), key=lambda row: (row[0], row[2])
+        )
@@ -0,0 +1,103 @@
+#  Copyright 2022 The FeatHub Authors
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#      https://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+import unittest
+from concurrent.futures import ThreadPoolExecutor
+from typing import cast
+
+import pandas as pd
+from pyspark.sql import SparkSession
+
+from feathub.common.types import Int64, String
+from feathub.feature_tables.sinks.memory_store_sink import MemoryStoreSink
+from feathub.feature_tables.sources.file_system_source import FileSystemSource
+from feathub.online_stores.memory_online_store import MemoryOnlineStore
+from feathub.processors.spark.dataframe_builder.source_sink_utils import (
+    OnlineStoreWriteFuture,
+    OnlineStoreWriteMetrics,
+    insert_into_sink,
+)
+from feathub.table.schema import Schema
+
+
+class SourceSinkUtilsTest(unittest.TestCase):
+    spark_session: SparkSession
+
+    @classmethod
+    def setUpClass(cls) -> None:
+        cls.spark_session = (
+            SparkSession.builder.master("local[1]")
+            .config("spark.sql.session.timeZone", "UTC")
+            .getOrCreate()
+        )
+
+    @classmethod
+    def tearDownClass(cls) -> None:
+        cls.spark_session.stop()
+
+    def tearDown(self) -> None:
+        MemoryOnlineStore.get_instance().reset()
+
+    def test_insert_into_memory_store_sink(self):
+        schema = (
+            Schema.new_builder()
+            .column("id", Int64)
+            .column("value", Int64)
+            .column("time", String)
+            .build()
+        )
+        features_desc = FileSystemSource(
+            name="source",
+            path="unused",
+            data_format="csv",
+            schema=schema,
+            keys=["id"],
+            timestamp_field="time",
+            timestamp_format="%Y-%m-%d %H:%M:%S",
+        )
+        dataframe = self.spark_session.createDataFrame(
+            pd.DataFrame(
+                [
+                    [1, 1, "2022-01-01 00:00:00"],
+                    [1, 2, "2022-01-01 00:00:01"],
+                    [2, 3, "2022-01-01 00:00:00"],
+                ],
+                columns=["id", "value", "time"],
+            )
+        )
+
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            future = insert_into_sink(
+                executor=executor,
+                dataframe=dataframe,
+                features_desc=features_desc,
+                sink=MemoryStoreSink("test_table"),
+                allow_overwrite=True,
+            )
+            metrics = future.result()
+
+        self.assertIsInstance(future, OnlineStoreWriteFuture)
+        self.assertIs(metrics, cast(OnlineStoreWriteFuture, future).metrics)
+        self.assertEqual(3, metrics.num_rows_read)
+        self.assertEqual(2, metrics.num_rows_written)
+        self.assertEqual(1, metrics.num_chunks)
+
+    def test_cancelled_online_store_write_future(self):
+        future = OnlineStoreWriteFuture(OnlineStoreWriteMetrics())
+        self.assertTrue(future.cancel())
+
+        def write() -> OnlineStoreWriteMetrics:
+            raise AssertionError("The write of a cancelled future should not run.")
+
+        future.run(write)
+        self.assertTrue(future.cancelled())
@@ -11,11 +11,13 @@
 # WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
 # See the License for the specific language governing permissions and
 # limitations under the License.
-from concurrent.futures import ThreadPoolExecutor
+import threading
+from concurrent.futures import ThreadPoolExecutor, Future
 from datetime import datetime
-from typing import Union, Optional, Dict, Sequence
+from typing import Union, Optional, Dict, Sequence, List
 
 import pandas as pd
+from pyspark import StorageLevel
 from pyspark.sql import DataFrame as NativeSparkDataFrame
 from pyspark.sql import SparkSession
 
@@ -39,8 +41,10 @@ from feathub.processors.spark.spark_job import SparkJob, CombinedSparkJob
 from feathub.processors.spark.spark_processor_config import (
     SparkProcessorConfig,
     MASTER_CONFIG,
+    STORAGE_LEVEL_CONFIG,
     NATIVE_CONFIG_PREFIX,
     NATIVE_CONFIG_PROCESSOR_CONFIG_MAP,
+    ARROW_NATIVE_CONFIGS,
 )
 from feathub.processors.spark.spark_table import SparkTable
 from feathub.registries.registry import Registry
@@ -55,6 +59,10 @@ class SparkProcessor(Processor):
     SparkProcessor constructor.
 
     master: The Spark master URL to connect to.
+    storage_level: The storage level to persist intermediate DataFrames that are used
+                   by more than one of the features materialized together. If it is
+                   NONE, the intermediate DataFrames are not persisted. Default to
+                   MEMORY_AND_DISK.
     native.*: Any key with the "native" prefix will be forwarded to the Spark Session
               config after the "native" prefix is removed. For example, if the processor
               config has an entry "native.spark.default.parallelism": 2, then the Spark
@@ -78,6 +86,8 @@ class SparkProcessor(Processor):
         spark_session_builder = spark_session_builder.config(
             "spark.sql.session.timeZone", config.get(TIMEZONE_CONFIG)
         ).config("spark.sql.legacy.sizeOfNull", False)
+        for k, v in ARROW_NATIVE_CONFIGS.items():
+            spark_session_builder = spark_session_builder.config(k, v)
 
         prefix_len = len(NATIVE_CONFIG_PREFIX)
         for k, v in config.original_props_with_prefix(
@@ -95,7 +105,12 @@ class SparkProcessor(Processor):
             spark_session_builder = spark_session_builder.config(k[prefix_len:], v)
         spark_session = spark_session_builder.getOrCreate()
 
-        self._dataframe_builder = SparkDataFrameBuilder(spark_session, self._registry)
+        storage_level = config.get(STORAGE_LEVEL_CONFIG)
+        self._dataframe_builder = SparkDataFrameBuilder(
+            spark_session,
+            self._registry,
+            None if storage_level == "NONE" else getattr(StorageLevel, storage_level),
+        )
 
         self._executor = ThreadPoolExecutor()
 
@@ -120,34 +135,55 @@ class SparkProcessor(Processor):
         self,
         materialization_descriptors: Sequence[MaterializationDescriptor],
     ) -> ProcessorJob:
-        # TODO: Optimize performance by reusing intermediate results.
-        spark_jobs = []
-        for materialization_descriptor in materialization_descriptors:
-            if materialization_descriptor.ttl is not None:
-                raise FeathubException(
-                    "Spark processor does not support inserting features with ttl."
+        # The DataFrames of the tables shared by the materialized features are reused
+        # and persisted, so that they are only computed once. All the features are
+        # built before any job is submitted, so that the shared DataFrames are
+        # persisted before the first job using them runs.
+        dataframes = []
+        try:
+            for materialization_descriptor in materialization_descriptors:
+                if materialization_descriptor.ttl is not None:
+                    raise FeathubException(
+                        "Spark processor does not support inserting features with ttl."
+                    )
+
+                resolved_features = self._resolve_table_descriptor(
+                    materialization_descriptor.feature_descriptor
                 )
 
-            resolved_features = self._resolve_table_descriptor(
-                materialization_descriptor.feature_descriptor
-            )
-
-            dataframe = self.get_spark_dataframe(
-                feature=resolved_features,
-                start_datetime=materialization_descriptor.start_datetime,
-                end_datetime=materialization_descriptor.end_datetime,
+                dataframe = self._dataframe_builder.build(
+                    features=resolved_features,
+                    start_datetime=materialization_descriptor.start_datetime,
+                    end_datetime=materialization_descriptor.end_datetime,
+                    reuse_built_dataframes=True,
+                )
+                dataframes.append(
+                    (materialization_descriptor, resolved_features, dataframe)
+                )
+        except BaseException:
+            _unpersist_on_completion(
+                [], self._dataframe_builder.release_built_dataframes()
             )
+            raise
+        persisted_dataframes = self._dataframe_builder.release_built_dataframes()
 
-            future = insert_into_sink(
-                executor=self._executor,
-                dataframe=dataframe,
-                features_desc=resolved_features,
-                sink=materialization_descriptor.sink,
-                allow_overwrite=materialization_descriptor.allow_overwrite,
+        spark_jobs = []
+        try:
+            for materialization_descriptor, resolved_features, dataframe in dataframes:
+                future = insert_into_sink(
+                    executor=self._executor,
+                    dataframe=dataframe,
+                    features_desc=resolved_features,
+                    sink=materialization_descriptor.sink,
+                    allow_overwrite=materialization_descriptor.allow_overwrite,
+                )
+                spark_jobs.append(SparkJob(job_future=future))
+        finally:
+            _unpersist_on_completion(
+                [spark_job._job_future for spark_job in spark_jobs],
+                persisted_dataframes,
             )
 
-            spark_jobs.append(SparkJob(job_future=future))
-
         if len(spark_jobs) == 1:
             return spark_jobs[0]
         else:
@@ -173,3 +209,27 @@ class SparkProcessor(Processor):
         return self._dataframe_builder.build(
             feature, keys, start_datetime, end_datetime
         )
+
+
+def _unpersist_on_completion(
+    futures: List[Future], dataframes: List[NativeSparkDataFrame]
+) -> None:
+    # Unpersists the given DataFrames after all the given futures are done.
+    if len(futures) == 0:
+        for dataframe in dataframes:
+            dataframe.unpersist()
+        return
+
+    num_pending_futures = [len(futures)]
+    lock = threading.Lock()
+
+    def unpersist(_: Future) -> None:
+        with lock:
+            num_pending_futures[0] -= 1
+            if num_pending_futures[0] > 0:
+                return
+        for dataframe in dataframes:
+            dataframe.unpersist()
+
+    for future in futures:
+        future.add_done_callback(unpersist)
@@ -14,7 +14,7 @@
 from typing import List, Dict, Any
 
 from feathub.common.config import ConfigDef, TIMEZONE_CONFIG
-from feathub.common.validators import not_none
+from feathub.common.validators import not_none, in_list
 from feathub.processors.processor_config import ProcessorConfig, PROCESSOR_PREFIX
 
 SPARK_PROCESSOR_PREFIX = PROCESSOR_PREFIX + "spark."
@@ -22,6 +22,14 @@ SPARK_PROCESSOR_PREFIX = PROCESSOR_PREFIX + "spark."
 MASTER_CONFIG = SPARK_PROCESSOR_PREFIX + "master"
 MASTER_DOC = "The Spark master URL to connect to."
 
+STORAGE_LEVEL_CONFIG = SPARK_PROCESSOR_PREFIX + "storage_level"
+STORAGE_LEVEL_DOC = (
+    "The storage level to persist intermediate DataFrames that are used by more than "
+    "one of the features materialized together, so that they are only computed once. "
+    "The persisted DataFrames are unpersisted when the materialization job completes. "
+    "If it is NONE, the intermediate DataFrames are not persisted."
+)
+
 NATIVE_CONFIG_PREFIX = SPARK_PROCESSOR_PREFIX + "native."
 
 spark_processor_config_defs: List[ConfigDef] = [
@@ -31,6 +39,24 @@ spark_processor_config_defs: List[ConfigDef] = [
         description=MASTER_DOC,
         validator=not_none(),
     ),
+    ConfigDef(
+        name=STORAGE_LEVEL_CONFIG,
+        value_type=str,
+        description=STORAGE_LEVEL_DOC,
+        default_value="MEMORY_AND_DISK",
+        validator=in_list(
+            "NONE",
+            "DISK_ONLY",
+            "DISK_ONLY_2",
+            "DISK_ONLY_3",
+            "MEMORY_AND_DISK",
+            "MEMORY_AND_DISK_2",
+            "MEMORY_AND_DISK_DESER",
+            "MEMORY_ONLY",
+            "MEMORY_ONLY_2",
+            "OFF_HEAP",
+        ),
+    ),
 ]
 
 # Map from native Spark configs to the corresponding FeatHub processor configs
@@ -39,6 +65,15 @@ NATIVE_CONFIG_PROCESSOR_CONFIG_MAP = {
     NATIVE_CONFIG_PREFIX + "spark.sql.session.timeZone": TIMEZONE_CONFIG,
 }
 
+# Native Spark configs that transfer data between Spark and pandas in Arrow batches
+# instead of row by row. The conversion falls back to the row-based one for types not
+# supported by Arrow. They can be overridden by the native configs given by users.
+ARROW_NATIVE_CONFIGS = {
+    "spark.sql.execution.arrow.pyspark.enabled": "true",
+    "spark.sql.execution.arrow.pyspark.fallback.enabled": "true",
+    "spark.sql.execution.arrow.pyspark.selfDestruct.enabled": "true",
+}
+
 
 class SparkProcessorConfig(ProcessorConfig):
     def __init__(self, props: Dict[str, Any]) -> None:
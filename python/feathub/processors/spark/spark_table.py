@@ -13,9 +13,15 @@
 # limitations under the License.
 import typing
 from datetime import timedelta, datetime
-from typing import Optional, Union
+from typing import Optional, Union, Dict, Iterator, List
 
+import numpy as np
 import pandas as pd
+import pyarrow as pa
+from dateutil import tz
+from pyspark.sql import DataFrame as NativeSparkDataFrame
+from pyspark.sql import types as native_spark_types
+from pyspark.sql.pandas.types import to_arrow_schema
 
 from feathub.common.exceptions import FeathubException
 from feathub.feature_tables.sinks.sink import Sink
@@ -23,16 +29,146 @@ from feathub.processors.materialization_descriptor import (
     MaterializationDescriptor,
 )
 from feathub.processors.processor_job import ProcessorJob
+from feathub.processors.type_utils import cast_dataframe_dtype
 from feathub.processors.spark.spark_types_utils import (
     to_feathub_schema,
 )
 from feathub.table.schema import Schema
-from feathub.table.table import Table
+from feathub.table.table import Table, DEFAULT_CHUNK_SIZE
 from feathub.table.table_descriptor import TableDescriptor
 
 if typing.TYPE_CHECKING:
     from feathub.processors.spark.spark_processor import SparkProcessor
 
+# The name of the field holding each serialized Arrow batch in the DataFrame
+# transferred by spark_dataframe_to_pandas_iterator.
+_SERIALIZED_BATCH_FIELD_NAME = "arrow_batch"
+
+# A type mapping from Spark DataType to numpy type that cannot be derived unambiguously
+# by pandas from the values of the Spark Rows.
+SPARK_DATA_TYPE_TO_NUMPY_TYPE: Dict = {
+    native_spark_types.ByteType: np.int8,
+    native_spark_types.ShortType: np.int16,
+    native_spark_types.IntegerType: np.int32,
+    native_spark_types.LongType: np.int64,
+    native_spark_types.FloatType: np.float32,
+    native_spark_types.DoubleType: np.float64,
+}
+
+
+def spark_dataframe_to_pandas_iterator(
+    dataframe: NativeSparkDataFrame, chunk_size: int = DEFAULT_CHUNK_SIZE
+) -> Iterator[pd.DataFrame]:
+    """
+    Converting the given Spark DataFrame to an iterator of pandas dataframes, each of
+    which contains at most `chunk_size` rows. Rows are fetched from Spark in Arrow
+    batches one partition at a time, so that only one partition and one chunk of rows
+    are held in Python memory at a time.
+    """
+    schema = dataframe.schema
+    timezone = dataframe.sparkSession.conf.get("spark.sql.session.timeZone")
+    try:
+        to_arrow_schema(schema)
+    except TypeError:
+        # Falls back to fetching the rows if there is a field that is not supported
+        # by the Arrow serializer of PySpark.
+        yield from _spark_dataframe_rows_to_pandas_iterator(
+            dataframe, chunk_size, timezone
+        )
+        return
+
+    batches: List[pa.RecordBatch] = []
+    num_rows = 0
+    for batch in _spark_dataframe_to_arrow_iterator(dataframe):
+        batches.append(batch)
+        num_rows += batch.num_rows
+        while num_rows >= chunk_size:
+            table = pa.Table.from_batches(batches)
+            yield _arrow_to_pandas(table.slice(0, chunk_size), schema, timezone)
+            table = table.slice(chunk_size)
+            batches = table.to_batches()
+            num_rows = table.num_rows
+    if num_rows > 0:
+        yield _arrow_to_pandas(pa.Table.from_batches(batches), schema, timezone)
+
+
+def _spark_dataframe_to_arrow_iterator(
+    dataframe: NativeSparkDataFrame,
+) -> Iterator[pa.RecordBatch]:
+    # Each Arrow batch is serialized into one binary value on the executors, so that
+    # toLocalIterator transfers a partition as a few values instead of row by row.
+    serialized_dataframe = dataframe.mapInArrow(
+        _serialize_arrow_batches, f"{_SERIALIZED_BATCH_FIELD_NAME} binary"
+    )
+    for row in serialized_dataframe.toLocalIterator(prefetchPartitions=True):
+        yield from pa.ipc.open_stream(pa.py_buffer(row[0]))
+
+
+def _serialize_arrow_batches(
+    batches: Iterator[pa.RecordBatch],
+) -> Iterator[pa.RecordBatch]:
+    for batch in batches:
+        if batch.num_rows == 0:
+            continue
+        sink = pa.BufferOutputStream()
+        with pa.ipc.new_stream(sink, batch.schema) as writer:
+            writer.write_batch(batch)
+        yield pa.RecordBatch.from_arrays(
+            [pa.array([sink.getvalue().to_pybytes()], type=pa.binary())],
+            names=[_SERIALIZED_BATCH_FIELD_NAME],
+        )
+
+
+def _arrow_to_pandas(
+    table: pa.Table, schema: native_spark_types.StructType, timezone: str
+) -> pd.DataFrame:
+    df = table.to_pandas(date_as_object=True)
+    for field in schema.fields:
+        if isinstance(field.dataType, native_spark_types.TimestampType):
+            # Arrow batches hold timestamps in UTC, while DataFrame#toPandas returns
+            # them in the session timezone.
+            df[field.name] = df[field.name].dt.tz_convert(timezone).dt.tz_localize(None)
+    return df
+
+
+def _spark_dataframe_rows_to_pandas_iterator(
+    dataframe: NativeSparkDataFrame, chunk_size: int, timezone: str
+) -> Iterator[pd.DataFrame]:
+    rows: List[native_spark_types.Row] = []
+    for row in dataframe.toLocalIterator(prefetchPartitions=True):
+        rows.append(row)
+        if len(rows) >= chunk_size:
+            yield _rows_to_pandas(rows, dataframe.schema, timezone)
+            rows = []
+    if rows:
+        yield _rows_to_pandas(rows, dataframe.schema, timezone)
+
+
+def _rows_to_pandas(
+    rows: List[native_spark_types.Row],
+    schema: native_spark_types.StructType,
+    timezone: str,
+) -> pd.DataFrame:
+    df = pd.DataFrame.from_records(rows, columns=schema.names)
+    for field in schema.fields:
+        if isinstance(field.dataType, native_spark_types.TimestampType):
+            # Spark Rows hold timestamps in the local timezone of the Python process,
+            # while DataFrame#toPandas returns them in the session timezone.
+            df[field.name] = (
+                pd.to_datetime(df[field.name])
+                .dt.tz_localize(tz.tzlocal(), ambiguous=False)
+                .dt.tz_convert(timezone)
+                .dt.tz_localize(None)
+            )
+    return cast_dataframe_dtype(
+        df,
+        {
+            field.name: SPARK_DATA_TYPE_TO_NUMPY_TYPE[type(field.dataType)]
+            for field in schema.fields
+            if type(field.dataType) in SPARK_DATA_TYPE_TO_NUMPY_TYPE
+        },
+    )
+
 
 class SparkTable(Table):
     """
@@ -90,6 +226,28 @@ class SparkTable(Table):
         )
 
     def to_pandas(self, force_bounded: bool = False) -> pd.DataFrame:
+        return self._get_spark_dataframe(force_bounded).toPandas()
+
+    def to_pandas_iterator(
+        self, force_bounded: bool = False, chunk_size: int = DEFAULT_CHUNK_SIZE
+    ) -> Iterator[pd.DataFrame]:
+        return spark_dataframe_to_pandas_iterator(
+            self._get_spark_dataframe(force_bounded), chunk_size
+        )
+
+    def to_arrow(self, force_bounded: bool = False) -> pa.Table:
+        dataframe = self._get_spark_dataframe(force_bounded)
+        try:
+            arrow_schema = to_arrow_schema(dataframe.schema)
+        except TypeError:
+            # Falls back to collecting the rows if there is a field that is not
+            # supported by the Arrow serializer of PySpark.
+            return pa.Table.from_pandas(dataframe.toPandas(), preserve_index=False)
+
+        # Transfers the rows from the JVM in Arrow batches.
+        return pa.Table.from_batches(dataframe._collect_as_arrow(), schema=arrow_schema)
+
+    def _get_spark_dataframe(self, force_bounded: bool) -> NativeSparkDataFrame:
         feature = self._feature
         if not feature.is_bounded():
             if not force_bounded:
@@ -99,15 +257,13 @@ class SparkTable(Table):
                 )
             feature = feature.get_bounded_view()
 
-        dataframe = self._spark_processor.get_spark_dataframe(
+        return self._spark_processor.get_spark_dataframe(
             feature=feature,
             keys=self._keys,
             start_datetime=self.start_datetime,
             end_datetime=self.end_datetime,
         )
 
-        return dataframe.toPandas()
-
     def execute_insert(
         self,
         sink: Sink,
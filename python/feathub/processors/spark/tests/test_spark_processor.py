@@ -12,19 +12,32 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 import unittest
-from typing import Optional, Dict
+from concurrent.futures import Future
+from typing import Optional, Dict, List, cast
+from unittest.mock import patch
+
+import pandas as pd
+from pyspark import StorageLevel
+from pyspark.sql import DataFrame as NativeSparkDataFrame
 
 from feathub.common.exceptions import FeathubConfigurationException
+from feathub.common.types import String, Int64, Float64
 from feathub.feathub_client import FeathubClient
+from feathub.feature_tables.sinks.black_hole_sink import BlackHoleSink
 from feathub.feature_tables.tests.test_black_hole_sink import BlackHoleSinkITTest
 from feathub.feature_tables.tests.test_datagen_source import DataGenSourceITTest
 from feathub.feature_tables.tests.test_file_system_source_sink import (
     FileSystemSourceSinkITTest,
 )
 from feathub.feature_tables.tests.test_print_sink import PrintSinkITTest
+from feathub.feature_views.derived_feature_view import DerivedFeatureView
+from feathub.feature_views.feature import Feature
 from feathub.feature_views.tests.test_derived_feature_view import (
     DerivedFeatureViewITTest,
 )
+from feathub.feature_views.tests.test_sliding_feature_view import (
+    SlidingFeatureViewITTest,
+)
 from feathub.feature_views.transforms.tests.test_expression_transform import (
     ExpressionTransformITTest,
 )
@@ -37,8 +50,13 @@ from feathub.feature_views.transforms.tests.test_over_window_transform import (
 from feathub.feature_views.transforms.tests.test_python_udf_transform import (
     PythonUDFTransformITTest,
 )
+from feathub.feature_views.transforms.tests.test_sliding_window_transform import (
+    SlidingWindowTransformITTest,
+)
+from feathub.processors.materialization_descriptor import MaterializationDescriptor
 from feathub.processors.spark.spark_processor import SparkProcessor
 from feathub.registries.local_registry import LocalRegistry
+from feathub.table.schema import Schema
 from feathub.tests.test_get_features import GetFeaturesITTest
 from feathub.tests.test_materialize_features import MaterializeFeaturesITTest
 from feathub.tests.test_online_features import OnlineFeaturesITTest
@@ -78,6 +96,18 @@ class SparkProcessorTest(unittest.TestCase):
 
         self.assertIn("cannot be None", cm.exception.args[0])
 
+    def test_invalid_storage_level_config(self):
+        with self.assertRaises(FeathubConfigurationException) as cm:
+            SparkProcessor(
+                props={
+                    "processor.spark.master": "local[1]",
+                    "processor.spark.storage_level": "MEMORY",
+                },
+                registry=self.registry,
+            )
+
+        self.assertIn("Invalid value MEMORY", cm.exception.args[0])
+
 
 class SparkProcessorITTest(
     BlackHoleSinkITTest,
@@ -91,6 +121,8 @@ class SparkProcessorITTest(
     JoinTransformITTest,
     GetFeaturesITTest,
     DerivedFeatureViewITTest,
+    SlidingWindowTransformITTest,
+    SlidingFeatureViewITTest,
     MaterializeFeaturesITTest,
 ):
     __test__ = True
@@ -170,5 +202,155 @@ class SparkProcessorITTest(
     def test_join_transform_with_map_lookup(self):
         pass
 
-    def test_transform_with_zero_window_size(self):
-        pass
+    def test_shared_dataframe_persisted_before_jobs(self):
+        source = self.create_file_source(self.input_data.copy())
+        feature_views = [
+            DerivedFeatureView(
+                name=f"feature_view_{i}",
+                source=source,
+                features=[Feature(name=f"cost_plus_{i}", transform=f"cost + {i}")],
+                keep_source_fields=True,
+            )
+            for i in range(2)
+        ]
+
+        processor = cast(SparkProcessor, self.client.processor)
+        dataframe_builder = processor._dataframe_builder
+        release_built_dataframes = dataframe_builder.release_built_dataframes
+        persisted_dataframes: List[NativeSparkDataFrame] = []
+
+        def release_and_record_built_dataframes() -> List[NativeSparkDataFrame]:
+            dataframes = release_built_dataframes()
+            persisted_dataframes.extend(dataframes)
+            return dataframes
+
+        # The storage levels of the persisted DataFrames when each job is submitted.
+        storage_levels: List[List[str]] = []
+
+        def insert_into_sink(**kwargs) -> Future:
+            storage_levels.append([str(df.storageLevel) for df in persisted_dataframes])
+            future: Future = Future()
+            future.set_result(None)
+            return future
+
+        with patch.object(
+            dataframe_builder,
+            "release_built_dataframes",
+            release_and_record_built_dataframes,
+        ), patch(
+            "feathub.processors.spark.spark_processor.insert_into_sink",
+            insert_into_sink,
+        ):
+            processor.materialize_features(
+                [
+                    MaterializationDescriptor(
+                        feature_descriptor=feature_view, sink=BlackHoleSink()
+                    )
+                    for feature_view in feature_views
+                ]
+            )
+
+        self.assertEqual(1, len(persisted_dataframes))
+        self.assertEqual([[str(StorageLevel.MEMORY_AND_DISK)]] * 2, storage_levels)
+        # The shared DataFrame is unpersisted once the jobs are done.
+        self.assertFalse(persisted_dataframes[0].is_cached)
+
+    def test_temporal_join_same_as_local_processor(self):
+        # The rows are out of order. Left rows have several candidate right rows,
+        # including right rows with the same keys and event time, and some keys are
+        # null.
+        left_df = pd.DataFrame(
+            [
+                ["Emma", 1, "2022-01-01 08:05:00"],
+                ["Alex", 2, "2022-01-01 08:03:00"],
+                ["Alex", 3, "2022-01-01 08:01:00"],
+                ["Alex", 4, "2022-01-01 08:03:00"],
+                [None, 5, "2022-01-01 08:04:00"],
+                ["Jack", 6, "2022-01-01 08:00:00"],
+                ["Lily", 7, "2022-01-01 08:06:00"],
+            ],
+            columns=["name", "id", "time"],
+        )
+        right_df = pd.DataFrame(
+            [
+                ["Alex", 30.0, "2022-01-01 08:02:00"],
+                ["Alex", 10.0, "2022-01-01 08:00:00"],
+                ["Alex", 20.0, "2022-01-01 08:02:00"],
+                ["Emma", 40.0, "2022-01-01 08:06:00"],
+                ["Emma", 50.0, "2022-01-01 08:05:00"],
+                [None, 60.0, "2022-01-01 08:01:00"],
+                ["Jack", 70.0, "2022-01-01 08:00:00"],
+            ],
+            columns=["name", "value", "time"],
+        )
+
+        expected_records = [
+            ["Emma", 1, "2022-01-01 08:05:00", 50.0],
+            ["Alex", 2, "2022-01-01 08:03:00", 30.0],
+            ["Alex", 3, "2022-01-01 08:01:00", 10.0],
+            ["Alex", 4, "2022-01-01 08:03:00", 30.0],
+            [None, 5, "2022-01-01 08:04:00", None],
+            ["Jack", 6, "2022-01-01 08:00:00", 70.0],
+            ["Lily", 7, "2022-01-01 08:06:00", None],
+        ]
+        local_client = self.get_client_with_local_registry({"type": "local"})
+        for client in [self.client, local_client]:
+            self.assertEqual(
+                expected_records,
+                self._get_temporal_join_records(client, left_df, right_df),
+            )
+
+    def test_temporal_join_with_null_timestamps(self):
+        left_df = pd.DataFrame(
+            [
+                ["Alex", 1, "2022-01-01 08:03:00"],
+                ["Alex", 2, None],
+            ],
+            columns=["name", "id", "time"],
+        )
+        right_df = pd.DataFrame(
+            [
+                ["Alex", 10.0, "2022-01-01 08:00:00"],
+                ["Alex", 20.0, None],
+            ],
+            columns=["name", "value", "time"],
+        )
+
+        # LocalProcessor does not support null timestamps. Rows with null timestamps
+        # are not matched.
+        self.assertEqual(
+            [
+                ["Alex", 1, "2022-01-01 08:03:00", 10.0],
+                ["Alex", 2, None, None],
+            ],
+            self._get_temporal_join_records(self.client, left_df, right_df),
+        )
+
+    def _get_temporal_join_records(
+        self, client: FeathubClient, left_df: pd.DataFrame, right_df: pd.DataFrame
+    ) -> List[List]:
+        left_source = self.create_file_source(
+            left_df,
+            schema=Schema(["name", "id", "time"], [String, Int64, String]),
+        )
+        right_source = self.create_file_source(
+            right_df,
+            schema=Schema(["name", "value", "time"], [String, Float64, String]),
+            keys=["name"],
+        )
+        feature_view = DerivedFeatureView(
+            name="feature_view",
+            source=left_source,
+            features=[f"{right_source.name}.value"],
+            keep_source_fields=True,
+        )
+        client.build_features([right_source])
+
+        result_df = (
+            client.get_features(feature_descriptor=feature_view)
+            .to_pandas()[["name", "id", "time", "value"]]
+            .sort_values(by=["id"])
+            .reset_index(drop=True)
+            .astype(object)
+        )
+        return result_df.where(result_df.notnull(), None).values.tolist()
@@ -14,7 +14,13 @@
 
 from abc import ABC, abstractmethod
 import json
-from typing import Dict
+from hashlib import sha256
+from typing import Dict, Any, Callable, TypeVar
+
+T = TypeVar("T")
+
+# The name of the attribute holding the cached values of an entity.
+_CACHE_ATTR = "_entity_cache"
 
 
 class Entity(ABC):
@@ -23,6 +29,10 @@ class Entity(ABC):
     An entity can refer to e.g. a dataset or a user. The concept is similar to
     the entity defined in the DataHub metadata model
     (https://github.com/datahub-project/datahub/blob/master/docs/modeling/metadata-model.md).
+
+    An entity caches its digest and the metadata derived from its attributes while it
+    is immutable, as determined by `_is_immutable`. Assigning an attribute of the
+    entity drops the cached values.
     """
 
     def __init__(self) -> None:
@@ -35,6 +45,51 @@ class Entity(ABC):
         """
         pass
 
+    def get_digest(self) -> str:
+        """
+        Returns the SHA-256 digest of the json-formatted object representing this
+        entity. Entities with the same digest are equal.
+        """
+        return self._get_cached(
+            "digest",
+            lambda: sha256(
+                json.dumps(self.to_json(), sort_keys=True, default=repr).encode("utf-8")
+            ).hexdigest(),
+        )
+
+    def _is_immutable(self) -> bool:
+        """
+        Returns whether the attributes of this entity, including the objects they
+        refer to, are no longer modified in place, so that values derived from them
+        can be cached.
+        """
+        return True
+
+    def _get_cached(
+        self, key: str, compute: Callable[[], T], check_immutable: bool = True
+    ) -> T:
+        """
+        Returns the value cached with the given key, or computes it with the given
+        function and caches it if this entity is immutable.
+
+        :param check_immutable: If False, the value is cached even if this entity is
+                                not immutable, which is only valid for values that
+                                can only change by assigning attributes of this
+                                entity.
+        """
+        cache = self.__dict__.get(_CACHE_ATTR)
+        if cache is not None and key in cache:
+            return cache[key]
+
+        value = compute()
+        if not check_immutable or self._is_immutable():
+            self.__dict__.setdefault(_CACHE_ATTR, {})[key] = value
+        return value
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        super().__setattr__(name, value)
+        self.__dict__.pop(_CACHE_ATTR, None)
+
     def __str__(self) -> str:
         return json.dumps(self.to_json(), indent=2, sort_keys=True)
 
@@ -42,4 +97,10 @@ class Entity(ABC):
         return self.__str__()
 
     def __eq__(self, other: object) -> bool:
-        return isinstance(other, self.__class__) and self.to_json() == other.to_json()
+        return self is other or (
+            isinstance(other, self.__class__)
+            and self.get_digest() == other.get_digest()
+        )
+
+    def __hash__(self) -> int:
+        return hash(self.get_digest())
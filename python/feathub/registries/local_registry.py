@@ -66,23 +66,28 @@ class LocalRegistry(Registry):
         props: Optional[Dict] = None,
     ) -> List[TableDescriptor]:
         result = []
-        for table in feature_descriptors:
-            if table.name == "":
-                raise FeathubException(
-                    "Cannot build a TableDescriptor with empty name."
+        with self._resolve_context():
+            for table in feature_descriptors:
+                if table.name == "":
+                    raise FeathubException(
+                        "Cannot build a TableDescriptor with empty name."
+                    )
+                original_table = self._copy_original(table)
+                self.tables[table.name] = (
+                    original_table,
+                    self._resolve(table, force_update=force_update, props=props),
                 )
-            self.tables[table.name] = (
-                table,
-                table.build(self, force_update=force_update, props=props),
-            )
-            result.append(self.tables[table.name][1])
+                self._index_dependencies(table)
+                result.append(self.tables[table.name][1])
 
         return result
 
     def register_features(
         self, feature_descriptors: List[TableDescriptor], force_update: bool = False
     ) -> List[bool]:
-        self.build_features(feature_descriptors, force_update)
+        self.build_features(
+            self._with_affected_descriptors(feature_descriptors), force_update
+        )
         return [True for _ in feature_descriptors]
 
     def get_features(
@@ -99,6 +104,7 @@ class LocalRegistry(Registry):
         if name not in self.tables:
             return False
         self.tables.pop(name)
+        self._unindex_dependencies(name)
         return True
 
     def clear_features(self) -> None:
@@ -106,3 +112,4 @@ class LocalRegistry(Registry):
         Deletes all features ever registered into this registry.
         """
         self.tables.clear()
+        self._clear_dependency_index()
@@ -12,16 +12,23 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 import json
+import logging
+import threading
+import time
+import weakref
+from contextlib import contextmanager
 from datetime import datetime
-from hashlib import sha256
-from typing import List, Optional, Dict, Any, Tuple
+from typing import List, Optional, Dict, Any, Tuple, Iterator, Sequence
 
-import mysql.connector
+from mysql.connector.cursor import MySQLCursor
+from mysql.connector.pooling import MySQLConnectionPool
 
 from feathub.common.config import ConfigDef
 from feathub.common.exceptions import FeathubException
 from feathub.common.utils import from_json
-from feathub.registries.registry import Registry
+from feathub.common.validators import gt_eq
+from feathub.metric_stores.online_metrics import OnlineMetrics
+from feathub.registries.registry import Registry, get_descriptor_digest
 from feathub.registries.registry_config import REGISTRY_PREFIX, RegistryConfig
 from feathub.table.table_descriptor import TableDescriptor
 
@@ -45,6 +52,30 @@ USERNAME_DOC = "Name of the user to connect to the MySQL server."
 PASSWORD_CONFIG = MYSQL_REGISTRY_PREFIX + "password"
 PASSWORD_DOC = "The password of the user."
 
+POOL_SIZE_CONFIG = MYSQL_REGISTRY_PREFIX + "pool_size"
+POOL_SIZE_DOC = (
+    "The maximum number of connections to the MySQL server that the registry keeps "
+    "open. Operations wait for an idle connection when all of them are in use."
+)
+
+REFRESH_INTERVAL_SEC_CONFIG = MYSQL_REGISTRY_PREFIX + "refresh_interval_sec"
+REFRESH_INTERVAL_SEC_DOC = (
+    "The interval in seconds to refresh the cached descriptors in a background "
+    "thread with the latest versions registered in the MySQL database, so that "
+    "get_features returns fresh descriptors without querying the database. "
+    "Background refresh is disabled if it is 0."
+)
+
+# The name of the metric holding the latency of refreshing the cached descriptors.
+# The number of refreshed descriptors is recorded as its row count.
+REGISTRY_REFRESH_METRIC = "registry_refresh"
+
+# The name of the metric holding the delay between registering a descriptor and
+# refreshing it in the cache. It is labeled by `table`.
+REGISTRY_STALENESS_METRIC = "registry_staleness"
+
+logger = logging.getLogger(__file__)
+
 
 # TODO: validate and throw exception if a required config's value is NONE.
 mysql_registry_config_defs: List[ConfigDef] = [
@@ -84,6 +115,19 @@ mysql_registry_config_defs: List[ConfigDef] = [
         description=PASSWORD_DOC,
         default_value=None,
     ),
+    ConfigDef(
+        name=POOL_SIZE_CONFIG,
+        value_type=int,
+        description=POOL_SIZE_DOC,
+        default_value=5,
+    ),
+    ConfigDef(
+        name=REFRESH_INTERVAL_SEC_CONFIG,
+        value_type=float,
+        description=REFRESH_INTERVAL_SEC_DOC,
+        default_value=0.0,
+        validator=gt_eq(0),  # type: ignore
+    ),
 ]
 
 
@@ -93,12 +137,6 @@ class MySqlRegistryConfig(RegistryConfig):
         self.update_config_values(mysql_registry_config_defs)
 
 
-def _get_digest(original_descriptor: str, resolved_descriptor: str) -> str:
-    return sha256(
-        (original_descriptor + resolved_descriptor).encode("utf-8")
-    ).hexdigest()
-
-
 class MySqlRegistry(Registry):
     """
     A registry that stores entities in a MySQL database.
@@ -116,6 +154,10 @@ class MySqlRegistry(Registry):
         self.port = mysql_registry_config.get(PORT_CONFIG)
         self.username = mysql_registry_config.get(USERNAME_CONFIG)
         self.password = mysql_registry_config.get(PASSWORD_CONFIG)
+        self.pool_size = mysql_registry_config.get(POOL_SIZE_CONFIG)
+        self.refresh_interval_sec = mysql_registry_config.get(
+            REFRESH_INTERVAL_SEC_CONFIG
+        )
 
         # dict that acts as a local cache for built and registered descriptors.
         # each value in the dict is a tuple of
@@ -124,27 +166,56 @@ class MySqlRegistry(Registry):
         # - UTC timestamp when the descriptor is resolved.
         self.tables: Dict[str, Tuple[TableDescriptor, TableDescriptor, datetime]] = {}
 
-        self.conn = mysql.connector.connect(
+        # The digest of the version in MySQL of each cached descriptor. A descriptor
+        # that is built but not registered has no digest.
+        self._digests: Dict[str, str] = {}
+
+        # Guards the updates of the cache, so that the descriptors fetched together
+        # are swapped into the cache together.
+        self._lock = threading.RLock()
+
+        self.metrics = OnlineMetrics()
+        self._last_refresh_time: Optional[float] = None
+        self._stop_event = threading.Event()
+        self._refresh_thread: Optional[threading.Thread] = None
+
+        # MySQLConnectionPool raises an error instead of blocking when all of its
+        # connections are in use, so the semaphore makes callers wait for an idle
+        # connection.
+        self._pool_semaphore = threading.BoundedSemaphore(self.pool_size)
+        self._pool = MySQLConnectionPool(
+            pool_size=self.pool_size,
             host=self.host,
             port=self.port,
             user=self.username,
             password=self.password,
             database=self.database,
         )
-        self.cursor = self.conn.cursor()
-
-        self.cursor.execute(
-            f"""
-                CREATE TABLE IF NOT EXISTS `{self.table}`(
-                   `name` VARCHAR(64) NOT NULL,
-                   `timestamp` TIMESTAMP NOT NULL,
-                   `digest` VARCHAR(64) NOT NULL,
-                   `original_descriptor` TEXT NOT NULL,
-                   `resolved_descriptor` TEXT NOT NULL,
-                   PRIMARY KEY ( `name`, `timestamp` )
-                );
-            """
-        )
+
+        with self._transaction() as cursor:
+            cursor.execute(
+                f"""
+                    CREATE TABLE IF NOT EXISTS `{self.table}`(
+                       `name` VARCHAR(64) NOT NULL,
+                       `timestamp` TIMESTAMP NOT NULL,
+                       `digest` VARCHAR(64) NOT NULL,
+                       `original_descriptor` TEXT NOT NULL,
+                       `resolved_descriptor` TEXT NOT NULL,
+                       PRIMARY KEY ( `name`, `timestamp` )
+                    );
+                """
+            )
+
+        if self.refresh_interval_sec > 0:
+            self._refresh_thread = threading.Thread(
+                target=_run_refresh,
+                args=(weakref.ref(self), self._stop_event, self.refresh_interval_sec),
+                daemon=True,
+            )
+            self._refresh_thread.start()
+            # Stops the thread if the registry is garbage collected without being
+            # closed.
+            weakref.finalize(self, self._stop_event.set)
 
     def build_features(
         self,
@@ -153,81 +224,107 @@ class MySqlRegistry(Registry):
         props: Optional[Dict] = None,
     ) -> List[TableDescriptor]:
         result = []
-        for table in feature_descriptors:
-            if table.name == "":
-                raise FeathubException(
-                    "Cannot build a TableDescriptor with empty name."
+        with self._resolve_context():
+            for table in feature_descriptors:
+                if table.name == "":
+                    raise FeathubException(
+                        "Cannot build a TableDescriptor with empty name."
+                    )
+
+                # TODO: add document about the limitations on the length of feature
+                #  table names.
+                if len(table.name) > 64:
+                    raise FeathubException(
+                        "Cannot build or register a descriptor with a name longer"
+                        "than 64 characters."
+                    )
+
+                original_table = self._copy_original(table)
+                resolved_table = self._resolve(
+                    table, force_update=force_update, props=props
                 )
-
-            # TODO: add document about the limitations on the length of feature
-            #  table names.
-            if len(table.name) > 64:
-                raise FeathubException(
-                    "Cannot build or register a descriptor with a name longer"
-                    "than 64 characters."
-                )
-
-            self.tables[table.name] = (
-                table,
-                table.build(self, force_update=force_update, props=props),
-                datetime.utcnow(),
-            )
-            result.append(self.tables[table.name][1])
+                with self._lock:
+                    self.tables[table.name] = (
+                        original_table,
+                        resolved_table,
+                        datetime.utcnow(),
+                    )
+                    self._digests.pop(table.name, None)
+                self._index_dependencies(table)
+                result.append(resolved_table)
 
         return result
 
     def register_features(
         self, feature_descriptors: List[TableDescriptor], force_update: bool = False
     ) -> List[bool]:
+        num_descriptors = len(feature_descriptors)
+        feature_descriptors = self._with_affected_descriptors(feature_descriptors)
         self.build_features(feature_descriptors, force_update=force_update)
 
+        existing_descriptors = self._get_descriptors_from_mysql(
+            [descriptor.name for descriptor in feature_descriptors]
+        )
+
         results = []
+        rows: Dict[str, Tuple[str, datetime, str, str, str]] = {}
         for descriptor in feature_descriptors:
-            existing_descriptor = self._get_descriptor_from_mysql(descriptor.name)
+            # A descriptor listed more than once is only inserted once.
+            if descriptor.name in rows:
+                results.append(False)
+                continue
 
-            original_descriptor = json.dumps(
-                self.tables[descriptor.name][0].to_json(), sort_keys=True
-            )
-            resolved_descriptor = json.dumps(
-                self.tables[descriptor.name][1].to_json(), sort_keys=True
-            )
-            digest = _get_digest(original_descriptor, resolved_descriptor)
+            original, resolved, timestamp = self.tables[descriptor.name]
+            original_descriptor = json.dumps(original.to_json(), sort_keys=True)
+            resolved_descriptor = json.dumps(resolved.to_json(), sort_keys=True)
+            digest = get_descriptor_digest(original_descriptor, resolved_descriptor)
 
-            if existing_descriptor is not None and (
-                existing_descriptor[1] == digest
-                or existing_descriptor[0] >= self.tables[descriptor.name][2]
-            ):
+            existing_descriptor = existing_descriptors.get(descriptor.name)
+            if existing_descriptor is not None and existing_descriptor[1] == digest:
+                with self._lock:
+                    self._digests[descriptor.name] = digest
                 results.append(False)
                 continue
 
-            original_descriptor = original_descriptor.replace('"', '\\"')
-            resolved_descriptor = resolved_descriptor.replace('"', '\\"')
-            timestamp = self.tables[descriptor.name][2].strftime("%Y-%m-%d %H:%M:%S %z")
-            self.cursor.execute(
-                f"""
-                    INSERT INTO {self.table} (
-                       `name`,
-                       `timestamp`,
-                       `digest`,
-                       `original_descriptor`,
-                       `resolved_descriptor`
-                    ) VALUES (
-                        "{descriptor.name}",
-                        "{timestamp}",
-                        "{digest}",
-                        "{original_descriptor}",
-                        "{resolved_descriptor}"
-                    );
-                """
+            if existing_descriptor is not None and existing_descriptor[0] >= timestamp:
+                results.append(False)
+                continue
+
+            rows[descriptor.name] = (
+                descriptor.name,
+                # The TIMESTAMP column has a precision of seconds.
+                timestamp.replace(microsecond=0),
+                digest,
+                original_descriptor,
+                resolved_descriptor,
             )
             results.append(True)
-        return results
+
+        if rows:
+            with self._transaction() as cursor:
+                cursor.executemany(
+                    f"""
+                        INSERT INTO `{self.table}` (
+                           `name`,
+                           `timestamp`,
+                           `digest`,
+                           `original_descriptor`,
+                           `resolved_descriptor`
+                        ) VALUES (%s, %s, %s, %s, %s);
+                    """,
+                    list(rows.values()),
+                )
+            with self._lock:
+                for name, _, digest, _, _ in rows.values():
+                    self._digests[name] = digest
+
+        return results[:num_descriptors]
 
     def get_features(
         self, name: str, force_update: bool = False, is_resolved: bool = True
     ) -> TableDescriptor:
         if force_update:
-            self._get_descriptor_from_mysql(name)
+            self._get_descriptors_from_mysql([name])
 
         if name not in self.tables:
             raise RuntimeError(
@@ -237,55 +334,245 @@ class MySqlRegistry(Registry):
 
         return self.tables[name][1 if is_resolved else 0]  # type: ignore
 
+    def get_features_many(
+        self,
+        names: Sequence[str],
+        force_update: bool = False,
+        is_resolved: bool = True,
+    ) -> List[TableDescriptor]:
+        if force_update:
+            self._get_descriptors_from_mysql(names)
+
+        return [self.get_features(name, is_resolved=is_resolved) for name in names]
+
     def delete_features(self, name: str) -> bool:
-        if self._get_descriptor_from_mysql(name) is None and name not in self.tables:
-            return False
-
-        self.cursor.execute(
-            f"""
-                DELETE FROM {self.table}
-                WHERE `name` = "{name}";
-            """
-        )
-        self.tables.pop(name)
-        return True
-
-    def _get_descriptor_from_mysql(
-        self, name: str
-    ) -> Optional[Tuple[datetime, str, TableDescriptor, TableDescriptor]]:
-        self.cursor.execute(
-            f"""
-                SELECT
-                    `timestamp`,
-                    `digest`,
-                    `original_descriptor`,
-                    `resolved_descriptor`
-                FROM {self.table}
-                WHERE `name` = "{name}"
-                ORDER BY `timestamp` DESC
-                LIMIT 1;
-            """
+        with self._transaction() as cursor:
+            cursor.execute(
+                f"DELETE FROM `{self.table}` WHERE `name` = %s;",
+                (name,),
+            )
+            is_deleted_from_mysql = cursor.rowcount > 0
+
+        with self._lock:
+            is_deleted_from_cache = self.tables.pop(name, None) is not None
+            self._digests.pop(name, None)
+        self._unindex_dependencies(name)
+        return is_deleted_from_mysql or is_deleted_from_cache
+
+    def clear_features(self) -> None:
+        """
+        Deletes all features ever registered into this registry.
+        """
+        with self._transaction() as cursor:
+            cursor.execute(f"DELETE FROM `{self.table}`;")
+        with self._lock:
+            self.tables.clear()
+            self._digests.clear()
+        self._clear_dependency_index()
+
+    def refresh(self) -> List[str]:
+        """
+        Refreshes the cached descriptors with the latest versions registered in MySQL.
+        Only the name, timestamp and digest of the latest versions are listed, and
+        only the descriptors whose digest differs from the cached version are fetched
+        and deserialized. A cached descriptor that is built after the latest version
+        is registered is kept. A cached descriptor fetched from or registered into
+        MySQL is evicted if it is no longer in MySQL and has not been registered or
+        built again since the latest versions were listed.
+
+        :return: The names of the refreshed and evicted descriptors.
+        """
+        start_time = time.perf_counter()
+        with self._lock:
+            digests_before_listing = dict(self._digests)
+        with self._transaction() as cursor:
+            cursor.execute(
+                f"""
+                    SELECT t.`name`, t.`timestamp`, t.`digest`
+                    FROM `{self.table}` AS t
+                    JOIN (
+                        SELECT `name`, MAX(`timestamp`) AS `timestamp`
+                        FROM `{self.table}`
+                        GROUP BY `name`
+                    ) AS latest
+                    ON t.`name` = latest.`name` AND t.`timestamp` = latest.`timestamp`;
+                """
+            )
+            listing: List[Tuple] = cursor.fetchall()
+
+        with self._lock:
+            changed_names = [
+                name
+                for name, timestamp, digest in listing
+                if self._digests.get(name) != digest
+                and (name not in self.tables or self.tables[name][2] < timestamp)
+            ]
+
+            # The descriptors that are only built in this process have no digest and
+            # are kept, as well as the descriptors whose digest has changed since the
+            # listing, which might have been registered after the listing.
+            listed_names = {name for name, _, _ in listing}
+            evicted_names = [
+                name
+                for name, digest in digests_before_listing.items()
+                if name not in listed_names and self._digests.get(name) == digest
+            ]
+            for name in evicted_names:
+                self.tables.pop(name, None)
+                self._digests.pop(name)
+        for name in evicted_names:
+            self._unindex_dependencies(name)
+
+        fetched_descriptors = self._get_descriptors_from_mysql(changed_names)
+        refreshed_names = evicted_names
+        now = datetime.utcnow()
+        for name, (timestamp, digest) in fetched_descriptors.items():
+            if self._digests.get(name) != digest:
+                continue
+            refreshed_names.append(name)
+            self.metrics.record(
+                REGISTRY_STALENESS_METRIC,
+                {"table": name},
+                max((now - timestamp).total_seconds() * 1000, 0.0),
+            )
+
+        self._last_refresh_time = time.monotonic()
+        self.metrics.record(
+            REGISTRY_REFRESH_METRIC,
+            {},
+            (time.perf_counter() - start_time) * 1000,
+            num_rows=len(refreshed_names),
         )
-        results: List[Tuple] = self.cursor.fetchall()
-        if len(results) == 0:
+        return refreshed_names
+
+    def get_staleness_sec(self) -> Optional[float]:
+        """
+        Returns the number of seconds since the cached descriptors were last
+        refreshed, or None if they have never been refreshed.
+        """
+        if self._last_refresh_time is None:
             return None
-
-        timestamp, digest, original_descriptor, resolved_descriptor = results[0]
-        if _get_digest(original_descriptor, resolved_descriptor) != digest:
-            raise FeathubException(
-                f"Acquired features' json string cannot match the digest. "
-                f"Data might be broken. Json string: {resolved_descriptor}, "
-                f"digest: {digest}"
+        return time.monotonic() - self._last_refresh_time
+
+    def close(self) -> None:
+        """
+        Stops refreshing the cached descriptors in the background.
+        """
+        if self._refresh_thread is None:
+            return
+        self._stop_event.set()
+        self._refresh_thread.join()
+        self._refresh_thread = None
+
+    @contextmanager
+    def _transaction(self) -> Iterator[MySQLCursor]:
+        """
+        Borrows a connection from the pool and yields a cursor of it. Statements
+        executed with the cursor are committed together if the block completes, and
+        are rolled back otherwise.
+        """
+        with self._pool_semaphore:
+            conn = self._pool.get_connection()
+            try:
+                cursor = conn.cursor()
+                try:
+                    yield cursor
+                    conn.commit()
+                except BaseException:
+                    conn.rollback()
+                    raise
+                finally:
+                    cursor.close()
+            finally:
+                # Returns the connection to the pool.
+                conn.close()
+
+    def _get_descriptors_from_mysql(
+        self, names: Sequence[str]
+    ) -> Dict[str, Tuple[datetime, str]]:
+        """
+        Fetches the latest version of the descriptors with the given names from MySQL
+        in one query and updates the local cache with the versions that are newer
+        than the cached ones.
+
+        :return: The timestamp and digest of the latest version of each descriptor
+                 found in MySQL, keyed by the name of the descriptor.
+        """
+        unique_names = list(dict.fromkeys(names))
+        if not unique_names:
+            return {}
+
+        placeholders = ", ".join(["%s"] * len(unique_names))
+        with self._transaction() as cursor:
+            cursor.execute(
+                f"""
+                    SELECT
+                        t.`name`,
+                        t.`timestamp`,
+                        t.`digest`,
+                        t.`original_descriptor`,
+                        t.`resolved_descriptor`
+                    FROM `{self.table}` AS t
+                    JOIN (
+                        SELECT `name`, MAX(`timestamp`) AS `timestamp`
+                        FROM `{self.table}`
+                        WHERE `name` IN ({placeholders})
+                        GROUP BY `name`
+                    ) AS latest
+                    ON t.`name` = latest.`name` AND t.`timestamp` = latest.`timestamp`;
+                """,
+                unique_names,
             )
+            rows: List[Tuple] = cursor.fetchall()
+
+        results = {}
+        updates = {}
+        for name, timestamp, digest, original_descriptor, resolved_descriptor in rows:
+            if (
+                get_descriptor_digest(original_descriptor, resolved_descriptor)
+                != digest
+            ):
+                raise FeathubException(
+                    f"Acquired features' json string cannot match the digest. "
+                    f"Data might be broken. Json string: {resolved_descriptor}, "
+                    f"digest: {digest}"
+                )
 
-        original_descriptor = from_json(json.loads(original_descriptor))
-        resolved_descriptor = from_json(json.loads(resolved_descriptor))
+            # Descriptors are only deserialized when they replace the cached ones.
+            if name not in self.tables or self.tables[name][2] < timestamp:
+                updates[name] = (
+                    from_json(json.loads(original_descriptor)),
+                    from_json(json.loads(resolved_descriptor)),
+                    timestamp,
+                    digest,
+                )
+
+            results[name] = (timestamp, digest)
 
-        if name not in self.tables or self.tables[name][2] < timestamp:
-            self.tables[name] = (original_descriptor, resolved_descriptor, timestamp)
+        with self._lock:
+            for name, (original, resolved, timestamp, digest) in updates.items():
+                # Checks again in case the descriptor is built during deserialization.
+                if name not in self.tables or self.tables[name][2] < timestamp:
+                    self.tables[name] = (original, resolved, timestamp)
+                    self._digests[name] = digest
+                    self._index_dependencies(original)
+
+        return results
 
-        return timestamp, digest, original_descriptor, resolved_descriptor
 
-    def __del__(self) -> None:
-        self.cursor.close()
-        self.conn.close()
+def _run_refresh(
+    registry_ref: "weakref.ref[MySqlRegistry]",
+    stop_event: threading.Event,
+    refresh_interval_sec: float,
+) -> None:
+    # Only holds the registry while refreshing it, so that the registry can be
+    # garbage collected without being closed.
+    while not stop_event.wait(refresh_interval_sec):
+        registry = registry_ref()
+        if registry is None:
+            return
+        try:
+            registry.refresh()
+        except Exception as e:
+            logger.warning(f"Failed to refresh the registry: {e}")
+        del registry
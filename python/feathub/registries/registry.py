@@ -13,9 +13,14 @@
 # limitations under the License.
 
 from __future__ import annotations
-from typing import List, Dict, Optional
+
+import threading
+from hashlib import sha256
+from contextlib import contextmanager
+from typing import List, Dict, Optional, Sequence, Tuple, Iterator, Any, Set
 from abc import ABC, abstractmethod
 
+from feathub.common.utils import from_json
 from feathub.registries.registry_config import (
     RegistryConfig,
     REGISTRY_TYPE_CONFIG,
@@ -38,6 +43,16 @@ class Registry(ABC):
         self._registry_type = registry_type
         self._config = config
 
+        # Holds the descriptors resolved during the outermost build_features call
+        # of each thread.
+        self._resolution_context = threading.local()
+
+        # The index of the tables each built descriptor refers to by name, and its
+        # reverse, i.e. the names of the descriptors referring to each table.
+        self._dependent_table_names: Dict[str, Set[str]] = {}
+        self._downstream_names: Dict[str, Set[str]] = {}
+        self._dependency_index_lock = threading.RLock()
+
     # TODO: move :param props: to other place to avoid job-specific global
     #  properties affecting feature descriptors saved in Registry.
     @abstractmethod
@@ -78,6 +93,10 @@ class Registry(ABC):
         caching them in memory as described in build_features. Each descriptor is
         uniquely identified by its name in the registry.
 
+        The descriptors that transitively depend on the given descriptors, as listed
+        by get_affected_features, are built and registered again so that they are
+        resolved with the given descriptors.
+
         :param feature_descriptors: A table descriptor to be registered.
         :param force_update: If True, the feature descriptor would be directly searched
                              in registry. If False, the feature descriptor would be
@@ -106,6 +125,32 @@ class Registry(ABC):
         """
         pass
 
+    def get_features_many(
+        self,
+        names: Sequence[str],
+        force_update: bool = False,
+        is_resolved: bool = True,
+    ) -> List[TableDescriptor]:
+        """
+        Returns the table descriptors previously registered with the given names, in
+        the same order as the names. Raises RuntimeError if any of the tables is not
+        in the registry. Registries backed by an external storage may override this
+        method to fetch all descriptors in one round trip.
+
+        :param names: The names of the table descriptors to search for.
+        :param force_update: If True, the feature descriptors would be directly
+                             searched in registry. If False, the feature descriptors
+                             would be searched in local cache first.
+        :param is_resolved: If False, the original feature descriptors would be
+                            returned. If True, the descriptors that had been resolved
+                            would be returned.
+        :return: A list of table descriptors with the given names.
+        """
+        return [
+            self.get_features(name, force_update=force_update, is_resolved=is_resolved)
+            for name in names
+        ]
+
     @abstractmethod
     def delete_features(self, name: str) -> bool:
         """
@@ -116,6 +161,179 @@ class Registry(ABC):
         """
         pass
 
+    def close(self) -> None:
+        """
+        Releases the resources held by this registry, e.g. its connections and
+        background threads. The registry should not be used after it is closed.
+        """
+        pass
+
+    def get_affected_features(self, names: Sequence[str]) -> List[str]:
+        """
+        Returns the names of the table descriptors that transitively depend on the
+        table descriptors with the given names, i.e. refer to them by name as their
+        source or as tables to join, in an order where each descriptor follows the
+        descriptors it depends on. The given names are not included.
+
+        :param names: The names of the table descriptors that are changed.
+        :return: The names of the table descriptors affected by the change.
+        """
+        changed_names = set(names)
+        affected_names: List[str] = []
+        # The edges between the affected descriptors, and the number of affected
+        # descriptors that each affected descriptor depends on.
+        affected_downstream_names: Dict[str, List[str]] = {}
+        in_degrees: Dict[str, int] = {}
+        frontier = list(dict.fromkeys(names))
+        while frontier:
+            next_frontier = []
+            for name, downstream_names in self._get_downstream_names(frontier).items():
+                for downstream_name in sorted(downstream_names):
+                    if downstream_name in changed_names:
+                        continue
+                    if downstream_name not in in_degrees:
+                        in_degrees[downstream_name] = 0
+                        affected_names.append(downstream_name)
+                        next_frontier.append(downstream_name)
+                    if name not in changed_names:
+                        affected_downstream_names.setdefault(name, []).append(
+                            downstream_name
+                        )
+                        in_degrees[downstream_name] += 1
+            frontier = next_frontier
+
+        # Orders the affected descriptors topologically. The remaining ones, which
+        # only exist if there is a dependency cycle, are appended as they are found.
+        ordered_names = [name for name in affected_names if in_degrees[name] == 0]
+        for name in ordered_names:
+            for downstream_name in affected_downstream_names.get(name, []):
+                in_degrees[downstream_name] -= 1
+                if in_degrees[downstream_name] == 0:
+                    ordered_names.append(downstream_name)
+        if len(ordered_names) < len(affected_names):
+            ordered_set = set(ordered_names)
+            ordered_names.extend(
+                name for name in affected_names if name not in ordered_set
+            )
+        return ordered_names
+
+    def _get_downstream_names(self, names: Sequence[str]) -> Dict[str, Set[str]]:
+        """
+        Returns the names of the descriptors that directly refer to each of the
+        table descriptors with the given names.
+        """
+        with self._dependency_index_lock:
+            return {
+                name: set(self._downstream_names[name])
+                for name in names
+                if name in self._downstream_names
+            }
+
+    def _index_dependencies(self, table: TableDescriptor) -> None:
+        """
+        Updates the dependency index with the tables that the given descriptor refers
+        to by name.
+        """
+        table_names = set(table.get_dependent_table_names())
+        with self._dependency_index_lock:
+            previous_table_names = self._dependent_table_names.get(table.name, set())
+            for table_name in previous_table_names - table_names:
+                self._downstream_names[table_name].discard(table.name)
+            for table_name in table_names:
+                self._downstream_names.setdefault(table_name, set()).add(table.name)
+            self._dependent_table_names[table.name] = table_names
+
+    def _unindex_dependencies(self, name: str) -> None:
+        """
+        Removes the tables that the descriptor with the given name refers to from the
+        dependency index. The descriptors referring to it are kept, so that they are
+        affected if it is registered again.
+        """
+        with self._dependency_index_lock:
+            for table_name in self._dependent_table_names.pop(name, set()):
+                self._downstream_names[table_name].discard(name)
+
+    def _clear_dependency_index(self) -> None:
+        with self._dependency_index_lock:
+            self._dependent_table_names.clear()
+            self._downstream_names.clear()
+
+    def _with_affected_descriptors(
+        self, feature_descriptors: List[TableDescriptor]
+    ) -> List[TableDescriptor]:
+        """
+        Returns the given descriptors followed by the original descriptors that are
+        affected by them, which should be built and registered again along with the
+        given descriptors.
+        """
+        affected_names = self.get_affected_features(
+            [descriptor.name for descriptor in feature_descriptors]
+        )
+        return feature_descriptors + self.get_features_many(
+            affected_names, is_resolved=False
+        )
+
+    @staticmethod
+    def _copy_original(table: TableDescriptor) -> TableDescriptor:
+        """
+        Returns the descriptor to cache as the original of the given descriptor,
+        which should be called before the given descriptor is built.
+
+        Building a descriptor completes the features it is given in place, e.g.
+        derives their dtypes from its source. A descriptor referring to other tables
+        by name is copied before it is built, so that it is built again from its
+        features as specified when the tables it refers to change.
+        """
+        if not table.get_dependent_table_names():
+            return table
+        return from_json(table.to_json())
+
+    @contextmanager
+    def _resolve_context(self) -> Iterator[None]:
+        """
+        Opens a resolution context if there is none in the current thread. Within
+        the context, each descriptor is only resolved once by `_resolve`, so that the
+        upstream descriptors shared by many feature views are not resolved again for
+        every downstream view. The context is closed when the outermost
+        build_features call returns.
+        """
+        if getattr(self._resolution_context, "resolved", None) is not None:
+            yield
+            return
+
+        self._resolution_context.resolved = {}
+        try:
+            yield
+        finally:
+            self._resolution_context.resolved = None
+
+    def _resolve(
+        self,
+        table: TableDescriptor,
+        force_update: bool = False,
+        props: Optional[Dict] = None,
+    ) -> TableDescriptor:
+        """
+        Returns the result of `table.build(...)`, reusing the result of building the
+        same descriptor object with the same properties in the current resolution
+        context.
+        """
+        resolved: Optional[Dict[Tuple, Tuple[TableDescriptor, TableDescriptor]]]
+        resolved = getattr(self._resolution_context, "resolved", None)
+        if resolved is None:
+            return table.build(self, force_update=force_update, props=props)
+
+        # Descriptors are identified by object rather than by a content digest, as
+        # computing the digest would serialize the whole upstream chain of each view.
+        key = (table.name, id(table), force_update, _get_props_key(props))
+        entry = resolved.get(key)
+        if entry is None:
+            # Keeps a reference to the descriptor so that its id is not reused
+            # within the context.
+            entry = (table, table.build(self, force_update=force_update, props=props))
+            resolved[key] = entry
+        return entry[1]
+
     @staticmethod
     def instantiate(props: Dict) -> Registry:
         """
@@ -133,6 +351,10 @@ class Registry(ABC):
             from feathub.registries.mysql_registry import MySqlRegistry
 
             return MySqlRegistry(props=props)
+        elif registry_type == RegistryType.SQLITE:
+            from feathub.registries.sqlite_registry import SqliteRegistry
+
+            return SqliteRegistry(props=props)
 
         raise RuntimeError(f"Failed to instantiate registry with props={props}.")
 
@@ -150,3 +372,17 @@ class Registry(ABC):
             and self._config == other._config
             and self._registry_type == other._registry_type
         )
+
+
+def _get_props_key(props: Optional[Dict[str, Any]]) -> str:
+    return "" if not props else repr(sorted(props.items()))
+
+
+def get_descriptor_digest(original_descriptor: str, resolved_descriptor: str) -> str:
+    """
+    Returns the digest of a table descriptor stored in a registry, computed from the
+    JSON strings of its original and resolved descriptors.
+    """
+    return sha256(
+        (original_descriptor + resolved_descriptor).encode("utf-8")
+    ).hexdigest()
@@ -22,6 +22,7 @@ from feathub.common.validators import in_list
 class RegistryType(Enum):
     LOCAL = "local"
     MYSQL = "mysql"
+    SQLITE = "sqlite"
 
 
 REGISTRY_PREFIX = "registry."
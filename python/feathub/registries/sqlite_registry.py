@@ -0,0 +1,414 @@
+# Copyright 2022 The FeatHub Authors
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+import json
+import sqlite3
+import threading
+from contextlib import contextmanager
+from datetime import datetime
+from typing import List, Optional, Dict, Any, Tuple, Iterator, Sequence, Set
+
+from feathub.common.config import ConfigDef
+from feathub.common.exceptions import FeathubException
+from feathub.common.utils import from_json
+from feathub.registries.registry import Registry, get_descriptor_digest
+from feathub.registries.registry_config import REGISTRY_PREFIX, RegistryConfig
+from feathub.table.table_descriptor import TableDescriptor
+
+SQLITE_REGISTRY_PREFIX = REGISTRY_PREFIX + "sqlite."
+
+DATABASE_CONFIG = SQLITE_REGISTRY_PREFIX + "database"
+DATABASE_DOC = (
+    "The path of the SQLite database file to hold the Feathub registry. The file is "
+    "created if it does not exist."
+)
+
+TABLE_CONFIG = SQLITE_REGISTRY_PREFIX + "table"
+TABLE_DOC = (
+    "The name of the SQLite table to hold the Feathub registry. The dependencies "
+    "between the registered descriptors are held in the table with the suffix "
+    "`_dependencies`."
+)
+
+sqlite_registry_config_defs: List[ConfigDef] = [
+    ConfigDef(
+        name=DATABASE_CONFIG,
+        value_type=str,
+        description=DATABASE_DOC,
+        default_value=None,
+    ),
+    ConfigDef(
+        name=TABLE_CONFIG,
+        value_type=str,
+        description=TABLE_DOC,
+        default_value="feathub_registry_features",
+    ),
+]
+
+# The format of the timestamps stored in the database, whose lexicographic order
+# matches the chronological order.
+_TIMESTAMP_FORMAT = "%Y-%m-%d %H:%M:%S.%f"
+
+
+class SqliteRegistryConfig(RegistryConfig):
+    def __init__(self, props: Dict[str, Any]) -> None:
+        super().__init__(props)
+        self.update_config_values(sqlite_registry_config_defs)
+
+
+class SqliteRegistry(Registry):
+    """
+    A registry that stores entities in an embedded SQLite database file.
+
+    Registered descriptors are persisted along with the names of the descriptors they
+    depend on. A descriptor that is not built in this process is fetched from the
+    database and deserialized the first time it is requested, so that the registry
+    starts without loading the whole catalog.
+    """
+
+    REGISTRY_TYPE = "sqlite"
+
+    def __init__(self, props: Dict) -> None:
+        """
+        :param props: The registry properties.
+        """
+        super().__init__(SqliteRegistry.REGISTRY_TYPE, props)
+        sqlite_registry_config = SqliteRegistryConfig(props)
+        self.database = sqlite_registry_config.get(DATABASE_CONFIG)
+        self.table = sqlite_registry_config.get(TABLE_CONFIG)
+        self.dependency_table = self.table + "_dependencies"
+        if self.database is None:
+            raise FeathubException(
+                f"The config {DATABASE_CONFIG} is required by SqliteRegistry."
+            )
+
+        # dict that acts as a local cache for built and fetched descriptors.
+        # each value in the dict is a tuple of
+        # - original descriptor.
+        # - resolved descriptor.
+        # - UTC timestamp when the descriptor is resolved.
+        self.tables: Dict[str, Tuple[TableDescriptor, TableDescriptor, datetime]] = {}
+
+        self._lock = threading.RLock()
+        self._conn = sqlite3.connect(self.database, check_same_thread=False)
+        with self._transaction() as cursor:
+            cursor.execute(
+                f"""
+                    CREATE TABLE IF NOT EXISTS `{self.table}`(
+                       `name` TEXT NOT NULL,
+                       `timestamp` TEXT NOT NULL,
+                       `digest` TEXT NOT NULL,
+                       `original_descriptor` TEXT NOT NULL,
+                       `resolved_descriptor` TEXT NOT NULL,
+                       PRIMARY KEY ( `name`, `timestamp` )
+                    );
+                """
+            )
+            cursor.execute(
+                f"""
+                    CREATE INDEX IF NOT EXISTS `{self.table}_timestamp_index`
+                    ON `{self.table}` ( `timestamp` );
+                """
+            )
+            cursor.execute(
+                f"""
+                    CREATE TABLE IF NOT EXISTS `{self.dependency_table}`(
+                       `name` TEXT NOT NULL,
+                       `dependency` TEXT NOT NULL,
+                       PRIMARY KEY ( `name`, `dependency` )
+                    );
+                """
+            )
+            cursor.execute(
+                f"""
+                    CREATE INDEX IF NOT EXISTS `{self.dependency_table}_index`
+                    ON `{self.dependency_table}` ( `dependency` );
+                """
+            )
+
+    def build_features(
+        self,
+        feature_descriptors: List[TableDescriptor],
+        force_update: bool = False,
+        props: Optional[Dict] = None,
+    ) -> List[TableDescriptor]:
+        result = []
+        with self._resolve_context():
+            for table in feature_descriptors:
+                if table.name == "":
+                    raise FeathubException(
+                        "Cannot build a TableDescriptor with empty name."
+                    )
+
+                original_table = self._copy_original(table)
+                resolved_table = self._resolve(
+                    table, force_update=force_update, props=props
+                )
+                with self._lock:
+                    self.tables[table.name] = (
+                        original_table,
+                        resolved_table,
+                        datetime.utcnow(),
+                    )
+                self._index_dependencies(table)
+                result.append(resolved_table)
+
+        return result
+
+    def register_features(
+        self, feature_descriptors: List[TableDescriptor], force_update: bool = False
+    ) -> List[bool]:
+        num_descriptors = len(feature_descriptors)
+        feature_descriptors = self._with_affected_descriptors(feature_descriptors)
+        self.build_features(feature_descriptors, force_update=force_update)
+
+        results = []
+        with self._transaction() as cursor:
+            existing_digests = self._get_latest_digests(
+                cursor, [descriptor.name for descriptor in feature_descriptors]
+            )
+            for descriptor in feature_descriptors:
+                original, resolved, timestamp = self.tables[descriptor.name]
+                original_descriptor = json.dumps(original.to_json(), sort_keys=True)
+                resolved_descriptor = json.dumps(resolved.to_json(), sort_keys=True)
+                digest = get_descriptor_digest(original_descriptor, resolved_descriptor)
+
+                if existing_digests.get(descriptor.name) == digest:
+                    results.append(False)
+                    continue
+
+                cursor.execute(
+                    f"""
+                        INSERT INTO `{self.table}` (
+                           `name`,
+                           `timestamp`,
+                           `digest`,
+                           `original_descriptor`,
+                           `resolved_descriptor`
+                        ) VALUES (?, ?, ?, ?, ?);
+                    """,
+                    (
+                        descriptor.name,
+                        timestamp.strftime(_TIMESTAMP_FORMAT),
+                        digest,
+                        original_descriptor,
+                        resolved_descriptor,
+                    ),
+                )
+                cursor.execute(
+                    f"DELETE FROM `{self.dependency_table}` WHERE `name` = ?;",
+                    (descriptor.name,),
+                )
+                cursor.executemany(
+                    f"""
+                        INSERT INTO `{self.dependency_table}` (`name`, `dependency`)
+                        VALUES (?, ?);
+                    """,
+                    [
+                        (descriptor.name, dependency)
+                        for dependency in original.get_dependent_table_names()
+                    ],
+                )
+                existing_digests[descriptor.name] = digest
+                results.append(True)
+
+        return results[:num_descriptors]
+
+    def get_features(
+        self, name: str, force_update: bool = False, is_resolved: bool = True
+    ) -> TableDescriptor:
+        if force_update or name not in self.tables:
+            self._get_descriptors_from_sqlite([name])
+
+        if name not in self.tables:
+            raise RuntimeError(
+                f"Table '{name}' is not found in the cache or registry. "
+                "Please invoke build_features(..) for this table."
+            )
+
+        return self.tables[name][1 if is_resolved else 0]  # type: ignore
+
+    def get_features_many(
+        self,
+        names: Sequence[str],
+        force_update: bool = False,
+        is_resolved: bool = True,
+    ) -> List[TableDescriptor]:
+        self._get_descriptors_from_sqlite(
+            [name for name in names if force_update or name not in self.tables]
+        )
+
+        return [self.get_features(name, is_resolved=is_resolved) for name in names]
+
+    def delete_features(self, name: str) -> bool:
+        with self._transaction() as cursor:
+            cursor.execute(f"DELETE FROM `{self.table}` WHERE `name` = ?;", (name,))
+            is_deleted_from_sqlite = cursor.rowcount > 0
+            cursor.execute(
+                f"DELETE FROM `{self.dependency_table}` WHERE `name` = ?;", (name,)
+            )
+
+        with self._lock:
+            is_deleted_from_cache = self.tables.pop(name, None) is not None
+        self._unindex_dependencies(name)
+        return is_deleted_from_sqlite or is_deleted_from_cache
+
+    def get_dependencies(self, name: str) -> List[str]:
+        """
+        Returns the names of the tables that the registered descriptor with the given
+        name refers to by name, as listed by
+        TableDescriptor#get_dependent_table_names.
+        """
+        with self._transaction() as cursor:
+            cursor.execute(
+                f"""
+                    SELECT `dependency` FROM `{self.dependency_table}`
+                    WHERE `name` = ?
+                    ORDER BY `dependency`;
+                """,
+                (name,),
+            )
+            return [dependency for dependency, in cursor.fetchall()]
+
+    def clear_features(self) -> None:
+        """
+        Deletes all features ever registered into this registry.
+        """
+        with self._transaction() as cursor:
+            cursor.execute(f"DELETE FROM `{self.table}`;")
+            cursor.execute(f"DELETE FROM `{self.dependency_table}`;")
+        with self._lock:
+            self.tables.clear()
+        self._clear_dependency_index()
+
+    def close(self) -> None:
+        """
+        Closes the connection to the database.
+        """
+        with self._lock:
+            self._conn.close()
+
+    def _get_downstream_names(self, names: Sequence[str]) -> Dict[str, Set[str]]:
+        # Looks up the persisted dependencies, so that the registered descriptors
+        # that are not loaded in this process are included.
+        downstream_names = super()._get_downstream_names(names)
+        unique_names = list(dict.fromkeys(names))
+        if not unique_names:
+            return downstream_names
+
+        placeholders = ", ".join(["?"] * len(unique_names))
+        with self._transaction() as cursor:
+            cursor.execute(
+                f"""
+                    SELECT `dependency`, `name` FROM `{self.dependency_table}`
+                    WHERE `dependency` IN ({placeholders});
+                """,
+                unique_names,
+            )
+            for dependency, name in cursor.fetchall():
+                downstream_names.setdefault(dependency, set()).add(name)
+        return downstream_names
+
+    @contextmanager
+    def _transaction(self) -> Iterator[sqlite3.Cursor]:
+        """
+        Yields a cursor whose statements are committed together if the block
+        completes, and are rolled back otherwise.
+        """
+        with self._lock:
+            cursor = self._conn.cursor()
+            try:
+                yield cursor
+                self._conn.commit()
+            except BaseException:
+                self._conn.rollback()
+                raise
+            finally:
+                cursor.close()
+
+    def _get_latest_digests(
+        self, cursor: sqlite3.Cursor, names: Sequence[str]
+    ) -> Dict[str, str]:
+        unique_names = list(dict.fromkeys(names))
+        if not unique_names:
+            return {}
+
+        placeholders = ", ".join(["?"] * len(unique_names))
+        cursor.execute(
+            f"""
+                SELECT `name`, `digest`, MAX(`timestamp`)
+                FROM `{self.table}`
+                WHERE `name` IN ({placeholders})
+                GROUP BY `name`;
+            """,
+            unique_names,
+        )
+        return {name: digest for name, digest, _ in cursor.fetchall()}
+
+    def _get_descriptors_from_sqlite(self, names: Sequence[str]) -> None:
+        """
+        Fetches the latest version of the descriptors with the given names from the
+        database and updates the local cache with the versions that are newer than
+        the cached ones.
+        """
+        unique_names = list(dict.fromkeys(names))
+        if not unique_names:
+            return
+
+        placeholders = ", ".join(["?"] * len(unique_names))
+        with self._transaction() as cursor:
+            # SQLite returns the other columns of the row holding the maximum value
+            # in an aggregate query with a single MAX().
+            cursor.execute(
+                f"""
+                    SELECT
+                        `name`,
+                        MAX(`timestamp`),
+                        `digest`,
+                        `original_descriptor`,
+                        `resolved_descriptor`
+                    FROM `{self.table}`
+                    WHERE `name` IN ({placeholders})
+                    GROUP BY `name`;
+                """,
+                unique_names,
+            )
+            rows: List[Tuple] = cursor.fetchall()
+
+        for (
+            name,
+            timestamp_str,
+            digest,
+            original_descriptor,
+            resolved_descriptor,
+        ) in rows:
+            if (
+                get_descriptor_digest(original_descriptor, resolved_descriptor)
+                != digest
+            ):
+                raise FeathubException(
+                    f"Acquired features' json string cannot match the digest. "
+                    f"Data might be broken. Json string: {resolved_descriptor}, "
+                    f"digest: {digest}"
+                )
+
+            timestamp = datetime.strptime(timestamp_str, _TIMESTAMP_FORMAT)
+            if name in self.tables and self.tables[name][2] >= timestamp:
+                continue
+
+            original = from_json(json.loads(original_descriptor))
+            resolved = from_json(json.loads(resolved_descriptor))
+            with self._lock:
+                if name not in self.tables or self.tables[name][2] < timestamp:
+                    self.tables[name] = (original, resolved, timestamp)
+                    self._index_dependencies(original)
@@ -11,11 +11,22 @@
 # WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
 # See the License for the specific language governing permissions and
 # limitations under the License.
-from typing import Any
+import gc
+import threading
+import time
+from contextlib import contextmanager
+from typing import cast, Iterator, List
+from unittest.mock import patch
 
 from testcontainers.mysql import MySqlContainer
 
 from feathub.feathub_client import FeathubClient
+from feathub.registries.mysql_registry import (
+    MySqlRegistry,
+    REGISTRY_REFRESH_METRIC,
+    REGISTRY_STALENESS_METRIC,
+    REFRESH_INTERVAL_SEC_CONFIG,
+)
 from feathub.registries.tests.test_registry import RegistryTestBase
 
 
@@ -66,8 +77,92 @@ class MySqlRegistryTest(RegistryTestBase):
 
     def tearDown(self) -> None:
         super().tearDown()
-        registry: Any = self.client.registry
-        registry.cursor.execute("DELETE FROM feathub_registry_features;")
+        cast(MySqlRegistry, self.client.registry).clear_features()
 
     def _get_client(self) -> FeathubClient:
         return self.client
+
+    def test_refresh(self):
+        registry = cast(MySqlRegistry, self.registry)
+        source = self._create_file_source(self.input_data.copy())
+        registry.register_features([source])
+        self.assertEqual([], registry.refresh())
+
+        other_registry = MySqlRegistry(self.client.props)
+        try:
+            self.assertIsNone(other_registry.get_staleness_sec())
+            self.assertEqual([source.name], other_registry.refresh())
+            self.assertEqual(source, other_registry.get_features(source.name))
+            self.assertEqual([], other_registry.refresh())
+
+            # The timestamps of the versions in MySQL have a precision of seconds.
+            time.sleep(1.1)
+            updated_source = self._create_file_source(self.input_data.copy())
+            self.assertNotEqual(source, updated_source)
+            registry.register_features([updated_source])
+
+            self.assertEqual([source.name], other_registry.refresh())
+            self.assertEqual(updated_source, other_registry.get_features(source.name))
+            self.assertLess(other_registry.get_staleness_sec(), 1)
+
+            refresh_histogram = other_registry.metrics.get_histogram(
+                REGISTRY_REFRESH_METRIC, {}
+            )
+            self.assertEqual(3, refresh_histogram.count)
+            self.assertEqual(
+                2, other_registry.metrics.get_row_count(REGISTRY_REFRESH_METRIC, {})
+            )
+            staleness_histogram = other_registry.metrics.get_histogram(
+                REGISTRY_STALENESS_METRIC, {"table": source.name}
+            )
+            self.assertEqual(2, staleness_histogram.count)
+
+            # The descriptors deleted from MySQL are evicted from the cache.
+            registry.delete_features(source.name)
+            self.assertEqual([source.name], other_registry.refresh())
+            self.assertNotIn(source.name, other_registry.tables)
+        finally:
+            other_registry.close()
+
+    def test_refresh_keeps_descriptors_registered_during_refresh(self):
+        registry = cast(MySqlRegistry, self.registry)
+        source = self._create_file_source(self.input_data.copy())
+        registry.register_features([source])
+
+        other_registry = MySqlRegistry(self.client.props)
+        try:
+            other_registry.delete_features(source.name)
+        finally:
+            other_registry.close()
+
+        # Registers the source again after the latest versions are listed and before
+        # the descriptors missing from the listing are evicted.
+        updated_source = self._create_file_source(self.input_data.copy())
+        transaction = registry._transaction
+        registered: List[bool] = []
+
+        @contextmanager
+        def transaction_registering_after_listing() -> Iterator:
+            with transaction() as cursor:
+                yield cursor
+            if not registered:
+                registered.append(True)
+                registry.register_features([updated_source])
+
+        with patch.object(
+            registry, "_transaction", transaction_registering_after_listing
+        ):
+            self.assertEqual([], registry.refresh())
+        self.assertEqual(updated_source, registry.get_features(source.name))
+
+    def test_refresh_thread_stopped_on_garbage_collection(self):
+        registry = MySqlRegistry(
+            {**self.client.props, REFRESH_INTERVAL_SEC_CONFIG: 0.1}
+        )
+        refresh_thread = cast(threading.Thread, registry._refresh_thread)
+        self.assertTrue(refresh_thread.is_alive())
+
+        del registry
+        gc.collect()
+        refresh_thread.join(timeout=5)
+        self.assertFalse(refresh_thread.is_alive())
@@ -15,7 +15,7 @@ import shutil
 import tempfile
 import unittest
 from abc import ABC, abstractmethod
-from typing import cast
+from typing import cast, List
 
 import numpy as np
 import pandas as pd
@@ -23,6 +23,7 @@ import pandas as pd
 from feathub.common import types
 from feathub.common.config import flatten_dict
 from feathub.common.types import from_numpy_dtype
+from feathub.common.utils import from_json
 from feathub.feathub_client import FeathubClient
 from feathub.feature_tables.sources.file_system_source import FileSystemSource
 from feathub.feature_views.derived_feature_view import DerivedFeatureView
@@ -110,6 +111,44 @@ class RegistryTestBase(ABC, unittest.TestCase):
         fetched_source = self.registry.get_features(source.name, force_update=True)
         self.assertEqual(source, fetched_source)
 
+    def test_get_features_many(self):
+        df = self.input_data.copy()
+        source = self._create_file_source(df)
+        features = DerivedFeatureView(
+            name="feature_view",
+            source="source",
+            features=[
+                Feature(
+                    name="cost_per_mile",
+                    dtype=types.Float32,
+                    transform="cost / distance + 10",
+                ),
+            ],
+            keep_source_fields=True,
+        )
+
+        self.assertEqual(
+            [True, True], self.registry.register_features([source, features])
+        )
+
+        fetched_features, fetched_source = self.registry.get_features_many(
+            [features.name, source.name], force_update=True
+        )
+        self.assertEqual(source, fetched_source)
+        self.assertEqual(self.registry.get_features(features.name), fetched_features)
+        self.assertEqual(
+            [features],
+            self.registry.get_features_many([features.name], is_resolved=False),
+        )
+
+        try:
+            self.registry.get_features_many([source.name, "invalid_name"])
+            self.fail("RuntimeError should be raised.")
+        except RuntimeError as err:
+            self.assertTrue(
+                "Table 'invalid_name' is not found in the cache or registry" in str(err)
+            )
+
     def test_build_features(self):
         df = self.input_data.copy()
         source = self._create_file_source(df)
@@ -155,6 +194,133 @@ class RegistryTestBase(ABC, unittest.TestCase):
         ).astype(np.float32)
         self.assertTrue(expected_result_df.equals(result_df))
 
+    def test_build_features_with_shared_source(self):
+        source = self._create_file_source(self.input_data.copy())
+        upstream = DerivedFeatureView(
+            name="upstream",
+            source=source,
+            features=[Feature(name="cost_plus_one", transform="cost + 1")],
+            keep_source_fields=True,
+        )
+        views: List[TableDescriptor] = [
+            DerivedFeatureView(
+                name=f"view_{i}",
+                source=upstream,
+                features=[Feature(name=f"cost_times_{i}", transform=f"cost * {i}")],
+                keep_source_fields=True,
+            )
+            for i in range(3)
+        ]
+
+        resolved_views = self.registry.build_features(views)
+
+        # The shared upstream is only resolved once within a build.
+        resolved_upstream = self.registry.get_features(upstream.name)
+        for view in resolved_views:
+            self.assertIs(
+                resolved_upstream, cast(DerivedFeatureView, view).get_resolved_source()
+            )
+
+        # It is resolved again in another build.
+        resolved_view = self.registry.build_features([views[0]])[0]
+        self.assertIsNot(
+            resolved_upstream,
+            cast(DerivedFeatureView, resolved_view).get_resolved_source(),
+        )
+        self.assertEqual(
+            resolved_upstream,
+            cast(DerivedFeatureView, resolved_view).get_resolved_source(),
+        )
+
+    def test_register_features_with_affected_features(self):
+        source = self._create_file_source(self.input_data.copy())
+        upstream = DerivedFeatureView(
+            name="upstream",
+            source="source",
+            features=[Feature(name="cost_plus_one", transform="cost + 1")],
+            keep_source_fields=True,
+        )
+        downstream = DerivedFeatureView(
+            name="downstream",
+            source="upstream",
+            features=[Feature(name="cost_plus_two", transform="cost_plus_one + 1")],
+            keep_source_fields=True,
+        )
+        unrelated = DerivedFeatureView(
+            name="unrelated",
+            source=self._create_file_source(self.input_data.copy()),
+            features=[Feature(name="cost_plus_three", transform="cost + 3")],
+            keep_source_fields=True,
+        )
+        # The descriptors as specified, before building them completes their features.
+        original_downstream = from_json(downstream.to_json())
+        self.registry.register_features([source, upstream, downstream, unrelated])
+
+        self.assertEqual(
+            ["upstream", "downstream"], self.registry.get_affected_features(["source"])
+        )
+        self.assertEqual(
+            ["downstream"],
+            self.registry.get_affected_features(["source", "upstream"]),
+        )
+        self.assertEqual([], self.registry.get_affected_features(["unrelated"]))
+
+        # Registering a descriptor again rebuilds the descriptors depending on it.
+        new_source = self._create_file_source(self.input_data.copy())
+        self.assertEqual([True], self.registry.register_features([new_source]))
+        resolved_downstream = cast(
+            DerivedFeatureView, self.registry.get_features(downstream.name)
+        )
+        resolved_upstream = cast(
+            DerivedFeatureView, resolved_downstream.get_resolved_source()
+        )
+        self.assertEqual(new_source, resolved_upstream.get_resolved_source())
+        self.assertEqual(
+            original_downstream,
+            self.registry.get_features(downstream.name, is_resolved=False),
+        )
+
+    def test_register_features_with_inline_source(self):
+        source = self._create_file_source(self.input_data.copy())
+        inline_view = DerivedFeatureView(
+            name="inline_view",
+            source="source",
+            features=[Feature(name="cost_plus_one", transform="cost + 1")],
+            keep_source_fields=True,
+        )
+        view = DerivedFeatureView(
+            name="view",
+            source=inline_view,
+            features=[Feature(name="cost_plus_two", transform="cost_plus_one + 1")],
+            keep_source_fields=True,
+        )
+        self.registry.register_features([source, view])
+
+        self.assertEqual(
+            ["inline_view", "view"], self.registry.get_affected_features(["source"])
+        )
+        resolved_view = self.registry.get_features("view")
+        self.assertEqual(types.Int64, resolved_view.get_feature("cost_plus_two").dtype)
+
+        # The view is rebuilt with its inline source resolved with the new source,
+        # and the dtypes of its derived features are derived again.
+        df = self.input_data.copy()
+        df["cost"] = df["cost"].astype(np.float64)
+        new_source = self._create_file_source(df)
+        self.registry.register_features([new_source])
+        for name in ["inline_view", "view"]:
+            self.assertEqual(
+                types.Float64,
+                self.registry.get_features(name).get_feature("cost").dtype,
+            )
+        resolved_view = self.registry.get_features("view")
+        self.assertEqual(
+            types.Float64, resolved_view.get_feature("cost_plus_one").dtype
+        )
+        self.assertEqual(
+            types.Float64, resolved_view.get_feature("cost_plus_two").dtype
+        )
+
     def test_delete_features(self):
         df = self.input_data.copy()
         source: TableDescriptor = self._create_file_source(df)
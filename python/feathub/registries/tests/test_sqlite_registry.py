@@ -0,0 +1,111 @@
+# Copyright 2022 The FeatHub Authors
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+import os
+import shutil
+import tempfile
+from typing import cast
+
+from feathub.common import types
+from feathub.feathub_client import FeathubClient
+from feathub.feature_views.derived_feature_view import DerivedFeatureView
+from feathub.feature_views.feature import Feature
+from feathub.registries.registry import Registry
+from feathub.registries.sqlite_registry import SqliteRegistry
+from feathub.registries.tests.test_registry import RegistryTestBase
+
+
+class SqliteRegistryTest(RegistryTestBase):
+    __test__ = True
+
+    def setUp(self) -> None:
+        self.database_dir = tempfile.mkdtemp()
+        super().setUp()
+
+    def tearDown(self) -> None:
+        super().tearDown()
+        cast(SqliteRegistry, self.registry).close()
+        shutil.rmtree(self.database_dir, ignore_errors=True)
+
+    def _get_client(self) -> FeathubClient:
+        return FeathubClient(self._get_props())
+
+    def _get_props(self) -> dict:
+        return {
+            "processor": {
+                "type": "local",
+            },
+            "online_store": {
+                "types": ["memory"],
+                "memory": {},
+            },
+            "registry": {
+                "type": "sqlite",
+                "sqlite": {
+                    "database": os.path.join(self.database_dir, "registry.db"),
+                },
+            },
+            "feature_service": {
+                "type": "local",
+                "local": {},
+            },
+        }
+
+    def test_lazy_deserialization(self):
+        source = self._create_file_source(self.input_data.copy())
+        features = DerivedFeatureView(
+            name="feature_view",
+            source="source",
+            features=[
+                Feature(
+                    name="cost_per_mile",
+                    dtype=types.Float32,
+                    transform="cost / distance + 10",
+                ),
+            ],
+            keep_source_fields=True,
+        )
+        self.assertEqual(
+            [True, True], self.registry.register_features([source, features])
+        )
+        self.assertEqual(
+            [False, False], self.registry.register_features([source, features])
+        )
+        resolved_features = self.registry.get_features(features.name)
+
+        registry = cast(SqliteRegistry, FeathubClient(self._get_props()).registry)
+        try:
+            self.assertEqual({}, registry.tables)
+            self.assertEqual(resolved_features, registry.get_features(features.name))
+            self.assertEqual({features.name}, registry.tables.keys())
+            self.assertEqual(
+                features, registry.get_features(features.name, is_resolved=False)
+            )
+            self.assertEqual(
+                [source], registry.get_features_many([source.name], is_resolved=False)
+            )
+
+            self.assertEqual([source.name], registry.get_dependencies(features.name))
+            self.assertEqual([], registry.get_dependencies(source.name))
+            # The affected descriptors are found from the persisted dependencies.
+            self.assertEqual(
+                [features.name], registry.get_affected_features([source.name])
+            )
+
+            self.assertTrue(registry.delete_features(features.name))
+            self.assertEqual([], registry.get_dependencies(features.name))
+        finally:
+            registry.close()
+
+    def test_instantiate(self):
+        self.assertIsInstance(Registry.instantiate(self.client.props), SqliteRegistry)
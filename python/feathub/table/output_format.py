@@ -0,0 +1,126 @@
+# Copyright 2022 The FeatHub Authors
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+from enum import Enum
+from typing import Dict, List, Any, Union
+
+import numpy as np
+import pandas as pd
+import pyarrow as pa
+
+
+class OutputFormat(Enum):
+    """
+    The format of the features returned to the user.
+
+    PANDAS: A pandas DataFrame.
+    ARROW: A pyarrow Table.
+    NUMPY: A dict from the name of each field to a NumPy array of its values. Numeric
+           fields are held in contiguous typed arrays.
+    """
+
+    PANDAS = "pandas"
+    ARROW = "arrow"
+    NUMPY = "numpy"
+
+
+def dataframe_to_arrow(df: pd.DataFrame) -> pa.Table:
+    """
+    Converts the given DataFrame to a pyarrow Table, without its index.
+    """
+    return pa.Table.from_pandas(df, preserve_index=False)
+
+
+def dataframe_to_numpy(df: pd.DataFrame) -> Dict[str, np.ndarray]:
+    """
+    Converts the given DataFrame to a dict from column names to NumPy arrays. The
+    arrays of numeric columns share the buffers of the DataFrame.
+    """
+    return {name: df[name].to_numpy() for name in df.columns}
+
+
+def arrow_to_numpy(table: pa.Table) -> Dict[str, np.ndarray]:
+    """
+    Converts the given pyarrow Table to a dict from column names to NumPy arrays. The
+    arrays of numeric columns without nulls share the buffers of the Table.
+    """
+    return {
+        name: column.to_numpy()
+        for name, column in zip(table.column_names, table.columns)
+    }
+
+
+def records_to_numpy(
+    records: List[Dict[str, Any]], field_names: List[str]
+) -> Dict[str, np.ndarray]:
+    """
+    Converts the given records to a dict from the given field names to NumPy arrays.
+    Fields whose values are all numeric scalars are converted to typed arrays.
+    """
+    result = {}
+    for name in field_names:
+        values = [record[name] for record in records]
+        if all(_is_numeric_scalar(value) for value in values):
+            result[name] = np.asarray(values)
+            continue
+
+        # The array is filled directly, as NumPy fails to infer the shape of values
+        # like vectors of different lengths or None.
+        array = np.empty(len(values), dtype=object)
+        for i, value in enumerate(values):
+            array[i] = value
+        result[name] = array
+    return result
+
+
+def _is_numeric_scalar(value: Any) -> bool:
+    return isinstance(value, (int, float, np.number, np.bool_))
+
+
+def records_to_arrow(records: List[Dict[str, Any]], field_names: List[str]) -> pa.Table:
+    """
+    Converts the given records to a pyarrow Table with the given field names.
+    """
+    return pa.Table.from_pydict(
+        {name: [record[name] for record in records] for name in field_names}
+    )
+
+
+def convert_dataframe(
+    df: pd.DataFrame, output_format: Union[str, OutputFormat]
+) -> Union[pd.DataFrame, pa.Table, Dict[str, np.ndarray]]:
+    """
+    Converts the given DataFrame to the given output format.
+    """
+    output_format = OutputFormat(output_format)
+    if output_format == OutputFormat.ARROW:
+        return dataframe_to_arrow(df)
+    if output_format == OutputFormat.NUMPY:
+        return dataframe_to_numpy(df)
+    return df
+
+
+def convert_records(
+    records: List[Dict[str, Any]],
+    field_names: List[str],
+    output_format: Union[str, OutputFormat],
+) -> Union[pd.DataFrame, pa.Table, Dict[str, np.ndarray]]:
+    """
+    Converts the given records to the given output format.
+    """
+    output_format = OutputFormat(output_format)
+    if output_format == OutputFormat.ARROW:
+        return records_to_arrow(records, field_names)
+    if output_format == OutputFormat.NUMPY:
+        return records_to_numpy(records, field_names)
+    return pd.DataFrame(records, columns=field_names)
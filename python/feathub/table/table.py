@@ -14,14 +14,25 @@
 
 from abc import ABC, abstractmethod
 from datetime import timedelta
-from typing import Optional
+from typing import Optional, Dict, Union, Iterator
 
+import numpy as np
 import pandas as pd
+import pyarrow as pa
 
 from feathub.feature_tables.sinks.sink import Sink
 from feathub.processors.processor_job import ProcessorJob
+from feathub.table.output_format import (
+    OutputFormat,
+    dataframe_to_arrow,
+    arrow_to_numpy,
+)
 from feathub.table.schema import Schema
 
+# The maximum number of rows in each DataFrame yielded by Table#to_pandas_iterator by
+# default.
+DEFAULT_CHUNK_SIZE = 10000
+
 
 class Table(ABC):
     """
@@ -57,6 +68,59 @@ class Table(ABC):
         """
         pass
 
+    def to_pandas_iterator(
+        self, force_bounded: bool = False, chunk_size: int = DEFAULT_CHUNK_SIZE
+    ) -> Iterator[pd.DataFrame]:
+        """
+        Returns an iterator of Pandas DataFrames containing values of this table, each
+        of which contains at most `chunk_size` rows. Unlike `to_pandas`, the table does
+        not have to fit in memory at once if the processor supports streaming its
+        values.
+
+        :param force_bounded: Whether to force the table to be bounded.
+        :param chunk_size: The maximum number of rows in each DataFrame.
+        """
+        df = self.to_pandas(force_bounded)
+        for start in range(0, len(df), chunk_size):
+            end = start + chunk_size
+            yield df.iloc[start:end]
+
+    def to_arrow(self, force_bounded: bool = False) -> pa.Table:
+        """
+        Returns a pyarrow Table containing values of this table.
+
+        :param force_bounded: Whether to force the table to be bounded.
+        """
+        return dataframe_to_arrow(self.to_pandas(force_bounded))
+
+    def to_numpy(self, force_bounded: bool = False) -> Dict[str, np.ndarray]:
+        """
+        Returns a dict from the name of each field of this table to a NumPy array of
+        its values. Numeric fields are held in contiguous typed arrays.
+
+        :param force_bounded: Whether to force the table to be bounded.
+        """
+        return arrow_to_numpy(self.to_arrow(force_bounded))
+
+    def collect(
+        self,
+        output_format: Union[str, OutputFormat] = OutputFormat.PANDAS,
+        force_bounded: bool = False,
+    ) -> Union[pd.DataFrame, pa.Table, Dict[str, np.ndarray]]:
+        """
+        Returns values of this table in the given format.
+
+        :param output_format: The format of the returned values. See OutputFormat for
+                              the supported formats.
+        :param force_bounded: Whether to force the table to be bounded.
+        """
+        output_format = OutputFormat(output_format)
+        if output_format == OutputFormat.ARROW:
+            return self.to_arrow(force_bounded)
+        if output_format == OutputFormat.NUMPY:
+            return self.to_numpy(force_bounded)
+        return self.to_pandas(force_bounded)
+
     @abstractmethod
     def execute_insert(
         self,
@@ -100,6 +100,14 @@ class TableDescriptor(Entity):
 
         return from_json(self.to_json())
 
+    def get_dependent_table_names(self) -> List[str]:
+        """
+        Returns the names of the tables that this table descriptor refers to by name,
+        e.g. a source given as a table name, or a table joined by its features,
+        including those referred to by the descriptors it embeds.
+        """
+        return []
+
     def get_feature(self, feature_name: str) -> Feature:
         """
         Returns the feature whose name matches the given feature name.
@@ -0,0 +1,90 @@
+# Copyright 2022 The FeatHub Authors
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+import unittest
+from typing import cast, List, Dict, Any
+
+import numpy as np
+import pandas as pd
+import pyarrow as pa
+
+from feathub.table.output_format import (
+    convert_dataframe,
+    convert_records,
+    arrow_to_numpy,
+)
+
+
+class OutputFormatTest(unittest.TestCase):
+    def test_convert_dataframe(self):
+        df = pd.DataFrame(
+            [["Alex", 1, 1.5], ["Emma", 2, 2.5]], columns=["name", "cost", "ratio"]
+        )
+
+        arrow_table = cast(pa.Table, convert_dataframe(df, "arrow"))
+        self.assertIsInstance(arrow_table, pa.Table)
+        self.assertEqual(["name", "cost", "ratio"], arrow_table.column_names)
+        self.assertEqual(pa.int64(), arrow_table.schema.field("cost").type)
+
+        arrays = convert_dataframe(df, "numpy")
+        self.assertEqual(np.int64, arrays["cost"].dtype)
+        self.assertTrue(np.shares_memory(arrays["ratio"], df["ratio"].to_numpy()))
+        self.assertEqual(["Alex", "Emma"], arrays["name"].tolist())
+
+        self.assertIs(df, convert_dataframe(df, "pandas"))
+
+    def test_convert_records(self):
+        records = [
+            {"name": "Alex", "cost": 1, "vector": [1.0, 2.0], "missing": None},
+            {"name": "Emma", "cost": 2, "vector": [3.0, 4.0], "missing": 1},
+        ]
+        field_names = ["name", "cost", "vector", "missing"]
+
+        arrays = convert_records(records, field_names, "numpy")
+        self.assertEqual(np.int64, arrays["cost"].dtype)
+        self.assertEqual(object, arrays["name"].dtype)
+        self.assertEqual((2,), arrays["vector"].shape)
+        self.assertEqual([1.0, 2.0], arrays["vector"][0])
+        self.assertEqual([None, 1], arrays["missing"].tolist())
+
+        arrow_table = cast(pa.Table, convert_records(records, field_names, "arrow"))
+        self.assertEqual(
+            {name: [r[name] for r in records] for name in field_names},
+            arrow_table.to_pydict(),
+        )
+
+        df = cast(pd.DataFrame, convert_records(records, field_names, "pandas"))
+        self.assertEqual(field_names, df.columns.tolist())
+
+    def test_convert_records_with_ragged_vectors(self):
+        records: List[Dict[str, Any]] = [
+            {"vector": [1.0, 2.0], "cost": 1.5},
+            {"vector": [3.0], "cost": 2.5},
+            {"vector": None, "cost": 3.5},
+        ]
+
+        arrays = convert_records(records, ["vector", "cost"], "numpy")
+        self.assertEqual(object, arrays["vector"].dtype)
+        self.assertEqual((3,), arrays["vector"].shape)
+        self.assertEqual([[1.0, 2.0], [3.0], None], arrays["vector"].tolist())
+        self.assertEqual(np.float64, arrays["cost"].dtype)
+
+        arrays = convert_records(records[1:], ["vector"], "numpy")
+        self.assertEqual([[3.0], None], arrays["vector"].tolist())
+
+    def test_arrow_to_numpy(self):
+        table = pa.Table.from_pydict({"a": [1, 2, 3], "b": [1, None, 3]})
+        arrays = arrow_to_numpy(table)
+        self.assertEqual(np.int64, arrays["a"].dtype)
+        self.assertEqual([1, 2, 3], arrays["a"].tolist())
+        self.assertTrue(np.isnan(arrays["b"][1]))
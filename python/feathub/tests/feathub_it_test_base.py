@@ -18,7 +18,7 @@ import unittest
 import uuid
 from abc import abstractmethod
 from datetime import timedelta
-from typing import Optional, List, Dict, Type, cast
+from typing import Optional, List, Dict, Type, cast, Sequence
 from unittest import TestLoader
 
 import pandas as pd
@@ -58,7 +58,7 @@ def _merge_nested_dict(a, b) -> None:
 #  these methods.
 class RegistryWithJsonCheck(Registry):
     def __init__(self, registry: Registry):
-        super().__init__("", {})
+        super().__init__(registry.registry_type, registry.config)
         self.registry = registry
 
     def build_features(
@@ -85,8 +85,22 @@ class RegistryWithJsonCheck(Registry):
     ) -> TableDescriptor:
         return self.registry.get_features(name, force_update, is_resolved)
 
+    def get_features_many(
+        self,
+        names: Sequence[str],
+        force_update: bool = False,
+        is_resolved: bool = True,
+    ) -> List[TableDescriptor]:
+        return self.registry.get_features_many(names, force_update, is_resolved)
+
     def delete_features(self, name: str) -> bool:
-        return self.delete_features(name)
+        return self.registry.delete_features(name)
+
+    def close(self) -> None:
+        self.registry.close()
+
+    def get_affected_features(self, names: Sequence[str]) -> List[str]:
+        return self.registry.get_affected_features(names)
 
     @staticmethod
     def _save_and_reload_through_json(features: TableDescriptor):
@@ -0,0 +1,96 @@
+# Copyright 2022 The FeatHub Authors
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+import unittest
+from concurrent.futures import ThreadPoolExecutor
+from typing import cast
+from unittest.mock import patch
+
+from feathub.feathub_client import FeathubClient
+from feathub.processors.local.local_processor import LocalProcessor
+from feathub.registries.local_registry import LocalRegistry
+
+
+class FeathubClientTest(unittest.TestCase):
+    def setUp(self) -> None:
+        self.client = FeathubClient(
+            {
+                "processor": {
+                    "type": "local",
+                },
+                "online_store": {
+                    "types": ["memory"],
+                    "memory": {},
+                },
+                "registry": {
+                    "type": "local",
+                    "local": {
+                        "namespace": "default",
+                    },
+                },
+                "feature_service": {
+                    "type": "local",
+                    "local": {},
+                },
+            }
+        )
+
+    def test_lazy_instantiation(self) -> None:
+        self.assertEqual({}, self.client.get_initialization_times())
+
+        registry = self.client.registry
+        self.assertIsInstance(registry, LocalRegistry)
+        self.assertEqual({"registry"}, self.client.get_initialization_times().keys())
+
+        processor = self.client.processor
+        self.assertIsInstance(processor, LocalProcessor)
+        self.assertIs(registry, cast(LocalProcessor, processor).registry)
+        self.assertEqual(
+            {"registry", "metric_store", "processor"},
+            self.client.get_initialization_times().keys(),
+        )
+        self.assertIs(processor, self.client.processor)
+
+        for elapsed_time in self.client.get_initialization_times().values():
+            self.assertGreaterEqual(elapsed_time, 0)
+
+    def test_concurrent_instantiation(self) -> None:
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            processors = list(executor.map(lambda _: self.client.processor, range(32)))
+
+        for processor in processors:
+            self.assertIs(processors[0], processor)
+
+    def test_set_component(self) -> None:
+        registry = LocalRegistry(props={"namespace": "default"})
+        self.client.registry = registry
+
+        self.assertIs(registry, self.client.registry)
+        self.assertIs(registry, cast(LocalProcessor, self.client.processor).registry)
+        self.assertNotIn("registry", self.client.get_initialization_times())
+
+    def test_close(self) -> None:
+        registry = self.client.registry
+        feature_service = self.client.feature_service
+        with patch.object(registry, "close") as close, patch.object(
+            feature_service, "close"
+        ) as close_feature_service:
+            self.client.close()
+        close.assert_called_once_with()
+        close_feature_service.assert_called_once_with()
+
+        # The components set by users are not closed.
+        self.client.registry = LocalRegistry(props={"namespace": "default"})
+        with patch.object(self.client.registry, "close") as close:
+            self.client.close()
+        close.assert_not_called()
@@ -14,6 +14,7 @@
 from abc import ABC
 from datetime import datetime
 
+import numpy as np
 import pandas as pd
 
 from feathub.common.exceptions import FeathubException
@@ -34,6 +35,30 @@ class GetFeaturesITTest(ABC, FeathubITTestBase):
         df = table.to_pandas()
         self.assertTrue(self.input_data.equals(df))
 
+    def test_get_table_in_arrow_and_numpy_format(self):
+        source = self.create_file_source(self.input_data.copy())
+        table = self.client.get_features(feature_descriptor=source)
+
+        arrow_table = table.collect(output_format="arrow")
+        self.assertEqual(["name", "cost", "distance", "time"], arrow_table.column_names)
+        self.assertTrue(self.input_data.equals(arrow_table.to_pandas()))
+
+        arrays = table.collect(output_format="numpy")
+        self.assertEqual(["name", "cost", "distance", "time"], list(arrays.keys()))
+        self.assertEqual(np.int64, arrays["cost"].dtype)
+        self.assertTrue(arrays["cost"].flags["C_CONTIGUOUS"])
+        self.assertEqual(self.input_data["cost"].tolist(), arrays["cost"].tolist())
+        self.assertEqual(self.input_data["name"].tolist(), arrays["name"].tolist())
+
+    def test_get_table_as_pandas_iterator(self):
+        source = self.create_file_source(self.input_data.copy())
+        table = self.client.get_features(feature_descriptor=source)
+
+        chunks = list(table.to_pandas_iterator(chunk_size=4))
+        self.assertTrue(all(len(chunk) <= 4 for chunk in chunks))
+        df = pd.concat(chunks, ignore_index=True)
+        self.assertTrue(self.input_data.equals(df))
+
     def test_get_table_with_single_key(self):
         source = self.create_file_source(self.input_data.copy(), keys=["name"])
         keys = pd.DataFrame(
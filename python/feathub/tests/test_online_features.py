@@ -12,13 +12,19 @@
 #  See the License for the specific language governing permissions and
 #  limitations under the License.
 from abc import ABC
-from typing import List, Optional
+from typing import List, Optional, cast
 
+import numpy as np
 import pandas as pd
+import pyarrow as pa
 
 from feathub.common import types
 from feathub.common.utils import get_table_schema
 from feathub.feature_tables.sinks.memory_store_sink import MemoryStoreSink
+from feathub.feature_tables.sources.memory_store_source import MemoryStoreSource
+from feathub.feature_views.derived_feature_view import DerivedFeatureView
+from feathub.feature_views.feature import Feature
+from feathub.feature_views.on_demand_feature_view import OnDemandFeatureView
 from feathub.online_stores.memory_online_store import MemoryOnlineStore
 from feathub.table.schema import Schema
 from feathub.tests.feathub_it_test_base import FeathubITTestBase
@@ -102,6 +108,27 @@ class OnlineFeaturesITTest(ABC, FeathubITTestBase):
         )
         self.assertTrue(expected_online_features.equals(online_features))
 
+    def test_materialize_empty_features(self):
+        table_name = "table_name_1"
+        source = self.create_file_source(self.input_data, keys=["name"])
+        feature_view = DerivedFeatureView(
+            name="feature_view",
+            source=source,
+            features=[Feature(name="double_cost", transform="cost * 2")],
+            keep_source_fields=True,
+            filter_expr="cost < 0",
+        )
+        self.client.materialize_features(
+            feature_descriptor=feature_view,
+            sink=MemoryStoreSink(table_name=table_name),
+            allow_overwrite=True,
+        ).wait()
+
+        # The table is created even if there is no row to insert.
+        self.assertEqual(
+            [], MemoryOnlineStore.get_instance().get_records(table_name, [])
+        )
+
     def test_get_online_features_with_extra_fields_in_input_data(self):
         keys = pd.DataFrame(
             [
@@ -158,6 +185,59 @@ class OnlineFeaturesITTest(ABC, FeathubITTestBase):
         )
         self.assertTrue(expected_online_features.equals(online_features))
 
+    def test_get_online_features_with_dict_requests(self):
+        sink = MemoryStoreSink(table_name="table_name_1")
+        source = self.create_file_source(self.input_data, keys=["name"])
+        self.client.materialize_features(
+            feature_descriptor=source, sink=sink, allow_overwrite=True
+        ).wait()
+
+        online_source = MemoryStoreSource(
+            name="online_source", keys=["name"], table_name="table_name_1"
+        )
+        on_demand_fv = OnDemandFeatureView(
+            name="on_demand_fv",
+            features=[
+                "online_source.cost",
+                Feature(name="double_cost", transform="cost * 2"),
+            ],
+            request_schema=Schema.new_builder().column("name", types.String).build(),
+        )
+        self.client.build_features([online_source, on_demand_fv])
+
+        self.assertEqual(
+            {"name": "Alex", "cost": 600, "double_cost": 1200},
+            self.client.get_online_features({"name": "Alex"}, "on_demand_fv"),
+        )
+        self.assertEqual(
+            [
+                {"name": "Alex", "cost": 600, "double_cost": 1200},
+                {"name": "Emma", "cost": 200, "double_cost": 400},
+            ],
+            self.client.get_online_features(
+                [{"name": "Alex"}, {"name": "Emma"}], "on_demand_fv"
+            ),
+        )
+
+        arrays = self.client.get_online_features(
+            [{"name": "Alex"}, {"name": "Emma"}],
+            "on_demand_fv",
+            output_format="numpy",
+        )
+        self.assertEqual(np.int64, arrays["double_cost"].dtype)
+        self.assertEqual([1200, 400], arrays["double_cost"].tolist())
+
+        arrow_table = cast(
+            pa.Table,
+            self.client.get_online_features(
+                pd.DataFrame([["Alex"], ["Emma"]], columns=["name"]),
+                "on_demand_fv",
+                output_format="arrow",
+            ),
+        )
+        self.assertEqual(["name", "cost", "double_cost"], arrow_table.column_names)
+        self.assertEqual([600, 200], arrow_table.column("cost").to_pylist())
+
     def _materialize_and_get_online_features(
         self,
         table_name: str,
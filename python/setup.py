@@ -112,6 +112,7 @@ try:
         "tzlocal~=4.2",
         "mysql-connector-python~=8.0.0",
         "cloudpickle==2.1.0",
+        "pyarrow>=5.0.0,<9.0.0",
     ]
 
     extras_require = {